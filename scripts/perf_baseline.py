@@ -98,6 +98,32 @@ def _benchmark_card_render(app):
     return {"items": 1000, "set_data_elapsed_sec": elapsed}
 
 
+def _benchmark_result_search_index(rows: int = 1_000_000):
+    from src.ui.widgets.result_table import ResultSearchIndex
+
+    index = ResultSearchIndex()
+    start = time.perf_counter()
+    for i in range(rows):
+        index.add(
+            i,
+            f"대량단지{i % 500} {('매매', '전세', '월세')[i % 3]} {i % 30}층 남향 "
+            f"{'gamma' if i % 2 else 'delta'} 중개사{i % 800} l{i}",
+        )
+    build_elapsed = time.perf_counter() - start
+
+    queries = []
+    for query in ("gamma", "단지499", "중개사7", "전세 1층", "zzzzz_not_found", "1", "l"):
+        best = None
+        for _ in range(3):
+            index.search("warm")
+            start = time.perf_counter()
+            matches = index.search(query)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        queries.append({"query": query, "matches": len(matches), "query_ms": best * 1000})
+    return {"rows": rows, "build_elapsed_sec": build_elapsed, "queries": queries}
+
+
 def _benchmark_compact_live_batches(app):
     from src.core.database import ComplexDatabase
     from src.ui.widgets.crawler_tab import CrawlerTab
@@ -110,7 +136,8 @@ def _benchmark_compact_live_batches(app):
                     "단지명": f"테스트단지{i}",
                     "단지ID": "11111",
                     "거래유형": "매매",
-                    "매매가": str(10000 + i),
+                    # 가격을 섞어 새 묶음 행이 목록 중간에 끼어들게 한다.
+                    "매매가": str(10000 + (i * 7919) % 3000),
                     "보증금": "",
                     "월세": "",
                     "면적(평)": 34.0,
@@ -134,13 +161,17 @@ def _benchmark_compact_live_batches(app):
         tab.btn_view_mode.setChecked(False)
         tab.view_stack.setCurrentWidget(tab.result_table)
 
+        batch_elapsed = []
         start = time.perf_counter()
         for start_index in range(0, 3000, 30):
+            batch_start = time.perf_counter()
             tab._on_items_batch(_make_batch(start_index))
+            batch_elapsed.append(time.perf_counter() - batch_start)
         app.processEvents()
         elapsed = time.perf_counter() - start
+        quarter = max(1, len(batch_elapsed) // 4)
 
-        rows = tab.result_table.rowCount()
+        rows = tab.result_model.rowCount()
         groups = len(getattr(tab, "_compact_items_by_key", {}) or {})
         db.close()
         tab.deleteLater()
@@ -152,9 +183,265 @@ def _benchmark_compact_live_batches(app):
         "groups": groups,
         "rows": rows,
         "elapsed_sec": elapsed,
+        # 행이 늘어도 배치당 비용이 평평해야 한다 (앞/뒤 1/4 구간 평균 비교).
+        "first_quarter_batch_ms": sum(batch_elapsed[:quarter]) / quarter * 1000,
+        "last_quarter_batch_ms": sum(batch_elapsed[-quarter:]) / quarter * 1000,
     }
 
 
+def _fill_synthetic_price_snapshots(db_path: str, total_rows: int, days: int = 30) -> int:
+    """단지당 행 수(일수 x 평형 4 x 거래유형 2)는 고정하고 단지 수로 전체 행 수를 맞춘다."""
+    import sqlite3
+
+    rows_per_complex = days * 8
+    complexes = max(1, total_rows // rows_per_complex)
+
+    def _rows():
+        for cid in range(complexes):
+            for day in range(days):
+                snapshot_date = f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}"
+                for pyeong in (20.0, 25.0, 30.0, 35.0):
+                    for trade_type in ("매매", "전세"):
+                        price = 10000 + (cid * 7 + day) % 50000
+                        yield (
+                            f"C{cid}", trade_type, pyeong, price, price + 500, price + 250, 3,
+                            "APT", "price", 0, snapshot_date,
+                        )
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO price_snapshots (
+                complex_id, trade_type, pyeong, min_price, max_price, avg_price, item_count,
+                asset_type, price_metric, legacy_monthly, snapshot_date
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            _rows(),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return complexes
+
+
+def _benchmark_price_snapshot_queries():
+    """price_snapshots 전체 행 수가 늘어도 단지 단위 조회 시간이 유지되는지 측정한다."""
+    from src.core.database import ComplexDatabase
+
+    sizes = [
+        int(token)
+        for token in os.environ.get("NAVERLAND_PERF_SNAPSHOT_ROWS", "100000,2000000").split(",")
+        if token.strip().isdigit()
+    ]
+    results = []
+    for total_rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "perf_price_snapshots.db")
+            ComplexDatabase(db_path).close()
+            complexes = _fill_synthetic_price_snapshots(db_path, total_rows)
+            db = ComplexDatabase(db_path)
+            try:
+                queries = 30
+                start = time.perf_counter()
+                for i in range(queries):
+                    cid = f"C{(i * 37) % complexes}"
+                    db.get_price_snapshots(cid, "매매", asset_type="APT")
+                    db.get_price_snapshot_pyeongs(cid, asset_type="APT", trade_type="매매")
+                    db.get_complex_price_history(cid, "매매", asset_type="APT")
+                elapsed = time.perf_counter() - start
+            finally:
+                db.close()
+        results.append(
+            {
+                "rows": total_rows,
+                "queries": queries * 3,
+                "avg_query_ms": elapsed * 1000 / (queries * 3),
+            }
+        )
+    return results
+
+
+def _benchmark_disappeared_targets():
+    """소멸 처리/집계가 대상 수가 아니라 대상 단지의 이력 행 수에 비례하는지 측정한다."""
+    import sqlite3
+
+    from src.core.database import ComplexDatabase
+
+    rows_per_target = 40
+    results = []
+    for target_count in (100, 500, 2000):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "perf_disappeared.db")
+            ComplexDatabase(db_path).close()
+            conn = sqlite3.connect(db_path)
+            try:
+                # 대상 밖 단지 이력도 같은 양만큼 넣어 전체 테이블 크기의 영향을 함께 본다.
+                conn.executemany(
+                    """
+                    INSERT INTO article_history (
+                        article_id, complex_id, trade_type, price, asset_type, status, last_seen
+                    ) VALUES (?, ?, '매매', 10000, 'APT', 'active', date('now', ?))
+                    """,
+                    (
+                        (f"A{cid}-{i}", f"C{cid}", "-2 day" if i % 2 else "+0 day")
+                        for cid in range(target_count * 2)
+                        for i in range(rows_per_target)
+                    ),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            db = ComplexDatabase(db_path)
+            try:
+                targets = [("APT", f"C{cid}", "매매") for cid in range(target_count)]
+                start = time.perf_counter()
+                marked = db.mark_disappeared_articles_for_targets(targets)
+                mark_elapsed = time.perf_counter() - start
+                start = time.perf_counter()
+                counted = db.count_disappeared_articles_for_targets(targets)
+                count_elapsed = time.perf_counter() - start
+            finally:
+                db.close()
+        seen_rows = target_count * rows_per_target
+        results.append(
+            {
+                "targets": target_count,
+                "seen_rows": seen_rows,
+                "marked": marked,
+                "counted": counted,
+                "mark_ms": mark_elapsed * 1000,
+                "count_ms": count_elapsed * 1000,
+                "mark_us_per_seen_row": mark_elapsed * 1_000_000 / seen_rows,
+            }
+        )
+    return results
+
+
+class _StageTimer:
+    """인스턴스 메서드를 감싸 단계별 누적 시간(초)과 호출 수를 잰다.
+
+    단계 시간은 호출 구간 기준이라 서로 겹칠 수 있다(예: push 안에서 호출되는 flush).
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+
+    def _add(self, stage, elapsed):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + elapsed
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def wrap(self, obj, method_name, stage):
+        import inspect
+
+        original = getattr(obj, method_name)
+        timer = self
+
+        if inspect.iscoroutinefunction(original):
+            async def _timed_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    timer._add(stage, time.perf_counter() - start)
+
+            setattr(obj, method_name, _timed_async)
+            return
+
+        def _timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timer._add(stage, time.perf_counter() - start)
+
+        setattr(obj, method_name, _timed)
+
+    def report(self):
+        return {
+            stage: {"elapsed_sec": self.seconds[stage], "calls": self.calls.get(stage, 0)}
+            for stage in sorted(self.seconds, key=self.seconds.get, reverse=True)
+        }
+
+
+def _run_replay_crawl(fixture_dir, db, targets, trade_types, crawl_mode):
+    from src.core.crawler import CrawlerThread
+
+    thread = CrawlerThread(
+        targets,
+        trade_types,
+        {"enabled": False},
+        {"enabled": False},
+        db,
+        engine_name="playwright",
+        crawl_mode=crawl_mode,
+        geo_config={"lat": 37.55, "lon": 126.99, "zoom": 15, "rings": 0, "asset_types": ["APT"]},
+        fallback_engine_enabled=False,
+        detail_cache_ttl_hours=0,
+        block_heavy_resources=False,
+        playwright_fixture_mode="replay_offline",
+        playwright_fixture_dir=str(fixture_dir),
+    )
+    timer = _StageTimer()
+    timer.wrap(thread, "_check_filters", "filter")
+    timer.wrap(thread, "_enrich_item_with_history_and_alerts", "history")
+    timer.wrap(thread, "_push_item", "push")
+    timer.wrap(thread, "_flush_pending_items_if_needed", "flush_items")
+    timer.wrap(thread, "_flush_history_updates", "flush_history")
+    create_engine = thread._create_engine
+
+    def _create_timed_engine():
+        engine = create_engine()
+        timer.wrap(engine, "_fetch_article_api_page", "capture")
+        timer.wrap(engine, "_normalize_article_api_payload", "normalize")
+        timer.wrap(engine, "_scan_geo_asset_type", "geo_markers")
+        return engine
+
+    thread._create_engine = _create_timed_engine
+    start = time.perf_counter()
+    thread.run()
+    elapsed = time.perf_counter() - start
+    pairs = len(thread._build_pair_sequence()) if crawl_mode == "complex" else (
+        int(thread.stats.get("geo_discovered_count", 0) or 0) * len(trade_types)
+    )
+    items = len(thread.collected_data)
+    return {
+        "mode": crawl_mode,
+        "pairs": pairs,
+        "items": items,
+        "elapsed_sec": elapsed,
+        "pairs_per_sec": pairs / elapsed if elapsed > 0 else 0.0,
+        "items_per_sec": items / elapsed if elapsed > 0 else 0.0,
+        "stages": timer.report(),
+    }
+
+
+def _benchmark_playwright_replay():
+    """합성 fixture를 브라우저 없이 재생해 Playwright 엔진 수집 경로 전체의 처리량을 잰다."""
+    from src.core.database import ComplexDatabase
+    from src.core.services.response_fixtures import ResponseFixtureStore, build_synthetic_fixtures
+
+    complex_count = int(os.environ.get("NAVERLAND_PERF_REPLAY_COMPLEXES", "300") or 300)
+    trade_types = ["매매", "전세"]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = Path(tmp) / "fixtures"
+        targets = build_synthetic_fixtures(
+            ResponseFixtureStore(fixture_dir),
+            complex_count=complex_count,
+            trade_codes=("A1", "B1"),
+            articles_per_pair=40,
+        )
+        for crawl_mode in ("complex", "geo_sweep"):
+            db = ComplexDatabase(os.path.join(tmp, f"perf_replay_{crawl_mode}.db"))
+            try:
+                results.append(_run_replay_crawl(fixture_dir, db, targets, trade_types, crawl_mode))
+            finally:
+                db.close()
+    return {"complexes": complex_count, "runs": results}
+
+
 def _benchmark_app_init(app):
     start = time.perf_counter()
     window = RealEstateApp()
@@ -227,6 +514,10 @@ def main():
         "cache": _benchmark_cache(),
         "card_render": _benchmark_card_render(app),
         "compact_live_batches": _benchmark_compact_live_batches(app),
+        "result_search_index": _benchmark_result_search_index(),
+        "price_snapshot_queries": _benchmark_price_snapshot_queries(),
+        "disappeared_targets": _benchmark_disappeared_targets(),
+        "playwright_replay": _benchmark_playwright_replay(),
         "preflight_startup": _benchmark_preflight_startup(),
         "app_startup_without_dashboard": _benchmark_app_startup_without_dashboard(app),
         "dashboard_first_open": _benchmark_dashboard_first_open(app),
@@ -242,7 +533,32 @@ def main():
     print(f"- cache set(100): {results['cache']['set_100_elapsed_sec']:.4f}s")
     print(f"- cache flush: {results['cache']['flush_elapsed_sec']:.4f}s")
     print(f"- card set_data(1000): {results['card_render']['set_data_elapsed_sec']:.4f}s")
-    print(f"- compact live batches(3000/30): {results['compact_live_batches']['elapsed_sec']:.4f}s")
+    print(
+        f"- compact live batches(3000/30): {results['compact_live_batches']['elapsed_sec']:.4f}s "
+        f"(batch {results['compact_live_batches']['first_quarter_batch_ms']:.2f}ms → "
+        f"{results['compact_live_batches']['last_quarter_batch_ms']:.2f}ms)"
+    )
+    for entry in results["result_search_index"]["queries"]:
+        print(
+            f"- result search index({results['result_search_index']['rows']} rows, {entry['query']!r}): "
+            f"{entry['query_ms']:.2f}ms ({entry['matches']} matches)"
+        )
+    for entry in results["price_snapshot_queries"]:
+        print(f"- price snapshot query({entry['rows']} rows): {entry['avg_query_ms']:.2f}ms/query")
+    for entry in results["disappeared_targets"]:
+        print(
+            f"- disappeared targets({entry['targets']} targets, {entry['seen_rows']} rows): "
+            f"mark {entry['mark_ms']:.2f}ms ({entry['mark_us_per_seen_row']:.2f}us/row), "
+            f"count {entry['count_ms']:.2f}ms"
+        )
+    for run in results["playwright_replay"]["runs"]:
+        stages = ", ".join(
+            f"{stage}={entry['elapsed_sec']:.2f}s" for stage, entry in run["stages"].items()
+        )
+        print(
+            f"- playwright replay({run['mode']}, {results['playwright_replay']['complexes']} complexes): "
+            f"{run['pairs_per_sec']:.1f} pairs/s, {run['items_per_sec']:.1f} items/s ({stages})"
+        )
     print(f"- preflight startup: {results['preflight_startup']['elapsed_sec']:.4f}s")
     print(f"- app startup(no dashboard): {results['app_startup_without_dashboard']['init_elapsed_sec']:.4f}s")
     print(f"- dashboard first open: {results['dashboard_first_open']['open_elapsed_sec']:.4f}s")
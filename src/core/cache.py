@@ -1,19 +1,32 @@
-import json
+import sqlite3
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 from threading import Lock
 from src.utils.paths import CACHE_PATH
 from src.utils.logger import get_logger
-from src.utils.json_store import atomic_write_json, load_json_with_recovery
+from src.core.cache_backends import (
+    CrawlCacheBackend,
+    JsonCrawlCacheBackend,
+    SqliteCrawlCacheBackend,
+    entry_payload,
+)
+
+CACHE_BACKENDS = ("sqlite", "json")
+
 
 class CrawlCache:
-    """크롤링 결과 캐시 (v12.0)"""
+    """크롤링 결과 캐시 (v12.0)
+
+    저장소는 ``backend`` 로 선택한다. 기본값 ``sqlite`` 는 키 단위로 쓰고 payload를
+    ``get`` 시점에 지연 로드하며, ``json`` 은 기존 단일 파일 방식을 유지한다.
+    """
     
     def __init__(
         self,
         ttl_minutes: int = 30,
         write_back_interval_sec: int = 2,
         max_entries: int = 2000,
+        backend: str = "sqlite",
     ):
         self.ttl = timedelta(minutes=ttl_minutes)
         self.write_back_interval_sec = max(1, int(write_back_interval_sec))
@@ -21,8 +34,21 @@ class CrawlCache:
         self._cache: Dict[str, dict] = {}
         self._lock = Lock()
         self._dirty = False
+        self._dirty_keys: Set[str] = set()
+        self._deleted_keys: Set[str] = set()
         self._last_flush_at = datetime.now()
+        self._backend = self._create_backend(backend)
         self._load()
+
+    @staticmethod
+    def _create_backend(backend: str) -> CrawlCacheBackend:
+        backend_name = str(backend or "sqlite").strip().lower()
+        if backend_name == "sqlite":
+            try:
+                return SqliteCrawlCacheBackend(CACHE_PATH.with_suffix(".db"), legacy_json_path=CACHE_PATH)
+            except (OSError, sqlite3.Error) as e:
+                get_logger('CrawlCache').warning(f"SQLite 캐시 초기화 실패, JSON 캐시로 대체합니다: {e}")
+        return JsonCrawlCacheBackend(CACHE_PATH)
     
     @staticmethod
     def _normalize_float_token(value) -> str:
@@ -106,41 +132,51 @@ class CrawlCache:
         return self.ttl
     
     def _load(self):
-        """캐시 파일 로드"""
-        data = load_json_with_recovery(
-            CACHE_PATH,
-            default_factory=dict,
-            logger_name="CrawlCache",
-            label="crawl_cache",
-        )
-        if isinstance(data, dict):
-            now = datetime.now()
-            for key, entry in data.items():
-                try:
-                    cached_at = datetime.fromisoformat(entry.get('cached_at', ''))
-                    has_payload = isinstance(entry.get("raw_items"), list) or isinstance(
-                        entry.get("items"), list
-                    )
-                    if now - cached_at < self._entry_ttl(entry) and has_payload:
-                        self._cache[key] = entry
-                except (ValueError, TypeError):
+        """캐시 인덱스 로드 (SQLite 백엔드는 payload 없이 메타데이터만 읽는다)"""
+        try:
+            index = self._backend.load_index()
+        except (OSError, sqlite3.Error) as e:
+            get_logger('CrawlCache').warning(f"캐시 로드 실패: {e}")
+            index = {}
+        now = datetime.now()
+        stale_entries = []
+        for key, entry in index.items():
+            try:
+                cached_at = datetime.fromisoformat(entry.get('cached_at', ''))
+                if now - cached_at < self._entry_ttl(entry):
+                    self._cache[key] = entry
                     continue
-        self._evict_if_needed()
+            except (ValueError, TypeError, AttributeError):
+                pass
+            if isinstance(entry, dict):
+                stale_entries.append((key, entry.get("cached_at", "")))
+        for key in self._evict_if_needed():
+            stale_entries.append((key, index.get(key, {}).get("cached_at", "")))
+        self._deleted_keys.clear()
+        self._dirty = False
+        self._backend.compact_in_background(stale_entries)
     
     def _save(self):
-        """캐시 파일 저장"""
+        """dirty 엔트리를 저장소에 반영 (SQLite 백엔드는 변경된 키만 기록)"""
         try:
-            atomic_write_json(CACHE_PATH, self._cache)
+            self._backend.write(self._cache, set(self._dirty_keys), set(self._deleted_keys))
+            self._dirty_keys.clear()
+            self._deleted_keys.clear()
             self._dirty = False
             self._last_flush_at = datetime.now()
-        except OSError as e:
+        except (OSError, sqlite3.Error) as e:
             get_logger('CrawlCache').warning(f"캐시 저장 실패: {e}")
 
-    def _evict_if_needed(self):
+    def _mark_deleted(self, key: str):
+        self._dirty_keys.discard(key)
+        self._deleted_keys.add(key)
+        self._dirty = True
+
+    def _evict_if_needed(self) -> List[str]:
         """최대 엔트리 수를 초과하면 오래된 항목부터 제거"""
         over = len(self._cache) - self.max_entries
         if over <= 0:
-            return
+            return []
 
         def _cache_time(entry: dict):
             try:
@@ -149,8 +185,11 @@ class CrawlCache:
                 return datetime.min
 
         sorted_keys = sorted(self._cache.keys(), key=lambda k: _cache_time(self._cache.get(k, {})))
-        for key in sorted_keys[:over]:
+        evicted = sorted_keys[:over]
+        for key in evicted:
             self._cache.pop(key, None)
+            self._mark_deleted(key)
+        return evicted
 
     def _flush_if_needed(self):
         if not self._dirty:
@@ -207,20 +246,21 @@ class CrawlCache:
                     suffix = f", context={context_ns}" if context_ns else ""
                     get_logger('CrawlCache').debug(f"캐시 히트: {complex_id} ({trade_type}{suffix})")
                     # v14.2: raw_items 우선 사용, legacy items 포맷과 호환 유지
-                    raw_items = entry.get("raw_items")
-                    if isinstance(raw_items, list):
-                        return raw_items
-                    legacy_items = entry.get("items")
-                    if isinstance(legacy_items, list):
-                        return legacy_items
-                    return []
+                    payload = entry_payload(entry)
+                    if payload is None:
+                        payload = self._backend.load_payload(key)
+                        if payload is None:
+                            self._cache.pop(key, None)
+                            return None
+                        entry["raw_items"] = payload
+                    return payload
                 else:
                     # 만료된 캐시 삭제
                     del self._cache[key]
-                    self._dirty = True
+                    self._mark_deleted(key)
                     self._flush_if_needed()
                     return None
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, sqlite3.Error):
                 return None
     
     def set(
@@ -274,8 +314,10 @@ class CrawlCache:
             if reason_token:
                 payload["reason"] = reason_token
             self._cache[key] = payload
-            self._evict_if_needed()
+            self._deleted_keys.discard(key)
+            self._dirty_keys.add(key)
             self._dirty = True
+            self._evict_if_needed()
             self._flush_if_needed()
             suffix = f", context={context_ns}" if context_ns else ""
             get_logger('CrawlCache').debug(
@@ -288,22 +330,31 @@ class CrawlCache:
             if self._dirty:
                 self._save()
     
+    def close(self):
+        """dirty 엔트리를 반영하고 저장소 연결을 닫는다"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+            self._backend.close()
+
     def clear(self):
         """전체 캐시 삭제"""
         with self._lock:
             self._cache = {}
             self._dirty = False
-            if CACHE_PATH.exists():
-                try:
-                    CACHE_PATH.unlink()
-                except OSError as e:
-                    get_logger('CrawlCache').debug(f"캐시 파일 삭제 실패 (무시): {e}")
+            self._dirty_keys.clear()
+            self._deleted_keys.clear()
+            try:
+                self._backend.clear()
+            except (OSError, sqlite3.Error) as e:
+                get_logger('CrawlCache').debug(f"캐시 삭제 실패 (무시): {e}")
             get_logger('CrawlCache').info("캐시 전체 삭제")
     
     def get_stats(self) -> dict:
         """캐시 통계"""
         return {
             'total_entries': len(self._cache),
+            'backend': self._backend.name,
             'ttl_minutes': self.ttl.total_seconds() / 60,
             'dirty': self._dirty,
             'write_back_interval_sec': self.write_back_interval_sec,
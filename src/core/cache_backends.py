@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.json_store import atomic_write_json, load_json_with_recovery
+from src.utils.logger import get_logger
+
+logger = get_logger("CrawlCache")
+
+
+def entry_payload(entry: dict) -> Optional[List[dict]]:
+    """엔트리에 이미 로드된 payload(raw_items 우선, legacy items 호환)를 반환한다."""
+    raw_items = entry.get("raw_items")
+    if isinstance(raw_items, list):
+        return raw_items
+    legacy_items = entry.get("items")
+    if isinstance(legacy_items, list):
+        return legacy_items
+    return None
+
+
+class CrawlCacheBackend(ABC):
+    """CrawlCache 저장소 인터페이스.
+
+    ``load_index`` 는 시작 시 키별 메타데이터(cached_at/ttl_seconds 등)를 반환하며,
+    payload를 지연 로드하는 백엔드는 ``raw_items`` 없이 메타데이터만 돌려준다.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def load_index(self) -> Dict[str, dict]:
+        raise NotImplementedError
+
+    def load_payload(self, key: str) -> Optional[List[dict]]:
+        return None
+
+    @abstractmethod
+    def write(self, entries: Dict[str, dict], dirty_keys: Iterable[str], deleted_keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def compact_in_background(self, stale_entries: Iterable[tuple]) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class JsonCrawlCacheBackend(CrawlCacheBackend):
+    """레거시 단일 JSON 파일 백엔드 (flush마다 전체 파일 재작성)."""
+
+    name = "json"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load_index(self) -> Dict[str, dict]:
+        data = load_json_with_recovery(
+            self.path,
+            default_factory=dict,
+            logger_name="CrawlCache",
+            label="crawl_cache",
+        )
+        if not isinstance(data, dict):
+            return {}
+        return {
+            str(key): entry
+            for key, entry in data.items()
+            if isinstance(entry, dict) and entry_payload(entry) is not None
+        }
+
+    def write(self, entries: Dict[str, dict], dirty_keys: Iterable[str], deleted_keys: Iterable[str]) -> None:
+        atomic_write_json(self.path, entries)
+
+    def clear(self) -> None:
+        if self.path.exists():
+            try:
+                self.path.unlink()
+            except OSError as e:
+                logger.debug(f"캐시 파일 삭제 실패 (무시): {e}")
+
+
+class SqliteCrawlCacheBackend(CrawlCacheBackend):
+    """키 단위로 읽고 쓰는 SQLite 백엔드.
+
+    시작 시에는 메타데이터만 읽고, payload는 ``get`` 시점에 키별로 로드한다.
+    레거시 JSON 파일이 있으면 최초 1회 가져온 뒤 삭제한다. DB 파일은 처음 쓸 때
+    만들므로, 읽기만 하는 동안에는 디스크에 아무것도 생기지 않는다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path, legacy_json_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path else None
+        self._lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self, *, create: bool) -> Optional[sqlite3.Connection]:
+        """연결을 연다. ``create`` 가 False면 DB 파일이 아직 없을 때 None을 반환한다."""
+        if self._conn is None:
+            if not create and not self.path.exists():
+                return None
+            self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        try:
+            # auto_vacuum은 테이블 생성 전에만 적용된다.
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    cached_at TEXT NOT NULL,
+                    ttl_seconds INTEGER NOT NULL DEFAULT 0,
+                    context TEXT NOT NULL DEFAULT '',
+                    reason TEXT NOT NULL DEFAULT '',
+                    item_count INTEGER NOT NULL DEFAULT 0,
+                    payload TEXT NOT NULL DEFAULT '[]'
+                )
+                """
+            )
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _row_from_entry(key: str, entry: dict) -> Optional[tuple]:
+        payload = entry_payload(entry)
+        if payload is None:
+            return None
+        try:
+            ttl_seconds = int(entry.get("ttl_seconds", 0) or 0)
+        except (TypeError, ValueError):
+            ttl_seconds = 0
+        return (
+            str(key),
+            str(entry.get("cached_at", "") or ""),
+            ttl_seconds,
+            str(entry.get("context", "") or ""),
+            str(entry.get("reason", "") or ""),
+            len(payload),
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+        )
+
+    @staticmethod
+    def _upsert_rows(conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        conn.executemany(
+            """
+            INSERT INTO crawl_cache
+            (cache_key, cached_at, ttl_seconds, context, reason, item_count, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                cached_at=excluded.cached_at,
+                ttl_seconds=excluded.ttl_seconds,
+                context=excluded.context,
+                reason=excluded.reason,
+                item_count=excluded.item_count,
+                payload=excluded.payload
+            """,
+            rows,
+        )
+
+    def _import_legacy_json(self) -> None:
+        legacy_path = self.legacy_json_path
+        if legacy_path is None or not legacy_path.exists():
+            return
+        entries = JsonCrawlCacheBackend(legacy_path).load_index()
+        rows = [row for row in (self._row_from_entry(key, entry) for key, entry in entries.items()) if row]
+        conn = self._connection(create=True)
+        assert conn is not None
+        if rows:
+            self._upsert_rows(conn, rows)
+        conn.commit()
+        try:
+            legacy_path.unlink()
+        except OSError as e:
+            logger.debug(f"레거시 캐시 파일 삭제 실패 (무시): {e}")
+        logger.info(f"레거시 JSON 캐시 {len(rows)}건을 SQLite 캐시로 이전했습니다.")
+
+    def load_index(self) -> Dict[str, dict]:
+        with self._lock:
+            conn = self._connection(create=False)
+            has_rows = conn is not None and conn.execute("SELECT 1 FROM crawl_cache LIMIT 1").fetchone() is not None
+            if not has_rows:
+                self._import_legacy_json()
+                conn = self._connection(create=False)
+            rows = []
+            if conn is not None:
+                rows = conn.execute(
+                    "SELECT cache_key, cached_at, ttl_seconds, context, reason FROM crawl_cache"
+                ).fetchall()
+        index: Dict[str, dict] = {}
+        for cache_key, cached_at, ttl_seconds, context, reason in rows:
+            entry: dict = {"cached_at": str(cached_at or "")}
+            if ttl_seconds:
+                entry["ttl_seconds"] = int(ttl_seconds)
+            if context:
+                entry["context"] = str(context)
+            if reason:
+                entry["reason"] = str(reason)
+            index[str(cache_key)] = entry
+        return index
+
+    def load_payload(self, key: str) -> Optional[List[dict]]:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT payload FROM crawl_cache WHERE cache_key = ?",
+                (str(key),),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            payload = json.loads(row[0] or "[]")
+        except (TypeError, ValueError):
+            return None
+        return payload if isinstance(payload, list) else None
+
+    def write(self, entries: Dict[str, dict], dirty_keys: Iterable[str], deleted_keys: Iterable[str]) -> None:
+        rows = []
+        for key in dirty_keys:
+            entry = entries.get(key)
+            row = self._row_from_entry(key, entry) if isinstance(entry, dict) else None
+            if row:
+                rows.append(row)
+        deletes = [(str(key),) for key in deleted_keys if key not in entries]
+        if not rows and not deletes:
+            return
+        with self._lock:
+            conn = self._connection(create=bool(rows))
+            if conn is None:
+                return
+            try:
+                if rows:
+                    self._upsert_rows(conn, rows)
+                if deletes:
+                    conn.executemany("DELETE FROM crawl_cache WHERE cache_key = ?", deletes)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is not None:
+                conn.execute("DELETE FROM crawl_cache")
+                conn.commit()
+        if self.legacy_json_path is not None and self.legacy_json_path.exists():
+            try:
+                self.legacy_json_path.unlink()
+            except OSError as e:
+                logger.debug(f"캐시 파일 삭제 실패 (무시): {e}")
+
+    def compact(self, stale_entries: Iterable[tuple]) -> int:
+        """만료/초과 엔트리를 삭제하고 빈 페이지를 반환한다.
+
+        ``stale_entries`` 는 ``(cache_key, cached_at)`` 목록이며, 그 사이 다시 저장된
+        키는 cached_at이 달라지므로 삭제되지 않는다.
+        """
+        deletes = [(str(key), str(cached_at or "")) for key, cached_at in stale_entries]
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            try:
+                if deletes:
+                    conn.executemany(
+                        "DELETE FROM crawl_cache WHERE cache_key = ? AND cached_at = ?",
+                        deletes,
+                    )
+                conn.commit()
+                conn.execute("PRAGMA incremental_vacuum")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.debug(f"캐시 compaction 실패 (무시): {e}")
+                return 0
+        return len(deletes)
+
+    def compact_in_background(self, stale_entries: Iterable[tuple]) -> None:
+        entries = list(stale_entries)
+        if not entries:
+            return
+        thread = threading.Thread(
+            target=self.compact,
+            args=(entries,),
+            name="CrawlCacheCompaction",
+            daemon=True,
+        )
+        self._compaction_thread = thread
+        thread.start()
+
+    def close(self) -> None:
+        thread = self._compaction_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=5)
+        self._compaction_thread = None
+        with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
@@ -25,18 +25,24 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
-from src.utils.constants import CRAWL_SPEED_PRESETS
+from src.utils.constants import CRAWL_SPEED_PRESETS, PLAYWRIGHT_MAX_TARGET_WORKERS, STATS_EMIT_INTERVAL_MS
 from src.utils.helpers import PriceConverter, ChromeParamHelper, DateTimeHelper, get_complex_url
 from src.utils.retry_handler import RetryCancelledError, RetryHandler
 from src.core.engines import PlaywrightCrawlerEngine, SeleniumCrawlerEngine
 from src.core.item_parser import ItemParser
-from src.core.models.crawl_models import GeoSweepConfig
+from src.core.models.crawl_models import GeoSweepConfig, ListingRecord, listing_prices
+from src.core.services.alert_rules import AlertRuleIndex
+from src.core.services.crawl_stats import CrawlStats
+from src.core.services.history_index import ArticleHistoryIndex
+from src.core.services.price_snapshots import PriceSnapshotAggregator
+from src.core.services.response_fixtures import normalize_fixture_mode
 
 # 메모리 임계치 (MB) - 초과 시 드라이버 재시작
 MEMORY_THRESHOLD_MB = 500
 
 from src.utils.mixin_rebind import rebind_inherited_methods
 
+from src.core.crawler_parts.db_writer import DB_WRITE_FLUSH_TIMEOUT_SEC, DbWriteBehind
 from src.core.crawler_parts.state_runtime import CrawlerStateRuntimeMixin
 from src.core.crawler_parts.history_alerts import CrawlerHistoryAlertsMixin
 from src.core.crawler_parts.selenium_flow import CrawlerSeleniumFlowMixin
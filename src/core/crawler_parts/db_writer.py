@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("DBWriter")
+
+DB_WRITE_QUEUE_MAX = 256
+DB_WRITE_BATCH_MAX = 64
+DB_WRITE_FLUSH_TIMEOUT_SEC = 60
+
+_BARRIER = "__barrier__"
+_STOP = "__stop__"
+
+
+class DbWriteBehind:
+    """크롤 루프 대신 SQLite 쓰기를 수행하는 전용 writer 스레드.
+
+    ``submit`` 으로 들어온 작업은 bounded queue에 쌓이고, writer는 한 번에 최대
+    ``batch_max`` 개를 꺼내 ``handler(batch)`` 로 넘긴다. 큐가 가득 차면 ``submit`` 이
+    대기하며(back-pressure) 대기 횟수/시간을 ``snapshot`` 으로 노출한다.
+    ``flush`` 는 그 시점까지 제출된 작업이 모두 반영될 때까지 기다리는 barrier다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list], None],
+        *,
+        max_queue: int = DB_WRITE_QUEUE_MAX,
+        batch_max: int = DB_WRITE_BATCH_MAX,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self._handler = handler
+        self._on_error = on_error
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._batch_max = max(1, int(batch_max))
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.submitted_count = 0
+        self.batch_count = 0
+        self.max_queue_depth = 0
+        self.backpressure_count = 0
+        self.backpressure_wait_ms = 0
+
+    @property
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="DbWriteBehind", daemon=True)
+        self._thread.start()
+
+    def submit(self, kind: str, payload: Any) -> None:
+        if self._closed:
+            raise RuntimeError("DbWriteBehind is closed")
+        item = (str(kind), payload)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            started = time.monotonic()
+            self._queue.put(item)
+            waited_ms = int((time.monotonic() - started) * 1000)
+            with self._stats_lock:
+                self.backpressure_count += 1
+                self.backpressure_wait_ms += waited_ms
+        with self._stats_lock:
+            self.submitted_count += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """이 호출 이전에 제출된 작업이 모두 처리될 때까지 대기한다."""
+        if not self.is_running:
+            return True
+        done = threading.Event()
+        self._queue.put((_BARRIER, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        if self._closed and not self.is_running:
+            return True
+        self._closed = True
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        self._queue.put((_STOP, None))
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def snapshot(self) -> dict:
+        with self._stats_lock:
+            return {
+                "db_write_queue_depth": self._queue.qsize(),
+                "db_write_queue_max_depth": self.max_queue_depth,
+                "db_write_backpressure_count": self.backpressure_count,
+                "db_write_backpressure_wait_ms": self.backpressure_wait_ms,
+                "db_write_batch_count": self.batch_count,
+            }
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            items = [first]
+            while len(items) < self._batch_max:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            batch = []
+            barriers = []
+            stop = False
+            for kind, payload in items:
+                if kind == _BARRIER:
+                    barriers.append(payload)
+                elif kind == _STOP:
+                    stop = True
+                else:
+                    batch.append((kind, payload))
+            if batch:
+                try:
+                    self._handler(batch)
+                except Exception as e:
+                    logger.error(f"DB write-behind batch failed: {e}")
+                    if self._on_error is not None:
+                        try:
+                            self._on_error(e)
+                        except Exception:
+                            pass
+                with self._stats_lock:
+                    self.batch_count += 1
+            for event in barriers:
+                event.set()
+            if stop:
+                return
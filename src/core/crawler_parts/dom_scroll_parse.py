@@ -205,13 +205,15 @@ class CrawlerDomScrollParseMixin:
                 if data and data.get("면적(㎡)", 0) > 0:
                     detected_type = data.get("거래유형", "")
                     if detected_type == ttype:
-                        raw_items.append(dict(data))
+                        # 캐시용 원본은 파서가 만든 dict를 그대로 두고, 레코드가 자기 사본을 가진다.
+                        raw_items.append(data)
+                        data = ListingRecord(data)
                         if not self._check_filters(data, ttype):
-                            self.stats["filtered_out"] += 1
+                            self.stats.incr("filtered_out")
                             continue
                         enriched = self._enrich_item_with_history_and_alerts(data)
                         if not self._check_filters(enriched, ttype):
-                            self.stats["filtered_out"] += 1
+                            self.stats.incr("filtered_out")
                             continue
                         if self._push_item(enriched):
                             matched_count += 1
@@ -249,10 +251,11 @@ class CrawlerDomScrollParseMixin:
                 return False
         if self.price_filter.get("enabled"):
             price_range = self.price_filter.get(ttype, {}) or {}
+            sale_price, deposit, monthly_rent = listing_prices(data)
             if ttype == "매매":
                 min_p = price_range.get("min", 0)
                 max_p = price_range.get("max", 999999)
-                price = PriceConverter.to_int(data.get("매매가", "0"))
+                price = sale_price
                 if price < min_p or price > max_p:
                     return False
             elif ttype == "월세":
@@ -260,8 +263,6 @@ class CrawlerDomScrollParseMixin:
                 deposit_max = price_range.get("deposit_max", price_range.get("max", 999999))
                 rent_min = price_range.get("rent_min", price_range.get("min", 0))
                 rent_max = price_range.get("rent_max", price_range.get("max", 999999))
-                deposit = PriceConverter.to_int(data.get("보증금", "0"))
-                monthly_rent = PriceConverter.to_int(data.get("월세", "0"))
                 if deposit < deposit_min or deposit > deposit_max:
                     return False
                 if monthly_rent < rent_min or monthly_rent > rent_max:
@@ -269,7 +270,7 @@ class CrawlerDomScrollParseMixin:
             else:
                 min_p = price_range.get("min", 0)
                 max_p = price_range.get("max", 999999)
-                price = PriceConverter.to_int(data.get("보증금", "0"))
+                price = deposit
                 if price < min_p or price > max_p:
                     return False
         return True
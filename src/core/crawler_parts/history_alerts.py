@@ -40,8 +40,14 @@ class CrawlerHistoryAlertsMixin:
                 self.discovered_complex_signal.emit(emitted)
             return 0
 
-        saved = 0
-        for dedupe_key, payload in pending.items():
+        if self._submit_db_write("discovered_complexes", pending):
+            # 실제 저장 건수는 writer 스레드가 반영한 뒤 _apply_db_write_batch 에서 기록한다.
+            return 0
+        return self._write_discovered_complexes(pending)
+
+    def _write_discovered_complexes(self, pending):
+        statuses = []
+        for payload in pending.values():
             status = "skipped"
             if self.db:
                 try:
@@ -60,6 +66,12 @@ class CrawlerHistoryAlertsMixin:
                         30,
                     )
                     status = "error"
+            statuses.append(status)
+        return self._publish_discovered_complex_statuses(pending, statuses)
+
+    def _publish_discovered_complex_statuses(self, pending, statuses):
+        saved = 0
+        for (dedupe_key, payload), status in zip(pending.items(), statuses):
             self._discovered_complex_status[dedupe_key] = status
             emitted = dict(payload)
             emitted["db_status"] = status
@@ -85,20 +97,23 @@ class CrawlerHistoryAlertsMixin:
     ):
         if not self.db:
             return
+        args = (name, cid, types, int(count or 0))
+        kwargs = {
+            "engine": engine or self.engine_name,
+            "mode": mode or self.crawl_mode,
+            "source_lat": source_lat,
+            "source_lon": source_lon,
+            "source_zoom": source_zoom,
+            "asset_type": asset_type,
+            "run_status": run_status,
+        }
+        if self._submit_db_write("crawl_history", (args, kwargs)):
+            return
+        self._write_crawl_history(args, kwargs)
+
+    def _write_crawl_history(self, args, kwargs):
         try:
-            self.db.add_crawl_history(
-                name,
-                cid,
-                types,
-                int(count or 0),
-                engine=engine or self.engine_name,
-                mode=mode or self.crawl_mode,
-                source_lat=source_lat,
-                source_lon=source_lon,
-                source_zoom=source_zoom,
-                asset_type=asset_type,
-                run_status=run_status,
-            )
+            self.db.add_crawl_history(*args, **kwargs)
             if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
                 self._notify_db_write_disabled()
         except Exception as e:
@@ -112,6 +127,9 @@ class CrawlerHistoryAlertsMixin:
             self.log("   disappeared marking skipped: no successful target pairs", 10)
             return
         if self.track_disappeared and (not self._should_stop()) and self.db:
+            # 소멸 판정은 last_seen 기준이므로 대기 중인 이력 쓰기를 먼저 반영한다.
+            self._flush_history_updates(force=True)
+            self._db_write_barrier()
             try:
                 if hasattr(self.db, "mark_disappeared_articles_for_targets"):
                     disappeared = int(
@@ -134,14 +152,14 @@ class CrawlerHistoryAlertsMixin:
         for raw_item in raw_items or []:
             if not isinstance(raw_item, dict):
                 continue
-            item = dict(raw_item)
+            item = ListingRecord(raw_item)
             trade_type = str(item.get("거래유형", requested_trade_type) or requested_trade_type)
             if not self._check_filters(item, trade_type):
-                self.stats["filtered_out"] += 1
+                self.stats.incr("filtered_out")
                 continue
             processed_item = self._enrich_item_with_history_and_alerts(item)
             if not self._check_filters(processed_item, trade_type):
-                self.stats["filtered_out"] += 1
+                self.stats.incr("filtered_out")
                 continue
             if self._push_item(processed_item):
                 matched_count += 1
@@ -231,7 +249,7 @@ class CrawlerHistoryAlertsMixin:
             self._fallback_allowed_pairs = allowed_pairs
             self._fallback_prefill_complexes = prefill_complexes
             self._fallback_prefill_processed_target_pairs = prefill_pairs
-            self.stats["fallback_trigger_count"] = int(self.stats.get("fallback_trigger_count", 0)) + 1
+            self.stats.incr("fallback_trigger_count")
             self.stats["fallback_last_reason"] = str(reason or "unknown_error")
             self.emit_stats()
             self.engine_name = "selenium"
@@ -242,25 +260,111 @@ class CrawlerHistoryAlertsMixin:
             self._fallback_prefill_processed_target_pairs = original_prefill_pairs
             self.engine_name = original_engine
 
-    def _get_history_state_map(self, complex_id, trade_type, asset_type="APT"):
-        trade_token = str(trade_type or "").strip()
-        key = (str(asset_type or "APT"), str(complex_id or ""), trade_token or "*")
-        if key in self._history_state_cache:
-            return self._history_state_cache[key]
-        history_map = {}
-        if self.db and complex_id:
+    def _preload_history_index(self):
+        """대상 단지 전체의 이력 상태를 크롤 시작 시 한 번의 조회로 적재한다."""
+        if not self.db or not hasattr(self.db, "get_article_history_states"):
+            return 0
+        index = self.history_index
+        complex_ids = []
+        for _name, cid, _asset_type in self._iter_targets():
+            cid = str(cid or "").strip()
+            if cid and cid not in complex_ids and not index.is_loaded(("complex", cid)):
+                complex_ids.append(cid)
+        if not complex_ids:
+            return 0
+        loaded = self._load_history_states_for_complexes(complex_ids, context="선적재")
+        if loaded is None:
+            return 0
+        self._report_history_index_footprint()
+        self.log(
+            f"📚 이력 인덱스 선적재: 단지 {len(complex_ids)}곳, 매물 {loaded}건 "
+            f"(약 {int(self.stats.get('history_index_bytes', 0)) // 1024}KB)",
+            10,
+        )
+        return loaded
+
+    def _load_history_states_for_complexes(self, complex_ids, *, context="로드"):
+        """여러 단지의 이력 상태를 한 번의 조회로 적재한다. 실패하면 None을 반환한다."""
+        try:
+            rows = self.db.get_article_history_states(complex_ids)
+        except Exception as e:
+            self.log(f"   ⚠️ 이력 상태 {context} 실패: {e}", 30)
+            return None
+        if not isinstance(rows, list):
+            return None
+        index = self.history_index
+        loaded = index.load_rows(rows)
+        for cid in complex_ids:
+            index.mark_loaded(("complex", cid))
+        return loaded
+
+    def _ensure_history_scope_loaded(self, complex_id, trade_type, asset_type="APT"):
+        """선적재되지 않은 단지(지도 탐색 발견 단지 등)의 이력 상태를 필요 시점에 적재한다."""
+        index = self.history_index
+        cid = str(complex_id or "").strip()
+        if not cid or not self.db or index.is_loaded(("complex", cid)):
+            return
+        scope_load_key = ("scope", *index.scope_key(asset_type, cid, trade_type))
+        if index.is_loaded(scope_load_key):
+            return
+        if hasattr(self.db, "get_article_history_states"):
             try:
-                history_map = self.db.get_article_history_state_bulk(
-                    complex_id,
-                    trade_type=trade_token or None,
-                    asset_type=asset_type,
-                )
+                rows = self.db.get_article_history_states([cid])
             except Exception as e:
                 self.log(f"   ⚠️ 이력 상태 로드 실패: {e}", 30)
-        self._history_state_cache[key] = history_map or {}
-        return self._history_state_cache[key]
+                rows = None
+            if isinstance(rows, list):
+                index.load_rows(rows)
+                index.mark_loaded(("complex", cid))
+                self.stats["history_index_size"] = len(index)
+                return
+        trade_token = str(trade_type or "").strip()
+        state_map = {}
+        try:
+            state_map = self.db.get_article_history_state_bulk(
+                cid,
+                trade_type=trade_token or None,
+                asset_type=asset_type,
+            )
+        except Exception as e:
+            self.log(f"   ⚠️ 이력 상태 로드 실패: {e}", 30)
+        index.load_state_map(asset_type, cid, trade_token, state_map or {})
+        index.mark_loaded(scope_load_key)
+        self.stats["history_index_size"] = len(index)
 
-    def _get_alert_rules(self, complex_id, trade_type, asset_type=""):
+    def _warm_history_index_for_cache_hit(self, cached_items, trade_type, asset_type="APT"):
+        """캐시 히트 매물에 등장하는 단지의 이력 상태를 처리 전에 한 번에 적재한다.
+
+        이력 비교 대상(단지ID·매물ID가 있는 매물)이 없으면 DB를 조회하지 않는다.
+        """
+        if not self.db:
+            return 0
+        index = self.history_index
+        complex_ids = []
+        for item in cached_items or ():
+            if not isinstance(item, dict) or not item.get("매물ID"):
+                continue
+            cid = str(item.get("단지ID", "") or "").strip()
+            if cid and cid not in complex_ids and not index.is_loaded(("complex", cid)):
+                complex_ids.append(cid)
+        if not complex_ids:
+            return 0
+        loaded = None
+        if hasattr(self.db, "get_article_history_states"):
+            loaded = self._load_history_states_for_complexes(complex_ids)
+        if loaded is None:
+            for cid in complex_ids:
+                self._ensure_history_scope_loaded(cid, trade_type, asset_type)
+        self.stats.incr("history_index_cache_warm_count")
+        self._report_history_index_footprint()
+        return len(complex_ids)
+
+    def _report_history_index_footprint(self):
+        index = self.history_index
+        self.stats["history_index_size"] = len(index)
+        self.stats["history_index_bytes"] = index.memory_bytes()
+
+    def _get_alert_rule_index(self, complex_id, trade_type, asset_type=""):
         key = self._cache_key(complex_id, trade_type, asset_type)
         if key in self._alert_rules_cache:
             return self._alert_rules_cache[key]
@@ -270,7 +374,7 @@ class CrawlerHistoryAlertsMixin:
                 rules = self.db.get_enabled_alert_rules(complex_id, trade_type, asset_type=asset_type)
             except Exception as e:
                 self.log(f"   ⚠️ 알림 룰 로드 실패: {e}", 30)
-        self._alert_rules_cache[key] = rules or []
+        self._alert_rules_cache[key] = AlertRuleIndex.from_rows(rules or [], getter=self._row_get)
         return self._alert_rules_cache[key]
 
     def _flush_history_updates_fallback(self, rows):
@@ -317,6 +421,10 @@ class CrawlerHistoryAlertsMixin:
         )
 
     def _flush_history_updates(self, force=False):
+        if self._pending_alert_notifications and (
+            force or len(self._pending_alert_notifications) >= self.history_batch_size
+        ):
+            self._flush_alert_notifications()
         if not self._pending_history_rows:
             return 0
         if not force and len(self._pending_history_rows) < self.history_batch_size:
@@ -325,6 +433,11 @@ class CrawlerHistoryAlertsMixin:
         self._pending_history_rows.clear()
         if not self.db:
             return 0
+        if self._submit_db_write("history", rows):
+            return len(rows)
+        return self._write_history_rows(rows)
+
+    def _write_history_rows(self, rows):
         if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
             self._notify_db_write_disabled()
             return 0
@@ -348,71 +461,31 @@ class CrawlerHistoryAlertsMixin:
         return self._flush_history_updates_fallback(rows)
 
     def _enrich_item_with_history_and_alerts(self, data):
-        if not isinstance(data, dict):
+        if not isinstance(data, (dict, ListingRecord)):
             return data
 
-        def _representative_price_value(price_text: str, current_trade_type: str, fallback: int = 0) -> int:
-            raw = str(price_text or "").strip()
-            fallback_value = int(fallback or 0)
-            if not raw:
-                return fallback_value
-            if current_trade_type == "월세":
-                deposit_text = raw
-                monthly_text = ""
-                if "/" in raw:
-                    deposit_text, monthly_text = raw.split("/", 1)
-                monthly_value = PriceConverter.to_int(monthly_text)
-                if monthly_value > 0:
-                    return monthly_value
-                deposit_value = PriceConverter.to_int(deposit_text)
-                if deposit_value > 0:
-                    return deposit_value
-                return fallback_value
-            price_value = PriceConverter.to_int(raw)
-            return price_value if price_value > 0 else fallback_value
-
-        trade_type = str(data.get("거래유형", "") or "")
-        complex_id = str(data.get("단지ID", "") or "")
-        article_id = str(data.get("매물ID", "") or "")
-        complex_name = str(data.get("단지명", "") or "")
-
-        if trade_type == "매매":
-            price_text = str(data.get("매매가", "") or "")
-        elif trade_type == "전세":
-            price_text = str(data.get("보증금", "") or "")
-        else:
-            deposit = str(data.get("보증금", "") or "")
-            monthly = str(data.get("월세", "") or "")
-            price_text = f"{deposit}/{monthly}" if monthly else deposit
-        price_int = _representative_price_value(price_text, trade_type)
-        asset_type = str(data.get("자산유형", "APT") or "APT").strip().upper() or "APT"
+        # dict로 들어온 경우에도 가격/면적은 여기서 한 번만 파싱한다.
+        listing = ListingRecord.from_item(data)
+        trade_type = listing.trade_type
+        complex_id = listing.complex_id
+        article_id = listing.article_id
+        complex_name = listing.complex_name
+        price_text = listing.price_text
+        price_int = listing.representative_price
+        asset_type = listing.asset_type
         if asset_type not in {"APT", "VL"}:
             asset_type = "APT"
-
-        area_pyeong = 0.0
-        try:
-            area_pyeong = float(data.get("면적(평)", 0) or 0)
-        except (TypeError, ValueError):
-            area_pyeong = 0.0
+        area_pyeong = listing.area_pyeong
 
         is_new = False
         raw_price_change = 0
         if article_id and complex_id and price_int > 0:
-            history_map = self._get_history_state_map(complex_id, trade_type, asset_type)
-            prev = history_map.get(article_id)
-            prev_price = int(self._row_get(prev, "price", 0) or 0)
-            prev_price_text = str(self._row_get(prev, "price_text", "") or "")
-            prev_comparable_price = _representative_price_value(prev_price_text, trade_type, fallback=prev_price)
-            is_new = prev is None
+            self._ensure_history_scope_loaded(complex_id, trade_type, asset_type)
+            prev_price = self.history_index.lookup(asset_type, complex_id, trade_type, article_id)
+            is_new = prev_price is None
+            prev_comparable_price = int(prev_price or 0)
             raw_price_change = 0 if is_new else price_int - prev_comparable_price
-
-            history_map[article_id] = {
-                "price": price_int,
-                "price_text": price_text,
-                "status": "active",
-                "last_price": prev_comparable_price if prev_comparable_price > 0 else price_int,
-                "price_change": raw_price_change,
-            }
+            self.history_index.record(asset_type, complex_id, trade_type, article_id, price_int)
 
             self._pending_history_rows.append(
                 {
@@ -450,11 +523,11 @@ class CrawlerHistoryAlertsMixin:
         if self.price_change_threshold > 0 and abs(price_change) < self.price_change_threshold:
             price_change = 0
         if is_new:
-            self.stats["new_count"] = int(self.stats.get("new_count", 0)) + 1
+            self.stats.incr("new_count")
         if price_change > 0:
-            self.stats["price_up"] = int(self.stats.get("price_up", 0)) + 1
+            self.stats.incr("price_up")
         elif price_change < 0:
-            self.stats["price_down"] = int(self.stats.get("price_down", 0)) + 1
+            self.stats.incr("price_down")
 
         visible_is_new = bool(is_new) if self.show_new_badge else False
         visible_price_change = int(price_change) if self.show_price_change else 0
@@ -465,47 +538,197 @@ class CrawlerHistoryAlertsMixin:
         data["가격변동"] = visible_price_change
 
         if complex_id and trade_type and area_pyeong > 0 and price_int > 0:
-            rules = self._get_alert_rules(complex_id, trade_type, asset_type)
-            for rule in rules:
-                area_min = float(self._row_get(rule, "area_min", 0) or 0)
-                area_max = float(self._row_get(rule, "area_max", 999999) or 999999)
-                price_min = int(self._row_get(rule, "price_min", 0) or 0)
-                price_max = int(self._row_get(rule, "price_max", 999999999) or 999999999)
-                if not (area_min <= area_pyeong <= area_max):
-                    continue
-                if not (price_min <= price_int <= price_max):
-                    continue
-                alert_id = int(self._row_get(rule, "id", 0) or 0)
-                alert_name = str(self._row_get(rule, "complex_name", complex_name) or complex_name)
-                should_emit = True
+            rule_index = self._get_alert_rule_index(complex_id, trade_type, asset_type)
+            for rule in rule_index.match(float(area_pyeong), price_int):
+                alert_id = rule.alert_id
+                alert_name = str(rule.complex_name or complex_name)
+                alert_args = (alert_name, trade_type, price_text, float(area_pyeong), alert_id)
                 if alert_id > 0 and article_id:
                     if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
-                        should_emit = True
-                    else:
-                        try:
-                            should_emit = bool(
-                                self.db.record_alert_notification(
-                                    alert_id=alert_id,
-                                    article_id=article_id,
-                                    complex_id=complex_id,
-                                    asset_type=asset_type,
-                                )
-                            )
-                        except Exception as e:
-                            should_emit = True
-                            self.log(f"   ⚠️ 알림 dedup 기록 실패 (emit 유지): {e}", 30)
-                elif alert_id > 0 and not article_id:
-                    self.log("   ℹ️ 매물ID 없음: 알림 dedup 생략", 10)
-
-                if not should_emit:
+                        self.alert_triggered_signal.emit(*alert_args)
+                        continue
+                    # 배치 flush 시 dedup 기록 후 신규 알림만 emit한다.
+                    self._pending_alert_notifications.append(
+                        {
+                            "alert_id": alert_id,
+                            "article_id": article_id,
+                            "complex_id": complex_id,
+                            "asset_type": asset_type,
+                            "emit_args": alert_args,
+                        }
+                    )
                     continue
-                self.alert_triggered_signal.emit(
-                    alert_name,
-                    trade_type,
-                    price_text,
-                    float(area_pyeong),
-                    alert_id,
-                )
+                if alert_id > 0 and not article_id:
+                    self.log("   ℹ️ 매물ID 없음: 알림 dedup 생략", 10)
+                self.alert_triggered_signal.emit(*alert_args)
 
         return data
-    
+
+    def _flush_alert_notifications(self):
+        pending = self._pending_alert_notifications
+        if not pending:
+            return 0
+        notifications = list(pending)
+        pending.clear()
+        if not self._submit_db_write("alerts", notifications):
+            self._write_alert_notifications(notifications)
+        return len(notifications)
+
+    def _write_alert_notifications(self, notifications):
+        """배치 단위로 alert log dedup을 기록하고 신규 알림만 원래 순서대로 emit한다."""
+        if not notifications:
+            return 0
+        if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
+            for notification in notifications:
+                self.alert_triggered_signal.emit(*notification["emit_args"])
+            return len(notifications)
+        rows = [
+            (n["alert_id"], n["article_id"], n["complex_id"], n["asset_type"])
+            for n in notifications
+        ]
+        flags = None
+        try:
+            bulk = getattr(self.db, "record_alert_notifications_bulk", None)
+            if callable(bulk):
+                result = bulk(rows)
+                if isinstance(result, (list, tuple)) and len(result) == len(rows):
+                    flags = [bool(x) for x in result]
+            if flags is None:
+                flags = [
+                    bool(
+                        self.db.record_alert_notification(
+                            alert_id=alert_id,
+                            article_id=article_id,
+                            complex_id=cid,
+                            asset_type=asset_type,
+                        )
+                    )
+                    for alert_id, article_id, cid, asset_type in rows
+                ]
+        except Exception as e:
+            flags = [True] * len(rows)
+            self.log(f"   ⚠️ 알림 dedup 기록 실패 (emit 유지): {e}", 30)
+        return self._emit_alert_notifications(notifications, flags)
+
+    def _emit_alert_notifications(self, notifications, flags):
+        emitted = 0
+        for notification, should_emit in zip(notifications, flags):
+            if should_emit:
+                self.alert_triggered_signal.emit(*notification["emit_args"])
+                emitted += 1
+        return emitted
+
+    def _start_db_writer(self):
+        if not self.db or getattr(self, "_db_writer", None) is not None:
+            return
+        writer = DbWriteBehind(
+            self._apply_db_write_batch,
+            on_error=lambda e: self.log(f"   ⚠️ DB 백그라운드 쓰기 실패: {e}", 30),
+        )
+        writer.start()
+        self._db_writer = writer
+
+    def _stop_db_writer(self):
+        writer = getattr(self, "_db_writer", None)
+        if writer is None:
+            return
+        if not writer.close(timeout=60):
+            self.log("⚠️ DB 백그라운드 쓰기 종료 대기 시간 초과", 30)
+        self._sync_db_writer_stats(writer)
+        self._db_writer = None
+
+    def _db_write_barrier(self):
+        writer = getattr(self, "_db_writer", None)
+        if writer is None:
+            return
+        if not writer.flush(timeout=DB_WRITE_FLUSH_TIMEOUT_SEC):
+            self.log(
+                f"⚠️ DB 백그라운드 쓰기 반영 대기 시간 초과 ({DB_WRITE_FLUSH_TIMEOUT_SEC}s), 대기 중인 쓰기 없이 진행",
+                30,
+            )
+        self._sync_db_writer_stats(writer)
+
+    def _submit_db_write(self, kind, payload) -> bool:
+        writer = getattr(self, "_db_writer", None)
+        if writer is None or not writer.is_running:
+            return False
+        writer.submit(kind, payload)
+        self._sync_db_writer_stats(writer)
+        return True
+
+    def _sync_db_writer_stats(self, writer):
+        self.stats.update(writer.snapshot())
+
+    def _apply_db_write_batch(self, batch):
+        """writer 스레드에서 호출된다. 꺼낸 작업 전체를 한 트랜잭션으로 기록한다.
+
+        DB가 묶음 쓰기를 지원하지 않거나 실패하면 종류별 개별 쓰기로 되돌아간다.
+        """
+        history_rows = []
+        discovered = {}
+        alerts = []
+        crawl_rows = []
+        for kind, payload in batch:
+            if kind == "history":
+                history_rows.extend(payload)
+            elif kind == "discovered_complexes":
+                discovered.update(payload)
+            elif kind == "alerts":
+                alerts.extend(payload)
+            elif kind == "crawl_history":
+                crawl_rows.append(payload)
+        if not (history_rows or discovered or alerts or crawl_rows):
+            return
+        if self._apply_db_write_batch_in_transaction(history_rows, discovered, alerts, crawl_rows):
+            return
+        if history_rows:
+            self._write_history_rows(history_rows)
+        if discovered:
+            saved = self._write_discovered_complexes(discovered)
+            self.log(f"   geo discovered complexes registered: {saved}", 10)
+        if alerts:
+            self._write_alert_notifications(alerts)
+        for args, kwargs in crawl_rows:
+            self._write_crawl_history(args, kwargs)
+
+    def _apply_db_write_batch_in_transaction(self, history_rows, discovered, alerts, crawl_rows) -> bool:
+        apply_batch = getattr(self.db, "apply_crawl_write_batch", None)
+        if not callable(apply_batch):
+            return False
+        if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
+            return False
+        complexes = [
+            (
+                str(payload.get("complex_name", "") or ""),
+                str(payload.get("complex_id", "") or ""),
+                str(payload.get("asset_type", "APT") or "APT").upper(),
+            )
+            for payload in discovered.values()
+        ]
+        alert_rows = [
+            (n["alert_id"], n["article_id"], n["complex_id"], n["asset_type"])
+            for n in alerts
+        ]
+        try:
+            result = apply_batch(
+                history_rows=history_rows,
+                complexes=complexes,
+                alert_rows=alert_rows,
+                crawl_rows=crawl_rows,
+            )
+        except Exception as e:
+            self.log(f"   ⚠️ DB 묶음 쓰기 실패: {e} (종류별 재시도)", 30)
+            return False
+        if not isinstance(result, dict):
+            if hasattr(self.db, "is_write_disabled") and self.db.is_write_disabled():
+                self._notify_db_write_disabled()
+            return False
+        if discovered:
+            saved = self._publish_discovered_complex_statuses(discovered, list(result.get("complex_statuses") or []))
+            self.log(f"   geo discovered complexes registered: {saved}", 10)
+        if alerts:
+            flags = [bool(x) for x in result.get("alert_flags") or []]
+            if len(flags) != len(alerts):
+                flags = [True] * len(alerts)
+            self._emit_alert_notifications(alerts, flags)
+        return True
@@ -59,6 +59,8 @@ class CrawlerSeleniumFlowMixin:
         self._engine = None
         try:
             self.log("🚀 크롤링 시작...")
+            self._start_db_writer()
+            self._preload_history_index()
             self._engine = self._create_engine()
             self._engine.run()
             self._flush_pending_items_if_needed(force=True)
@@ -73,11 +75,14 @@ class CrawlerSeleniumFlowMixin:
         finally:
             self._flush_pending_items_if_needed(force=True)
             self._flush_history_updates(force=True)
+            self._stop_db_writer()
+            self._report_history_index_footprint()
             if self._engine is not None:
                 try:
                     self._engine.close()
                 except Exception as e:
                     self.log(f"⚠️ 엔진 종료 중 오류: {e}", 30)
+            self.emit_stats(force=True)
             self.finished_signal.emit(self.collected_data)
 
     def _run_selenium_loop(self):
@@ -271,16 +276,17 @@ class CrawlerSeleniumFlowMixin:
             if cached_items is not None:
                 self.log(f"   💾 캐시 히트! {len(cached_items)}건 로드")
                 self.stats["cache_hits"] = self.stats.get("cache_hits", 0) + 1
+                self._warm_history_index_for_cache_hit(cached_items, ttype, asset_token)
                 matched_count = 0
                 for raw_item in cached_items:
                     if not isinstance(raw_item, dict):
                         continue
-                    processed_item = self._enrich_item_with_history_and_alerts(dict(raw_item))
+                    processed_item = self._enrich_item_with_history_and_alerts(ListingRecord(raw_item))
                     if self._check_filters(processed_item, ttype):
                         if self._push_item(processed_item):
                             matched_count += 1
                     else:
-                        self.stats["filtered_out"] += 1
+                        self.stats.incr("filtered_out")
                 self._flush_history_updates(force=True)
                 self._flush_pending_items_if_needed(force=True)
                 return {"count": matched_count, "cache_hit": True, "raw_count": len(cached_items)}
@@ -311,11 +317,11 @@ class CrawlerSeleniumFlowMixin:
         blocked_detected = bool(parse_result.get("blocked_detected", False))
 
         if response_seen:
-            self.stats["response_seen_count"] = int(self.stats.get("response_seen_count", 0)) + 1
+            self.stats.incr("response_seen_count")
         if parse_success:
-            self.stats["parse_success_count"] = int(self.stats.get("parse_success_count", 0)) + 1
+            self.stats.incr("parse_success_count")
         elif response_seen:
-            self.stats["parse_fail_count"] = int(self.stats.get("parse_fail_count", 0)) + 1
+            self.stats.incr("parse_fail_count")
 
         if blocked_detected:
             blocked_state = self._record_blocked_event(name, cid, ttype, asset_type=asset_token)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.core.crawler import *  # noqa: F403
@@ -35,6 +35,9 @@ class CrawlerStateRuntimeMixin:
         fallback_engine_enabled=True,
         playwright_headless=False,
         playwright_detail_workers=12,
+        playwright_target_workers=1,
+        detail_cache_ttl_hours=24,
+        geo_tile_cache_ttl_hours=12,
         block_heavy_resources=True,
         playwright_response_drain_timeout_ms=3000,
         playwright_navigation_timeout_ms=15000,
@@ -42,6 +45,8 @@ class CrawlerStateRuntimeMixin:
         playwright_article_api_timeout_ms=2500,
         playwright_article_response_wait_ms=1200,
         geo_incomplete_safety_mode=True,
+        playwright_fixture_mode="",
+        playwright_fixture_dir="",
     ):
         super().__init__()
         self.targets = targets
@@ -54,62 +59,7 @@ class CrawlerStateRuntimeMixin:
         self._running = True
         self.collected_data = []
         self.pending_items = []
-        self.stats = {
-            "total_found": 0,
-            "filtered_out": 0,
-            "cache_hits": 0,
-            "new_count": 0,
-            "price_up": 0,
-            "price_down": 0,
-            "geo_discovered_count": 0,
-            "geo_dedup_count": 0,
-            "geo_marker_switch_attempt_count": 0,
-            "geo_marker_switch_success_count": 0,
-            "geo_marker_switch_fail_count": 0,
-            "geo_marker_switch_last_method": "",
-            "geo_incomplete": False,
-            "geo_incomplete_count": 0,
-            "geo_incomplete_reasons": [],
-            "response_drain_wait_count": 0,
-            "response_drain_timeout_count": 0,
-            "response_seen_count": 0,
-            "parse_success_count": 0,
-            "parse_fail_count": 0,
-            "detail_fetch_total": 0,
-            "detail_fetch_success": 0,
-            "detail_success_count": 0,
-            "detail_fail_count": 0,
-            "detail_partial_count": 0,
-            "detail_missing_field_total": 0,
-            "detail_fetch_skipped_count": 0,
-            "blocked_page_count": 0,
-            "playwright_recycle_count": 0,
-            "playwright_last_recycle_reason": "",
-            "playwright_browser_source": "",
-            "playwright_browser_path": "",
-            "playwright_profile_dir": "",
-            "playwright_session_reused": 0,
-            "playwright_headed_fallback_used": 0,
-            "playwright_warmup_count": 0,
-            "playwright_last_entry_plan": "",
-            "playwright_last_final_url": "",
-            "playwright_last_page_title": "",
-            "playwright_last_block_reason": "",
-            "response_match_count": 0,
-            "capture_failed_count": 0,
-            "block_like_redirect_count": 0,
-            "article_api_fast_path_hit_count": 0,
-            "article_api_fast_path_fail_count": 0,
-            "article_api_fast_path_fallback_count": 0,
-            "article_api_last_status": "",
-            "detail_network_response_total": 0,
-            "detail_hydration_hit_count": 0,
-            "fallback_trigger_count": 0,
-            "fallback_last_reason": "",
-            "block_detect_count": 0,
-            "block_cooldown_count": 0,
-            "by_trade_type": {"매매": 0, "전세": 0, "월세": 0},
-        }
+        self.stats = CrawlStats()
         self.start_time = None
         self.items_per_second = 0
         try:
@@ -153,6 +103,18 @@ class CrawlerStateRuntimeMixin:
             self.playwright_detail_workers = max(1, int(playwright_detail_workers))
         except (TypeError, ValueError):
             self.playwright_detail_workers = 12
+        try:
+            self.playwright_target_workers = min(PLAYWRIGHT_MAX_TARGET_WORKERS, max(1, int(playwright_target_workers)))
+        except (TypeError, ValueError):
+            self.playwright_target_workers = 1
+        try:
+            self.detail_cache_ttl_hours = max(0, int(detail_cache_ttl_hours))
+        except (TypeError, ValueError):
+            self.detail_cache_ttl_hours = 24
+        try:
+            self.geo_tile_cache_ttl_hours = max(0, int(geo_tile_cache_ttl_hours))
+        except (TypeError, ValueError):
+            self.geo_tile_cache_ttl_hours = 12
         self.block_heavy_resources = bool(block_heavy_resources)
         try:
             self.playwright_response_drain_timeout_ms = max(100, int(playwright_response_drain_timeout_ms))
@@ -172,14 +134,23 @@ class CrawlerStateRuntimeMixin:
         except (TypeError, ValueError):
             self.playwright_article_response_wait_ms = 1200
         self.geo_incomplete_safety_mode = bool(geo_incomplete_safety_mode)
+        self.playwright_fixture_mode = normalize_fixture_mode(playwright_fixture_mode)
+        self.playwright_fixture_dir = str(playwright_fixture_dir or "").strip()
         self.geo_incomplete = False
         self.geo_incomplete_reasons = []
         self.geo_incomplete_count = 0
         self._engine = None
         self._last_batch_flush_at = time.monotonic()
-        self._history_state_cache = {}
+        self.stats_emit_interval_ms = max(self.ui_batch_interval_ms, STATS_EMIT_INTERVAL_MS)
+        self._last_stats_emit_at = 0.0
+        self._stats_emit_pending = False
+        self.stats_emit_count = 0
+        self.history_index = ArticleHistoryIndex()
         self._alert_rules_cache = {}
         self._pending_history_rows = []
+        self._pending_alert_notifications = []
+        self.price_snapshot_aggregator = PriceSnapshotAggregator()
+        self._db_writer: Optional[DbWriteBehind] = None
         self._db_write_disabled_notified = False
         self._registered_discovered_complex_keys = set()
         self._discovered_complex_status = {}
@@ -341,6 +312,8 @@ class CrawlerStateRuntimeMixin:
             "marker_switch_fail": "marker switch fail",
             "marker_drain_timeout": "marker drain timeout",
             "geo_scan_failure": "geo scan failure",
+            "marker_tile_fail": "marker tile fail",
+            "marker_plan_budget": "marker plan budget",
         }
         token = str(reason or "").strip().lower()
         return mapping.get(token, token or "unknown")
@@ -353,7 +326,7 @@ class CrawlerStateRuntimeMixin:
         return not (self.crawl_mode == "geo_sweep" and self.geo_incomplete and self.geo_incomplete_safety_mode)
 
     def _item_dedupe_key(self, item):
-        if not isinstance(item, dict):
+        if not isinstance(item, (dict, ListingRecord)):
             return None
         asset_type = str(item.get("자산유형", "") or item.get("asset_type", "")).strip().upper() or "APT"
         article_id = str(item.get("매물ID", "") or item.get("article_id", "")).strip()
@@ -373,85 +346,57 @@ class CrawlerStateRuntimeMixin:
             if dedupe_key in self._seen_item_keys:
                 return False
             self._seen_item_keys.add(dedupe_key)
+        # 가격 스냅샷 통계는 수집과 동시에 누적해 크롤 종료 시 바로 저장할 수 있게 한다.
+        self.price_snapshot_aggregator.add_item(item)
+        if isinstance(item, ListingRecord):
+            # UI/캐시/내보내기는 dict를 기대하므로 파이프라인 경계에서 한 번 변환한다.
+            item = item.to_dict()
         self.collected_data.append(item)
         self.pending_items.append(item)
-        self.stats["total_found"] += 1
+        self.stats.incr("total_found")
         if self.emit_legacy_item_signal:
             self.item_signal.emit(item)
         self._flush_pending_items_if_needed()
         return True
 
+    def price_snapshot_rows(self) -> list[tuple]:
+        """이번 크롤에서 누적한 가격 스냅샷 행(``add_price_snapshots_bulk`` 형식)."""
+        return self.price_snapshot_aggregator.rows()
+
     def _flush_pending_items_if_needed(self, force=False):
         if not self.pending_items:
+            if self._stats_emit_pending:
+                # 보낼 항목이 없어도 간격 안에서 미뤄 둔 통계 변경은 이 flush 경로에서 내보낸다.
+                self.emit_stats(force=force)
             return
         elapsed_ms = (time.monotonic() - self._last_batch_flush_at) * 1000
         if force or len(self.pending_items) >= self.ui_batch_size or elapsed_ms >= self.ui_batch_interval_ms:
             batch = list(self.pending_items)
             self.pending_items.clear()
             self.items_signal.emit(batch)
-            self.emit_stats()
+            self.emit_stats(force=force)
             self._last_batch_flush_at = time.monotonic()
 
     def _build_stats_payload(self) -> dict:
-        return {
-            "total_found": self.stats.get("total_found", 0),
-            "filtered_out": self.stats.get("filtered_out", 0),
-            "cache_hits": self.stats.get("cache_hits", 0),
-            "new_count": self.stats.get("new_count", 0),
-            "price_up": self.stats.get("price_up", 0),
-            "price_down": self.stats.get("price_down", 0),
-            "geo_discovered_count": self.stats.get("geo_discovered_count", 0),
-            "geo_dedup_count": self.stats.get("geo_dedup_count", 0),
-            "geo_marker_switch_attempt_count": self.stats.get("geo_marker_switch_attempt_count", 0),
-            "geo_marker_switch_success_count": self.stats.get("geo_marker_switch_success_count", 0),
-            "geo_marker_switch_fail_count": self.stats.get("geo_marker_switch_fail_count", 0),
-            "geo_marker_switch_last_method": self.stats.get("geo_marker_switch_last_method", ""),
-            "geo_incomplete": bool(self.stats.get("geo_incomplete", False)),
-            "geo_incomplete_count": self.stats.get("geo_incomplete_count", 0),
-            "geo_incomplete_reasons": list(self.stats.get("geo_incomplete_reasons", [])),
-            "response_drain_wait_count": self.stats.get("response_drain_wait_count", 0),
-            "response_drain_timeout_count": self.stats.get("response_drain_timeout_count", 0),
-            "response_seen_count": self.stats.get("response_seen_count", 0),
-            "parse_success_count": self.stats.get("parse_success_count", 0),
-            "parse_fail_count": self.stats.get("parse_fail_count", 0),
-            "detail_fetch_total": self.stats.get("detail_fetch_total", 0),
-            "detail_fetch_success": self.stats.get("detail_fetch_success", 0),
-            "detail_success_count": self.stats.get("detail_success_count", 0),
-            "detail_fail_count": self.stats.get("detail_fail_count", 0),
-            "detail_partial_count": self.stats.get("detail_partial_count", 0),
-            "detail_missing_field_total": self.stats.get("detail_missing_field_total", 0),
-            "detail_fetch_skipped_count": self.stats.get("detail_fetch_skipped_count", 0),
-            "blocked_page_count": self.stats.get("blocked_page_count", 0),
-            "playwright_recycle_count": self.stats.get("playwright_recycle_count", 0),
-            "playwright_last_recycle_reason": self.stats.get("playwright_last_recycle_reason", ""),
-            "playwright_browser_source": self.stats.get("playwright_browser_source", ""),
-            "playwright_browser_path": self.stats.get("playwright_browser_path", ""),
-            "playwright_profile_dir": self.stats.get("playwright_profile_dir", ""),
-            "playwright_session_reused": self.stats.get("playwright_session_reused", 0),
-            "playwright_headed_fallback_used": self.stats.get("playwright_headed_fallback_used", 0),
-            "playwright_warmup_count": self.stats.get("playwright_warmup_count", 0),
-            "playwright_last_entry_plan": self.stats.get("playwright_last_entry_plan", ""),
-            "playwright_last_final_url": self.stats.get("playwright_last_final_url", ""),
-            "playwright_last_page_title": self.stats.get("playwright_last_page_title", ""),
-            "playwright_last_block_reason": self.stats.get("playwright_last_block_reason", ""),
-            "response_match_count": self.stats.get("response_match_count", 0),
-            "capture_failed_count": self.stats.get("capture_failed_count", 0),
-            "block_like_redirect_count": self.stats.get("block_like_redirect_count", 0),
-            "article_api_fast_path_hit_count": self.stats.get("article_api_fast_path_hit_count", 0),
-            "article_api_fast_path_fail_count": self.stats.get("article_api_fast_path_fail_count", 0),
-            "article_api_fast_path_fallback_count": self.stats.get("article_api_fast_path_fallback_count", 0),
-            "article_api_last_status": self.stats.get("article_api_last_status", ""),
-            "detail_network_response_total": self.stats.get("detail_network_response_total", 0),
-            "detail_hydration_hit_count": self.stats.get("detail_hydration_hit_count", 0),
-            "fallback_trigger_count": self.stats.get("fallback_trigger_count", 0),
-            "fallback_last_reason": self.stats.get("fallback_last_reason", ""),
-            "block_detect_count": self.stats.get("block_detect_count", 0),
-            "block_cooldown_count": self.stats.get("block_cooldown_count", 0),
-            "by_trade_type": dict(self.stats.get("by_trade_type", {})),
-        }
-
-    def emit_stats(self):
-        self.stats_signal.emit(self._build_stats_payload())
+        return self.stats.snapshot()
+
+    def emit_stats(self, force=False):
+        """바뀐 통계만 모아 ``stats_signal`` 로 보낸다.
+
+        ``stats_emit_interval_ms`` 안에 다시 불리면 보내지 않고 ``_stats_emit_pending`` 만 세워 두며,
+        다음 호출이나 ``_flush_pending_items_if_needed`` (항목이 없을 때 포함, 종료 시점은
+        ``force=True``)에서 그동안의 변경을 한 번에 보낸다.
+        """
+        now = time.monotonic()
+        if not force and (now - self._last_stats_emit_at) * 1000 < self.stats_emit_interval_ms:
+            self._stats_emit_pending = True
+            return
+        self._last_stats_emit_at = now
+        self._stats_emit_pending = False
+        delta = self.stats.take_delta()
+        if delta:
+            self.stats_emit_count += 1
+            self.stats_signal.emit(delta)
 
     @staticmethod
     def _row_get(row, key, default=None):
@@ -486,7 +431,7 @@ class CrawlerStateRuntimeMixin:
         streak = int(self._blocked_pair_streaks.get(key, 0) or 0) + 1
         self._blocked_pair_streaks[key] = streak
         self._blocked_total_count = int(self._blocked_total_count) + 1
-        self.stats["blocked_page_count"] = int(self.stats.get("blocked_page_count", 0)) + 1
+        self.stats.incr("blocked_page_count")
 
         pair_cooldown_started = False
         cooldown_seconds = 0
@@ -529,14 +474,14 @@ class CrawlerStateRuntimeMixin:
         return False
 
     def _register_block_detection(self, reason: str = "") -> bool:
-        self.stats["block_detect_count"] = int(self.stats.get("block_detect_count", 0)) + 1
+        self.stats.incr("block_detect_count")
         self._consecutive_block_detect_count += 1
         if reason:
             self.log(f"   ⚠️ 차단 신호 누적 {self._consecutive_block_detect_count}/{self._block_cooldown_threshold}: {reason}", 30)
         if self._consecutive_block_detect_count < int(self._block_cooldown_threshold):
             return False
         self._consecutive_block_detect_count = 0
-        self.stats["block_cooldown_count"] = int(self.stats.get("block_cooldown_count", 0)) + 1
+        self.stats.incr("block_cooldown_count")
         return True
 
     def _reset_block_detection_streak(self):
@@ -1,14 +1,17 @@
+import json
 import re
 import sqlite3
 import os
 from pathlib import Path
 from queue import Queue, Empty, Full
 from threading import Lock, Condition
+import threading
 import time
 import shutil
 from src.utils.paths import DB_PATH
 from src.utils.logger import get_logger
 from src.utils.helpers import DateTimeHelper, PriceConverter
+from src.core.services.price_snapshots import build_price_snapshot_rows_from_history
 
 logger = get_logger("DB")
 
@@ -21,7 +24,9 @@ from src.core.database_parts.complex_group_ops import ComplexDatabaseComplexGrou
 from src.core.database_parts.crawl_snapshot_ops import ComplexDatabaseCrawlSnapshotOpsMixin
 from src.core.database_parts.article_ops import ComplexDatabaseArticleOpsMixin
 from src.core.database_parts.alert_ops import ComplexDatabaseAlertOpsMixin
+from src.core.database_parts.geo_tile_ops import ComplexDatabaseGeoTileOpsMixin
 from src.core.database_parts.backup_restore_ops import ComplexDatabaseBackupRestoreOpsMixin
+from src.core.database_parts.write_batch_ops import ComplexDatabaseWriteBatchOpsMixin
 
 
 class ComplexDatabase(
@@ -31,7 +36,9 @@ class ComplexDatabase(
     ComplexDatabaseCrawlSnapshotOpsMixin,
     ComplexDatabaseArticleOpsMixin,
     ComplexDatabaseAlertOpsMixin,
+    ComplexDatabaseGeoTileOpsMixin,
     ComplexDatabaseBackupRestoreOpsMixin,
+    ComplexDatabaseWriteBatchOpsMixin,
 ):
     _NUMERIC_RE = re.compile(r"-?\d+(?:\.\d+)?")
     _RESTORE_REQUIRED_TABLES = (
@@ -57,7 +64,9 @@ rebind_inherited_methods(
         ComplexDatabaseCrawlSnapshotOpsMixin,
         ComplexDatabaseArticleOpsMixin,
         ComplexDatabaseAlertOpsMixin,
+        ComplexDatabaseGeoTileOpsMixin,
         ComplexDatabaseBackupRestoreOpsMixin,
+        ComplexDatabaseWriteBatchOpsMixin,
     ],
     globals_dict=globals(),
 )
\ No newline at end of file
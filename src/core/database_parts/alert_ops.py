@@ -113,6 +113,96 @@ class ComplexDatabaseAlertOpsMixin:
         finally:
             self._pool.return_connection(conn)
 
+    _ALERT_LOG_INSERT_CHUNK = 150
+
+    def record_alert_notifications_bulk(self, rows, notified_on=None) -> list[bool]:
+        """Record many alert notifications in one transaction.
+
+        ``rows`` are ``(alert_id, article_id, complex_id, asset_type)`` tuples. The
+        returned flags align with ``rows``: True only for rows that were newly logged
+        (a key repeated inside the batch is True on its first occurrence only).
+        """
+        rows = list(rows or [])
+        conn = self._pool.get_connection()
+        try:
+            results = self._insert_alert_log_rows(conn.cursor(), rows, notified_on)
+            conn.commit()
+            return results
+        except Exception as e:
+            logger.error(f"alert dedupe bulk record failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return [False] * len(rows)
+        finally:
+            self._pool.return_connection(conn)
+
+    def _insert_alert_log_rows(self, c, rows: list, notified_on=None) -> list[bool]:
+        """``record_alert_notifications_bulk`` 의 INSERT 부분. 커밋은 호출자 몫이다."""
+        results = [False] * len(rows)
+        first_index: dict[tuple[int, str, str, str], int] = {}
+        for idx, row in enumerate(rows):
+            try:
+                alert_id, article_id, complex_id, asset_type = row
+                alert_id = int(alert_id or 0)
+            except (TypeError, ValueError):
+                continue
+            article_id = str(article_id or "").strip()
+            complex_id = str(complex_id or "").strip()
+            if alert_id <= 0 or not article_id or not complex_id:
+                continue
+            asset_scope = self._normalize_alert_asset_scope(asset_type, default="ALL")
+            first_index.setdefault((alert_id, article_id, complex_id, asset_scope), idx)
+        if not first_index:
+            return results
+
+        notified_token = str(notified_on).strip() if notified_on else ""
+        date_sql = "?" if notified_token else "CURRENT_DATE"
+        row_sql = f"(?, ?, ?, ?, {date_sql}, CURRENT_TIMESTAMP)"
+        keys = list(first_index)
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            chunk_size = self._ALERT_LOG_INSERT_CHUNK
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                params = []
+                for key in chunk:
+                    params.extend(key)
+                    if notified_token:
+                        params.append(notified_token)
+                inserted = c.execute(
+                    f"""
+                    INSERT INTO article_alert_log (
+                        alert_id, article_id, complex_id, asset_type, notified_on, created_at
+                    )
+                    VALUES {",".join(row_sql for _ in chunk)}
+                    ON CONFLICT(alert_id, article_id, complex_id, asset_type, notified_on) DO NOTHING
+                    RETURNING alert_id, article_id, complex_id, asset_type
+                    """,
+                    params,
+                ).fetchall()
+                for row in inserted:
+                    key = (int(row[0]), str(row[1]), str(row[2]), str(row[3]))
+                    if key in first_index:
+                        results[first_index[key]] = True
+        else:
+            # RETURNING 미지원 SQLite: 같은 트랜잭션에서 행 단위 rowcount로 판정한다.
+            for key in keys:
+                params = (*key, notified_token) if notified_token else key
+                c.execute(
+                    f"""
+                    INSERT INTO article_alert_log (
+                        alert_id, article_id, complex_id, asset_type, notified_on, created_at
+                    )
+                    VALUES {row_sql}
+                    ON CONFLICT(alert_id, article_id, complex_id, asset_type, notified_on) DO NOTHING
+                    """,
+                    params,
+                )
+                if (c.rowcount or 0) > 0:
+                    results[first_index[key]] = True
+        return results
+
     def get_all_alert_settings(self):
         conn = self._pool.get_connection()
         try:
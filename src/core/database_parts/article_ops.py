@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from src.core.database_parts.article_parts.article_bulk_ops import ComplexDatabaseArticleBulkOpsMixin
 from src.core.database_parts.article_parts.article_history_ops import ComplexDatabaseArticleHistoryOpsMixin
+from src.core.database_parts.article_parts.detail_cache_ops import ComplexDatabaseDetailCacheOpsMixin
 from src.core.database_parts.article_parts.disappeared_ops import ComplexDatabaseDisappearedOpsMixin
 from src.core.database_parts.article_parts.favorite_ops import ComplexDatabaseFavoriteOpsMixin
 
@@ -11,5 +12,6 @@ class ComplexDatabaseArticleOpsMixin(
     ComplexDatabaseArticleBulkOpsMixin,
     ComplexDatabaseFavoriteOpsMixin,
     ComplexDatabaseDisappearedOpsMixin,
+    ComplexDatabaseDetailCacheOpsMixin,
 ):
     pass
@@ -17,12 +17,55 @@ class ComplexDatabaseArticleBulkOpsMixin:
     if TYPE_CHECKING:
         def __getattr__(self, name: str) -> Any: ...
 
-    def upsert_article_history_bulk(self, rows):
-        if not rows:
-            return 0
-        if self.is_write_disabled():
-            return 0
+    _ARTICLE_HISTORY_UPSERT_SQL = """
+        INSERT INTO article_history (
+            article_id, complex_id, complex_name, trade_type,
+            price, price_text, area_pyeong, floor_info, feature,
+            first_seen, last_seen, last_price, price_change, status,
+            asset_type, source_mode, source_lat, source_lon, source_zoom, marker_id,
+            broker_office, broker_name, broker_phone1, broker_phone2,
+            prev_jeonse_won, jeonse_period_years, jeonse_max_won, jeonse_min_won,
+            gap_amount_won, gap_ratio
+        ) VALUES (
+            :article_id, :complex_id, :complex_name, :trade_type,
+            :price, :price_text, :area_pyeong, :floor_info, :feature,
+            CURRENT_DATE, CURRENT_DATE, :last_price, 0, 'active',
+            :asset_type, :source_mode, :source_lat, :source_lon, :source_zoom, :marker_id,
+            :broker_office, :broker_name, :broker_phone1, :broker_phone2,
+            :prev_jeonse_won, :jeonse_period_years, :jeonse_max_won, :jeonse_min_won,
+            :gap_amount_won, :gap_ratio
+        )
+        ON CONFLICT(asset_type, article_id, complex_id) DO UPDATE SET
+            complex_name = excluded.complex_name,
+            trade_type = excluded.trade_type,
+            price = excluded.price,
+            price_text = excluded.price_text,
+            area_pyeong = excluded.area_pyeong,
+            floor_info = excluded.floor_info,
+            feature = excluded.feature,
+            asset_type = excluded.asset_type,
+            source_mode = excluded.source_mode,
+            source_lat = excluded.source_lat,
+            source_lon = excluded.source_lon,
+            source_zoom = excluded.source_zoom,
+            marker_id = excluded.marker_id,
+            broker_office = excluded.broker_office,
+            broker_name = excluded.broker_name,
+            broker_phone1 = excluded.broker_phone1,
+            broker_phone2 = excluded.broker_phone2,
+            prev_jeonse_won = excluded.prev_jeonse_won,
+            jeonse_period_years = excluded.jeonse_period_years,
+            jeonse_max_won = excluded.jeonse_max_won,
+            jeonse_min_won = excluded.jeonse_min_won,
+            gap_amount_won = excluded.gap_amount_won,
+            gap_ratio = excluded.gap_ratio,
+            last_seen = CURRENT_DATE,
+            last_price = article_history.price,
+            price_change = excluded.price - article_history.price,
+            status = 'active'
+    """
 
+    def _normalize_article_history_bulk_rows(self, rows) -> list[dict[str, Any]]:
         normalized = []
         for row in rows:
             if isinstance(row, dict):
@@ -102,7 +145,19 @@ class ComplexDatabaseArticleBulkOpsMixin:
             if not payload["article_id"] or not payload["complex_id"] or payload["price"] <= 0:
                 continue
             normalized.append(payload)
+        return normalized
+
+    @classmethod
+    def _execute_article_history_upsert(cls, c, normalized: list[dict[str, Any]]) -> None:
+        c.executemany(cls._ARTICLE_HISTORY_UPSERT_SQL, normalized)
+
+    def upsert_article_history_bulk(self, rows):
+        if not rows:
+            return 0
+        if self.is_write_disabled():
+            return 0
 
+        normalized = self._normalize_article_history_bulk_rows(rows)
         if not normalized:
             return 0
 
@@ -115,56 +170,7 @@ class ComplexDatabaseArticleBulkOpsMixin:
                     pass
                 for attempt in range(3):
                     try:
-                        conn.cursor().executemany(
-                            """
-                            INSERT INTO article_history (
-                                article_id, complex_id, complex_name, trade_type,
-                                price, price_text, area_pyeong, floor_info, feature,
-                                first_seen, last_seen, last_price, price_change, status,
-                                asset_type, source_mode, source_lat, source_lon, source_zoom, marker_id,
-                                broker_office, broker_name, broker_phone1, broker_phone2,
-                                prev_jeonse_won, jeonse_period_years, jeonse_max_won, jeonse_min_won,
-                                gap_amount_won, gap_ratio
-                            ) VALUES (
-                                :article_id, :complex_id, :complex_name, :trade_type,
-                                :price, :price_text, :area_pyeong, :floor_info, :feature,
-                                CURRENT_DATE, CURRENT_DATE, :last_price, 0, 'active',
-                                :asset_type, :source_mode, :source_lat, :source_lon, :source_zoom, :marker_id,
-                                :broker_office, :broker_name, :broker_phone1, :broker_phone2,
-                                :prev_jeonse_won, :jeonse_period_years, :jeonse_max_won, :jeonse_min_won,
-                                :gap_amount_won, :gap_ratio
-                            )
-                            ON CONFLICT(asset_type, article_id, complex_id) DO UPDATE SET
-                                complex_name = excluded.complex_name,
-                                trade_type = excluded.trade_type,
-                                price = excluded.price,
-                                price_text = excluded.price_text,
-                                area_pyeong = excluded.area_pyeong,
-                                floor_info = excluded.floor_info,
-                                feature = excluded.feature,
-                                asset_type = excluded.asset_type,
-                                source_mode = excluded.source_mode,
-                                source_lat = excluded.source_lat,
-                                source_lon = excluded.source_lon,
-                                source_zoom = excluded.source_zoom,
-                                marker_id = excluded.marker_id,
-                                broker_office = excluded.broker_office,
-                                broker_name = excluded.broker_name,
-                                broker_phone1 = excluded.broker_phone1,
-                                broker_phone2 = excluded.broker_phone2,
-                                prev_jeonse_won = excluded.prev_jeonse_won,
-                                jeonse_period_years = excluded.jeonse_period_years,
-                                jeonse_max_won = excluded.jeonse_max_won,
-                                jeonse_min_won = excluded.jeonse_min_won,
-                                gap_amount_won = excluded.gap_amount_won,
-                                gap_ratio = excluded.gap_ratio,
-                                last_seen = CURRENT_DATE,
-                                last_price = article_history.price,
-                                price_change = excluded.price - article_history.price,
-                                status = 'active'
-                            """,
-                            normalized,
-                        )
+                        self._execute_article_history_upsert(conn.cursor(), normalized)
                         conn.commit()
                         return len(normalized)
                     except sqlite3.OperationalError as e:
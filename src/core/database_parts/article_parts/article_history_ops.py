@@ -22,16 +22,16 @@ class ComplexDatabaseArticleHistoryOpsMixin:
         token = str(asset_type or "APT").strip().upper()
         return token if token in {"APT", "VL"} else "APT"
 
-    @classmethod
     def _asset_scope_where(
-        cls,
+        self,
         asset_type,
         *,
         column_name: str = "asset_type",
         include_legacy_empty_for_apt: bool = True,
     ) -> tuple[str, list[str]]:
-        token = cls._normalize_listing_asset_type(asset_type)
-        if include_legacy_empty_for_apt and token == "APT":
+        """자산유형 조건절. 빈 asset_type 보정이 끝난 DB에서는 인덱스를 타는 단순 동등 조건만 쓴다."""
+        token = self._normalize_listing_asset_type(asset_type)
+        if include_legacy_empty_for_apt and token == "APT" and self._legacy_asset_scope_predicates:
             return f"({column_name} = ? OR COALESCE({column_name}, '') = '')", [token]
         return f"{column_name} = ?", [token]
 
@@ -72,6 +72,52 @@ class ComplexDatabaseArticleHistoryOpsMixin:
         finally:
             self._pool.return_connection(conn)
 
+    _HISTORY_STATE_LOOKUP_CHUNK = 400
+
+    def get_article_history_states(self, complex_ids):
+        """여러 단지의 이력 상태를 한 번에 읽는다.
+
+        ``(asset_type, complex_id, trade_type, article_id, price, price_text)`` 튜플 목록을
+        반환하며 asset_type이 비어 있는 레거시 행은 APT로 정규화한다. 조회 실패 시 None.
+        """
+        ids = list(dict.fromkeys(str(cid).strip() for cid in (complex_ids or []) if str(cid or "").strip()))
+        if not ids:
+            return []
+        conn = self._pool.get_connection()
+        try:
+            c = conn.cursor()
+            result = []
+            chunk_size = self._HISTORY_STATE_LOOKUP_CHUNK
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                rows = c.execute(
+                    f"""
+                    SELECT asset_type, complex_id, trade_type, article_id, price, price_text
+                    FROM article_history
+                    WHERE complex_id IN ({",".join("?" for _ in chunk)})
+                    """,
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    if not row["article_id"]:
+                        continue
+                    result.append(
+                        (
+                            self._normalize_listing_asset_type(row["asset_type"]),
+                            str(row["complex_id"] or ""),
+                            str(row["trade_type"] or ""),
+                            str(row["article_id"]),
+                            int(row["price"] or 0),
+                            str(row["price_text"] or ""),
+                        )
+                    )
+            return result
+        except Exception as e:
+            logger.error(f"article history state preload failed: {e}")
+            return None
+        finally:
+            self._pool.return_connection(conn)
+
     def check_article_history(self, article_id, complex_id, current_price, asset_type=None):
         conn = self._pool.get_connection()
         try:
@@ -265,6 +311,44 @@ class ComplexDatabaseArticleHistoryOpsMixin:
         finally:
             self._pool.return_connection(conn)
 
+    def iter_article_history_rows(self, complex_id=None, asset_type=None, status=None, batch_size=1000):
+        """``article_history`` 행을 ``id`` 순으로 ``batch_size`` 개씩 읽어 하나씩 내보낸다.
+
+        배치마다 커넥션을 빌렸다가 바로 돌려주는 keyset 페이지네이션이라, 내보내기처럼 오래
+        걸리는 소비자가 있어도 풀 커넥션이나 읽기 트랜잭션을 붙잡고 있지 않는다.
+        """
+        where = ["id > ?"]
+        filter_params: list[Any] = []
+        if complex_id:
+            where.append("complex_id = ?")
+            filter_params.append(complex_id)
+        if asset_type:
+            asset_where, asset_params = self._asset_scope_where(asset_type)
+            where.append(asset_where)
+            filter_params.extend(asset_params)
+        if status:
+            where.append("status = ?")
+            filter_params.append(status)
+        sql = f"SELECT * FROM article_history WHERE {' AND '.join(where)} ORDER BY id LIMIT ?"
+        limit = max(1, int(batch_size or 1))
+        last_id = 0
+        while True:
+            conn = self._pool.get_connection()
+            try:
+                rows = conn.cursor().execute(sql, [last_id, *filter_params, limit]).fetchall()
+            except Exception as e:
+                logger.error(f"article history iteration failed: {e}")
+                return
+            finally:
+                self._pool.return_connection(conn)
+            if not rows:
+                return
+            for row in rows:
+                yield row
+            if len(rows) < limit:
+                return
+            last_id = int(rows[-1]["id"])
+
     def cleanup_old_articles(self, days=30, asset_type=None):
         conn = self._pool.get_connection()
         try:
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, TYPE_CHECKING
+
+from src.utils.logger import get_logger
+
+logger = get_logger("DB")
+
+if TYPE_CHECKING:
+    from src.core.database import *  # noqa: F403
+
+
+class ComplexDatabaseDetailCacheOpsMixin:
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    _DETAIL_CACHE_LOOKUP_CHUNK = 400
+
+    def get_article_detail_cache(self, keys, max_age_seconds=None):
+        """(asset_type, article_id) 목록에 대한 캐시된 상세정보를 반환한다.
+
+        반환값은 ``{(asset_type, article_id): (fingerprint, detail)}`` 형태이며
+        ``max_age_seconds`` 보다 오래된 항목은 제외된다.
+        """
+        grouped: dict[str, list[str]] = {}
+        for asset_type, article_id in keys or []:
+            article_token = str(article_id or "").strip()
+            if not article_token:
+                continue
+            asset_token = self._normalize_listing_asset_type(asset_type)
+            grouped.setdefault(asset_token, []).append(article_token)
+        if not grouped:
+            return {}
+
+        min_fetched_at = 0.0
+        if max_age_seconds is not None:
+            min_fetched_at = time.time() - max(0.0, float(max_age_seconds))
+
+        result = {}
+        conn = self._pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            chunk_size = self._DETAIL_CACHE_LOOKUP_CHUNK
+            for asset_token, article_ids in grouped.items():
+                unique_ids = list(dict.fromkeys(article_ids))
+                for start in range(0, len(unique_ids), chunk_size):
+                    chunk = unique_ids[start:start + chunk_size]
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows = cursor.execute(
+                        f"""
+                        SELECT article_id, fingerprint, detail_json
+                        FROM article_detail_cache
+                        WHERE asset_type = ?
+                          AND article_id IN ({placeholders})
+                          AND fetched_at >= ?
+                        """,
+                        (asset_token, *chunk, min_fetched_at),
+                    ).fetchall()
+                    for row in rows:
+                        try:
+                            detail = json.loads(row["detail_json"] or "{}")
+                        except (TypeError, ValueError):
+                            continue
+                        if not isinstance(detail, dict):
+                            continue
+                        result[(asset_token, str(row["article_id"]))] = (str(row["fingerprint"] or ""), detail)
+            return result
+        except Exception as e:
+            logger.error(f"article detail cache lookup failed: {e}")
+            return {}
+        finally:
+            self._pool.return_connection(conn)
+
+    def upsert_article_detail_cache(self, rows):
+        """``(asset_type, article_id, fingerprint, detail)`` 목록을 캐시에 저장한다."""
+        payload = []
+        fetched_at = time.time()
+        for asset_type, article_id, fingerprint, detail in rows or []:
+            article_token = str(article_id or "").strip()
+            if not article_token or not isinstance(detail, dict):
+                continue
+            try:
+                detail_json = json.dumps(detail, ensure_ascii=False)
+            except (TypeError, ValueError):
+                continue
+            payload.append(
+                (
+                    self._normalize_listing_asset_type(asset_type),
+                    article_token,
+                    str(fingerprint or ""),
+                    detail_json,
+                    fetched_at,
+                )
+            )
+        if not payload:
+            return 0
+        conn = self._pool.get_connection()
+        try:
+            conn.cursor().executemany(
+                """
+                INSERT INTO article_detail_cache
+                (asset_type, article_id, fingerprint, detail_json, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(asset_type, article_id) DO UPDATE SET
+                    fingerprint=excluded.fingerprint,
+                    detail_json=excluded.detail_json,
+                    fetched_at=excluded.fetched_at
+                """,
+                payload,
+            )
+            conn.commit()
+            return len(payload)
+        except Exception as e:
+            logger.error(f"article detail cache upsert failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
+        finally:
+            self._pool.return_connection(conn)
@@ -60,10 +60,7 @@ class ComplexDatabaseDisappearedOpsMixin:
                 pass
             self._pool.return_connection(conn)
 
-    def mark_disappeared_articles_for_targets(self, targets: list[tuple[str, ...]]) -> int:
-        if self.is_write_disabled():
-            return 0
-
+    def _normalize_disappeared_targets(self, targets) -> list[tuple[str, str, str]]:
         normalized_triples: list[tuple[str, str, str]] = []
         for pair in targets or []:
             if not isinstance(pair, (list, tuple)):
@@ -80,14 +77,54 @@ class ComplexDatabaseDisappearedOpsMixin:
                 continue
             if asset_type and complex_id and trade_type:
                 normalized_triples.append((asset_type, complex_id, trade_type))
+        return normalized_triples
+
+    @staticmethod
+    def _load_disappeared_targets(c, triples: list[tuple[str, str, str]]) -> None:
+        """연결 전용 TEMP 테이블에 (자산유형, 단지ID, 거래유형) 대상을 채운다.
+
+        대상 수와 무관하게 갱신/집계를 조인 한 번으로 실행하려는 용도라, 대상마다
+        ``OR`` 절을 붙여 청크 단위로 다시 파싱·계획하던 비용이 없다.
+        """
+        c.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS disappeared_targets (
+                asset_type TEXT NOT NULL,
+                complex_id TEXT NOT NULL,
+                trade_type TEXT NOT NULL,
+                PRIMARY KEY (asset_type, complex_id, trade_type)
+            ) WITHOUT ROWID
+            """
+        )
+        c.execute("DELETE FROM temp.disappeared_targets")
+        c.executemany("INSERT OR IGNORE INTO temp.disappeared_targets VALUES (?, ?, ?)", triples)
+
+    def _disappeared_target_join_sql(self, status: str) -> str:
+        """대상 TEMP 테이블 ``t`` 와 ``status`` 상태의 article_history ``h`` 를 잇는 FROM 절.
+
+        단순 동등 조건이면 CROSS JOIN 으로 대상 테이블을 바깥 루프에 고정해 대상마다
+        (status, asset_type, complex_id, trade_type, last_seen) 인덱스를 탐색한다.
+        빈 asset_type 보정 전에는 OR 조건이라 인덱스를 끝까지 못 쓰므로 순서를 플래너에 맡긴다.
+        """
+        if self._legacy_asset_scope_predicates:
+            join_sql = "JOIN"
+            asset_sql = "(h.asset_type = t.asset_type OR (t.asset_type = 'APT' AND COALESCE(h.asset_type, '') = ''))"
+        else:
+            join_sql = "CROSS JOIN"
+            asset_sql = "h.asset_type = t.asset_type"
+        return (
+            f"temp.disappeared_targets t {join_sql} article_history h "
+            f"ON h.status = '{status}' AND {asset_sql} "
+            "AND h.complex_id = t.complex_id AND h.trade_type = t.trade_type"
+        )
 
-        if not normalized_triples:
+    def mark_disappeared_articles_for_targets(self, targets: list[tuple[str, ...]]) -> int:
+        if self.is_write_disabled():
             return 0
 
-        def _iter_chunks(rows, chunk_size):
-            size = max(1, int(chunk_size or 1))
-            for idx in range(0, len(rows), size):
-                yield rows[idx : idx + size]
+        normalized_triples = self._normalize_disappeared_targets(targets)
+        if not normalized_triples:
+            return 0
 
         conn = self._pool.get_connection()
         try:
@@ -97,30 +134,20 @@ class ComplexDatabaseDisappearedOpsMixin:
                 except Exception:
                     pass
                 c = conn.cursor()
-                updated = 0
-                triple_chunk_size = min(200, max(1, 900 // 3))
-
-                for triple_chunk in _iter_chunks(normalized_triples, triple_chunk_size):
-                    clauses = []
-                    params = []
-                    for asset_type, complex_id, trade_type in triple_chunk:
-                        asset_where, asset_params = self._asset_scope_where(asset_type)
-                        clauses.append(f"(({asset_where}) AND complex_id = ? AND trade_type = ?)")
-                        params.extend(asset_params)
-                        params.extend([complex_id, trade_type])
-                    where_triples = " OR ".join(clauses)
-                    c.execute(
-                        f"""
-                        UPDATE article_history
-                        SET status='disappeared'
-                        WHERE last_seen < CURRENT_DATE
-                          AND status='active'
-                          AND ({where_triples})
-                        """,
-                        params,
+                self._load_disappeared_targets(c, normalized_triples)
+                c.execute(
+                    f"""
+                    UPDATE article_history
+                    SET status='disappeared'
+                    WHERE id IN (
+                        SELECT h.id
+                        FROM {self._disappeared_target_join_sql('active')}
+                        WHERE h.last_seen < CURRENT_DATE
                     )
-                    updated += c.rowcount if c.rowcount != -1 else 0
-
+                    """
+                )
+                updated = c.rowcount if c.rowcount != -1 else 0
+                c.execute("DELETE FROM temp.disappeared_targets")
                 conn.commit()
                 if updated > 0:
                     logger.info(f"mark disappeared articles for targets: {updated}")
@@ -142,56 +169,29 @@ class ComplexDatabaseDisappearedOpsMixin:
             self._pool.return_connection(conn)
 
     def count_disappeared_articles_for_targets(self, targets: list[tuple[str, ...]]) -> int:
-        normalized_triples: list[tuple[str, str, str]] = []
-        for pair in targets or []:
-            if not isinstance(pair, (list, tuple)):
-                continue
-            if len(pair) >= 3:
-                asset_type = self._normalize_listing_asset_type(pair[0])
-                complex_id = str(pair[1] or "").strip()
-                trade_type = str(pair[2] or "").strip()
-            elif len(pair) >= 2:
-                asset_type = "APT"
-                complex_id = str(pair[0] or "").strip()
-                trade_type = str(pair[1] or "").strip()
-            else:
-                continue
-            if asset_type and complex_id and trade_type:
-                normalized_triples.append((asset_type, complex_id, trade_type))
-
+        normalized_triples = self._normalize_disappeared_targets(targets)
         if not normalized_triples:
             return 0
 
-        def _iter_chunks(rows, chunk_size):
-            size = max(1, int(chunk_size or 1))
-            for idx in range(0, len(rows), size):
-                yield rows[idx : idx + size]
-
         conn = self._pool.get_connection()
         try:
             c = conn.cursor()
-            total = 0
-            triple_chunk_size = min(200, max(1, 900 // 3))
-            for triple_chunk in _iter_chunks(normalized_triples, triple_chunk_size):
-                clauses = []
-                params = []
-                for asset_type, complex_id, trade_type in triple_chunk:
-                    asset_where, asset_params = self._asset_scope_where(asset_type)
-                    clauses.append(f"(({asset_where}) AND complex_id = ? AND trade_type = ?)")
-                    params.extend(asset_params)
-                    params.extend([complex_id, trade_type])
-                row = c.execute(
-                    f"""
-                    SELECT COUNT(*)
-                    FROM article_history
-                    WHERE status='disappeared'
-                      AND ({' OR '.join(clauses)})
-                    """,
-                    params,
-                ).fetchone()
-                total += int(row[0] if row else 0)
-            return total
+            self._load_disappeared_targets(c, normalized_triples)
+            row = c.execute(
+                f"""
+                SELECT COUNT(*)
+                FROM {self._disappeared_target_join_sql('disappeared')}
+                """
+            ).fetchone()
+            c.execute("DELETE FROM temp.disappeared_targets")
+            # TEMP 테이블 쓰기로 열린 트랜잭션을 닫아 읽기 스냅샷을 붙잡지 않게 한다.
+            conn.commit()
+            return int(row[0] if row else 0)
         except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
             logger.error(f"count disappeared articles for targets failed: {e}")
             return 0
         finally:
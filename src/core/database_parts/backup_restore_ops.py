@@ -134,6 +134,7 @@ class ComplexDatabaseBackupRestoreOpsMixin:
                     logger.error("복원 중단: 롤백용 사전 백업 생성 실패")
                     return False
 
+            self._stop_schema_backfills()
             if self._pool:
                 close_result = self._pool.close_all(timeout_ms=8000, force_after_timeout=False)
                 if not getattr(close_result, "ok", False):
@@ -189,6 +190,7 @@ class ComplexDatabaseBackupRestoreOpsMixin:
 
     def close(self):
         """DB 연결 종료."""
+        self._stop_schema_backfills()
         try:
             if self._pool:
                 self._pool.close_all()
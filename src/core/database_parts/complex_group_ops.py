@@ -22,6 +22,23 @@ class ComplexDatabaseComplexGroupOpsMixin:
         except Exception as rollback_error:
             logger.warning(f"{context} rollback 실패: {rollback_error}")
 
+    @staticmethod
+    def _insert_complex_row(c, name, complex_id, memo, asset_type) -> str:
+        """단지 행을 없을 때만 추가하고 "inserted"/"existing" 을 반환한다(커밋은 호출자 몫)."""
+        c.execute(
+            "SELECT id FROM complexes WHERE asset_type = ? AND complex_id = ?",
+            (asset_type, complex_id),
+        )
+        if c.fetchone():
+            logger.debug(f"단지 이미 존재: {name} ({complex_id})")
+            return "existing"
+        c.execute(
+            "INSERT INTO complexes (name, asset_type, complex_id, memo) VALUES (?, ?, ?, ?)",
+            (name, asset_type, complex_id, memo),
+        )
+        logger.info(f"단지 추가 성공: {name} ({complex_id})")
+        return "inserted"
+
     def add_complex(
         self,
         name,
@@ -44,22 +61,10 @@ class ComplexDatabaseComplexGroupOpsMixin:
                 normalized_asset_type = self._normalize_asset_type(asset_type)
                 for attempt in range(3):
                     try:
-                        c = conn.cursor()
-                        c.execute(
-                            "SELECT id FROM complexes WHERE asset_type = ? AND complex_id = ?",
-                            (normalized_asset_type, complex_id),
-                        )
-                        existing = c.fetchone()
-                        if existing:
-                            logger.debug(f"단지 이미 존재: {name} ({complex_id})")
+                        status = self._insert_complex_row(conn.cursor(), name, complex_id, memo, normalized_asset_type)
+                        if status == "existing":
                             return "existing" if return_status else True
-
-                        c.execute(
-                            "INSERT INTO complexes (name, asset_type, complex_id, memo) VALUES (?, ?, ?, ?)",
-                            (name, normalized_asset_type, complex_id, memo),
-                        )
                         conn.commit()
-                        logger.info(f"단지 추가 성공: {name} ({complex_id})")
                         return "inserted" if return_status else True
                     except sqlite3.IntegrityError:
                         try:
@@ -176,7 +181,7 @@ class ComplexDatabaseComplexGroupOpsMixin:
             # 3) 스냅샷에만 남아 있는 단지 보강
             snapshot_rows = self._fetchall_safe(
                 conn,
-                "SELECT DISTINCT COALESCE(NULLIF(asset_type, ''), 'APT') AS asset_type, complex_id FROM price_snapshots",
+                "SELECT DISTINCT asset_type, complex_id FROM price_snapshots",
                 context="통계 단지 조회(price_snapshots)",
             )
             for row in snapshot_rows:
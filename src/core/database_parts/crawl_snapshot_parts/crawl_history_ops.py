@@ -10,6 +10,44 @@ class ComplexDatabaseCrawlHistoryOpsMixin:
     if TYPE_CHECKING:
         def __getattr__(self, name: str) -> Any: ...
 
+    @staticmethod
+    def _insert_crawl_history_row(
+        c,
+        name,
+        cid,
+        types,
+        count,
+        *,
+        engine="",
+        mode="complex",
+        source_lat=None,
+        source_lon=None,
+        source_zoom=None,
+        asset_type="",
+        run_status="success",
+    ) -> None:
+        c.execute(
+            """
+            INSERT INTO crawl_history (
+                complex_name, complex_id, trade_types, item_count,
+                engine, mode, source_lat, source_lon, source_zoom, asset_type, run_status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                name,
+                cid,
+                types,
+                count,
+                engine,
+                mode,
+                float(source_lat or 0),
+                float(source_lon or 0),
+                int(source_zoom or 0),
+                asset_type,
+                str(run_status or "success"),
+            ),
+        )
+
     def add_crawl_history(
         self,
         name,
@@ -36,26 +74,19 @@ class ComplexDatabaseCrawlHistoryOpsMixin:
                     pass
                 for attempt in range(3):
                     try:
-                        conn.cursor().execute(
-                            """
-                            INSERT INTO crawl_history (
-                                complex_name, complex_id, trade_types, item_count,
-                                engine, mode, source_lat, source_lon, source_zoom, asset_type, run_status
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                name,
-                                cid,
-                                types,
-                                count,
-                                engine,
-                                mode,
-                                float(source_lat or 0),
-                                float(source_lon or 0),
-                                int(source_zoom or 0),
-                                asset_type,
-                                str(run_status or "success"),
-                            ),
+                        self._insert_crawl_history_row(
+                            conn.cursor(),
+                            name,
+                            cid,
+                            types,
+                            count,
+                            engine=engine,
+                            mode=mode,
+                            source_lat=source_lat,
+                            source_lon=source_lon,
+                            source_zoom=source_zoom,
+                            asset_type=asset_type,
+                            run_status=run_status,
                         )
                         conn.commit()
                         return True
@@ -39,7 +39,7 @@ class ComplexDatabasePriceSnapshotQueryOpsMixin:
                 include_legacy_monthly=include_legacy_monthly,
             )
             self._append_snapshot_asset_filter(sql_parts, params, asset_type)
-            self._append_latest_snapshot_filter(sql_parts)
+            self._append_latest_snapshot_filter(sql_parts, params, complex_id, trade_type)
 
             sql_parts.append("ORDER BY snapshot_date DESC, pyeong")
 
@@ -122,7 +122,7 @@ class ComplexDatabasePriceSnapshotQueryOpsMixin:
                 include_legacy_monthly=include_legacy_monthly,
             )
             self._append_snapshot_asset_filter(sql_parts, params, asset_type)
-            self._append_latest_snapshot_filter(sql_parts)
+            self._append_latest_snapshot_filter(sql_parts, params, complex_id, trade_type)
             sql_parts.append("ORDER BY pyeong")
             rows = self._fetchall_safe(
                 conn,
@@ -181,7 +181,7 @@ class ComplexDatabasePriceSnapshotQueryOpsMixin:
                 if parsed_pyeong is not None:
                     sql_parts.append("AND pyeong = ?")
                     params.append(parsed_pyeong)
-            self._append_latest_snapshot_filter(sql_parts)
+            self._append_latest_snapshot_filter(sql_parts, params, complex_id, trade_type)
             
             sql_parts.append('ORDER BY snapshot_date DESC, trade_type, pyeong')
             
@@ -23,6 +23,9 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
         asset_type="APT",
         price_metric="price",
         legacy_monthly=0,
+        median_price=0,
+        p25_price=0,
+        p75_price=0,
     ):
         """Store one price snapshot row."""
         conn = self._pool.get_connection()
@@ -42,6 +45,9 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
                     asset_token,
                     metric_token,
                     max(0, self._coerce_int(legacy_monthly, default=0)),
+                    self._coerce_price(median_price, default=0),
+                    self._coerce_price(p25_price, default=0),
+                    self._coerce_price(p75_price, default=0),
                 ),
             )
             conn.commit()
@@ -65,6 +71,11 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
                     skipped += 1
                     continue
                 values = list(row)
+                quantile_values = [0, 0, 0]
+                if len(values) == 13:
+                    # 10열 행 + (median, p25, p75)
+                    quantile_values = values[10:13]
+                    values = values[:10]
                 if len(values) == 7:
                     complex_id, trade_type, pyeong, min_price, max_price, avg_price, item_count = values
                     asset_token = "APT"
@@ -129,6 +140,7 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
                         self._normalize_asset_type(asset_token),
                         self._normalize_price_metric(metric_token, trade_type=trade_type),
                         max(0, self._coerce_int(legacy_monthly, default=0)),
+                        *(self._coerce_price(value, default=0) for value in quantile_values),
                     )
                 )
             if not normalized_rows:
@@ -147,6 +159,7 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
                     asset_type,
                     price_metric,
                     legacy_monthly,
+                    *_quantiles,
                 ) = row
                 key = (asset_type, complex_id, trade_type, pyeong, price_metric, legacy_monthly)
                 deduped_rows[key] = row
@@ -161,13 +174,78 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
         finally:
             self._pool.return_connection(conn)
 
+    def rebuild_price_snapshots_from_history(self, complex_ids=None, snapshot_date=None):
+        """Re-aggregate active ``article_history`` rows last seen on ``snapshot_date``.
+
+        기본 날짜는 ``last_seen`` 과 같은 SQLite ``CURRENT_DATE`` 이며, 결과는 해당 날짜의
+        스냅샷 키에 upsert된다.
+        """
+        scope_ids = [str(cid).strip() for cid in (complex_ids or []) if str(cid or "").strip()]
+        conn = self._pool.get_connection()
+        try:
+            if snapshot_date:
+                date_token = str(snapshot_date).strip()
+            else:
+                date_token = str(conn.cursor().execute("SELECT CURRENT_DATE").fetchone()[0])
+            sql = (
+                "SELECT asset_type, complex_id, trade_type, area_pyeong, price, price_text "
+                "FROM article_history WHERE status = 'active' AND last_seen = ?"
+            )
+            params: list = [date_token]
+            if scope_ids:
+                sql += f" AND complex_id IN ({','.join('?' for _ in scope_ids)})"
+                params.extend(scope_ids)
+            history_rows = conn.cursor().execute(sql, params).fetchall()
+            rows = build_price_snapshot_rows_from_history(history_rows)
+            if not rows:
+                return 0
+            with self._write_lock:
+                conn.cursor().executemany(
+                    self._price_snapshot_upsert_sql(with_snapshot_date=True),
+                    [(*row, date_token) for row in rows],
+                )
+                conn.commit()
+            logger.info(f"가격 스냅샷 재집계: {len(rows)}건 ({date_token})")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"가격 스냅샷 재집계 실패: {e}")
+            return 0
+        finally:
+            self._pool.return_connection(conn)
+
+    def rebuild_missing_price_snapshot_quartiles(self) -> int:
+        """오늘 스냅샷 중 중앙값/사분위가 비어 있는 단지를 ``article_history`` 로 다시 집계한다.
+
+        이력은 매물마다 마지막 상태만 남기므로 지난 날짜의 사분위는 복원할 수 없다.
+        ``last_seen`` 이 오늘인 이력이 그 단지의 오늘 수집분 전체이므로 오늘 스냅샷만 채운다.
+        """
+        conn = self._pool.get_connection()
+        try:
+            complex_ids = [
+                str(row[0])
+                for row in conn.cursor().execute(
+                    "SELECT DISTINCT complex_id FROM price_snapshots "
+                    "WHERE snapshot_date = CURRENT_DATE AND item_count > 0 AND COALESCE(median_price, 0) = 0"
+                ).fetchall()
+            ]
+        except Exception as e:
+            logger.warning(f"사분위 누락 스냅샷 조회 실패 (무시): {e}")
+            return 0
+        finally:
+            self._pool.return_connection(conn)
+        if not complex_ids:
+            return 0
+        return self.rebuild_price_snapshots_from_history(complex_ids)
+
     @staticmethod
-    def _price_snapshot_upsert_sql() -> str:
-        return """
+    def _price_snapshot_upsert_sql(with_snapshot_date: bool = False) -> str:
+        date_column = ", snapshot_date" if with_snapshot_date else ""
+        date_value = ", ?" if with_snapshot_date else ""
+        return f"""
             INSERT INTO price_snapshots (
                 complex_id, trade_type, pyeong, min_price, max_price, avg_price, item_count,
-                asset_type, price_metric, legacy_monthly
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                asset_type, price_metric, legacy_monthly, median_price, p25_price, p75_price{date_column}
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?{date_value})
             ON CONFLICT(
                 snapshot_date,
                 asset_type,
@@ -180,7 +258,10 @@ class ComplexDatabasePriceSnapshotWriteOpsMixin:
                 min_price = excluded.min_price,
                 max_price = excluded.max_price,
                 avg_price = excluded.avg_price,
-                item_count = excluded.item_count
+                item_count = excluded.item_count,
+                median_price = excluded.median_price,
+                p25_price = excluded.p25_price,
+                p75_price = excluded.p75_price
         """
 
     def _upsert_price_snapshot_row(self, cursor, row) -> None:
@@ -11,25 +11,40 @@ class ComplexDatabaseSnapshotFilterMixin:
         def __getattr__(self, name: str) -> Any: ...
 
     def _append_snapshot_asset_filter(self, sql_parts: list[str], params: list[Any], asset_type) -> None:
+        # 빈 asset_type 은 스키마 v3 에서 'APT' 로 정규화되므로 단순 동등 조건으로 인덱스를 탄다.
         if self._is_all_filter_value(asset_type):
             return
-        asset_token = self._normalize_asset_type(asset_type)
-        if asset_token == "APT":
-            sql_parts.append("AND (asset_type = ? OR COALESCE(asset_type, '') = '')")
-            params.append("APT")
-        else:
-            sql_parts.append("AND asset_type = ?")
-            params.append(asset_token)
+        sql_parts.append("AND asset_type = ?")
+        params.append(self._normalize_asset_type(asset_type))
 
-    def _append_latest_snapshot_filter(self, sql_parts: list[str]) -> None:
+    def _append_latest_snapshot_filter(
+        self,
+        sql_parts: list[str],
+        params: list[Any],
+        complex_id,
+        trade_type=None,
+    ) -> None:
+        """같은 스냅샷 키의 중복 행 중 최신(id 최대) 행만 남긴다.
+
+        최신 행 판정 서브쿼리를 요청한 단지(및 거래유형)로 한정해 ``complex_id`` 인덱스로
+        해당 단지 행만 읽게 한다. 테이블 전체를 GROUP BY 하지 않으므로 조회 시간이
+        누적된 전체 스냅샷 수와 무관하다.
+        """
+        scope_sql = "WHERE complex_id = ?"
+        params.append(complex_id)
+        trade_type_token = str(trade_type or "").strip()
+        if trade_type_token:
+            scope_sql += " AND trade_type = ?"
+            params.append(trade_type_token)
         sql_parts.append(
-            """
+            f"""
             AND id IN (
                 SELECT MAX(id)
                 FROM price_snapshots
+                {scope_sql}
                 GROUP BY
                     snapshot_date,
-                    COALESCE(NULLIF(asset_type, ''), 'APT'),
+                    asset_type,
                     complex_id,
                     trade_type,
                     pyeong,
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, TYPE_CHECKING
+
+from src.utils.logger import get_logger
+
+logger = get_logger("DB")
+
+if TYPE_CHECKING:
+    from src.core.database import *  # noqa: F403
+
+
+class ComplexDatabaseGeoTileOpsMixin:
+    """지도 마커 타일 캐시와 이미 알려진 단지 좌표 인덱스.
+
+    ``geo_marker_tiles`` 는 (자산, 거래유형, 줌, 타일 x/y) 단위로 정규화된 마커 목록을 저장하고,
+    ``geo_known_complexes`` 는 단지별 최신 좌표를 보관해 bbox 조회를 네트워크 없이 처리한다.
+    """
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    _GEO_TILE_LOOKUP_CHUNK = 200
+
+    def get_geo_marker_tiles(self, asset_type, trade_type, zoom, tile_keys, max_age_seconds=None, include_meta=False):
+        """``{(tile_x, tile_y): [marker, ...]}`` 형태로 캐시된 타일을 반환한다.
+
+        ``max_age_seconds`` 보다 오래된 타일은 제외된다. ``include_meta`` 이면 값이
+        ``(markers, cluster_count)`` 이다.
+        """
+        keys = list(dict.fromkeys((int(x), int(y)) for x, y in tile_keys or []))
+        if not keys:
+            return {}
+        asset_token = self._normalize_listing_asset_type(asset_type)
+        trade_token = str(trade_type or "").strip()
+        min_fetched_at = 0.0
+        if max_age_seconds is not None:
+            min_fetched_at = time.time() - max(0.0, float(max_age_seconds))
+
+        result = {}
+        conn = self._pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            wanted = set(keys)
+            xs = sorted({x for x, _y in keys})
+            chunk_size = self._GEO_TILE_LOOKUP_CHUNK
+            for start in range(0, len(xs), chunk_size):
+                chunk = xs[start:start + chunk_size]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = cursor.execute(
+                    f"""
+                    SELECT tile_x, tile_y, cluster_count, markers_json
+                    FROM geo_marker_tiles
+                    WHERE asset_type = ?
+                      AND trade_type = ?
+                      AND zoom = ?
+                      AND tile_x IN ({placeholders})
+                      AND fetched_at >= ?
+                    """,
+                    (asset_token, trade_token, int(zoom), *chunk, min_fetched_at),
+                ).fetchall()
+                for row in rows:
+                    key = (int(row["tile_x"]), int(row["tile_y"]))
+                    if key not in wanted:
+                        continue
+                    try:
+                        markers = json.loads(row["markers_json"] or "[]")
+                    except (TypeError, ValueError):
+                        continue
+                    if not isinstance(markers, list):
+                        continue
+                    result[key] = (markers, int(row["cluster_count"] or 0)) if include_meta else markers
+            return result
+        except Exception as e:
+            logger.error(f"geo marker tile lookup failed: {e}")
+            return {}
+        finally:
+            self._pool.return_connection(conn)
+
+    def upsert_geo_marker_tiles(self, rows):
+        """``(asset_type, trade_type, zoom, tile_x, tile_y, markers[, cluster_count])`` 목록을 저장한다.
+
+        타일에 들어 있는 좌표가 있는 마커는 ``geo_known_complexes`` 에도 반영한다.
+        """
+        payload = []
+        known_markers = []
+        fetched_at = time.time()
+        for row in rows or []:
+            asset_type, trade_type, zoom, tile_x, tile_y, markers = row[:6]
+            cluster_count = int(row[6] or 0) if len(row) > 6 else 0
+            if not isinstance(markers, list):
+                continue
+            asset_token = self._normalize_listing_asset_type(asset_type)
+            try:
+                markers_json = json.dumps(markers, ensure_ascii=False)
+            except (TypeError, ValueError):
+                continue
+            payload.append(
+                (
+                    asset_token,
+                    str(trade_type or "").strip(),
+                    int(zoom),
+                    int(tile_x),
+                    int(tile_y),
+                    len(markers),
+                    cluster_count,
+                    markers_json,
+                    fetched_at,
+                )
+            )
+            known_markers.extend(dict(marker, asset_type=asset_token) for marker in markers if isinstance(marker, dict))
+        if not payload:
+            return 0
+        conn = self._pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO geo_marker_tiles
+                (asset_type, trade_type, zoom, tile_x, tile_y, marker_count, cluster_count, markers_json, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(asset_type, trade_type, zoom, tile_x, tile_y) DO UPDATE SET
+                    marker_count=excluded.marker_count,
+                    cluster_count=excluded.cluster_count,
+                    markers_json=excluded.markers_json,
+                    fetched_at=excluded.fetched_at
+                """,
+                payload,
+            )
+            self._upsert_geo_known_complex_rows(cursor, known_markers, fetched_at)
+            conn.commit()
+            return len(payload)
+        except Exception as e:
+            logger.error(f"geo marker tile upsert failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
+        finally:
+            self._pool.return_connection(conn)
+
+    def upsert_geo_known_complexes(self, markers):
+        """정규화된 마커 목록의 단지 좌표를 저장한다. 좌표가 없는 마커는 건너뛴다."""
+        conn = self._pool.get_connection()
+        try:
+            count = self._upsert_geo_known_complex_rows(conn.cursor(), list(markers or []), time.time())
+            conn.commit()
+            return count
+        except Exception as e:
+            logger.error(f"geo known complex upsert failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            return 0
+        finally:
+            self._pool.return_connection(conn)
+
+    def _upsert_geo_known_complex_rows(self, cursor, markers, seen_at) -> int:
+        rows = {}
+        for marker in markers:
+            if not isinstance(marker, dict):
+                continue
+            complex_id = str(marker.get("complex_id", "") or "").strip()
+            try:
+                lat = float(marker.get("lat", 0) or 0)
+                lon = float(marker.get("lon", 0) or 0)
+                count = int(marker.get("count", 0) or 0)
+            except (TypeError, ValueError):
+                continue
+            if not complex_id or not lat or not lon:
+                continue
+            asset_token = self._normalize_listing_asset_type(marker.get("asset_type", ""))
+            rows[(asset_token, complex_id)] = (
+                asset_token,
+                complex_id,
+                str(marker.get("complex_name", "") or ""),
+                str(marker.get("marker_id", "") or ""),
+                lat,
+                lon,
+                count,
+                float(seen_at),
+            )
+        if not rows:
+            return 0
+        cursor.executemany(
+            """
+            INSERT INTO geo_known_complexes
+            (asset_type, complex_id, complex_name, marker_id, latitude, longitude, article_count, seen_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(asset_type, complex_id) DO UPDATE SET
+                complex_name=CASE WHEN excluded.complex_name != '' THEN excluded.complex_name
+                                  ELSE geo_known_complexes.complex_name END,
+                marker_id=excluded.marker_id,
+                latitude=excluded.latitude,
+                longitude=excluded.longitude,
+                article_count=excluded.article_count,
+                seen_at=excluded.seen_at
+            """,
+            list(rows.values()),
+        )
+        return len(rows)
+
+    def get_known_complexes_in_bounds(self, bounds, asset_types=None, limit=2000):
+        """``(leftLon, rightLon, topLat, bottomLat)`` 안에 있는 것으로 알려진 단지를 반환한다.
+
+        결과는 마커 정규화 형식(complex_id/complex_name/asset_type/marker_id/count/lat/lon)이며
+        매물 수가 많은 순으로 정렬된다.
+        """
+        left_lon, right_lon, top_lat, bottom_lat = (float(v) for v in bounds)
+        params: list[Any] = [min(top_lat, bottom_lat), max(top_lat, bottom_lat), min(left_lon, right_lon), max(left_lon, right_lon)]
+        asset_clause = ""
+        asset_tokens = [self._normalize_listing_asset_type(asset) for asset in asset_types or []]
+        if asset_tokens:
+            asset_tokens = list(dict.fromkeys(asset_tokens))
+            asset_clause = f" AND asset_type IN ({','.join('?' for _ in asset_tokens)})"
+            params.extend(asset_tokens)
+        params.append(max(1, int(limit or 1)))
+        conn = self._pool.get_connection()
+        try:
+            rows = conn.cursor().execute(
+                f"""
+                SELECT asset_type, complex_id, complex_name, marker_id, latitude, longitude, article_count
+                FROM geo_known_complexes
+                WHERE latitude BETWEEN ? AND ?
+                  AND longitude BETWEEN ? AND ?{asset_clause}
+                ORDER BY article_count DESC, complex_name
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+            return [
+                {
+                    "complex_id": str(row["complex_id"]),
+                    "complex_name": str(row["complex_name"] or ""),
+                    "asset_type": str(row["asset_type"] or "APT"),
+                    "marker_id": str(row["marker_id"] or ""),
+                    "count": int(row["article_count"] or 0),
+                    "lat": float(row["latitude"]),
+                    "lon": float(row["longitude"]),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"geo known complex lookup failed: {e}")
+            return []
+        finally:
+            self._pool.return_connection(conn)
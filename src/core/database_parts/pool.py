@@ -85,6 +85,12 @@ class ConnectionPool:
                     pass
             raise
     
+    @property
+    def is_closing(self) -> bool:
+        """close_all 이 시작되어 새 연결을 빌려줄 수 없는 상태인지."""
+        with self._lease_lock:
+            return self._closing
+
     def get_connection(self):
         with self._lease_lock:
             if self._closing:
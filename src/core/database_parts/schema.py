@@ -4,10 +4,12 @@ from src.core.database_parts.schema_parts.cleanup import ComplexDatabaseSchemaCl
 from src.core.database_parts.schema_parts.indexes import ComplexDatabaseSchemaIndexMixin
 from src.core.database_parts.schema_parts.migrations import ComplexDatabaseSchemaMigrationMixin
 from src.core.database_parts.schema_parts.tables import ComplexDatabaseSchemaTableMixin
+from src.core.database_parts.schema_parts.versioning import ComplexDatabaseSchemaVersionMixin
 
 
 class ComplexDatabaseSchemaMixin(
     ComplexDatabaseSchemaTableMixin,
+    ComplexDatabaseSchemaVersionMixin,
     ComplexDatabaseSchemaMigrationMixin,
     ComplexDatabaseSchemaIndexMixin,
     ComplexDatabaseSchemaCleanupMixin,
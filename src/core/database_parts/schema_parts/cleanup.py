@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any, TYPE_CHECKING
 
 from src.utils.logger import get_logger
@@ -15,7 +16,10 @@ class ComplexDatabaseSchemaCleanupMixin:
     if TYPE_CHECKING:
         def __getattr__(self, name: str) -> Any: ...
 
-    def _cleanup_schema_data(self, conn, c):
+    _ARTICLE_DETAIL_CACHE_RETENTION_SEC = 30 * 24 * 3600
+    _GEO_MARKER_TILE_RETENTION_SEC = 7 * 24 * 3600
+
+    def _normalize_price_snapshot_rows(self, conn, c):
         # v14.x: normalize legacy price_snapshots string values (for example, "34평", "1억2,000만")
         try:
             c.execute(
@@ -179,38 +183,7 @@ class ComplexDatabaseSchemaCleanupMixin:
         except Exception as me:
             logger.warning(f"price_snapshots cleanup failed (ignored): {me}")
 
-        try:
-            c.execute(
-                """
-                UPDATE article_history
-                SET asset_type = 'APT'
-                WHERE TRIM(COALESCE(asset_type, '')) = ''
-                """
-            )
-            c.execute(
-                """
-                UPDATE article_favorites
-                SET asset_type = 'APT'
-                WHERE TRIM(COALESCE(asset_type, '')) = ''
-                """
-            )
-            c.execute(
-                """
-                UPDATE alert_settings
-                SET asset_type = 'ALL'
-                WHERE TRIM(COALESCE(asset_type, '')) = ''
-                """
-            )
-            c.execute(
-                """
-                UPDATE article_alert_log
-                SET asset_type = 'ALL'
-                WHERE TRIM(COALESCE(asset_type, '')) = ''
-                """
-            )
-        except Exception as me:
-            logger.warning(f"asset scope cleanup failed (ignored): {me}")
-
+    def _prune_orphan_group_links(self, conn, c):
         # Remove orphan rows from group_complexes when FK constraints were missing in old schemas
         c.execute(
             """
@@ -219,3 +192,20 @@ class ComplexDatabaseSchemaCleanupMixin:
                OR group_id NOT IN (SELECT id FROM groups)
             """
         )
+
+    def _prune_expired_caches(self, c):
+        # 상세 캐시·마커 타일은 재수집으로 복구 가능하므로 백그라운드 정리 때 오래된 항목을 지운다.
+        try:
+            c.execute(
+                "DELETE FROM article_detail_cache WHERE fetched_at < ?",
+                (time.time() - self._ARTICLE_DETAIL_CACHE_RETENTION_SEC,),
+            )
+        except Exception as me:
+            logger.warning(f"article detail cache cleanup failed (ignored): {me}")
+        try:
+            c.execute(
+                "DELETE FROM geo_marker_tiles WHERE fetched_at < ?",
+                (time.time() - self._GEO_MARKER_TILE_RETENTION_SEC,),
+            )
+        except Exception as me:
+            logger.warning(f"geo marker tile cleanup failed (ignored): {me}")
@@ -60,6 +60,9 @@ class ComplexDatabaseSchemaIndexMixin:
                 "asset_type": "TEXT DEFAULT 'APT'",
                 "price_metric": "TEXT DEFAULT 'price'",
                 "legacy_monthly": "INTEGER DEFAULT 0",
+                "median_price": "INTEGER DEFAULT 0",
+                "p25_price": "INTEGER DEFAULT 0",
+                "p75_price": "INTEGER DEFAULT 0",
             },
             "alert_settings": {
                 "asset_type": "TEXT DEFAULT 'ALL'",
@@ -101,6 +104,12 @@ class ComplexDatabaseSchemaIndexMixin:
             'ON article_history(status, asset_type, complex_id, trade_type, last_seen)'
         )
         
+        # 지도 bbox 조회: 위도 범위로 좁힌 뒤 경도를 인덱스 안에서 거른다.
+        c.execute(
+            'CREATE INDEX IF NOT EXISTS idx_geo_known_complexes_latlon '
+            'ON geo_known_complexes(latitude, longitude)'
+        )
+
         c.execute('DROP INDEX IF EXISTS idx_favorites')
         c.execute('CREATE INDEX IF NOT EXISTS idx_favorites ON article_favorites(asset_type, article_id, complex_id)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_favorites_updated_at ON article_favorites(updated_at DESC)')
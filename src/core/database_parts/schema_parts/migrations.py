@@ -172,7 +172,7 @@ class ComplexDatabaseSchemaMigrationMixin:
                 last_price INTEGER,
                 price_change INTEGER DEFAULT 0,
                 status TEXT DEFAULT 'active',
-                asset_type TEXT DEFAULT 'APT',
+                asset_type TEXT NOT NULL DEFAULT 'APT',
                 source_mode TEXT DEFAULT 'complex',
                 source_lat REAL DEFAULT 0,
                 source_lon REAL DEFAULT 0,
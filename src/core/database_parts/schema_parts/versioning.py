@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.core.database import *  # noqa: F403
+
+
+logger = get_logger("DB")
+
+
+class ComplexDatabaseSchemaVersionMixin:
+    """``PRAGMA user_version`` 기반 스키마 마이그레이션 레지스트리.
+
+    ``_SCHEMA_MIGRATIONS`` 의 각 항목은 (버전, 메서드 이름, 설명)이며 DB 버전보다 높은
+    항목만 순서대로 한 번씩 실행하고, 항목마다 커밋과 함께 ``user_version`` 을 올린다.
+    대용량 테이블의 데이터 보정은 ``_SCHEMA_BACKFILLS`` 에 등록해 두고 ``schema_backfills``
+    테이블에 진행 위치(id)를 남기며 백그라운드 배치로 처리하므로, 중간에 앱이 종료돼도
+    다음 실행에서 이어서 진행한다. 단계 메서드가 False를 반환하면(보정 완료 대기 등)
+    그 버전에서 멈추고, 보정이 끝나면 백그라운드 스레드가 나머지 단계를 이어서 적용한다.
+    """
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    _SCHEMA_MIGRATIONS = (
+        (1, "_schema_v1_tables", "기본 테이블 생성 및 구 스키마 테이블 재구성"),
+        (2, "_schema_v2_columns_and_indexes", "추가 컬럼 및 조회 인덱스"),
+        (3, "_schema_v3_price_snapshot_rows", "price_snapshots 값 정규화·중복 제거·일별 unique 인덱스"),
+        (4, "_schema_v4_group_links", "group_complexes 고아 행 정리"),
+        (5, "_schema_v5_asset_scope_backfills", "빈 asset_type 보정 백그라운드 작업 등록"),
+        (6, "_schema_v6_asset_scope_equality", "asset_type 보정 완료 확인 후 단순 동등 조건으로 전환"),
+    )
+    _SCHEMA_VERSION = _SCHEMA_MIGRATIONS[-1][0]
+
+    # (이름, 테이블, SET 절, 대상 조건). 배치는 id 구간 단위로 나눠 실행한다.
+    _SCHEMA_BACKFILLS = (
+        ("article_history_asset_type", "article_history", "asset_type = 'APT'", "TRIM(COALESCE(asset_type, '')) = ''"),
+        ("article_favorites_asset_type", "article_favorites", "asset_type = 'APT'", "TRIM(COALESCE(asset_type, '')) = ''"),
+        ("alert_settings_asset_type", "alert_settings", "asset_type = 'ALL'", "TRIM(COALESCE(asset_type, '')) = ''"),
+        ("article_alert_log_asset_type", "article_alert_log", "asset_type = 'ALL'", "TRIM(COALESCE(asset_type, '')) = ''"),
+    )
+    _SCHEMA_BACKFILL_BATCH_ROWS = 5000
+    # 이 버전부터 article_history/article_favorites 에 빈 asset_type 이 남아 있지 않다.
+    _ASSET_SCOPE_EQUALITY_VERSION = 6
+    _legacy_asset_scope_predicates = True
+
+    @staticmethod
+    def _read_schema_version(c) -> int:
+        row = c.execute("PRAGMA user_version").fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def _apply_schema_migrations(self, conn, c, current_version: int) -> bool:
+        """밀린 마이그레이션을 적용하고, 남은 백그라운드 보정이 있으면 True를 반환한다."""
+        for version, method_name, description in self._SCHEMA_MIGRATIONS:
+            if version <= current_version:
+                continue
+            logger.info(f"schema migration v{version} start: {description}")
+            try:
+                applied = getattr(self, method_name)(conn, c)
+                if applied is False:
+                    conn.commit()
+                    logger.info(f"schema migration v{version} deferred until backfills complete")
+                    break
+                c.execute(f"PRAGMA user_version = {int(version)}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            current_version = version
+            logger.info(f"schema migration v{version} complete")
+        self._legacy_asset_scope_predicates = current_version < self._ASSET_SCOPE_EQUALITY_VERSION
+        return self._has_pending_schema_backfills(c)
+
+    # ── 마이그레이션 단계 ──
+    def _schema_v1_tables(self, conn, c):
+        self._create_schema_tables(conn, c)
+
+    def _schema_v2_columns_and_indexes(self, conn, c):
+        self._ensure_schema_indexes(c)
+
+    def _schema_v3_price_snapshot_rows(self, conn, c):
+        self._normalize_price_snapshot_rows(conn, c)
+
+    def _schema_v4_group_links(self, conn, c):
+        self._prune_orphan_group_links(conn, c)
+
+    def _schema_v5_asset_scope_backfills(self, conn, c):
+        self._ensure_schema_backfill_table(c)
+        for name, table_name, _set_sql, _where_sql in self._SCHEMA_BACKFILLS:
+            row = c.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table_name}").fetchone()
+            total_id = int(row[0] or 0)
+            c.execute(
+                """
+                INSERT OR IGNORE INTO schema_backfills (name, cursor_id, target_id, done)
+                VALUES (?, 0, ?, ?)
+                """,
+                (name, total_id, 1 if total_id <= 0 else 0),
+            )
+
+    def _schema_v6_asset_scope_equality(self, conn, c):
+        # 보정이 남아 있으면 버전을 올리지 않는다. 그동안 조회는 빈 값도 포함하는 조건을 쓴다.
+        return not self._has_pending_schema_backfills(c)
+
+    # ── 백그라운드 보정 ──
+    @staticmethod
+    def _ensure_schema_backfill_table(c):
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_backfills (
+                name TEXT PRIMARY KEY,
+                cursor_id INTEGER NOT NULL DEFAULT 0,
+                target_id INTEGER NOT NULL DEFAULT 0,
+                updated_rows INTEGER NOT NULL DEFAULT 0,
+                done INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+    def _has_pending_schema_backfills(self, c) -> bool:
+        if "schema_backfills" not in self._sqlite_table_names(c):
+            return False
+        row = c.execute("SELECT COUNT(*) FROM schema_backfills WHERE done = 0").fetchone()
+        return int(row[0] or 0) > 0
+
+    def get_schema_backfill_progress(self) -> dict[str, dict[str, Any]]:
+        """보정 작업별 진행 상황 {이름: {cursor_id, target_id, updated_rows, done, ratio}}."""
+        conn = self._pool.get_connection()
+        try:
+            c = conn.cursor()
+            if "schema_backfills" not in self._sqlite_table_names(c):
+                return {}
+            progress = {}
+            for row in c.execute(
+                "SELECT name, cursor_id, target_id, updated_rows, done FROM schema_backfills ORDER BY name"
+            ).fetchall():
+                target_id = int(row["target_id"] or 0)
+                cursor_id = int(row["cursor_id"] or 0)
+                done = bool(row["done"])
+                progress[str(row["name"])] = {
+                    "cursor_id": cursor_id,
+                    "target_id": target_id,
+                    "updated_rows": int(row["updated_rows"] or 0),
+                    "done": done,
+                    "ratio": 1.0 if done or target_id <= 0 else min(1.0, cursor_id / target_id),
+                }
+            return progress
+        except Exception as e:
+            logger.error(f"보정 작업 진행 상황 조회 실패: {e}")
+            return {}
+        finally:
+            self._pool.return_connection(conn)
+
+    def run_schema_backfills(
+        self,
+        *,
+        batch_rows: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """등록된 보정 작업을 id 구간 배치로 이어서 실행한다. 모두 끝났으면 True.
+
+        배치마다 쓰기 잠금을 잡고 커밋하며 진행 위치를 같은 트랜잭션에 기록하므로,
+        ``max_batches`` 나 ``should_stop`` 으로 멈춘 뒤 다시 부르면 멈춘 곳부터 진행한다.
+        모두 끝나면 보정 완료를 기다리던 마이그레이션 단계까지 적용한다.
+        ``progress(name, cursor_id, target_id)`` 는 배치가 끝날 때마다 호출된다.
+        """
+        if self.is_write_disabled():
+            return False
+        batch_rows = max(1, int(batch_rows or self._SCHEMA_BACKFILL_BATCH_ROWS))
+        batches = 0
+        conn = self._pool.get_connection()
+        try:
+            c = conn.cursor()
+            if "schema_backfills" not in self._sqlite_table_names(c):
+                return True
+            states = {
+                str(row["name"]): (int(row["cursor_id"] or 0), int(row["target_id"] or 0))
+                for row in c.execute(
+                    "SELECT name, cursor_id, target_id FROM schema_backfills WHERE done = 0"
+                ).fetchall()
+            }
+            for name, table_name, set_sql, where_sql in self._SCHEMA_BACKFILLS:
+                if name not in states:
+                    continue
+                cursor_id, target_id = states[name]
+                while cursor_id < target_id:
+                    if should_stop is not None and should_stop():
+                        return False
+                    if max_batches is not None and batches >= max_batches:
+                        return False
+                    next_id = min(target_id, cursor_id + batch_rows)
+                    with self._write_lock:
+                        c.execute(
+                            f"UPDATE {table_name} SET {set_sql} WHERE id > ? AND id <= ? AND {where_sql}",
+                            (cursor_id, next_id),
+                        )
+                        updated = max(0, int(c.rowcount or 0))
+                        c.execute(
+                            """
+                            UPDATE schema_backfills
+                            SET cursor_id = ?, updated_rows = updated_rows + ?,
+                                done = ?, updated_at = CURRENT_TIMESTAMP
+                            WHERE name = ?
+                            """,
+                            (next_id, updated, 1 if next_id >= target_id else 0, name),
+                        )
+                        conn.commit()
+                    cursor_id = next_id
+                    batches += 1
+                    if progress is not None:
+                        progress(name, cursor_id, target_id)
+                with self._write_lock:
+                    c.execute("UPDATE schema_backfills SET done = 1 WHERE name = ?", (name,))
+                    conn.commit()
+                logger.info(f"schema backfill complete: {name}")
+            with self._write_lock:
+                # 보정 완료를 기다리던 단계(v6 등)를 이어서 적용한다.
+                version = self._read_schema_version(c)
+                if version < self._SCHEMA_VERSION:
+                    self._apply_schema_migrations(conn, c, version)
+                else:
+                    self._legacy_asset_scope_predicates = False
+            return True
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            self._log_corruption_detected("schema_backfill", e)
+            logger.error(f"스키마 보정 작업 실패 (다음 실행에서 재시도): {e}")
+            return False
+        finally:
+            self._pool.return_connection(conn)
+
+    def _schema_background_worker(self, prune_caches: bool):
+        stop_event = self._schema_backfill_stop
+        if prune_caches:
+            conn = None
+            try:
+                conn = self._pool.get_connection()
+                with self._write_lock:
+                    self._prune_expired_caches(conn.cursor())
+                    conn.commit()
+            except Exception as e:
+                logger.warning(f"캐시 정리 실패 (무시): {e}")
+            finally:
+                if conn is not None:
+                    self._pool.return_connection(conn)
+
+        def _log_progress(name, cursor_id, target_id):
+            logger.debug(f"schema backfill {name}: {cursor_id}/{target_id}")
+
+        if stop_event.is_set() or self._pool.is_closing:
+            return
+        try:
+            self.run_schema_backfills(progress=_log_progress, should_stop=stop_event.is_set)
+            if prune_caches and not stop_event.is_set():
+                # 사분위 열이 생기기 전에 저장된 오늘 스냅샷을 이력으로 다시 채운다.
+                self.rebuild_missing_price_snapshot_quartiles()
+        except RuntimeError as e:
+            # close() 와 경합해 풀이 먼저 닫힌 경우다. 진행 위치가 남아 있으니 다음 실행에서 이어간다.
+            if not self._pool.is_closing:
+                raise
+            logger.debug(f"DB 종료로 스키마 보정 중단: {e}")
+
+    def start_schema_backfills(self, *, prune_caches: bool = False) -> bool:
+        """남은 보정 작업(및 선택적으로 만료 캐시 정리)을 데몬 스레드에서 시작한다.
+
+        DB가 닫히는 중이거나 이미 닫혔으면 아무것도 하지 않고 False를 반환한다.
+        """
+        pool = getattr(self, "_pool", None)
+        if pool is None or pool.is_closing:
+            return False
+        worker = getattr(self, "_schema_backfill_thread", None)
+        if worker is not None and worker.is_alive():
+            return False
+        self._schema_backfill_stop = threading.Event()
+        worker = threading.Thread(
+            target=self._schema_background_worker,
+            args=(bool(prune_caches),),
+            name="schema-backfill",
+            daemon=True,
+        )
+        self._schema_backfill_thread = worker
+        worker.start()
+        return True
+
+    def _stop_schema_backfills(self, timeout: float = 5.0) -> bool:
+        worker = getattr(self, "_schema_backfill_thread", None)
+        if worker is None:
+            return True
+        stop_event = getattr(self, "_schema_backfill_stop", None)
+        if stop_event is not None:
+            stop_event.set()
+        worker.join(timeout)
+        if worker.is_alive():
+            logger.warning("스키마 보정 스레드가 제한 시간 안에 끝나지 않았습니다.")
+            return False
+        self._schema_backfill_thread = None
+        return True
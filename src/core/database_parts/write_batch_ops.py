@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.database import *  # noqa: F403
+
+
+class ComplexDatabaseWriteBatchOpsMixin:
+    """크롤 writer 스레드가 한 번에 꺼낸 작업을 한 트랜잭션으로 기록한다."""
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    def apply_crawl_write_batch(
+        self,
+        *,
+        history_rows=(),
+        complexes=(),
+        alert_rows=(),
+        crawl_rows=(),
+    ) -> Optional[dict[str, Any]]:
+        """이력 upsert·발견 단지 등록·알림 로그·크롤 기록을 커밋 한 번으로 반영한다.
+
+        ``complexes`` 는 (이름, 단지ID, 자산유형), ``alert_rows`` 는
+        ``record_alert_notifications_bulk`` 와 같은 튜플, ``crawl_rows`` 는 ``add_crawl_history`` 의
+        (args, kwargs) 목록이다. 성공하면 종류별 결과를, 실패하면 전체를 롤백하고 None을 반환한다.
+        """
+        if self.is_write_disabled():
+            return None
+        normalized_history = self._normalize_article_history_bulk_rows(history_rows) if history_rows else []
+        complex_rows = [
+            (str(name or ""), str(complex_id or ""), self._normalize_asset_type(asset_type))
+            for name, complex_id, asset_type in complexes or []
+        ]
+        alert_rows = list(alert_rows or [])
+        crawl_rows = list(crawl_rows or [])
+
+        conn = self._pool.get_connection()
+        try:
+            with self._write_lock:
+                try:
+                    conn.execute("PRAGMA busy_timeout=5000")
+                except Exception:
+                    pass
+                for attempt in range(3):
+                    try:
+                        c = conn.cursor()
+                        if normalized_history:
+                            self._execute_article_history_upsert(c, normalized_history)
+                        complex_statuses = []
+                        for name, complex_id, asset_type in complex_rows:
+                            try:
+                                complex_statuses.append(self._insert_complex_row(c, name, complex_id, "", asset_type))
+                            except sqlite3.IntegrityError:
+                                complex_statuses.append("existing")
+                        alert_flags = self._insert_alert_log_rows(c, alert_rows) if alert_rows else []
+                        for args, kwargs in crawl_rows:
+                            self._insert_crawl_history_row(c, *args, **kwargs)
+                        conn.commit()
+                        return {
+                            "history_saved": len(normalized_history),
+                            "complex_statuses": complex_statuses,
+                            "alert_flags": alert_flags,
+                            "crawl_saved": len(crawl_rows),
+                        }
+                    except sqlite3.OperationalError as e:
+                        self._rollback_write_transaction(conn, "크롤 쓰기 배치")
+                        if self._is_locked_sqlite_error(e) and attempt < 2:
+                            time.sleep(0.1 * (attempt + 1))
+                            continue
+                        if self._is_corruption_sqlite_error(e):
+                            self._disable_writes("database_corruption", e)
+                        logger.error(f"크롤 쓰기 배치 실패: {e}")
+                        return None
+                    except sqlite3.DatabaseError as e:
+                        self._rollback_write_transaction(conn, "크롤 쓰기 배치")
+                        if self._is_corruption_sqlite_error(e):
+                            self._disable_writes("database_corruption", e)
+                        logger.error(f"크롤 쓰기 배치 실패: {e}")
+                        return None
+        except Exception as e:
+            self._rollback_write_transaction(conn, "크롤 쓰기 배치")
+            logger.error(f"크롤 쓰기 배치 실패: {e}")
+            return None
+        finally:
+            try:
+                conn.execute("PRAGMA busy_timeout=30000")
+            except Exception:
+                pass
+            self._pool.return_connection(conn)
+        return None
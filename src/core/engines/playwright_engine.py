@@ -1,24 +1,61 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from collections.abc import MutableMapping
 from urllib.parse import urlencode
 
-from src.core.services.detail_fetcher import apply_mobile_detail, fetch_mobile_article_detail
-from src.core.services.map_geometry import build_grid_sweep_coords, clamp_korea
+from src.core.services.detail_fetcher import (
+    apply_mobile_detail,
+    build_detail_fingerprint,
+    fetch_mobile_article_detail,
+)
+from src.core.models.crawl_models import ListingRecord
+from src.core.services.map_geometry import (
+    DEFAULT_VIEWPORT_PX,
+    build_grid_sweep_coords,
+    build_marker_tile_keys,
+    clamp_korea,
+    marker_tile_bounds,
+)
 from src.core.services.article_api import (
     MAX_ARTICLE_API_PAGES,
+    MAX_ARTICLE_API_PREFETCH_IN_FLIGHT,
     article_api_has_more_pages,
     article_api_list_count,
     article_api_path_kind,
+    article_api_prefetch_pages,
     article_api_real_estate_type,
+    article_api_total_pages,
     build_article_api_url,
+    build_single_markers_url,
+)
+from src.core.services.crawl_stats import CrawlStats
+from src.core.services.geo_planner import QuadtreeSweepPlanner
+from src.core.services.response_fixtures import (
+    ReplayBrowserContext,
+    ReplayPage,
+    ReplayRequestContext,
+    ReplayResponse,
+    ResponseFixtureStore,
+    classify_fixture_url,
+    empty_document_html,
+    normalize_fixture_mode,
 )
 from src.core.services.response_capture import (
     TRADE_CODE_MAP,
     detect_trade_type,
+    is_cluster_marker,
     normalize_article_payload,
     normalize_marker_payload,
 )
+from src.utils.constants import (
+    GEO_PLANNER_MAX_DEPTH,
+    GEO_PLANNER_MAX_ZOOM,
+    GEO_PLANNER_REQUEST_BUDGET,
+    GEO_PLANNER_SPLIT_MARKER_COUNT,
+    PLAYWRIGHT_MAX_TARGET_WORKERS,
+)
 from src.utils.helpers import ChromeParamHelper
 from src.utils.logger import get_logger
 from .base import CrawlerEngine
@@ -52,6 +89,8 @@ PLAYWRIGHT_RETRY_BASE_DELAY_SEC = 0.35
 from src.utils.mixin_rebind import rebind_inherited_methods
 
 from src.core.engines.playwright_parts.runtime import PlaywrightRuntimeMixin
+from src.core.engines.playwright_parts.runtime_parts.target_workers import NullAsyncContext, TargetWorkerGate
+from src.core.engines.playwright_parts.runtime_parts.pacing import AsyncTokenBucket, EndpointPacer
 from src.core.engines.playwright_parts.complex_mode import PlaywrightComplexModeMixin
 from src.core.engines.playwright_parts.complex_mode_parts.article_api import PlaywrightArticleApiMixin
 from src.core.engines.playwright_parts.geo_mode import PlaywrightGeoModeMixin
@@ -5,10 +5,13 @@ from typing import Any, TYPE_CHECKING
 
 from src.core.services.article_api import (
     MAX_ARTICLE_API_PAGES,
+    MAX_ARTICLE_API_PREFETCH_IN_FLIGHT,
     article_api_has_more_pages,
     article_api_list_count,
     article_api_path_kind,
+    article_api_prefetch_pages,
     article_api_real_estate_type,
+    article_api_total_pages,
     build_article_api_url,
 )
 from src.core.services.detail_fetcher import apply_mobile_detail, fetch_mobile_article_detail
@@ -148,9 +151,7 @@ class PlaywrightArticleApiMixin:
         response_match_count: int,
         final_api_url: str,
     ) -> dict:
-        self.thread.stats["article_api_fast_path_hit_count"] = (
-            int(self.thread.stats.get("article_api_fast_path_hit_count", 0)) + 1
-        )
+        self.thread.stats.incr("article_api_fast_path_hit_count")
         return {
             "raw_items": raw_items,
             "response_seen": True,
@@ -166,12 +167,8 @@ class PlaywrightArticleApiMixin:
         }
 
     def _article_api_fast_path_fail_stats(self) -> None:
-        self.thread.stats["article_api_fast_path_fail_count"] = (
-            int(self.thread.stats.get("article_api_fast_path_fail_count", 0)) + 1
-        )
-        self.thread.stats["article_api_fast_path_fallback_count"] = (
-            int(self.thread.stats.get("article_api_fast_path_fallback_count", 0)) + 1
-        )
+        self.thread.stats.incr("article_api_fast_path_fail_count")
+        self.thread.stats.incr("article_api_fast_path_fallback_count")
 
     def _record_article_api_failure(self, reason: str, *, status: str = "") -> None:
         self._article_api_fast_path_fail_stats()
@@ -182,9 +179,22 @@ class PlaywrightArticleApiMixin:
         failures[key] = int(failures.get(key, 0)) + 1
 
     def _mark_article_api_page_cap_truncation(self) -> None:
-        self.thread.stats["article_api_page_cap_truncated_count"] = (
-            int(self.thread.stats.get("article_api_page_cap_truncated_count", 0)) + 1
+        self.thread.stats.incr("article_api_page_cap_truncated_count")
+
+    async def _fetch_article_api_page(self, request_context, api_url: str, target_url: str):
+        if not await self._pace_endpoint("article_api"):
+            raise RuntimeError("article api request aborted by stop request")
+        response = await request_context.get(
+            api_url,
+            headers=self._article_api_headers(target_url),
+            timeout=self._article_api_timeout_ms(),
         )
+        status = getattr(response, "status", None)
+        if status is not None and int(status) >= 400:
+            return response, None
+        payload = await response.json()
+        self._save_fixture(api_url, payload, status=status or 200)
+        return response, payload
 
     async def _paginate_article_api_request_context(
         self,
@@ -211,53 +221,97 @@ class PlaywrightArticleApiMixin:
         first_page = max(1, int(start_page or 1))
         last_has_more = False
         last_page = first_page
+        total_pages = 0
+        lookahead = 1
+        page = first_page
+        next_unscheduled = first_page
+        pending: dict[int, tuple[str, asyncio.Task]] = {}
+        in_flight = asyncio.Semaphore(MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)
 
-        for page in range(first_page, MAX_ARTICLE_API_PAGES + 1):
-            last_page = page
-            api_url = self._build_article_api_url(
-                base_kind, cid, trade_type, path_asset, page=page
-            )
-            final_api_url = api_url
-            response = await request_context.get(
-                api_url,
-                headers=self._article_api_headers(target_url),
-                timeout=self._article_api_timeout_ms(),
-            )
-            response_match_count += 1
-            status = getattr(response, "status", None)
-            status_label = str(status if status is not None else "")
-            self.thread.stats["article_api_last_status"] = status_label
-            if status is not None and int(status) >= 400:
-                if page == first_page and not all_raw_items:
-                    self._record_article_api_failure("http_error", status=status_label)
-                    return None
-                break
-            payload = await response.json()
-            raw_items, valid_payload = self._normalize_article_api_payload(
-                payload,
-                name=name,
-                cid=cid,
-                trade_type=trade_type,
-                path_asset=path_asset,
-                mode=mode,
-                source_lat=source_lat,
-                source_lon=source_lon,
-                source_zoom=source_zoom,
-                marker_id=marker_id,
-                seen_ids=seen_ids,
-            )
-            if not valid_payload:
-                if page == first_page and not all_raw_items:
-                    self._record_article_api_failure("invalid_payload", status=status_label or "invalid_payload")
-                    return None
-                break
-            list_count = article_api_list_count(payload)
-            all_raw_items.extend(raw_items)
-            last_has_more = article_api_has_more_pages(payload, list_count)
-            if not last_has_more:
-                break
+        async def _fetch_bounded(api_url: str):
+            async with in_flight:
+                return await self._fetch_article_api_page(request_context, api_url, target_url)
+
+        def _schedule_through(last_wanted: int) -> None:
+            nonlocal next_unscheduled
+            if last_wanted < next_unscheduled:
+                return
+            for scheduled_page in article_api_prefetch_pages(
+                next_unscheduled,
+                window=last_wanted - next_unscheduled + 1,
+                total_pages=total_pages,
+                max_pages=MAX_ARTICLE_API_PAGES,
+            ):
+                api_url = self._build_article_api_url(base_kind, cid, trade_type, path_asset, page=scheduled_page)
+                pending[scheduled_page] = (api_url, asyncio.ensure_future(_fetch_bounded(api_url)))
+                next_unscheduled = scheduled_page + 1
+
+        # 첫 페이지로 남은 분량을 확인한 뒤 뒤 페이지를 미리 예약한다. 동시 요청 수는 세마포어가
+        # MAX_ARTICLE_API_PREFETCH_IN_FLIGHT 로 묶으므로 느린 페이지 하나가 나머지 요청을 막지 않는다.
+        # 결과 병합은 항상 페이지 순서대로 seen_ids dedupe를 거친다.
+        try:
+            while True:
+                _schedule_through(page + lookahead - 1)
+                if page not in pending:
+                    break
+                api_url, task = pending.pop(page)
+                response, payload = await task
+                last_page = page
+                final_api_url = api_url
+                response_match_count += 1
+                status = getattr(response, "status", None)
+                status_label = str(status if status is not None else "")
+                self.thread.stats["article_api_last_status"] = status_label
+                if payload is None:
+                    if page == first_page and not all_raw_items:
+                        self._record_article_api_failure("http_error", status=status_label)
+                        return None
+                    break
+                raw_items, valid_payload = self._normalize_article_api_payload(
+                    payload,
+                    name=name,
+                    cid=cid,
+                    trade_type=trade_type,
+                    path_asset=path_asset,
+                    mode=mode,
+                    source_lat=source_lat,
+                    source_lon=source_lon,
+                    source_zoom=source_zoom,
+                    marker_id=marker_id,
+                    seen_ids=seen_ids,
+                )
+                if not valid_payload:
+                    if page == first_page and not all_raw_items:
+                        self._record_article_api_failure("invalid_payload", status=status_label or "invalid_payload")
+                        return None
+                    break
+                list_count = article_api_list_count(payload)
+                all_raw_items.extend(raw_items)
+                last_has_more = article_api_has_more_pages(payload, list_count)
+                if page == first_page and first_page == 1:
+                    total_pages = article_api_total_pages(payload)
+                if not last_has_more:
+                    break
+                if total_pages > 0:
+                    # 남은 페이지를 모두 예약해 두고 세마포어가 동시 요청 수를 제한한다.
+                    lookahead = MAX_ARTICLE_API_PAGES
+                elif page > first_page:
+                    # 전체 분량을 모르면 종료 페이지를 지나칠 수 있으니 예약 범위를 조금씩 늘린다.
+                    lookahead = min(MAX_ARTICLE_API_PREFETCH_IN_FLIGHT, lookahead * 2)
+                page += 1
+        finally:
+            if pending:
+                # 종료 페이지 뒤로 미리 예약한 요청은 취소하고 결과를 버린다.
+                self.thread.stats.incr("article_api_prefetch_discarded_count", len(pending))
+                leftover = [task for _api_url, task in pending.values()]
+                for task in leftover:
+                    task.cancel()
+                await asyncio.gather(*leftover, return_exceptions=True)
 
-        if last_has_more and last_page >= MAX_ARTICLE_API_PAGES:
+        # 페이지 상한이나 totalCount 로 계산한 마지막 페이지에서 멈췄는데 API가 아직 더 있다고 하면 잘린 것이다.
+        if last_has_more and (
+            last_page >= MAX_ARTICLE_API_PAGES or (total_pages > 0 and last_page >= total_pages)
+        ):
             self._mark_article_api_page_cap_truncation()
 
         if not all_raw_items and response_match_count == 0:
@@ -286,8 +340,7 @@ class PlaywrightArticleApiMixin:
     ) -> dict | None:
         if not bool(getattr(self.thread, "playwright_article_api_fast_path", True)):
             return None
-        context = self._desktop_context
-        request_context = getattr(context, "request", None) if context is not None else None
+        request_context = self._article_api_request_context()
         if request_context is None or not hasattr(request_context, "get"):
             return None
         if not str(getattr(self, "_article_api_auth_header", "") or "").strip():
@@ -341,8 +394,7 @@ class PlaywrightArticleApiMixin:
                 return list(existing_items or [])
         elif not existing_items:
             return list(existing_items or [])
-        context = self._desktop_context
-        request_context = getattr(context, "request", None) if context is not None else None
+        request_context = self._article_api_request_context()
         if request_context is None or not hasattr(request_context, "get"):
             return list(existing_items or [])
         try:
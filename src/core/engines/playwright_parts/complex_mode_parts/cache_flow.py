@@ -63,6 +63,7 @@ class PlaywrightComplexCacheFlowMixin:
             if cached is not None:
                 self.thread.log(f"   캐시 히트: {len(cached)}건 로드")
                 self.thread.stats["cache_hits"] = self.thread.stats.get("cache_hits", 0) + 1
+                self.thread._warm_history_index_for_cache_hit(cached, trade_type, normalized_asset_type)
                 matched = await self._process_raw_items_with_filtered_details(
                     list(cached or []),
                     trade_type,
@@ -119,20 +120,20 @@ class PlaywrightComplexCacheFlowMixin:
         capture_failed = bool(collect_result.get("capture_failed", False))
         failure_reason = str(collect_result.get("failure_reason", "") or "")
         if response_seen:
-            self.thread.stats["response_seen_count"] = int(self.thread.stats.get("response_seen_count", 0)) + 1
+            self.thread.stats.incr("response_seen_count")
         if parse_success:
-            self.thread.stats["parse_success_count"] = int(self.thread.stats.get("parse_success_count", 0)) + 1
+            self.thread.stats.incr("parse_success_count")
         elif response_seen:
-            self.thread.stats["parse_fail_count"] = int(self.thread.stats.get("parse_fail_count", 0)) + 1
-        self.thread.stats["response_match_count"] = int(self.thread.stats.get("response_match_count", 0)) + response_match_count
+            self.thread.stats.incr("parse_fail_count")
+        self.thread.stats.incr("response_match_count", response_match_count)
         if final_url:
             self.thread.stats["playwright_last_final_url"] = final_url
         if block_reason:
             self.thread.stats["playwright_last_block_reason"] = block_reason
         if block_like_redirect:
-            self.thread.stats["block_like_redirect_count"] = int(self.thread.stats.get("block_like_redirect_count", 0)) + 1
+            self.thread.stats.incr("block_like_redirect_count")
         if capture_failed:
-            self.thread.stats["capture_failed_count"] = int(self.thread.stats.get("capture_failed_count", 0)) + 1
+            self.thread.stats.incr("capture_failed_count")
         if cache:
             if raw_items:
                 cache.set(cid, trade_type, raw_items, **cache_ctx)
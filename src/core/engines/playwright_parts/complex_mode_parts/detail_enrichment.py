@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, TYPE_CHECKING
+from collections.abc import Mapping
+from typing import Any, Optional, TYPE_CHECKING
 from urllib.parse import urlencode
 
-from src.core.services.detail_fetcher import apply_mobile_detail, fetch_mobile_article_detail
+from src.core.services.detail_fetcher import (
+    apply_mobile_detail,
+    build_detail_fingerprint,
+    fetch_mobile_article_detail,
+)
+from src.core.services.gap_analysis import ListingItemT
 from src.core.services.response_capture import TRADE_CODE_MAP, detect_trade_type, normalize_article_payload
 
 if TYPE_CHECKING:
@@ -24,107 +30,177 @@ class PlaywrightDetailEnrichmentMixin:
         trade_type: str,
     ) -> int:
         matched_count = 0
-        detail_candidates: list[dict] = []
+        detail_candidates: list[ListingRecord] = []
 
         for raw_item in raw_items or []:
             if not isinstance(raw_item, dict):
                 continue
-            item = dict(raw_item)
+            # 레코드는 여기서 한 번 만들고 상세 보강·이력·푸시까지 같은 객체를 쓴다.
+            item = ListingRecord(raw_item)
             if self.thread._check_filters(item, trade_type):
                 detail_candidates.append(item)
                 continue
-            self.thread.stats["filtered_out"] = int(self.thread.stats.get("filtered_out", 0)) + 1
-            self.thread.stats["detail_fetch_skipped_count"] = (
-                int(self.thread.stats.get("detail_fetch_skipped_count", 0)) + 1
-            )
+            self.thread.stats.incr("filtered_out")
+            self.thread.stats.incr("detail_fetch_skipped_count")
 
         if detail_candidates:
             detailed_items = await self._enrich_items_with_mobile_details(detail_candidates)
             for detailed_item in detailed_items:
-                processed_item = self.thread._enrich_item_with_history_and_alerts(dict(detailed_item))
+                processed_item = self.thread._enrich_item_with_history_and_alerts(ListingRecord.from_item(detailed_item))
                 if self.thread._check_filters(processed_item, trade_type):
                     if self.thread._push_item(processed_item):
                         matched_count += 1
                 else:
-                    self.thread.stats["filtered_out"] = int(self.thread.stats.get("filtered_out", 0)) + 1
+                    self.thread.stats.incr("filtered_out")
 
         self.thread._flush_history_updates(force=True)
         self.thread._flush_pending_items_if_needed(force=True)
         self.thread.emit_stats()
         return matched_count
 
-    async def _enrich_items_with_mobile_details(self, items: list[dict]) -> list[dict]:
+    def _detail_cache_db(self):
+        if self._detail_cache_ttl_seconds() <= 0:
+            return None
+        db = getattr(self.thread, "db", None)
+        if db is None or not callable(getattr(db, "get_article_detail_cache", None)):
+            return None
+        return db
+
+    def _detail_cache_ttl_seconds(self) -> int:
+        try:
+            ttl_hours = float(getattr(self.thread, "detail_cache_ttl_hours", 0) or 0)
+        except (TypeError, ValueError):
+            return 0
+        return max(0, int(ttl_hours * 3600))
+
+    @staticmethod
+    def _detail_cache_key(item: Mapping[str, Any]) -> tuple[str, str]:
+        asset_type = str(item.get("자산유형", "") or "APT").strip().upper() or "APT"
+        article_no = str(item.get("매물ID", "") or item.get(_LEGACY_ARTICLE_ID_KEY, "") or "").strip()
+        return asset_type, article_no
+
+    async def _apply_cached_details(
+        self,
+        items: list[ListingItemT],
+    ) -> tuple[list[Optional[ListingItemT]], list[tuple[int, ListingItemT]]]:
+        """캐시 지문이 일치하는 매물은 상세 이동 없이 채운다.
+
+        입력 순서대로 채운 결과 슬롯과, 상세를 받아야 하는 (위치, 매물) 목록을 반환한다.
+        SQLite 조회는 이벤트 루프를 막지 않도록 별도 스레드에서 실행한다.
+        """
+        slots: list[Optional[ListingItemT]] = [None] * len(items)
+        db = self._detail_cache_db()
+        if db is None:
+            return slots, list(enumerate(items))
+        keys = [self._detail_cache_key(item) for item in items]
+        try:
+            cached = await asyncio.to_thread(
+                db.get_article_detail_cache,
+                keys,
+                max_age_seconds=self._detail_cache_ttl_seconds(),
+            )
+        except Exception:
+            cached = {}
+        if not isinstance(cached, dict):
+            cached = {}
+        misses: list[tuple[int, ListingItemT]] = []
+        for index, (item, key) in enumerate(zip(items, keys)):
+            entry = cached.get(key) if key[1] else None
+            if entry and entry[0] == build_detail_fingerprint(item):
+                slots[index] = apply_mobile_detail(item, dict(entry[1]))
+            else:
+                misses.append((index, item))
+        hit_count = len(items) - len(misses)
+        if hit_count:
+            self.thread.stats.incr("detail_cache_hit_count", hit_count)
+        if misses:
+            self.thread.stats.incr("detail_cache_miss_count", len(misses))
+        return slots, misses
+
+    async def _store_cached_details(self, rows: list[tuple]) -> None:
+        db = self._detail_cache_db()
+        if db is None or not rows:
+            return
+        upsert = getattr(db, "upsert_article_detail_cache", None)
+        if not callable(upsert):
+            return
+        try:
+            await asyncio.to_thread(upsert, rows)
+        except Exception:
+            pass
+
+    async def _enrich_items_with_mobile_details(self, items: list[ListingItemT]) -> list[ListingItemT]:
+        """상세를 채운 매물을 입력 순서대로 반환한다. 넘겨받은 매물 매핑을 제자리에서 갱신한다."""
         if not items or self._page_pool is None:
             return items
 
-        async def _fetch_one(item: dict) -> dict:
+        slots, misses = await self._apply_cached_details(items)
+        if not misses:
+            return [item for item in slots if item is not None]
+        cache_rows: list[tuple] = []
+
+        async def _fetch_one(item: ListingItemT) -> ListingItemT:
             page = await self._page_pool.get()
             detail_success = False
             try:
                 article_no = str(item.get("매물ID", "") or item.get(_LEGACY_ARTICLE_ID_KEY, ""))
-                self.thread.stats["detail_fetch_total"] = int(self.thread.stats.get("detail_fetch_total", 0)) + 1
-                detail = await self._async_retry(
-                    f"mobile detail {article_no}",
-                    lambda: fetch_mobile_article_detail(
+                self.thread.stats.incr("detail_fetch_total")
+
+                async def _request_detail():
+                    if not await self._pace_endpoint("mobile_detail"):
+                        raise RuntimeError(f"mobile detail {article_no} aborted by stop request")
+                    return await fetch_mobile_article_detail(
                         page,
                         article_no,
                         navigation_timeout_ms=self._navigation_timeout_ms(),
-                    ),
-                )
+                    )
+
+                detail = await self._async_retry(f"mobile detail {article_no}", _request_detail)
                 detail_meta = dict(detail.get("_detail_meta", {}) or {}) if isinstance(detail, dict) else {}
                 missing_field_count = int(detail_meta.get("missing_field_count", 0) or 0)
                 if missing_field_count > 0:
-                    self.thread.stats["detail_missing_field_total"] = (
-                        int(self.thread.stats.get("detail_missing_field_total", 0)) + missing_field_count
-                    )
+                    self.thread.stats.incr("detail_missing_field_total", missing_field_count)
                 network_response_count = int(detail_meta.get("network_response_count", 0) or 0)
                 if network_response_count > 0:
-                    self.thread.stats["detail_network_response_total"] = (
-                        int(self.thread.stats.get("detail_network_response_total", 0)) + network_response_count
-                    )
+                    self.thread.stats.incr("detail_network_response_total", network_response_count)
                 hydration_hit = int(detail_meta.get("hydration_hit", 0) or 0)
                 if hydration_hit > 0:
-                    self.thread.stats["detail_hydration_hit_count"] = (
-                        int(self.thread.stats.get("detail_hydration_hit_count", 0)) + hydration_hit
-                    )
+                    self.thread.stats.incr("detail_hydration_hit_count", hydration_hit)
                 parse_state = str(detail_meta.get("detail_parse_state", "") or "")
                 if parse_state == "partial":
-                    self.thread.stats["detail_partial_count"] = (
-                        int(self.thread.stats.get("detail_partial_count", 0)) + 1
-                    )
+                    self.thread.stats.incr("detail_partial_count")
                 if detail and parse_state != "failed":
                     detail_success = True
-                    self.thread.stats["detail_fetch_success"] = (
-                        int(self.thread.stats.get("detail_fetch_success", 0)) + 1
-                    )
+                    asset_type, cache_article_no = self._detail_cache_key(item)
+                    cache_rows.append((asset_type, cache_article_no, build_detail_fingerprint(item), detail))
+                    self.thread.stats.incr("detail_fetch_success")
             except Exception:
                 detail = {}
             finally:
                 await self._page_pool.put(page)
             if detail_success:
-                self.thread.stats["detail_success_count"] = int(self.thread.stats.get("detail_success_count", 0)) + 1
+                self.thread.stats.incr("detail_success_count")
             else:
-                self.thread.stats["detail_fail_count"] = int(self.thread.stats.get("detail_fail_count", 0)) + 1
-            return apply_mobile_detail(dict(item), detail)
+                self.thread.stats.incr("detail_fail_count")
+            return apply_mobile_detail(item, detail)
 
-        queue: asyncio.Queue[dict] = asyncio.Queue()
-        for item in items:
-            queue.put_nowait(item)
-        result = []
+        queue: asyncio.Queue[tuple[int, ListingItemT]] = asyncio.Queue()
+        for entry in misses:
+            queue.put_nowait(entry)
         interrupted = False
 
         async def _worker() -> None:
             while not self.thread._should_stop():
                 try:
-                    item = queue.get_nowait()
+                    index, item = queue.get_nowait()
                 except asyncio.QueueEmpty:
                     return
                 try:
-                    result.append(await _fetch_one(item))
+                    slots[index] = await _fetch_one(item)
                 finally:
                     queue.task_done()
 
-        worker_count = min(len(items), max(1, int(getattr(self.thread, "playwright_detail_workers", 1) or 1)))
+        worker_count = min(len(misses), max(1, int(getattr(self.thread, "playwright_detail_workers", 1) or 1)))
         tasks = [asyncio.create_task(_worker()) for _ in range(worker_count)]
         try:
             pending_tasks = set(tasks)
@@ -149,4 +225,5 @@ class PlaywrightDetailEnrichmentMixin:
             pending = [task for task in tasks if not task.done()]
             if pending:
                 await asyncio.gather(*pending, return_exceptions=True)
-        return result
+            await self._store_cached_details(cache_rows)
+        return [item for item in slots if item is not None]
@@ -21,8 +21,6 @@ class PlaywrightComplexLoopMixin:
     async def _run_complex_mode(self):
         await self._ensure_started()
         targets = list(self.thread._iter_targets())
-        total = len(targets) * len(self.thread.trade_types)
-        current = 0
         processed_pairs = set()
         for pair in set(getattr(self.thread, "_fallback_prefill_processed_target_pairs", set()) or set()):
             if not isinstance(pair, tuple) or len(pair) < 2:
@@ -31,20 +29,87 @@ class PlaywrightComplexLoopMixin:
                 processed_pairs.add((str(pair[0]), str(pair[1]), str(pair[2])))
             else:
                 processed_pairs.add(("APT", str(pair[0]), str(pair[1])))
-        for name, cid, asset_type in targets:
-            if self.thread._should_stop():
-                break
-            complex_count = 0
-            attempted_trade_types = []
-            complex_trade_types = []
-            for trade_type in self.thread.trade_types:
+        run_state = {
+            "total": len(targets) * len(self.thread.trade_types),
+            "current": 0,
+            "processed_pairs": processed_pairs,
+            "aborted": False,
+            "fallback_request": None,
+        }
+        worker_count = min(self._target_worker_count(), len(targets))
+        # 페이지 이동 간격은 동시 워커 수만큼 버스트를 허용하는 공용 토큰 버킷이 맞춘다.
+        self._configure_pacing(navigation_slots=max(1, worker_count))
+        if worker_count > 1:
+            await self._run_complex_targets_concurrently(targets, run_state, worker_count)
+        else:
+            for name, cid, asset_type in targets:
                 if self.thread._should_stop():
                     break
-                if trade_type not in attempted_trade_types:
-                    attempted_trade_types.append(trade_type)
-                await self._check_memory_and_recycle_if_needed("complex_loop")
+                await self._crawl_complex_target(name, cid, asset_type, run_state)
+                if run_state["aborted"]:
+                    break
+        if run_state["aborted"]:
+            fallback_request = run_state.get("fallback_request")
+            if fallback_request:
+                self.thread._run_fallback_selenium(
+                    start_name=fallback_request["name"],
+                    start_cid=fallback_request["cid"],
+                    start_trade=fallback_request["trade_type"],
+                    prefill_complex=fallback_request["prefill_complex"],
+                    prefill_processed_target_pairs=set(run_state["processed_pairs"]),
+                    reason=fallback_request["reason"],
+                )
+            self.thread._current_pair = None
+            return
+        self.thread._current_pair = None
+        self.thread._finalize_disappeared_articles(run_state["processed_pairs"])
+
+    async def _run_complex_targets_concurrently(self, targets: list, run_state: dict, worker_count: int) -> None:
+        queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue()
+        for target in targets:
+            queue.put_nowait(target)
+
+        async def _worker() -> None:
+            while not self.thread._should_stop() and not run_state["aborted"]:
+                try:
+                    name, cid, asset_type = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self._crawl_complex_target(name, cid, asset_type, run_state)
+
+        self.thread.log(f"단지 동시 수집 워커 {worker_count}개로 진행합니다.", 10)
+        self._target_gate = TargetWorkerGate()
+        try:
+            results = await asyncio.gather(
+                *[asyncio.create_task(_worker()) for _ in range(worker_count)],
+                return_exceptions=True,
+            )
+        finally:
+            self._target_gate = None
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, asyncio.CancelledError):
+                raise result
+
+    async def _crawl_complex_target(self, name: str, cid: str, asset_type: str, run_state: dict) -> None:
+        processed_pairs = run_state["processed_pairs"]
+        complex_count = 0
+        attempted_trade_types = []
+        complex_trade_types = []
+        interrupted_by_fallback = False
+        for trade_type in self.thread.trade_types:
+            if self.thread._should_stop():
+                break
+            if run_state["aborted"]:
+                interrupted_by_fallback = bool(run_state.get("fallback_request"))
+                break
+            if trade_type not in attempted_trade_types:
+                attempted_trade_types.append(trade_type)
+            await self._check_memory_and_recycle_if_needed("complex_loop")
+            async with self._target_pair_slot():
                 self.thread._current_pair = self.thread._pair_key(name, cid, trade_type, asset_type=asset_type)
-                current += 1
+                run_state["current"] += 1
+                current = int(run_state["current"])
+                total = int(run_state["total"])
                 self.thread.progress_signal.emit(
                     int(current / total * 100) if total else 0,
                     f"{name} ({trade_type})",
@@ -80,8 +145,12 @@ class PlaywrightComplexLoopMixin:
                                 f"   ⏸️ 차단 신호 3회 연속 감지, {int(self.thread._block_cooldown_seconds)}초 쿨다운",
                                 30,
                             )
-                            if not await self._sleep_async_interruptible(self.thread._block_cooldown_seconds):
-                                self.thread._current_pair = None
+                            async with self._exclusive_runtime():
+                                cooled_down = await self._sleep_async_interruptible(
+                                    self.thread._block_cooldown_seconds
+                                )
+                            if not cooled_down:
+                                run_state["aborted"] = True
                                 return
                     else:
                         self.thread._reset_block_detection_streak()
@@ -103,38 +172,61 @@ class PlaywrightComplexLoopMixin:
                                     "count": int(complex_count),
                                     "trade_types": list(complex_trade_types),
                                 }
-                            self.thread._run_fallback_selenium(
-                                start_name=name,
-                                start_cid=cid,
-                                start_trade=trade_type,
-                                prefill_complex=prefill_payload,
-                                prefill_processed_target_pairs=set(processed_pairs),
-                                reason=str(exc),
-                            )
-                            self.thread._current_pair = None
+                            # 실제 전환은 진행 중인 다른 워커가 현재 pair를 마친 뒤 한 번만 수행한다.
+                            run_state["fallback_request"] = {
+                                "name": name,
+                                "cid": cid,
+                                "trade_type": trade_type,
+                                "prefill_complex": prefill_payload,
+                                "reason": str(exc),
+                            }
+                            run_state["aborted"] = True
                             return
-                if not self.thread._sleep_interruptible(self.thread._get_speed_delay()):
-                    break
-            self.thread._flush_history_updates(force=True)
-            if not attempted_trade_types:
-                continue
-            run_status = self.thread._determine_run_status(
-                self.thread.trade_types,
-                complex_trade_types,
-                attempted_trade_types,
-            )
-            history_trade_types = complex_trade_types or attempted_trade_types
-            self.thread.record_crawl_history(
-                name,
-                cid,
-                ",".join(history_trade_types),
-                int(complex_count),
-                engine=self.engine_name,
-                mode=self.thread.crawl_mode,
-                asset_type=asset_type,
-                run_status=run_status,
-            )
-            if complex_trade_types:
-                self.thread.complex_finished_signal.emit(name, cid, ",".join(complex_trade_types), int(complex_count))
-        self.thread._current_pair = None
-        self.thread._finalize_disappeared_articles(processed_pairs)
+        if interrupted_by_fallback:
+            self._defer_complex_to_fallback(name, cid, asset_type, complex_count, complex_trade_types)
+            return
+        self.thread._flush_history_updates(force=True)
+        if not attempted_trade_types:
+            return
+        run_status = self.thread._determine_run_status(
+            self.thread.trade_types,
+            complex_trade_types,
+            attempted_trade_types,
+        )
+        history_trade_types = complex_trade_types or attempted_trade_types
+        self.thread.record_crawl_history(
+            name,
+            cid,
+            ",".join(history_trade_types),
+            int(complex_count),
+            engine=self.engine_name,
+            mode=self.thread.crawl_mode,
+            asset_type=asset_type,
+            run_status=run_status,
+        )
+        if complex_trade_types:
+            self.thread.complex_finished_signal.emit(name, cid, ",".join(complex_trade_types), int(complex_count))
+
+    def _defer_complex_to_fallback(
+        self,
+        name: str,
+        cid: str,
+        asset_type: str,
+        complex_count: int,
+        complex_trade_types: list[str],
+    ) -> None:
+        """다른 워커의 fallback 전환으로 중단된 단지의 부분 결과를 Selenium 이력 기록에 넘긴다."""
+        self.thread._flush_history_updates(force=True)
+        if not complex_trade_types:
+            return
+        prefill_complexes = getattr(self.thread, "_fallback_prefill_complexes", None)
+        if not isinstance(prefill_complexes, dict):
+            prefill_complexes = {}
+            self.thread._fallback_prefill_complexes = prefill_complexes
+        prefill_complexes[(str(name), str(cid))] = {
+            "name": name,
+            "cid": cid,
+            "asset_type": asset_type,
+            "count": int(complex_count),
+            "trade_types": list(complex_trade_types),
+        }
@@ -80,143 +80,146 @@ class PlaywrightResponseCaptureMixin:
             if api_result is not None:
                 return api_result
 
-            page = self._desktop_page
+            page = await self._acquire_desktop_page()
             if page is None:
                 break
-            plan_key = (str(mode or "complex"), str(asset_type or "APT").upper(), str(base_kind or ""))
-            for plan in self._ordered_entry_plans(target_url, plan_key):
-                pending_tasks: set[asyncio.Task] = set()
-                response_event = asyncio.Event()
-                plan_response_seen = False
-                plan_parse_success = False
-                plan_parse_failed = False
-                plan_block_like_redirect = False
-                plan_block_reason = ""
-                plan_final_url = ""
+            try:
+                plan_key = (str(mode or "complex"), str(asset_type or "APT").upper(), str(base_kind or ""))
+                for plan in self._ordered_entry_plans(target_url, plan_key):
+                    pending_tasks: set[asyncio.Task] = set()
+                    response_event = asyncio.Event()
+                    plan_response_seen = False
+                    plan_parse_success = False
+                    plan_parse_failed = False
+                    plan_block_like_redirect = False
+                    plan_block_reason = ""
+                    plan_final_url = ""
 
-                async def _consume(response):
-                    nonlocal response_seen, parse_success, parse_failed, response_match_count
-                    nonlocal plan_response_seen, plan_parse_success, plan_parse_failed
-                    nonlocal capture_last_payload
-                    url = response.url
-                    expected = f"/api/articles/{'house' if base_kind == 'houses' else 'complex'}/{cid}"
-                    if expected not in url:
-                        return
-                    response_match_count += 1
-                    response_seen = True
-                    plan_response_seen = True
-                    self._remember_article_api_request_headers(response)
-                    try:
-                        payload = await response.json()
-                    except Exception:
-                        parse_failed = True
-                        plan_parse_failed = True
-                        response_event.set()
-                        return
-                    article_list = payload.get("articleList") or payload.get("articles") or []
-                    if not isinstance(article_list, list):
-                        parse_failed = True
-                        plan_parse_failed = True
+                    async def _consume(response):
+                        nonlocal response_seen, parse_success, parse_failed, response_match_count
+                        nonlocal plan_response_seen, plan_parse_success, plan_parse_failed
+                        nonlocal capture_last_payload
+                        url = response.url
+                        expected = f"/api/articles/{'house' if base_kind == 'houses' else 'complex'}/{cid}"
+                        if expected not in url:
+                            return
+                        response_match_count += 1
+                        response_seen = True
+                        plan_response_seen = True
+                        self._remember_article_api_request_headers(response)
+                        try:
+                            payload = await response.json()
+                        except Exception:
+                            parse_failed = True
+                            plan_parse_failed = True
+                            response_event.set()
+                            return
+                        article_list = payload.get("articleList") or payload.get("articles") or []
+                        if not isinstance(article_list, list):
+                            parse_failed = True
+                            plan_parse_failed = True
+                            response_event.set()
+                            return
+                        capture_last_payload = payload
+                        parse_success = True
+                        plan_parse_success = True
+                        for article in article_list:
+                            if detect_trade_type(article, requested_trade_type=trade_type) != trade_type:
+                                continue
+                            payload_marker_id = "" if mode == "complex" else str(marker_id or cid or "")
+                            item = normalize_article_payload(
+                                article,
+                                complex_name=name,
+                                complex_id=cid,
+                                requested_trade_type=trade_type,
+                                asset_type=path_asset,
+                                mode=mode,
+                                lat=source_lat,
+                                lon=source_lon,
+                                zoom=source_zoom,
+                                marker_id=payload_marker_id,
+                            )
+                            aid = str(item.get("매물ID", "") or item.get(_LEGACY_ARTICLE_ID_KEY, "") or "")
+                            if not aid or aid in seen_ids:
+                                continue
+                            seen_ids.add(aid)
+                            raw_items.append(item)
                         response_event.set()
-                        return
-                    capture_last_payload = payload
-                    parse_success = True
-                    plan_parse_success = True
-                    for article in article_list:
-                        if detect_trade_type(article, requested_trade_type=trade_type) != trade_type:
-                            continue
-                        payload_marker_id = "" if mode == "complex" else str(marker_id or cid or "")
-                        item = normalize_article_payload(
-                            article,
-                            complex_name=name,
-                            complex_id=cid,
-                            requested_trade_type=trade_type,
-                            asset_type=path_asset,
-                            mode=mode,
-                            lat=source_lat,
-                            lon=source_lon,
-                            zoom=source_zoom,
-                            marker_id=payload_marker_id,
-                        )
-                        aid = str(item.get("매물ID", "") or item.get(_LEGACY_ARTICLE_ID_KEY, "") or "")
-                        if not aid or aid in seen_ids:
-                            continue
-                        seen_ids.add(aid)
-                        raw_items.append(item)
-                    response_event.set()
 
-                def _handle(response):
-                    try:
-                        self._spawn_response_task(pending_tasks, _consume(response))
-                    except Exception:
-                        return None
+                    def _handle(response):
+                        try:
+                            self._spawn_response_task(pending_tasks, _consume(response))
+                        except Exception:
+                            return None
 
-                page.on("response", _handle)
-                try:
-                    await self._run_entry_plan(
-                        page,
-                        plan,
-                        label=f"article {base_kind}/{cid}",
-                    )
+                    page.on("response", _handle)
                     try:
-                        await asyncio.wait_for(
-                            response_event.wait(),
-                            timeout=max(0.1, float(self._article_response_wait_ms()) / 1000.0),
+                        await self._run_entry_plan(
+                            page,
+                            plan,
+                            label=f"article {base_kind}/{cid}",
                         )
-                    except Exception:
-                        pass
-                    if response_event.is_set() and (
-                        raw_items or (plan_response_seen and plan_parse_success and not plan_parse_failed)
-                    ):
-                        plan_final_url = str(getattr(page, "url", "") or "")
-                    else:
                         try:
-                            await self._async_retry(
-                                f"article load {base_kind}/{cid}",
-                                lambda: page.wait_for_load_state("networkidle", timeout=6000),
+                            await asyncio.wait_for(
+                                response_event.wait(),
+                                timeout=max(0.1, float(self._article_response_wait_ms()) / 1000.0),
                             )
                         except Exception:
                             pass
-                        for text in ["매매", trade_type]:
+                        if response_event.is_set() and (
+                            raw_items or (plan_response_seen and plan_parse_success and not plan_parse_failed)
+                        ):
+                            plan_final_url = str(getattr(page, "url", "") or "")
+                        else:
                             try:
-                                await page.locator(f"text={text}").first.click(timeout=1000)
-                                await page.wait_for_timeout(400)
+                                await self._async_retry(
+                                    f"article load {base_kind}/{cid}",
+                                    lambda: page.wait_for_load_state("networkidle", timeout=6000),
+                                )
                             except Exception:
-                                continue
-                        await page.wait_for_timeout(1800)
-                        page_state = await self._classify_page_state(page)
-                        plan_final_url = str(page_state.get("final_url", "") or "")
-                        plan_block_like_redirect = bool(page_state.get("block_like_redirect", False))
-                        plan_block_reason = str(page_state.get("block_reason", "") or "")
-                except Exception as exc:
-                    self.thread.log(
-                        f"   entry plan 실패({base_kind}/{cid}, {plan.get('name', 'direct')}): {exc}",
-                        20,
-                    )
-                finally:
-                    try:
-                        page.remove_listener("response", _handle)
-                    except Exception:
-                        pass
-                    _, timed_out = await self._drain_pending_response_tasks(
-                        pending_tasks,
-                        label=f"article_capture:{base_kind}/{cid}:{plan.get('name', 'direct')}",
-                    )
-                    drain_timed_out = drain_timed_out or bool(timed_out)
+                                pass
+                            for text in ["매매", trade_type]:
+                                try:
+                                    await page.locator(f"text={text}").first.click(timeout=1000)
+                                    await page.wait_for_timeout(400)
+                                except Exception:
+                                    continue
+                            await page.wait_for_timeout(1800)
+                            page_state = await self._classify_page_state(page)
+                            plan_final_url = str(page_state.get("final_url", "") or "")
+                            plan_block_like_redirect = bool(page_state.get("block_like_redirect", False))
+                            plan_block_reason = str(page_state.get("block_reason", "") or "")
+                    except Exception as exc:
+                        self.thread.log(
+                            f"   entry plan 실패({base_kind}/{cid}, {plan.get('name', 'direct')}): {exc}",
+                            20,
+                        )
+                    finally:
+                        try:
+                            page.remove_listener("response", _handle)
+                        except Exception:
+                            pass
+                        _, timed_out = await self._drain_pending_response_tasks(
+                            pending_tasks,
+                            label=f"article_capture:{base_kind}/{cid}:{plan.get('name', 'direct')}",
+                        )
+                        drain_timed_out = drain_timed_out or bool(timed_out)
 
-                if plan_final_url:
-                    final_url = plan_final_url
-                block_like_redirect = bool(plan_block_like_redirect and not raw_items)
-                if plan_block_reason:
-                    block_reason = plan_block_reason
-                if plan_response_seen and plan_parse_success:
-                    confirmed_capture = True
-                    confirmed_parse_success = True
-                    self._remember_entry_plan_success(plan_key, str(plan.get("name", "direct") or "direct"))
-                if raw_items:
-                    break
-                if plan_response_seen and plan_parse_success and not plan_parse_failed and not plan_block_like_redirect:
-                    break
+                    if plan_final_url:
+                        final_url = plan_final_url
+                    block_like_redirect = bool(plan_block_like_redirect and not raw_items)
+                    if plan_block_reason:
+                        block_reason = plan_block_reason
+                    if plan_response_seen and plan_parse_success:
+                        confirmed_capture = True
+                        confirmed_parse_success = True
+                        self._remember_entry_plan_success(plan_key, str(plan.get("name", "direct") or "direct"))
+                    if raw_items:
+                        break
+                    if plan_response_seen and plan_parse_success and not plan_parse_failed and not plan_block_like_redirect:
+                        break
+            finally:
+                self._release_desktop_page(page)
             if raw_items:
                 break
 
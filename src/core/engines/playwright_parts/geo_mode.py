@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from src.core.engines.playwright_parts.geo_mode_parts.map_controls import PlaywrightGeoMapControlMixin
+from src.core.engines.playwright_parts.geo_mode_parts.marker_api import PlaywrightGeoMarkerApiMixin
 from src.core.engines.playwright_parts.geo_mode_parts.markers import PlaywrightGeoMarkerMixin
 from src.core.engines.playwright_parts.geo_mode_parts.scan import PlaywrightGeoScanMixin
 
 
 class PlaywrightGeoModeMixin(
     PlaywrightGeoScanMixin,
+    PlaywrightGeoMarkerApiMixin,
     PlaywrightGeoMarkerMixin,
     PlaywrightGeoMapControlMixin,
 ):
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, TYPE_CHECKING
+from urllib.parse import urlencode
+
+from src.core.services.article_api import MAX_ARTICLE_API_PREFETCH_IN_FLIGHT, build_single_markers_url
+from src.core.services.geo_planner import QuadtreeSweepPlanner
+from src.core.services.map_geometry import DEFAULT_VIEWPORT_PX, build_marker_tile_keys, marker_tile_bounds
+from src.core.services.response_capture import TRADE_CODE_MAP, is_cluster_marker, normalize_marker_payload
+from src.core.services.response_fixtures import ReplayResponse
+from src.utils.constants import (
+    GEO_PLANNER_MAX_DEPTH,
+    GEO_PLANNER_MAX_ZOOM,
+    GEO_PLANNER_REQUEST_BUDGET,
+    GEO_PLANNER_SPLIT_MARKER_COUNT,
+)
+
+if TYPE_CHECKING:
+    from src.core.engines.playwright_engine import *  # noqa: F403
+
+_TRADE_TO_CODE: dict[str, str] = {value: key for key, value in TRADE_CODE_MAP.items()}
+
+
+class PlaywrightGeoMarkerApiMixin:
+    """지도를 드래그하지 않고 ``single-markers`` 타일을 request API로 직접 받아 오는 탐색.
+
+    타일은 줌별 고정 격자(``build_marker_tile_keys``)로 나누고, 밀집 타일만 ``QuadtreeSweepPlanner``
+    로 한 단계씩 확대해 다시 요청한다. 유효한 타일 캐시가 있으면 네트워크 없이 재사용한다. 남은 타일은 세션(인증 헤더)이 확보된 뒤에만 요청하며, 응답은
+    ``_run_geo`` 가 등록한 marker handler에 넘겨 드래그 탐색과 같은 ``discovered`` 에 모인다.
+    타일을 하나도 얻지 못한 조합은 호출한 쪽이 지도 드래그 탐색으로 대신 처리한다.
+    """
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    def _geo_marker_api_ready(self) -> bool:
+        if not str(getattr(self, "_article_api_auth_header", "") or "").strip():
+            return False
+        return self._article_api_request_context() is not None
+
+    async def _wait_for_marker_auth(self, timeout_ms: int) -> bool:
+        """첫 화면의 마커 응답이 처리되어 인증 헤더가 잡힐 때까지 최대 ``timeout_ms`` 기다린다."""
+        if getattr(self, "_geo_marker_handler", None) is None:
+            return False
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0, int(timeout_ms)) / 1000.0
+        while not str(getattr(self, "_article_api_auth_header", "") or "").strip():
+            if self.thread._should_stop() or loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def _geo_tile_cache_db(self):
+        try:
+            ttl_hours = float(getattr(self.thread, "geo_tile_cache_ttl_hours", 0) or 0)
+        except (TypeError, ValueError):
+            return None
+        if ttl_hours <= 0:
+            return None
+        db = getattr(self.thread, "db", None)
+        if db is None or not callable(getattr(db, "get_geo_marker_tiles", None)):
+            return None
+        return db
+
+    def _load_cached_marker_tiles(self, asset_type: str, trade_type: str, zoom: int, tile_keys) -> dict:
+        """``{(tile_x, tile_y): (markers, cluster_count)}`` 형태로 유효한 캐시 타일을 반환한다."""
+        db = self._geo_tile_cache_db()
+        if db is None or not tile_keys:
+            return {}
+        max_age = float(getattr(self.thread, "geo_tile_cache_ttl_hours", 0) or 0) * 3600
+        try:
+            cached = db.get_geo_marker_tiles(asset_type, trade_type, zoom, tile_keys, max_age_seconds=max_age, include_meta=True)
+        except Exception:
+            return {}
+        if not isinstance(cached, dict):
+            return {}
+        return {
+            key: value if isinstance(value, tuple) else (value, 0)
+            for key, value in cached.items()
+        }
+
+    def _store_marker_tiles(self, rows: list[tuple]) -> None:
+        db = self._geo_tile_cache_db()
+        if db is None or not rows:
+            return
+        upsert = getattr(db, "upsert_geo_marker_tiles", None)
+        if not callable(upsert):
+            return
+        try:
+            upsert(rows)
+        except Exception:
+            pass
+
+    def _remember_known_complexes(self, markers: list[dict]) -> None:
+        """드래그 탐색으로 찾은 단지도 좌표 인덱스에 남겨 다음 탐색 화면에 바로 보여 준다."""
+        db = self._geo_tile_cache_db()
+        upsert = getattr(db, "upsert_geo_known_complexes", None) if db is not None else None
+        if not callable(upsert) or not markers:
+            return
+        try:
+            upsert(markers)
+        except Exception:
+            pass
+
+    async def _fetch_marker_tile(self, request_context, url: str, referer: str) -> list:
+        if not await self._pace_endpoint("article_api"):
+            raise RuntimeError("marker tile request aborted by stop request")
+        response = await request_context.get(
+            url,
+            headers=self._article_api_headers(referer),
+            timeout=self._article_api_timeout_ms(),
+        )
+        status = int(getattr(response, "status", 200) or 200)
+        if status >= 400:
+            raise RuntimeError(f"marker tile HTTP {status}")
+        payload = await response.json()
+        if not isinstance(payload, list):
+            raise RuntimeError("marker tile payload is not a list")
+        self._save_fixture(url, payload, status=status)
+        return payload
+
+    async def _sweep_geo_markers_via_api(
+        self,
+        pairs: list[tuple[str, str]],
+        lat: float,
+        lon: float,
+        zoom: int,
+        geo,
+    ) -> set[tuple[str, str]]:
+        """``(asset_type, trade_type)`` 조합마다 quadtree planner로 타일을 채우고, 처리된 조합을 반환한다.
+
+        시작 타일은 ``zoom`` 의 고정 격자이며, 마커가 많거나 클러스터가 섞인 타일만 한 단계 확대한
+        자식 타일 4개로 다시 요청한다. 조합들은 같은 semaphore를 나눠 쓰며 동시에 진행된다.
+        """
+        marker_handler = getattr(self, "_geo_marker_handler", None)
+        if not pairs or marker_handler is None:
+            return set()
+        if getattr(self, "_geo_tiles_served", None) is None:
+            self._geo_tiles_served = set()
+        root_keys = build_marker_tile_keys(
+            lat,
+            lon,
+            zoom,
+            rings=geo.rings,
+            step_px=geo.step_px,
+            viewport_px=DEFAULT_VIEWPORT_PX,
+        )
+        request_context = self._article_api_request_context() if self._geo_marker_api_ready() else None
+        semaphore = asyncio.Semaphore(MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)
+        request_budget = int(getattr(geo, "request_budget", GEO_PLANNER_REQUEST_BUDGET) or 0)
+        max_depth = int(getattr(geo, "max_depth", GEO_PLANNER_MAX_DEPTH) or 0)
+        if request_context is not None:
+            self.thread.log(
+                f"   지도 마커 API 탐색: 조합 {len(pairs)}개, 시작 타일 {len(root_keys)}개 (조합당 요청 상한 {request_budget or '없음'})",
+                10,
+            )
+        summaries = await asyncio.gather(
+            *(
+                self._plan_geo_marker_pair(
+                    pair,
+                    [(int(zoom), key[0], key[1]) for key in root_keys],
+                    lat,
+                    lon,
+                    zoom,
+                    request_context,
+                    semaphore,
+                    request_budget=request_budget,
+                    max_depth=max_depth,
+                )
+                for pair in pairs
+            )
+        )
+
+        stats = self.thread.stats
+        cache_hits = sum(summary["cache_hits"] for summary in summaries)
+        requested = sum(summary["ok"] + summary["fail"] for summary in summaries)
+        if cache_hits:
+            stats.incr("geo_tile_cache_hit_count", cache_hits)
+        cache_misses = sum(summary["cache_misses"] for summary in summaries)
+        if cache_misses and self._geo_tile_cache_db() is not None:
+            stats.incr("geo_tile_cache_miss_count", cache_misses)
+        if requested:
+            stats.incr("geo_api_sweep_count")
+            stats.incr("geo_api_tile_count", sum(s["ok"] for s in summaries))
+            stats.incr("geo_api_tile_fail_count", sum(s["fail"] for s in summaries))
+        planners = [summary["planner"] for summary in summaries]
+        stats.incr("geo_plan_tile_count", sum(p.tile_count for p in planners))
+        stats.incr("geo_plan_request_count", sum(p.request_count for p in planners))
+        stats.incr("geo_plan_split_count", sum(p.split_count for p in planners))
+        stats.raise_to("geo_plan_max_depth", max((p.max_depth_reached for p in planners), default=0))
+        root_area = sum(p.root_area for p in planners)
+        if root_area > 0:
+            stats["geo_plan_coverage_pct"] = round(100.0 * sum(p.resolved_area for p in planners) / root_area, 1)
+
+        swept: set[tuple[str, str]] = set()
+        for pair, summary in zip(pairs, summaries):
+            label = f"{pair[0]}/{pair[1]}"
+            planner = summary["planner"]
+            if summary["root_missing"]:
+                if request_context is not None and summary["root_missing"] == len(root_keys):
+                    stats.incr("geo_api_fallback_count")
+                    self.thread.log(f"   {label} 마커 API 타일을 받지 못해 지도 드래그 탐색으로 전환합니다.", 20)
+                    continue
+                if request_context is None:
+                    # 세션이 없으면 시작 타일을 캐시로 다 채운 조합만 처리된 것으로 본다.
+                    continue
+            if planner.budget_exhausted:
+                stats.incr("geo_plan_budget_exhausted_count")
+            if self.thread._should_stop():
+                swept.add(pair)
+                continue
+            if summary["fail"] > 0:
+                self.thread._mark_geo_incomplete("marker_tile_fail", f"{label} {summary['fail']}/{summary['ok'] + summary['fail']}")
+            elif planner.budget_exhausted:
+                self.thread._mark_geo_incomplete(
+                    "marker_plan_budget",
+                    f"{label} coverage {planner.coverage_ratio() * 100:.0f}%",
+                )
+            swept.add(pair)
+        if request_context is None and cache_hits:
+            self.thread.log(f"   지도 마커 타일 캐시로 탐색: 조합 {len(swept)}/{len(pairs)}개, 타일 {cache_hits}건", 10)
+        self.thread.emit_stats()
+        return swept
+
+    async def _plan_geo_marker_pair(
+        self,
+        pair: tuple[str, str],
+        roots: list[tuple[int, int, int]],
+        lat: float,
+        lon: float,
+        zoom: int,
+        request_context,
+        semaphore: asyncio.Semaphore,
+        *,
+        request_budget: int,
+        max_depth: int,
+    ) -> dict[str, Any]:
+        """한 조합의 quadtree 탐색. 캐시 우선, 이후 예산 안에서 요청하며 결과를 handler에 넘긴다."""
+        asset_type, trade_type = pair
+        marker_handler = self._geo_marker_handler
+        served = self._geo_tiles_served
+        base_kind = "houses" if asset_type == "VL" else "complexes"
+        referer = (
+            f"https://new.land.naver.com/{base_kind}?"
+            + urlencode({"ms": f"{lat},{lon},{zoom}", "a": asset_type, "tradeTypes": _TRADE_TO_CODE.get(trade_type, "A1")})
+        )
+        planner = QuadtreeSweepPlanner(
+            roots,
+            split_marker_count=GEO_PLANNER_SPLIT_MARKER_COUNT,
+            max_depth=max_depth,
+            max_zoom=GEO_PLANNER_MAX_ZOOM,
+            request_budget=request_budget,
+        )
+        summary: dict[str, Any] = {
+            "planner": planner,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "ok": 0,
+            "fail": 0,
+            "root_missing": 0,
+        }
+
+        def _tile_url(tile) -> str:
+            tile_zoom, tile_x, tile_y = tile
+            return build_single_markers_url(
+                base_kind,
+                trade_type,
+                asset_type,
+                zoom=tile_zoom,
+                bounds=marker_tile_bounds(tile_x, tile_y, tile_zoom, DEFAULT_VIEWPORT_PX),
+            )
+
+        async def _run_one(url: str):
+            async with semaphore:
+                return await self._async_retry(
+                    "geo marker tile",
+                    lambda: self._fetch_marker_tile(request_context, url, referer),
+                    attempts=2,
+                )
+
+        while len(planner) and not self.thread._should_stop():
+            batch = planner.next_batch(MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)
+            by_zoom: dict[int, list[tuple[int, int]]] = {}
+            for (tile_zoom, tile_x, tile_y), _depth in batch:
+                if (asset_type, trade_type, tile_zoom, tile_x, tile_y) not in served:
+                    by_zoom.setdefault(tile_zoom, []).append((tile_x, tile_y))
+            cached_by_zoom = {
+                tile_zoom: self._load_cached_marker_tiles(asset_type, trade_type, tile_zoom, keys)
+                for tile_zoom, keys in by_zoom.items()
+            }
+            fetches = []
+            for tile, depth in batch:
+                tile_zoom, tile_x, tile_y = tile
+                if (asset_type, trade_type, *tile) in served:
+                    # 같은 실행에서 이미 넘긴 타일은 다시 넘기지 않고, 더 내려가지도 않는다.
+                    planner.record(tile, depth, marker_count=0)
+                    continue
+                cached = cached_by_zoom.get(tile_zoom, {}).get((tile_x, tile_y))
+                if cached is not None:
+                    markers, cluster_count = cached
+                    served.add((asset_type, trade_type, *tile))
+                    marker_handler(ReplayResponse(_tile_url(tile), 200, markers))
+                    summary["cache_hits"] += 1
+                    planner.record(tile, depth, marker_count=len(markers), cluster_count=cluster_count)
+                    continue
+                summary["cache_misses"] += 1
+                if request_context is None or not planner.charge_request():
+                    planner.mark_unresolved(tile, depth)
+                    if depth == 0:
+                        summary["root_missing"] += 1
+                    continue
+                fetches.append((tile, depth, _tile_url(tile)))
+            if not fetches:
+                continue
+            results = await asyncio.gather(*(_run_one(url) for _tile, _depth, url in fetches), return_exceptions=True)
+            cache_rows: list[tuple] = []
+            for (tile, depth, url), result in zip(fetches, results):
+                if isinstance(result, BaseException):
+                    summary["fail"] += 1
+                    planner.mark_unresolved(tile, depth)
+                    if depth == 0:
+                        summary["root_missing"] += 1
+                    continue
+                summary["ok"] += 1
+                markers = []
+                cluster_count = 0
+                for raw_marker in result:
+                    if not isinstance(raw_marker, dict):
+                        continue
+                    if is_cluster_marker(raw_marker):
+                        cluster_count += 1
+                        continue
+                    markers.append(normalize_marker_payload(raw_marker, asset_type=asset_type))
+                served.add((asset_type, trade_type, *tile))
+                cache_rows.append((asset_type, trade_type, tile[0], tile[1], tile[2], markers, cluster_count))
+                marker_handler(ReplayResponse(url, 200, markers))
+                planner.record(tile, depth, marker_count=len(markers), cluster_count=cluster_count)
+            self._store_marker_tiles(cache_rows)
+        planner.drain_unresolved()
+        return summary
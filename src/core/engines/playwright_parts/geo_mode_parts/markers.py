@@ -27,6 +27,8 @@ class PlaywrightGeoMarkerMixin:
             url = response.url
             if ("complexes/single-markers" not in url) and ("houses/single-markers" not in url):
                 return
+            # 화면이 보낸 마커 요청의 인증 헤더를 기억해 두면 이후 조합은 마커 API로 바로 탐색한다.
+            self._remember_article_api_request_headers(response)
             try:
                 payload = await response.json()
             except Exception:
@@ -34,6 +36,7 @@ class PlaywrightGeoMarkerMixin:
             if not isinstance(payload, list):
                 return
             asset = "VL" if "houses/" in url else "APT"
+            dedup_skipped = 0
             for raw_marker in payload:
                 marker = normalize_marker_payload(raw_marker, asset_type=asset)
                 cid = marker.get("complex_id", "")
@@ -45,13 +48,14 @@ class PlaywrightGeoMarkerMixin:
                 current_count = int(current.get("count", 0) or 0) if current else -1
                 if current is None or marker_count > current_count:
                     discovered[dedupe_key] = marker
-                    self.thread.stats["geo_discovered_count"] = len(discovered)
                     self.thread.register_discovered_complex(marker)
-                    self.thread.emit_stats()
                 else:
-                    stats["dedup_skipped"] = int(stats.get("dedup_skipped", 0)) + 1
-                    self.thread.stats["geo_dedup_count"] = int(stats.get("dedup_skipped", 0) or 0)
-                    self.thread.emit_stats()
+                    dedup_skipped += 1
+            # 통계는 마커마다가 아니라 응답 하나를 다 처리한 뒤 한 번만 갱신/전송한다.
+            stats["dedup_skipped"] += dedup_skipped
+            self.thread.stats["geo_discovered_count"] = len(discovered)
+            self.thread.stats["geo_dedup_count"] = stats["dedup_skipped"]
+            self.thread.emit_stats()
 
         def _handle(response):
             try:
@@ -64,9 +68,7 @@ class PlaywrightGeoMarkerMixin:
     async def _switch_to_listing_markers(self):
         if not self._desktop_page:
             return False
-        self.thread.stats["geo_marker_switch_attempt_count"] = (
-            int(self.thread.stats.get("geo_marker_switch_attempt_count", 0)) + 1
-        )
+        self.thread.stats.incr("geo_marker_switch_attempt_count")
         attempts: list[tuple[str, Any]] = []
         for text in ["상세매물검색", "매물", "매물검색", "매물 보기"]:
             attempts.append((f"text:{text}", self._desktop_page.locator(f"text={text}").first))
@@ -85,9 +87,7 @@ class PlaywrightGeoMarkerMixin:
             try:
                 await locator.click(timeout=1200)
                 await self._desktop_page.wait_for_timeout(500)
-                self.thread.stats["geo_marker_switch_success_count"] = (
-                    int(self.thread.stats.get("geo_marker_switch_success_count", 0)) + 1
-                )
+                self.thread.stats.incr("geo_marker_switch_success_count")
                 self.thread.stats["geo_marker_switch_last_method"] = label
                 self.thread.emit_stats()
                 return True
@@ -98,15 +98,11 @@ class PlaywrightGeoMarkerMixin:
             await self._desktop_page.wait_for_timeout(300)
             await self._desktop_page.locator("text=매물").first.click(timeout=1200)
             await self._desktop_page.wait_for_timeout(500)
-            self.thread.stats["geo_marker_switch_success_count"] = (
-                int(self.thread.stats.get("geo_marker_switch_success_count", 0)) + 1
-            )
+            self.thread.stats.incr("geo_marker_switch_success_count")
             self.thread.stats["geo_marker_switch_last_method"] = "type_menu:text:매물"
             self.thread.emit_stats()
             return True
         except Exception:
-            self.thread.stats["geo_marker_switch_fail_count"] = (
-                int(self.thread.stats.get("geo_marker_switch_fail_count", 0)) + 1
-            )
+            self.thread.stats.incr("geo_marker_switch_fail_count")
             self.thread.emit_stats()
             return False
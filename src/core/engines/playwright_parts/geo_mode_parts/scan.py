@@ -36,13 +36,21 @@ class PlaywrightGeoScanMixin:
         marker_wait_count = 0
         marker_drain_timed_out = False
         self._desktop_page.on("response", marker_handler)
+        self._geo_marker_handler = marker_handler
+        self._geo_tiles_served = set()
         try:
+            pairs = [(asset_type, trade_type) for asset_type in geo.asset_types for trade_type in self.thread.trade_types]
+            api_swept = set()
+            if not self._fixture_offline_active():
+                api_swept = await self._sweep_geo_markers_via_api(pairs, lat, lon, zoom, geo)
             for asset_type in geo.asset_types:
                 if self.thread._should_stop():
                     break
                 for trade_type in self.thread.trade_types:
                     if self.thread._should_stop():
                         break
+                    if (asset_type, trade_type) in api_swept:
+                        continue
                     try:
                         await self._scan_geo_asset_type(asset_type, trade_type, lat, lon, zoom, geo)
                     except Exception as exc:
@@ -55,6 +63,7 @@ class PlaywrightGeoScanMixin:
                             30,
                         )
         finally:
+            self._geo_marker_handler = None
             try:
                 self._desktop_page.remove_listener("response", marker_handler)
             except Exception:
@@ -73,7 +82,11 @@ class PlaywrightGeoScanMixin:
         )
         self.thread.stats["geo_discovered_count"] = len(discovered)
         self.thread.stats["geo_dedup_count"] = dedup_removed
+        plan_requests = int(self.thread.stats.get("geo_plan_request_count", 0) or 0)
+        if plan_requests > 0:
+            self.thread.stats["geo_complexes_per_request"] = round(len(discovered) / plan_requests, 2)
         self.thread.emit_stats()
+        self._remember_known_complexes(list(discovered.values()))
 
         persistence_allowed = self.thread._should_persist_geo_results()
         flushed_count = self.thread._flush_discovered_complex_registrations()
@@ -204,6 +217,11 @@ class PlaywrightGeoScanMixin:
         if not self._desktop_page:
             return False
         base_kind = "houses" if asset_type == "VL" else "complexes"
+        if self._fixture_offline_active():
+            # 오프라인 재생은 지도 조작 대신 녹화된 마커 응답을 marker handler에 그대로 흘려 보낸다.
+            replayed = self._desktop_page.dispatch_markers(base_kind)
+            self.thread.log(f"   {asset_type}/{trade_type} 마커 fixture 재생 {replayed}건", 10)
+            return True
         trade_code = _TRADE_TO_CODE.get(trade_type, "A1")
         url = (
             f"https://new.land.naver.com/{base_kind}?"
@@ -230,6 +248,10 @@ class PlaywrightGeoScanMixin:
                     )
                 except Exception:
                     self.thread.log("geo canvas wait timeout", 10)
+                pair = (asset_type, trade_type)
+                if await self._wait_for_marker_auth(max(100, int(geo.dwell_ms))):
+                    if pair in await self._sweep_geo_markers_via_api([pair], lat, lon, zoom, geo):
+                        return True
                 await self._human_like_recenter(lat, lon, zoom)
                 switched = await self._switch_to_listing_markers()
                 if not switched:
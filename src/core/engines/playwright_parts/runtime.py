@@ -3,8 +3,11 @@ from __future__ import annotations
 from src.core.engines.playwright_parts.runtime_parts.blocking import PlaywrightBlockingRuntimeMixin
 from src.core.engines.playwright_parts.runtime_parts.browser import PlaywrightBrowserRuntimeMixin
 from src.core.engines.playwright_parts.runtime_parts.contexts import PlaywrightContextRuntimeMixin
+from src.core.engines.playwright_parts.runtime_parts.fixtures import PlaywrightFixtureRuntimeMixin
 from src.core.engines.playwright_parts.runtime_parts.navigation import PlaywrightNavigationRuntimeMixin
+from src.core.engines.playwright_parts.runtime_parts.pacing import PlaywrightPacingRuntimeMixin
 from src.core.engines.playwright_parts.runtime_parts.response_tasks import PlaywrightResponseTaskRuntimeMixin
+from src.core.engines.playwright_parts.runtime_parts.target_workers import PlaywrightTargetWorkerRuntimeMixin
 
 
 class PlaywrightRuntimeMixin(
@@ -13,5 +16,8 @@ class PlaywrightRuntimeMixin(
     PlaywrightNavigationRuntimeMixin,
     PlaywrightBlockingRuntimeMixin,
     PlaywrightResponseTaskRuntimeMixin,
+    PlaywrightTargetWorkerRuntimeMixin,
+    PlaywrightPacingRuntimeMixin,
+    PlaywrightFixtureRuntimeMixin,
 ):
     pass
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any, TYPE_CHECKING
 
+from src.core.services.crawl_stats import CrawlStats
 from src.utils.helpers import ChromeParamHelper
 
 if TYPE_CHECKING:
@@ -20,6 +21,9 @@ class PlaywrightBrowserRuntimeMixin:
         self._browser: Any | None = None
         self._desktop_context: Any | None = None
         self._desktop_page: Any | None = None
+        self._desktop_page_pool: asyncio.Queue[Any] | None = None
+        self._desktop_pool_pages: list[Any] = []
+        self._target_gate: TargetWorkerGate | None = None
         self._mobile_context: Any | None = None
         self._page_pool: asyncio.Queue[Any] | None = None
         self._started: bool = False
@@ -29,9 +33,17 @@ class PlaywrightBrowserRuntimeMixin:
         self._headed_fallback_used: bool = False
         self._entry_plan_success_by_key: dict[tuple[str, str, str], str] = {}
         self._article_api_auth_header: str = ""
+        self._geo_marker_handler: Any | None = None
+        self._geo_tiles_served: set[tuple[str, str, int, int, int]] = set()
+        self._response_fixture_store: ResponseFixtureStore | None = None
+        self._replay_request_context: ReplayRequestContext | None = None
+        self._fixture_record_tasks: set[asyncio.Task] = set()
+        self._pacer: EndpointPacer | None = None
+        self._ensure_runtime_stats()
+        self._configure_pacing()
 
     def run(self) -> None:
-        if not PLAYWRIGHT_AVAILABLE:
+        if not PLAYWRIGHT_AVAILABLE and not self._fixture_offline_active():
             raise RuntimeError("playwright is not installed")
         self._ensure_runtime_stats()
         if self.thread.crawl_mode == "geo_sweep":
@@ -57,46 +69,11 @@ class PlaywrightBrowserRuntimeMixin:
         return self._loop.run_until_complete(coro)
 
     def _ensure_runtime_stats(self):
+        """스레드 통계를 ``CrawlStats`` 로 맞춘다. 일반 dict면 값을 옮겨 담아 모든 필드를 보장한다."""
         stats = getattr(self.thread, "stats", None)
-        if not isinstance(stats, dict):
+        if isinstance(stats, CrawlStats) or not isinstance(stats, dict):
             return
-        stats.setdefault("response_seen_count", 0)
-        stats.setdefault("parse_success_count", 0)
-        stats.setdefault("parse_fail_count", 0)
-        stats.setdefault("detail_success_count", 0)
-        stats.setdefault("detail_fail_count", 0)
-        stats.setdefault("detail_partial_count", 0)
-        stats.setdefault("detail_missing_field_total", 0)
-        stats.setdefault("detail_fetch_skipped_count", 0)
-        stats.setdefault("blocked_page_count", 0)
-        stats.setdefault("geo_incomplete", False)
-        stats.setdefault("geo_incomplete_count", 0)
-        stats.setdefault("geo_incomplete_reasons", [])
-        stats.setdefault("geo_marker_switch_attempt_count", 0)
-        stats.setdefault("geo_marker_switch_success_count", 0)
-        stats.setdefault("geo_marker_switch_fail_count", 0)
-        stats.setdefault("geo_marker_switch_last_method", "")
-        stats.setdefault("playwright_recycle_count", 0)
-        stats.setdefault("playwright_last_recycle_reason", "")
-        stats.setdefault("playwright_browser_source", "")
-        stats.setdefault("playwright_browser_path", "")
-        stats.setdefault("playwright_profile_dir", "")
-        stats.setdefault("playwright_session_reused", 0)
-        stats.setdefault("playwright_headed_fallback_used", 0)
-        stats.setdefault("playwright_warmup_count", 0)
-        stats.setdefault("playwright_last_entry_plan", "")
-        stats.setdefault("playwright_last_final_url", "")
-        stats.setdefault("playwright_last_page_title", "")
-        stats.setdefault("playwright_last_block_reason", "")
-        stats.setdefault("response_match_count", 0)
-        stats.setdefault("capture_failed_count", 0)
-        stats.setdefault("block_like_redirect_count", 0)
-        stats.setdefault("article_api_fast_path_hit_count", 0)
-        stats.setdefault("article_api_fast_path_fail_count", 0)
-        stats.setdefault("article_api_fast_path_fallback_count", 0)
-        stats.setdefault("article_api_last_status", "")
-        stats.setdefault("detail_network_response_total", 0)
-        stats.setdefault("detail_hydration_hit_count", 0)
+        self.thread.stats = CrawlStats(**stats)
 
     async def _sleep_async_interruptible(self, seconds: float, chunk: float = 0.1) -> bool:
         remaining = max(0.0, float(seconds or 0.0))
@@ -133,30 +110,42 @@ class PlaywrightBrowserRuntimeMixin:
         except (TypeError, ValueError):
             return 15000
 
-    async def _check_memory_and_recycle_if_needed(self, reason: str):
-        self._ensure_runtime_stats()
+    @staticmethod
+    def _current_memory_mb() -> float | None:
         if not PSUTIL_AVAILABLE:
-            return
+            return None
         try:
-            memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+            return psutil.Process().memory_info().rss / (1024 * 1024)
         except Exception:
-            return
-        if memory_mb <= PLAYWRIGHT_MEMORY_THRESHOLD_MB:
+            return None
+
+    async def _check_memory_and_recycle_if_needed(self, reason: str):
+        self._ensure_runtime_stats()
+        memory_mb = self._current_memory_mb()
+        if memory_mb is None or memory_mb <= PLAYWRIGHT_MEMORY_THRESHOLD_MB:
             return
 
-        self.thread.stats["playwright_recycle_count"] = int(self.thread.stats.get("playwright_recycle_count", 0)) + 1
-        self.thread.stats["playwright_last_recycle_reason"] = f"{reason}:{memory_mb:.0f}MB"
-        self.thread.log(
-            f"⚠️ Playwright memory {memory_mb:.0f}MB > {PLAYWRIGHT_MEMORY_THRESHOLD_MB}MB, recycling browser context...",
-            30,
-        )
-        await self._shutdown_async()
-        await self._ensure_started()
+        async with self._exclusive_runtime():
+            # 대기하는 동안 다른 워커가 이미 recycle했으면 다시 측정한 값으로 판단한다.
+            memory_mb = self._current_memory_mb()
+            if memory_mb is None or memory_mb <= PLAYWRIGHT_MEMORY_THRESHOLD_MB:
+                return
+            self.thread.stats.incr("playwright_recycle_count")
+            self.thread.stats["playwright_last_recycle_reason"] = f"{reason}:{memory_mb:.0f}MB"
+            self.thread.log(
+                f"⚠️ Playwright memory {memory_mb:.0f}MB > {PLAYWRIGHT_MEMORY_THRESHOLD_MB}MB, recycling browser context...",
+                30,
+            )
+            await self._shutdown_async()
+            await self._ensure_started()
         self.thread.emit_stats()
 
     async def _ensure_started(self):
         if self._started:
             return
+        if self._fixture_offline_active():
+            await self._start_fixture_standin()
+            return
         self._started = True
         playwright = await async_playwright().start()
         self._playwright = playwright
@@ -183,11 +172,13 @@ class PlaywrightBrowserRuntimeMixin:
         )
         self._desktop_context = desktop_context
         await self._setup_blocking(desktop_context)
+        await self._attach_fixture_hooks(desktop_context)
         desktop_page = await desktop_context.new_page()
         self._desktop_page = desktop_page
         await desktop_page.add_init_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
         )
+        await self._create_desktop_page_pool(desktop_context, desktop_page)
 
         device = playwright.devices["iPhone 14 Pro Max"]
         mobile_context = await self._create_context(
@@ -202,6 +193,7 @@ class PlaywrightBrowserRuntimeMixin:
         )
         self._mobile_context = mobile_context
         await self._setup_blocking(mobile_context)
+        await self._attach_fixture_hooks(mobile_context)
         page_pool: asyncio.Queue[Any] = asyncio.Queue()
         self._page_pool = page_pool
         for _ in range(max(1, int(self.thread.playwright_detail_workers))):
@@ -217,6 +209,7 @@ class PlaywrightBrowserRuntimeMixin:
         self.thread.emit_stats()
 
     async def _shutdown_async(self):
+        await self._drain_fixture_record_tasks()
         await self._save_context_state(self._desktop_context, "desktop")
         await self._save_context_state(self._mobile_context, "mobile")
         if self._page_pool is not None:
@@ -226,6 +219,13 @@ class PlaywrightBrowserRuntimeMixin:
                     await page.close()
                 except Exception:
                     pass
+        for page in list(self._desktop_pool_pages or []):
+            if page is self._desktop_page:
+                continue
+            try:
+                await page.close()
+            except Exception:
+                pass
         for obj in [self._desktop_page, self._mobile_context, self._desktop_context, self._browser]:
             if obj is None:
                 continue
@@ -239,6 +239,8 @@ class PlaywrightBrowserRuntimeMixin:
             except Exception:
                 pass
         self._desktop_page = None
+        self._desktop_page_pool = None
+        self._desktop_pool_pages = []
         self._mobile_context = None
         self._desktop_context = None
         self._browser = None
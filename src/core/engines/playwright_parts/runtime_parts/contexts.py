@@ -21,9 +21,7 @@ class PlaywrightContextRuntimeMixin:
         if storage_state:
             try:
                 context = await browser.new_context(storage_state=storage_state, **kwargs)
-                self.thread.stats["playwright_session_reused"] = (
-                    int(self.thread.stats.get("playwright_session_reused", 0)) + 1
-                )
+                self.thread.stats.incr("playwright_session_reused")
                 self.thread.log(f"Playwright 세션 재사용: {label}", 10)
                 return context
             except Exception as exc:
@@ -59,9 +57,7 @@ class PlaywrightContextRuntimeMixin:
                 await page.wait_for_load_state("networkidle", timeout=2500)
             except Exception:
                 pass
-            self.thread.stats["playwright_warmup_count"] = (
-                int(self.thread.stats.get("playwright_warmup_count", 0)) + 1
-            )
+            self.thread.stats.incr("playwright_warmup_count")
             return True
         except Exception as exc:
             self.thread.log(f"Playwright warm-up 실패({label}, {url}): {exc}", 10)
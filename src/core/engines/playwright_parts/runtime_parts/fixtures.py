@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, TYPE_CHECKING
+
+from src.core.services.response_fixtures import (
+    ReplayBrowserContext,
+    ReplayPage,
+    ReplayRequestContext,
+    ResponseFixtureStore,
+    classify_fixture_url,
+    empty_document_html,
+    normalize_fixture_mode,
+)
+
+if TYPE_CHECKING:
+    from src.core.engines.playwright_engine import *  # noqa: F403
+
+
+class PlaywrightFixtureRuntimeMixin:
+    """매칭 응답 녹화(record)와 오프라인 재생(replay/replay_offline).
+
+    - record: 매물 목록/마커/상세 응답을 ``playwright_fixture_dir`` 에 저장한다.
+    - replay: 실제 브라우저를 띄우되 ``context.route`` 로 fixture만 응답하고 나머지는 차단한다.
+    - replay_offline: 브라우저 없이 stand-in context/page로 같은 수집 경로를 돌린다.
+    재생 모드에서는 네트워크에 나가지 않으므로 pacing도 적용하지 않는다.
+    """
+
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    def _fixture_mode(self) -> str:
+        return normalize_fixture_mode(getattr(self.thread, "playwright_fixture_mode", ""))
+
+    def _fixture_store(self) -> ResponseFixtureStore | None:
+        if not self._fixture_mode():
+            return None
+        store = getattr(self, "_response_fixture_store", None)
+        if store is None:
+            root = str(getattr(self.thread, "playwright_fixture_dir", "") or "").strip()
+            if not root:
+                return None
+            store = ResponseFixtureStore(root)
+            self._response_fixture_store = store
+        return store
+
+    def _fixture_replay_active(self) -> bool:
+        return self._fixture_mode() in {"replay", "replay_offline"} and self._fixture_store() is not None
+
+    def _fixture_offline_active(self) -> bool:
+        return self._fixture_mode() == "replay_offline" and self._fixture_store() is not None
+
+    async def _start_fixture_standin(self) -> None:
+        store = self._fixture_store()
+        assert store is not None
+        self._started = True
+        self._desktop_context = ReplayBrowserContext(store)
+        self._desktop_page = ReplayPage(store)
+        self._page_pool = None
+        if not str(getattr(self, "_article_api_auth_header", "") or "").strip():
+            self._article_api_auth_header = "Bearer fixture-replay"
+        self.thread.stats["playwright_browser_source"] = "fixture_replay"
+        self.thread.stats["playwright_browser_path"] = str(store.root)
+        self.thread.log(f"Playwright 오프라인 재생 모드: fixture {store.count()}개 ({store.root})", 10)
+        self.thread.emit_stats()
+
+    async def _attach_fixture_hooks(self, context) -> None:
+        mode = self._fixture_mode()
+        store = self._fixture_store()
+        if store is None or context is None:
+            return
+        if mode == "record":
+            pending_tasks = getattr(self, "_fixture_record_tasks", None)
+            if pending_tasks is None:
+                pending_tasks = set()
+                self._fixture_record_tasks = pending_tasks
+
+            def _handle(response):
+                if classify_fixture_url(getattr(response, "url", "")) is None:
+                    return None
+                try:
+                    self._spawn_response_task(pending_tasks, self._record_fixture_response(response))
+                except Exception:
+                    return None
+
+            context.on("response", _handle)
+        elif mode == "replay":
+            await context.route("**/*", self._serve_fixture_route)
+            if not str(getattr(self, "_article_api_auth_header", "") or "").strip():
+                self._article_api_auth_header = "Bearer fixture-replay"
+
+    async def _record_fixture_response(self, response) -> None:
+        store = self._fixture_store()
+        if store is None:
+            return
+        url = str(getattr(response, "url", "") or "")
+        try:
+            headers = dict(getattr(response, "headers", {}) or {})
+            content_type = str(headers.get("content-type", "") or "")
+            body = await response.json() if "json" in content_type else await response.text()
+        except Exception:
+            return
+        self._save_fixture(url, body, status=getattr(response, "status", 200), content_type=content_type)
+
+    def _save_fixture(self, url: str, body: Any, *, status: Any = 200, content_type: str = "application/json") -> None:
+        if self._fixture_mode() != "record":
+            return
+        store = self._fixture_store()
+        if store is None:
+            return
+        try:
+            saved = store.save(url, body, status=int(status or 200), content_type=content_type or "application/json")
+        except (OSError, TypeError, ValueError) as exc:
+            self.thread.log(f"   fixture 저장 실패({url}): {exc}", 30)
+            return
+        if saved is not None:
+            self.thread.stats.incr("fixture_recorded_count")
+
+    async def _serve_fixture_route(self, route) -> None:
+        request = route.request
+        store = self._fixture_store()
+        fixture = store.load(request.url) if store is not None else None
+        if fixture is not None:
+            body = fixture.get("body")
+            await route.fulfill(
+                status=int(fixture.get("status", 200) or 200),
+                content_type=str(fixture.get("content_type", "") or "application/json"),
+                body=body if isinstance(body, str) else json.dumps(body, ensure_ascii=False),
+            )
+            return
+        if getattr(request, "resource_type", "") == "document":
+            await route.fulfill(status=200, content_type="text/html", body=empty_document_html())
+            return
+        await route.abort()
+
+    def _article_api_request_context(self):
+        if self._fixture_replay_active():
+            replay_context = getattr(self, "_replay_request_context", None)
+            if replay_context is None:
+                store = self._fixture_store()
+                assert store is not None
+                replay_context = ReplayRequestContext(store)
+                self._replay_request_context = replay_context
+            return replay_context
+        context = self._desktop_context
+        return getattr(context, "request", None) if context is not None else None
+
+    async def _drain_fixture_record_tasks(self) -> None:
+        pending_tasks = getattr(self, "_fixture_record_tasks", None)
+        if pending_tasks:
+            await asyncio.gather(*list(pending_tasks), return_exceptions=True)
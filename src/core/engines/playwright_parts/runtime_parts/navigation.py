@@ -51,6 +51,9 @@ class PlaywrightNavigationRuntimeMixin:
             except Exception:
                 pass
             await page.wait_for_timeout(350)
+        # 대상 페이지 이동만 토큰을 소모한다. 기다리는 동안 다른 코루틴은 계속 실행된다.
+        if not await self._pace_endpoint("navigation"):
+            raise RuntimeError(f"{label} aborted by stop request")
         await self._async_retry(
             f"{label} target {plan_name}",
             lambda: page.goto(
@@ -65,10 +68,14 @@ class PlaywrightNavigationRuntimeMixin:
             return False
         if not bool(self._launched_headless):
             return False
-        self.thread.log(f"Playwright headed fallback 전환: {reason or 'capture recovery'}", 30)
-        self._headed_fallback_used = True
-        self.thread.stats["playwright_headed_fallback_used"] = 1
-        self._launch_headless_override = False
-        await self._shutdown_async()
-        await self._ensure_started()
+        async with self._exclusive_runtime():
+            if self._headed_fallback_used:
+                # 대기 중 다른 타깃 워커가 이미 headed로 전환했으므로 새 runtime에서 재시도한다.
+                return True
+            self.thread.log(f"Playwright headed fallback 전환: {reason or 'capture recovery'}", 30)
+            self._headed_fallback_used = True
+            self.thread.stats["playwright_headed_fallback_used"] = 1
+            self._launch_headless_override = False
+            await self._shutdown_async()
+            await self._ensure_started()
         return True
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from src.utils.constants import CRAWL_SPEED_PRESETS, PACING_ENDPOINT_LIMITS
+
+if TYPE_CHECKING:
+    from src.core.engines.playwright_engine import *  # noqa: F403
+
+PACING_FAMILIES = ("navigation", "article_api", "mobile_detail")
+_PACING_SLEEP_CHUNK_SEC = 0.2
+
+
+class AsyncTokenBucket:
+    """이벤트 루프를 막지 않는 토큰 버킷.
+
+    토큰 한 개마다 ``min_interval``~``max_interval`` 사이의 간격을 무작위로 배정하고,
+    ``burst`` 개까지는 쌓아 두었다가 바로 내준다. ``acquire`` 는 호출 즉시 자기 순번을
+    예약한 뒤 ``asyncio.sleep`` 으로 기다리므로, 대기 중에도 응답 캡처·상세 워커 등
+    다른 코루틴은 계속 실행되고 동시 요청자는 요청 순서대로 통과한다.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: Optional[float] = None,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval = max(0.0, float(min_interval or 0.0))
+        self.max_interval = max(self.min_interval, float(max_interval if max_interval is not None else self.min_interval))
+        self.burst = max(1, int(burst or 1))
+        self._clock = clock
+        self._ready_at: Optional[float] = None
+        self.acquired_count = 0
+        self.wait_seconds_total = 0.0
+        self.max_wait_seconds = 0.0
+        self._first_acquired_at: Optional[float] = None
+        self._last_acquired_at: Optional[float] = None
+
+    @classmethod
+    def per_second(cls, rate: float, *, burst: int = 1, clock: Callable[[], float] = time.monotonic) -> "AsyncTokenBucket":
+        rate_value = float(rate or 0.0)
+        interval = 1.0 / rate_value if rate_value > 0 else 0.0
+        return cls(interval, interval, burst=burst, clock=clock)
+
+    def _next_interval(self) -> float:
+        if self.max_interval <= self.min_interval:
+            return self.min_interval
+        return random.uniform(self.min_interval, self.max_interval)
+
+    def reserve(self) -> float:
+        """다음 토큰을 예약하고 기다려야 할 시간(초)을 반환한다."""
+        now = self._clock()
+        # 버스트 허용치만큼 과거로 당겨 두면, 한동안 쉬었던 버킷은 burst개를 바로 내준다.
+        tolerance = (self.burst - 1) * (self.min_interval + self.max_interval) / 2.0
+        ready_at = self._ready_at
+        if ready_at is None or ready_at < now - tolerance:
+            ready_at = now - tolerance
+        start_at = max(now, ready_at)
+        self._ready_at = ready_at + self._next_interval()
+        return max(0.0, start_at - now)
+
+    async def acquire(self, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """토큰을 얻을 때까지 비동기로 기다린다. 중지 요청이 들어오면 False."""
+        wait = self.reserve()
+        remaining = wait
+        while remaining > 0:
+            if should_stop is not None and should_stop():
+                return False
+            step = _PACING_SLEEP_CHUNK_SEC if remaining > _PACING_SLEEP_CHUNK_SEC else remaining
+            await asyncio.sleep(step)
+            remaining -= step
+        if should_stop is not None and should_stop():
+            return False
+        now = self._clock()
+        if self._first_acquired_at is None:
+            self._first_acquired_at = now
+        self._last_acquired_at = now
+        self.acquired_count += 1
+        self.wait_seconds_total += wait
+        if wait > self.max_wait_seconds:
+            self.max_wait_seconds = wait
+        return True
+
+    @property
+    def effective_rps(self) -> float:
+        """첫 토큰부터 마지막 토큰까지 실제로 통과한 초당 요청 수."""
+        if self.acquired_count < 2 or self._first_acquired_at is None or self._last_acquired_at is None:
+            return 0.0
+        span = self._last_acquired_at - self._first_acquired_at
+        if span <= 0:
+            return 0.0
+        return (self.acquired_count - 1) / span
+
+
+class EndpointPacer:
+    """엔드포인트 계열(navigation/article_api/mobile_detail)별 토큰 버킷 묶음."""
+
+    def __init__(self, buckets: dict[str, AsyncTokenBucket]):
+        self._buckets = dict(buckets)
+
+    @classmethod
+    def for_speed(cls, speed: Any, *, navigation_slots: int = 1) -> "EndpointPacer":
+        """수집 속도 프리셋으로 버킷을 만든다.
+
+        페이지 이동은 프리셋 간격(min~max초)을 ``navigation_slots`` 개 동시 워커가 나눠 쓰고,
+        API/상세 요청 한도는 "보통" 대비 프리셋 간격 비율로 늘리거나 줄인다.
+        """
+        preset = CRAWL_SPEED_PRESETS.get(str(speed or ""), CRAWL_SPEED_PRESETS["보통"])
+        slots = max(1, int(navigation_slots or 1))
+        min_delay = float(preset["min"])
+        max_delay = float(preset["max"])
+        buckets = {
+            "navigation": AsyncTokenBucket(min_delay / slots, max_delay / slots, burst=slots),
+        }
+        scale = float(CRAWL_SPEED_PRESETS["보통"]["min"]) / max(0.1, min_delay)
+        for family, limit in PACING_ENDPOINT_LIMITS.items():
+            buckets[family] = AsyncTokenBucket.per_second(
+                float(limit.get("rate", 1.0)) * scale,
+                burst=int(limit.get("burst", 1)),
+            )
+        return cls(buckets)
+
+    def bucket(self, family: str) -> Optional[AsyncTokenBucket]:
+        return self._buckets.get(family)
+
+    async def acquire(self, family: str, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            return True
+        return await bucket.acquire(should_stop)
+
+    def export_stats(self, stats: MutableMapping) -> None:
+        wait_ms_total = 0
+        for family in PACING_FAMILIES:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                continue
+            wait_ms = int(bucket.wait_seconds_total * 1000)
+            wait_ms_total += wait_ms
+            stats[f"pacing_{family}_count"] = int(bucket.acquired_count)
+            stats[f"pacing_{family}_wait_ms"] = wait_ms
+            stats[f"pacing_{family}_rps"] = round(bucket.effective_rps, 3)
+        stats["pacing_wait_ms_total"] = wait_ms_total
+
+
+class PlaywrightPacingRuntimeMixin:
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    def _configure_pacing(self, navigation_slots: int = 1) -> None:
+        if self._fixture_replay_active():
+            # fixture 재생은 네트워크에 나가지 않으므로 속도 제한 없이 돌린다.
+            self._pacer = None
+            return
+        self._pacer = EndpointPacer.for_speed(
+            getattr(self.thread, "speed", "보통"),
+            navigation_slots=navigation_slots,
+        )
+
+    async def _pace_endpoint(self, family: str) -> bool:
+        pacer = getattr(self, "_pacer", None)
+        if pacer is None:
+            return not self.thread._should_stop()
+        acquired = await pacer.acquire(family, self.thread._should_stop)
+        stats = getattr(self.thread, "stats", None)
+        if isinstance(stats, MutableMapping):
+            pacer.export_stats(stats)
+        return acquired
@@ -35,9 +35,7 @@ class PlaywrightResponseTaskRuntimeMixin:
                 timeout_ms = int(getattr(self.thread, "playwright_response_drain_timeout_ms", 3000))
             except (TypeError, ValueError):
                 timeout_ms = 3000
-        self.thread.stats["response_drain_wait_count"] = (
-            int(self.thread.stats.get("response_drain_wait_count", 0)) + wait_count
-        )
+        self.thread.stats.incr("response_drain_wait_count", wait_count)
         self.thread.log(f"   응답 처리 대기중 ({label}): {wait_count}", 10)
         try:
             await asyncio.wait_for(
@@ -46,9 +44,7 @@ class PlaywrightResponseTaskRuntimeMixin:
             )
         except asyncio.TimeoutError:
             timed_out = True
-            self.thread.stats["response_drain_timeout_count"] = (
-                int(self.thread.stats.get("response_drain_timeout_count", 0)) + 1
-            )
+            self.thread.stats.incr("response_drain_timeout_count")
             for task in list(pending_tasks):
                 if not task.done():
                     task.cancel()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.engines.playwright_engine import *  # noqa: F403
+
+
+class NullAsyncContext:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class TargetWorkerGate:
+    """동시 타깃 워커의 pair 진입과 runtime 재시작/쿨다운 구간을 조율한다.
+
+    pair 구간은 여러 워커가 동시에 진입할 수 있고, exclusive 구간은 진행 중인 pair가
+    모두 끝날 때까지 기다린 뒤 단독으로 실행된다. exclusive 요청자가 pair 구간 안에
+    있으면 대기하는 동안 자신의 슬롯을 반납해 교착을 피한다.
+    """
+
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._exclusive_lock = asyncio.Lock()
+        self._active: set[Any] = set()
+        self._paused = False
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @asynccontextmanager
+    async def pair(self):
+        task = asyncio.current_task()
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._paused)
+            self._active.add(task)
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._active.discard(task)
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def exclusive(self):
+        task = asyncio.current_task()
+        async with self._cond:
+            parked = task in self._active
+            self._active.discard(task)
+            self._cond.notify_all()
+        async with self._exclusive_lock:
+            async with self._cond:
+                self._paused = True
+                await self._cond.wait_for(lambda: not self._active)
+            try:
+                yield
+            finally:
+                async with self._cond:
+                    self._paused = False
+                    if parked:
+                        self._active.add(task)
+                    self._cond.notify_all()
+
+
+class PlaywrightTargetWorkerRuntimeMixin:
+    if TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any: ...
+
+    def _target_worker_count(self) -> int:
+        try:
+            configured = int(getattr(self.thread, "playwright_target_workers", 1) or 1)
+        except (TypeError, ValueError):
+            configured = 1
+        return min(PLAYWRIGHT_MAX_TARGET_WORKERS, max(1, configured))
+
+    def _target_pair_slot(self):
+        gate = getattr(self, "_target_gate", None)
+        if gate is None:
+            return NullAsyncContext()
+        return gate.pair()
+
+    def _exclusive_runtime(self):
+        gate = getattr(self, "_target_gate", None)
+        if gate is None:
+            return NullAsyncContext()
+        return gate.exclusive()
+
+    async def _create_desktop_page_pool(self, desktop_context, desktop_page) -> None:
+        self._desktop_page_pool = None
+        self._desktop_pool_pages = []
+        worker_count = self._target_worker_count()
+        if worker_count <= 1:
+            return
+        pages = [desktop_page]
+        for _ in range(worker_count - 1):
+            page = await desktop_context.new_page()
+            await page.add_init_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+            )
+            pages.append(page)
+        page_pool: asyncio.Queue[Any] = asyncio.Queue()
+        for page in pages:
+            page_pool.put_nowait(page)
+        self._desktop_pool_pages = pages
+        self._desktop_page_pool = page_pool
+
+    async def _acquire_desktop_page(self):
+        page_pool = getattr(self, "_desktop_page_pool", None)
+        if page_pool is None:
+            return self._desktop_page
+        return await page_pool.get()
+
+    def _release_desktop_page(self, page) -> None:
+        page_pool = getattr(self, "_desktop_page_pool", None)
+        if page_pool is None or page is None:
+            return
+        # recycle 이후에는 이전 runtime page를 pool에 되돌리지 않는다.
+        if any(page is pooled for pooled in getattr(self, "_desktop_pool_pages", []) or []):
+            page_pool.put_nowait(page)
@@ -1,19 +1,24 @@
 import csv
 import json
+import os
 from dataclasses import dataclass
+from src.utils.constants import EXPORT_CHUNK_ROWS
 from src.utils.helpers import PriceConverter, DateTimeHelper
 from src.utils.logger import get_logger
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
     from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     Workbook = None
+    WriteOnlyCell = None
     Font = None
     PatternFill = None
     Alignment = None
+    NamedStyle = None
     get_column_letter = None
     OPENPYXL_AVAILABLE = False
 logger = get_logger("Export")
@@ -32,10 +37,132 @@ class ExportResult:
     ok: bool
     path: object = None
     error: str = ""
+    cancelled: bool = False
+    count: int = 0
 
     def __bool__(self):
         return bool(self.ok)
 
+
+class ExportCancelled(Exception):
+    """내보내기 도중 취소 요청을 받았을 때 쓰기 루프를 빠져나가는 용도."""
+
+
+def _partial_path(path):
+    return f"{os.fspath(path)}.part"
+
+
+def _discard_partial(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _split_history_price(trade_type, price_text):
+    """이력 DB의 ``price_text`` 를 (매매가, 보증금, 월세) 표시 문자열로 나눈다."""
+    text = str(price_text or "").strip()
+    if trade_type == "매매":
+        return text, "", ""
+    if trade_type == "월세" and "/" in text:
+        deposit, _, rent = text.partition("/")
+        return "", deposit.strip(), rent.strip()
+    return "", text, ""
+
+
+def history_rows_to_export_items(rows):
+    """``article_history`` 행(sqlite3.Row 또는 dict)을 내보내기 항목으로 바꾸는 제너레이터.
+
+    DB 커서에서 바로 넘겨받아 한 행씩 변환하므로 전체 이력을 메모리에 올리지 않는다.
+    """
+    today = DateTimeHelper.now_string("%Y-%m-%d")
+    for row in rows:
+        record = dict(row)
+        trade_type = str(record.get("trade_type") or "")
+        sale, deposit, rent = _split_history_price(trade_type, record.get("price_text"))
+        first_seen = str(record.get("first_seen") or "")
+        yield {
+            "단지명": record.get("complex_name") or "",
+            "자산유형": record.get("asset_type") or "APT",
+            "거래유형": trade_type,
+            "매매가": sale,
+            "보증금": deposit,
+            "월세": rent,
+            "면적(평)": record.get("area_pyeong") or 0,
+            "층/방향": record.get("floor_info") or "",
+            "타입/특징": record.get("feature") or "",
+            "기전세금(원)": record.get("prev_jeonse_won") or 0,
+            "갭금액(원)": record.get("gap_amount_won") or 0,
+            "갭비율": record.get("gap_ratio") or 0,
+            "부동산상호": record.get("broker_office") or "",
+            "중개사이름": record.get("broker_name") or "",
+            "전화1": record.get("broker_phone1") or "",
+            "전화2": record.get("broker_phone2") or "",
+            "수집모드": record.get("source_mode") or "",
+            "위도": record.get("source_lat") or "",
+            "경도": record.get("source_lon") or "",
+            "줌": record.get("source_zoom") or "",
+            "마커ID": record.get("marker_id") or "",
+            "매물ID": record.get("article_id") or "",
+            "단지ID": record.get("complex_id") or "",
+            "수집시각": record.get("last_seen") or "",
+            "최초발견": first_seen,
+            "상태": record.get("status") or "",
+            "is_new": bool(first_seen) and first_seen == today,
+            "price_change": record.get("price_change") or 0,
+        }
+
+
+class _ExcelStyleSet:
+    """write-only 시트용 스타일 캐시.
+
+    셀마다 Font/PatternFill 객체를 붙이면 행 수만큼 스타일이 쌓이므로,
+    (배경, 글자색) 조합마다 NamedStyle 하나만 등록해 이름으로 참조한다.
+    """
+
+    _FILL_COLORS = {"매매": "FFCCCC", "전세": "CCFFCC", "월세": "CCE5FF", "new": "FFF3CD"}
+    _FONT_COLORS = {"up": "FF0000", "down": "008000"}
+
+    def __init__(self, workbook):
+        self._workbook = workbook
+        self._names = {}
+
+    @classmethod
+    def fill_key_for(cls, trade_type):
+        return trade_type if trade_type in cls._FILL_COLORS else None
+
+    @staticmethod
+    def _solid(color):
+        assert PatternFill is not None
+        return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+    def header(self):
+        name = self._names.get("header")
+        if name is None:
+            assert NamedStyle is not None and Font is not None and Alignment is not None
+            style = NamedStyle(name="export_header")
+            style.font = Font(bold=True, color="FFFFFF")
+            style.fill = self._solid("4472C4")
+            style.alignment = Alignment(horizontal="center")
+            self._workbook.add_named_style(style)
+            name = self._names["header"] = style.name
+        return name
+
+    def cell(self, fill_key=None, font_key=None):
+        key = (fill_key, font_key)
+        name = self._names.get(key)
+        if name is None:
+            assert NamedStyle is not None and Font is not None
+            style = NamedStyle(name=f"export_{fill_key or 'plain'}_{font_key or 'plain'}")
+            if fill_key:
+                style.fill = self._solid(self._FILL_COLORS[fill_key])
+            if font_key:
+                style.font = Font(color=self._FONT_COLORS[font_key])
+            self._workbook.add_named_style(style)
+            name = self._names[key] = style.name
+        return name
+
+
 class ExcelTemplate:
     """엑셀 내보내기 템플릿 (v7.3)"""
     DEFAULT_COLUMNS = [
@@ -88,6 +215,14 @@ class ExcelTemplate:
         return {col: bool(enabled) for col, enabled in ExcelTemplate.DEFAULT_COLUMNS}
 
 class DataExporter:
+    """수집 결과를 Excel/CSV/JSON/JSONL 파일로 내보낸다.
+
+    ``data`` 는 리스트뿐 아니라 제너레이터(예: DB 이력 커서)도 받으며, 모든 형식이 한 번의
+    순회로 ``chunk_rows`` 행씩 흘려 쓴다. 청크마다 ``progress(done, total)`` 를 호출하고
+    ``should_cancel()`` 이 참이면 중단한다. 파일은 ``<path>.part`` 에 쓴 뒤 교체하므로
+    실패·취소 시 기존 파일이 반쯤 덮어써지지 않는다.
+    """
+
     # v12.0: 확장된 컬럼 (평당가, 신규, 가격변동 포함)
     COLUMNS = [
         "단지명", "자산유형", "거래유형", "매매가", "보증금", "월세", 
@@ -97,18 +232,63 @@ class DataExporter:
         "수집모드", "위도", "경도", "줌", "마커ID",
         "매물ID", "단지ID", "수집시각", "신규여부", "가격변동"
     ]
-    
-    def __init__(self, data): 
+
+    def __init__(self, data, *, total=None, chunk_rows=EXPORT_CHUNK_ROWS):
         self.data = data
+        if total is None and hasattr(data, "__len__"):
+            total = len(data)
+        self.total = int(total) if total is not None else None
+        self.chunk_rows = max(1, int(chunk_rows or EXPORT_CHUNK_ROWS))
+        self.exported_count = 0
         self.last_error = ""
 
     def _success(self, path):
         self.last_error = ""
-        return ExportResult(True, path, "")
+        return ExportResult(True, path, "", count=self.exported_count)
 
-    def _failure(self, error):
+    def _failure(self, error, *, cancelled=False):
         self.last_error = str(error or "알 수 없는 저장 오류")
-        return ExportResult(False, None, self.last_error)
+        return ExportResult(False, None, self.last_error, cancelled=cancelled, count=self.exported_count)
+
+    def _iter_chunks(self, progress=None, should_cancel=None):
+        """``data`` 를 ``chunk_rows`` 단위로 끊어 내보낸다. 청크 사이에서 취소/진행률을 확인한다."""
+        self.exported_count = 0
+        if should_cancel is not None and should_cancel():
+            raise ExportCancelled()
+        chunk = []
+        for item in self.data:
+            if not isinstance(item, dict):
+                continue
+            chunk.append(item)
+            if len(chunk) < self.chunk_rows:
+                continue
+            yield chunk
+            self.exported_count += len(chunk)
+            chunk = []
+            if should_cancel is not None and should_cancel():
+                raise ExportCancelled()
+            if progress is not None:
+                progress(self.exported_count, self.total or 0)
+        if chunk:
+            yield chunk
+            self.exported_count += len(chunk)
+        if progress is not None:
+            progress(self.exported_count, self.total or self.exported_count)
+
+    def _write_atomic(self, path, label, write):
+        partial = _partial_path(path)
+        try:
+            write(partial)
+            os.replace(partial, path)
+            return self._success(path)
+        except ExportCancelled:
+            _discard_partial(partial)
+            logger.info(f"{label} 저장 취소: {path} ({self.exported_count}행 처리 후)")
+            return self._failure(f"{label} 저장이 취소되었습니다.", cancelled=True)
+        except Exception as e:
+            _discard_partial(partial)
+            logger.error(f"{label} 저장 실패: {e}")
+            return self._failure(f"{label} 저장 실패: {e}")
 
     @staticmethod
     def _change_to_int(value):
@@ -138,6 +318,17 @@ class DataExporter:
             ratio = 0.0
         return f"{ratio:.4f}" if ratio else ""
 
+    @classmethod
+    def _cell_value(cls, item, column, new_text="신규"):
+        # 특수 컬럼 처리
+        if column == "신규여부":
+            return new_text if item.get("is_new", False) else ""
+        if column == "가격변동":
+            return cls._format_price_change(item.get("price_change", 0))
+        if column == "갭비율":
+            return cls._format_gap_ratio(item.get("갭비율", 0))
+        return _sanitize_spreadsheet_value(item.get(column, ""))
+
     @staticmethod
     def _columns_from_template(template=None):
         default_columns = ExcelTemplate.get_default_template()
@@ -164,148 +355,150 @@ class DataExporter:
             seen.add(token)
             order.append(token)
         return [col for col in order if bool(raw_columns.get(col, False))]
-    
-    def export_excel(self, path, template=None):
-        """엑셀로 내보내기 - 템플릿 지원 (v7.3)"""
+
+    def export(self, kind, path, template=None, *, progress=None, should_cancel=None):
+        """``kind`` (excel/csv/json/jsonl) 형식으로 내보낸다. 백그라운드 스레드용 단일 진입점."""
+        token = str(kind or "").lower()
+        if token == "excel":
+            return self.export_excel(path, template, progress=progress, should_cancel=should_cancel)
+        if token == "csv":
+            return self.export_csv(path, template, progress=progress, should_cancel=should_cancel)
+        if token == "json":
+            return self.export_json(path, progress=progress, should_cancel=should_cancel)
+        if token == "jsonl":
+            return self.export_jsonl(path, progress=progress, should_cancel=should_cancel)
+        return self._failure(f"지원하지 않는 내보내기 형식: {kind}")
+
+    def _excel_row(self, ws, styles, item, columns):
+        fill_key = styles.fill_key_for(item.get("거래유형", ""))
+        is_new = bool(item.get("is_new", False))
+        cells = []
+        for cn in columns:
+            cell_fill = "new" if is_new and cn == "단지명" else fill_key
+            font_key = None
+            if cn == "가격변동":
+                pc = self._change_to_int(item.get("price_change", 0))
+                value = PriceConverter.to_signed_string(pc, zero_text="")
+                font_key = "up" if pc > 0 else ("down" if pc < 0 else None)
+            else:
+                value = self._cell_value(item, cn, "🆕 신규")
+            if cell_fill is None and font_key is None:
+                cells.append(value)
+                continue
+            assert WriteOnlyCell is not None
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = styles.cell(cell_fill, font_key)
+            cells.append(cell)
+        return cells
+
+    def export_excel(self, path, template=None, *, progress=None, should_cancel=None):
+        """엑셀로 내보내기 - 템플릿 지원 (v7.3)
+
+        write-only 워크북으로 행을 흘려 쓰므로 메모리 사용량이 행 수와 무관하다.
+        """
         if (
             not OPENPYXL_AVAILABLE
             or Workbook is None
+            or WriteOnlyCell is None
             or Font is None
             or PatternFill is None
             or Alignment is None
+            or NamedStyle is None
             or get_column_letter is None
         ):
             return self._failure("openpyxl 라이브러리를 사용할 수 없어 Excel 저장을 수행할 수 없습니다.")
-        try:
-            wb = Workbook()
-            ws = wb.active
-            if ws is None:
-                return self._failure("Excel 워크시트를 생성할 수 없습니다.")
-            ws.title = "매물 데이터"
-            
+
+        def _write(target):
+            assert Workbook is not None and WriteOnlyCell is not None and get_column_letter is not None
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("매물 데이터")
             columns = self._columns_from_template(template)
-            
-            # 헤더 스타일
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            
-            # 헤더 작성
-            for col, h in enumerate(columns, 1):
-                cell = ws.cell(row=1, column=col, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal="center")
-            
-            # 거래유형별 색상
-            trade_colors = {
-                "매매": PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid"),
-                "전세": PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid"),
-                "월세": PatternFill(start_color="CCE5FF", end_color="CCE5FF", fill_type="solid")
-            }
-            
-            # v7.3: 신규/가격변동 색상
-            new_fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-            price_up_font = Font(color="FF0000")
-            price_down_font = Font(color="008000")
-            
-            # 데이터 작성
-            for ri, item in enumerate(self.data, 2):
-                tt = item.get("거래유형", "")
-                fill = trade_colors.get(tt)
-                
-                for ci, cn in enumerate(columns, 1):
-                    # 특수 컬럼 처리
-                    if cn == "신규여부":
-                        value = "🆕 신규" if item.get('is_new', False) else ""
-                    elif cn == "가격변동":
-                        value = self._format_price_change(item.get('price_change', 0))
-                    elif cn == "갭비율":
-                        value = self._format_gap_ratio(item.get("갭비율", 0))
-                    else:
-                        value = _sanitize_spreadsheet_value(item.get(cn, ""))
-                    
-                    cell = ws.cell(row=ri, column=ci, value=value)
-                    
-                    # 스타일 적용
-                    if fill:
-                        cell.fill = fill
-                    
-                    # 신규 매물 강조
-                    if item.get('is_new', False) and cn == "단지명":
-                        cell.fill = new_fill
-                    
-                    # 가격 변동 색상
-                    if cn == "가격변동":
-                        pc = self._change_to_int(item.get('price_change', 0))
-                        if pc > 0:
-                            cell.font = price_up_font
-                        elif pc < 0:
-                            cell.font = price_down_font
-            
-            # 컬럼 너비 설정
+            styles = _ExcelStyleSet(wb)
+
+            # write-only 시트는 행을 쓰기 전에 너비/틀 고정을 지정해야 한다.
             for col in range(1, len(columns) + 1):
                 ws.column_dimensions[get_column_letter(col)].width = 15
-            
             ws.freeze_panes = "A2"
-            wb.save(path)
-            return self._success(path)
-        except Exception as e:
-            logger.error(f"Excel 저장 실패: {e}")
-            return self._failure(f"Excel 저장 실패: {e}")
+
+            header_style = styles.header()
+            header = []
+            for h in columns:
+                cell = WriteOnlyCell(ws, value=h)
+                cell.style = header_style
+                header.append(cell)
+            ws.append(header)
+
+            for chunk in self._iter_chunks(progress, should_cancel):
+                for item in chunk:
+                    ws.append(self._excel_row(ws, styles, item, columns))
+            wb.save(target)
+
+        return self._write_atomic(path, "Excel", _write)
 
     def to_excel(self, path, template=None):
         result = self.export_excel(path, template)
         return result.path if result.ok else None
     
-    def export_csv(self, path, template=None):
+    def export_csv(self, path, template=None, *, progress=None, should_cancel=None):
         """CSV로 내보내기 - 템플릿 지원"""
-        try:
-            columns = self._columns_from_template(template)
-            
-            with open(path, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-                writer.writeheader()
-                
-                for item in self.data:
-                    # 특수 컬럼 추가
-                    row = dict(item)
-                    row['신규여부'] = "신규" if item.get('is_new', False) else ""
-                    row['가격변동'] = self._format_price_change(item.get('price_change', 0))
-                    row['갭비율'] = self._format_gap_ratio(item.get('갭비율', 0))
-                    row = {
-                        column: (
-                            row.get(column, "")
-                            if column in {"신규여부", "가격변동", "갭비율"}
-                            else _sanitize_spreadsheet_value(row.get(column, ""))
-                        )
-                        for column in columns
-                    }
-                    writer.writerow(row)
-            return self._success(path)
-        except Exception as e:
-            logger.error(f"CSV 저장 실패: {e}")
-            return self._failure(f"CSV 저장 실패: {e}")
+        columns = self._columns_from_template(template)
+
+        def _write(target):
+            with open(target, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                for chunk in self._iter_chunks(progress, should_cancel):
+                    writer.writerows([self._cell_value(item, column) for column in columns] for item in chunk)
+
+        return self._write_atomic(path, "CSV", _write)
 
     def to_csv(self, path, template=None):
         result = self.export_csv(path, template)
         return result.path if result.ok else None
     
-    def export_json(self, path):
-        """JSON으로 내보내기"""
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "exported_at": DateTimeHelper.now_string(), 
-                    "total_count": len(self.data),
-                    "new_count": sum(1 for d in self.data if d.get('is_new', False)),
-                    "price_change_count": sum(1 for d in self.data if d.get('price_change', 0) != 0),
-                    "data": self.data
-                }, f, ensure_ascii=False, indent=2)
-            return self._success(path)
-        except Exception as e:
-            logger.error(f"JSON 저장 실패: {e}")
-            return self._failure(f"JSON 저장 실패: {e}")
+    def export_json(self, path, *, progress=None, should_cancel=None):
+        """JSON으로 내보내기
+
+        ``data`` 배열을 항목 단위로 흘려 쓰고, 집계(total/new/price_change)는 배열 뒤에 붙인다.
+        """
+        def _write(target):
+            new_count = 0
+            price_change_count = 0
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write('{"exported_at": ')
+                f.write(json.dumps(DateTimeHelper.now_string(), ensure_ascii=False))
+                f.write(', "data": [')
+                first = True
+                for chunk in self._iter_chunks(progress, should_cancel):
+                    lines = []
+                    for item in chunk:
+                        if item.get('is_new', False):
+                            new_count += 1
+                        if item.get('price_change', 0) != 0:
+                            price_change_count += 1
+                        lines.append(("\n" if first else ",\n") + json.dumps(item, ensure_ascii=False))
+                        first = False
+                    f.write("".join(lines))
+                f.write(
+                    f'\n], "total_count": {self.exported_count}, "new_count": {new_count}, '
+                    f'"price_change_count": {price_change_count}}}\n'
+                )
+
+        return self._write_atomic(path, "JSON", _write)
 
     def to_json(self, path):
         result = self.export_json(path)
         return result.path if result.ok else None
+
+    def export_jsonl(self, path, *, progress=None, should_cancel=None):
+        """JSON Lines로 내보내기 - 한 줄에 매물 하나"""
+        def _write(target):
+            with open(target, 'w', encoding='utf-8') as f:
+                for chunk in self._iter_chunks(progress, should_cancel):
+                    f.write("".join(json.dumps(item, ensure_ascii=False) + "\n" for item in chunk))
+
+        return self._write_atomic(path, "JSONL", _write)
+
+    def to_jsonl(self, path):
+        result = self.export_jsonl(path)
+        return result.path if result.ok else None
@@ -30,6 +30,7 @@ DEFAULT_SETTINGS = {
     "cache_negative_ttl_minutes": 5,  # 0건 결과 캐시 유효시간(분)
     "cache_write_back_interval_sec": 2,  # 캐시 파일 write-back 주기
     "cache_max_entries": 2000,  # 최대 캐시 엔트리 수
+    "cache_backend": "sqlite",  # 캐시 저장소 (sqlite | json)
     "show_price_per_pyeong": True,  # 평당가 표시
     "track_disappeared": True,  # 매물 소멸 추적
     "visible_columns": None,  # 표시할 컬럼 목록
@@ -50,6 +51,10 @@ DEFAULT_SETTINGS = {
     "fallback_engine_enabled": True,
     "playwright_headless": False,
     "playwright_detail_workers": 12,
+    "playwright_target_workers": 1,  # 단지 동시 수집 워커 수 (complex 모드)
+    "detail_cache_ttl_hours": 24,  # 매물 상세 캐시 유효시간 (시간, 0=사용 안 함)
+    "geo_tile_cache_ttl_hours": 12,  # 지도 마커 타일 캐시 유효시간 (시간, 0=사용 안 함)
+    "geo_request_budget": 120,  # 지도 마커 타일 요청 상한 (자산·거래유형 조합당, 0=무제한)
     "playwright_block_heavy_resources": True,
     "playwright_response_drain_timeout_ms": 3000,
     "playwright_navigation_timeout_ms": 15000,
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
+
+from src.utils.constants import GEO_PLANNER_MAX_DEPTH, GEO_PLANNER_REQUEST_BUDGET
+from src.utils.helpers import PriceConverter
 
 DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
@@ -21,6 +26,8 @@ class GeoSweepConfig:
     step_px: int = 480
     dwell_ms: int = 600
     asset_types: list[str] = field(default_factory=lambda: ["APT", "VL"])
+    request_budget: int = GEO_PLANNER_REQUEST_BUDGET
+    max_depth: int = GEO_PLANNER_MAX_DEPTH
 
 
 @dataclass(**DATACLASS_KWARGS)
@@ -30,3 +37,177 @@ class CrawlRequest:
     targets: list[tuple[str, str]] = field(default_factory=list)
     trade_types: list[str] = field(default_factory=list)
     geo: GeoSweepConfig | None = None
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ListingRecord(MutableMapping):
+    """크롤 파이프라인에서 쓰는 매물 레코드.
+
+    원본 매물 dict를 한 번 복사해 값 그대로 보관하므로 ``dict(record)``/``to_dict()`` 는 넣은 값을
+    그대로 돌려준다. 가격(만원)은 처음 읽을 때 한 번만 파싱해 ``__slots__`` 에 캐시하고, 해당 키에
+    새 값을 쓰면 캐시를 비운다. 필터에서 걸러지는 매물은 비교에 쓴 가격만 파싱된다.
+    UI·캐시·내보내기는 여전히 dict를 받으므로 ``_push_item`` 에서 ``to_dict()`` 로 넘긴다.
+    """
+
+    __slots__ = ("_data", "_sale_price", "_deposit", "_monthly_rent")
+
+    # 한글 가격 키 → 파싱 값 캐시 slot
+    _PRICE_SLOTS = {
+        "매매가": "_sale_price",
+        "보증금": "_deposit",
+        "월세": "_monthly_rent",
+    }
+
+    def __init__(self, item: Any = None, **kwargs: Any):
+        self._data: dict[str, Any] = dict(item) if item else {}
+        if kwargs:
+            self._data.update(kwargs)
+        self._sale_price: int | None = None
+        self._deposit: int | None = None
+        self._monthly_rent: int | None = None
+
+    @classmethod
+    def from_item(cls, item: Any) -> "ListingRecord":
+        if isinstance(item, ListingRecord):
+            return item
+        return cls(item if isinstance(item, Mapping) else None)
+
+    def _parsed_price(self, key: str) -> int:
+        slot = self._PRICE_SLOTS[key]
+        cached = getattr(self, slot)
+        if cached is None:
+            cached = int(PriceConverter.to_int(_text(self._data.get(key))) or 0)
+            setattr(self, slot, cached)
+        return cached
+
+    # ── 파싱된 값 ──
+    @property
+    def sale_price(self) -> int:
+        return self._parsed_price("매매가")
+
+    @property
+    def deposit(self) -> int:
+        return self._parsed_price("보증금")
+
+    @property
+    def monthly_rent(self) -> int:
+        return self._parsed_price("월세")
+
+    @property
+    def complex_name(self) -> str:
+        return _text(self._data.get("단지명"))
+
+    @property
+    def complex_id(self) -> str:
+        return _text(self._data.get("단지ID"))
+
+    @property
+    def article_id(self) -> str:
+        return _text(self._data.get("매물ID"))
+
+    @property
+    def trade_type(self) -> str:
+        return _text(self._data.get("거래유형"))
+
+    @property
+    def asset_type(self) -> str:
+        return _text(self._data.get("자산유형")).strip().upper() or "APT"
+
+    @property
+    def area_sqm(self) -> float:
+        return _float(self._data.get("면적(㎡)"))
+
+    @property
+    def area_pyeong(self) -> float:
+        return _float(self._data.get("면적(평)"))
+
+    @property
+    def representative_price(self) -> int:
+        """비교용 대표 가격(만원): 매매가, 월세는 월세(없으면 보증금), 그 외 보증금."""
+        trade_type = self.trade_type
+        if trade_type == "매매":
+            return self.sale_price
+        if trade_type == "월세" and self.monthly_rent > 0:
+            return self.monthly_rent
+        return self.deposit
+
+    @property
+    def price_text(self) -> str:
+        """표시용 가격 문자열 (월세는 ``보증금/월세``)."""
+        trade_type = self.trade_type
+        if trade_type == "매매":
+            return _text(self._data.get("매매가"))
+        deposit_text = _text(self._data.get("보증금"))
+        monthly_text = _text(self._data.get("월세"))
+        if trade_type != "전세" and monthly_text:
+            return f"{deposit_text}/{monthly_text}"
+        return deposit_text
+
+    # ── dict 호환 인터페이스 ──
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+        slot = self._PRICE_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, None)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        slot = self._PRICE_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def copy(self) -> "ListingRecord":
+        clone = ListingRecord.__new__(ListingRecord)
+        clone._data = dict(self._data)
+        clone._sale_price = self._sale_price
+        clone._deposit = self._deposit
+        clone._monthly_rent = self._monthly_rent
+        return clone
+
+    def to_dict(self) -> dict[str, Any]:
+        """레거시 소비자용 dict. 생성할 때 받은 값이 그대로 들어 있다."""
+        return dict(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"ListingRecord(article_id={self.article_id!r}, complex_id={self.complex_id!r}, "
+            f"trade_type={self.trade_type!r}, price={self.representative_price})"
+        )
+
+
+def listing_prices(item: Any) -> tuple[int, int, int]:
+    """``(매매가, 보증금, 월세)`` 만원 값을 반환한다. ListingRecord는 다시 파싱하지 않는다."""
+    if isinstance(item, ListingRecord):
+        return item.sale_price, item.deposit, item.monthly_rent
+    if not isinstance(item, Mapping):
+        return 0, 0, 0
+    return (
+        int(PriceConverter.to_int(item.get("매매가", "")) or 0),
+        int(PriceConverter.to_int(item.get("보증금", "")) or 0),
+        int(PriceConverter.to_int(item.get("월세", "")) or 0),
+    )
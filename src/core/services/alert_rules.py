@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+
+AREA_MAX_DEFAULT = 999999.0
+PRICE_MAX_DEFAULT = 999999999
+
+
+def _default_getter(row: Any, key: str, default: Any = None) -> Any:
+    try:
+        value = row[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+    return default if value is None else value
+
+
+@dataclass(frozen=True)
+class AlertRuleSpec:
+    order: int
+    alert_id: int
+    complex_name: str
+    area_min: float
+    area_max: float
+    price_min: int
+    price_max: int
+
+    def matches(self, area: float, price: int) -> bool:
+        return self.area_min <= area <= self.area_max and self.price_min <= price <= self.price_max
+
+
+class AlertRuleIndex:
+    """(단지, 거래유형, 자산유형) 단위 알림 룰의 면적/가격 구간 인덱스.
+
+    룰을 ``area_min`` 기준으로 정렬해 두고 bisect로 하한 후보만 좁힌 뒤
+    ``area_max``/가격 구간을 검사한다. 매칭 결과는 DB에서 받은 원래 룰 순서를 따른다.
+    """
+
+    __slots__ = ("_rules", "_area_mins")
+
+    def __init__(self, rules: Iterable[AlertRuleSpec] = ()):
+        ordered = sorted(rules, key=lambda rule: (rule.area_min, rule.order))
+        self._rules = ordered
+        self._area_mins = [rule.area_min for rule in ordered]
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Any],
+        getter: Optional[Callable[[Any, str, Any], Any]] = None,
+    ) -> "AlertRuleIndex":
+        get = getter or _default_getter
+        specs = []
+        for order, row in enumerate(rows or []):
+            specs.append(
+                AlertRuleSpec(
+                    order=order,
+                    alert_id=int(get(row, "id", 0) or 0),
+                    complex_name=str(get(row, "complex_name", "") or ""),
+                    area_min=float(get(row, "area_min", 0) or 0),
+                    area_max=float(get(row, "area_max", AREA_MAX_DEFAULT) or AREA_MAX_DEFAULT),
+                    price_min=int(get(row, "price_min", 0) or 0),
+                    price_max=int(get(row, "price_max", PRICE_MAX_DEFAULT) or PRICE_MAX_DEFAULT),
+                )
+            )
+        return cls(specs)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def match(self, area: float, price: int) -> list[AlertRuleSpec]:
+        if not self._rules:
+            return []
+        upper = bisect_right(self._area_mins, area)
+        matched = [rule for rule in self._rules[:upper] if rule.matches(area, price)]
+        if len(matched) > 1:
+            matched.sort(key=lambda rule: rule.order)
+        return matched
@@ -8,6 +8,7 @@ from src.core.services.response_capture import TRADE_CODE_MAP
 _TRADE_TO_CODE: dict[str, str] = {value: key for key, value in TRADE_CODE_MAP.items()}
 DEFAULT_ARTICLE_API_PAGE_SIZE = 20
 MAX_ARTICLE_API_PAGES = 50
+MAX_ARTICLE_API_PREFETCH_IN_FLIGHT = 4
 
 
 def article_api_path_kind(base_kind: str) -> str:
@@ -69,6 +70,43 @@ def build_article_api_url(
     return f"https://new.land.naver.com/api/articles/{path_kind}/{cid}?" + urlencode(params)
 
 
+_MARKER_QUERY_SKIP_KEYS = frozenset({"page", "buildingNos", "areaNos", "type", "order"})
+
+
+def build_single_markers_url(
+    base_kind: str,
+    trade_type: str,
+    path_asset: str = "APT",
+    *,
+    zoom: int,
+    bounds: tuple[float, float, float, float],
+) -> str:
+    """지도 화면이 보내는 ``{complexes|houses}/single-markers`` 요청 URL을 bbox로 직접 만든다.
+
+    ``bounds`` 는 ``(leftLon, rightLon, topLat, bottomLat)`` 이다.
+    """
+    kind = "houses" if str(base_kind or "") == "houses" else "complexes"
+    left_lon, right_lon, top_lat, bottom_lat = bounds
+    params = {
+        key: value
+        for key, value in build_article_api_query_params(trade_type, path_asset).items()
+        if key not in _MARKER_QUERY_SKIP_KEYS
+    }
+    params.update(
+        {
+            "zoom": str(int(zoom)),
+            "leftLon": f"{float(left_lon):.7f}",
+            "rightLon": f"{float(right_lon):.7f}",
+            "topLat": f"{float(top_lat):.7f}",
+            "bottomLat": f"{float(bottom_lat):.7f}",
+            "markerId": "",
+            "markerType": "",
+            "isPresale": "true",
+        }
+    )
+    return f"https://new.land.naver.com/api/{kind}/single-markers/2.0?" + urlencode(params)
+
+
 def article_api_list_count(payload: Any) -> int:
     if not isinstance(payload, dict):
         return 0
@@ -89,4 +127,45 @@ def article_api_has_more_pages(
         return bool(payload.get("isMoreData"))
     if "moreData" in payload:
         return bool(payload.get("moreData"))
-    return int(articles_on_page or 0) >= max(1, int(page_size or DEFAULT_ARTICLE_API_PAGE_SIZE))
\ No newline at end of file
+    return int(articles_on_page or 0) >= max(1, int(page_size or DEFAULT_ARTICLE_API_PAGE_SIZE))
+
+
+def article_api_total_pages(
+    payload: Any,
+    *,
+    page_size: int = DEFAULT_ARTICLE_API_PAGE_SIZE,
+) -> int:
+    """Return the page count implied by a total-count field, or 0 when the payload has none."""
+    if not isinstance(payload, dict):
+        return 0
+    raw_total = payload.get("totalCount")
+    if raw_total is None:
+        return 0
+    try:
+        total = int(raw_total)
+    except (TypeError, ValueError):
+        return 0
+    if total <= 0:
+        return 0
+    size = max(1, int(page_size or DEFAULT_ARTICLE_API_PAGE_SIZE))
+    return (total + size - 1) // size
+
+
+def article_api_prefetch_pages(
+    next_page: int,
+    *,
+    window: int,
+    total_pages: int = 0,
+    max_pages: int = MAX_ARTICLE_API_PAGES,
+) -> list[int]:
+    """Pages to schedule next, starting at ``next_page`` and spanning at most ``window`` pages.
+
+    Without a known total the window is speculative, so callers grow it gradually
+    and discard pages that follow the one reporting no more data.
+    """
+    start = max(1, int(next_page or 1))
+    last_page = max(0, int(max_pages or 0))
+    if total_pages > 0:
+        last_page = min(last_page, int(total_pages))
+    end = min(last_page, start + max(1, int(window or 1)) - 1)
+    return list(range(start, end + 1))
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional
+
+# 크롤 통계 필드와 기본값. 순서가 UI 전송(snapshot/delta)의 키 순서다.
+STAT_FIELDS: dict[str, Any] = {
+    "total_found": 0,
+    "filtered_out": 0,
+    "cache_hits": 0,
+    "new_count": 0,
+    "price_up": 0,
+    "price_down": 0,
+    "geo_discovered_count": 0,
+    "geo_dedup_count": 0,
+    "geo_marker_switch_attempt_count": 0,
+    "geo_marker_switch_success_count": 0,
+    "geo_marker_switch_fail_count": 0,
+    "geo_marker_switch_last_method": "",
+    "geo_api_sweep_count": 0,
+    "geo_api_tile_count": 0,
+    "geo_api_tile_fail_count": 0,
+    "geo_api_fallback_count": 0,
+    "geo_tile_cache_hit_count": 0,
+    "geo_tile_cache_miss_count": 0,
+    "geo_plan_tile_count": 0,
+    "geo_plan_request_count": 0,
+    "geo_plan_split_count": 0,
+    "geo_plan_max_depth": 0,
+    "geo_plan_budget_exhausted_count": 0,
+    "geo_plan_coverage_pct": 0.0,
+    "geo_complexes_per_request": 0.0,
+    "geo_incomplete": False,
+    "geo_incomplete_count": 0,
+    "geo_incomplete_reasons": [],
+    "response_drain_wait_count": 0,
+    "response_drain_timeout_count": 0,
+    "response_seen_count": 0,
+    "parse_success_count": 0,
+    "parse_fail_count": 0,
+    "detail_fetch_total": 0,
+    "detail_fetch_success": 0,
+    "detail_success_count": 0,
+    "detail_fail_count": 0,
+    "detail_partial_count": 0,
+    "detail_missing_field_total": 0,
+    "detail_fetch_skipped_count": 0,
+    "detail_cache_hit_count": 0,
+    "detail_cache_miss_count": 0,
+    "blocked_page_count": 0,
+    "playwright_recycle_count": 0,
+    "playwright_last_recycle_reason": "",
+    "playwright_browser_source": "",
+    "playwright_browser_path": "",
+    "playwright_profile_dir": "",
+    "playwright_session_reused": 0,
+    "playwright_headed_fallback_used": 0,
+    "playwright_warmup_count": 0,
+    "playwright_last_entry_plan": "",
+    "playwright_last_final_url": "",
+    "playwright_last_page_title": "",
+    "playwright_last_block_reason": "",
+    "response_match_count": 0,
+    "capture_failed_count": 0,
+    "block_like_redirect_count": 0,
+    "article_api_fast_path_hit_count": 0,
+    "article_api_fast_path_fail_count": 0,
+    "article_api_fast_path_fallback_count": 0,
+    "article_api_last_status": "",
+    "detail_network_response_total": 0,
+    "detail_hydration_hit_count": 0,
+    "fallback_trigger_count": 0,
+    "fallback_last_reason": "",
+    "block_detect_count": 0,
+    "block_cooldown_count": 0,
+    "db_write_queue_depth": 0,
+    "db_write_queue_max_depth": 0,
+    "db_write_backpressure_count": 0,
+    "db_write_backpressure_wait_ms": 0,
+    "db_write_batch_count": 0,
+    "history_index_size": 0,
+    "history_index_bytes": 0,
+    "history_index_cache_warm_count": 0,
+    "pacing_navigation_count": 0,
+    "pacing_navigation_wait_ms": 0,
+    "pacing_navigation_rps": 0.0,
+    "pacing_article_api_count": 0,
+    "pacing_article_api_wait_ms": 0,
+    "pacing_article_api_rps": 0.0,
+    "pacing_mobile_detail_count": 0,
+    "pacing_mobile_detail_wait_ms": 0,
+    "pacing_mobile_detail_rps": 0.0,
+    "pacing_wait_ms_total": 0,
+    "by_trade_type": {"매매": 0, "전세": 0, "월세": 0},
+}
+_FIELD_NAMES = frozenset(STAT_FIELDS)
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class CrawlStats(MutableMapping):
+    """크롤 스레드와 엔진이 함께 쓰는 통계 카운터.
+
+    알려진 필드는 ``__slots__`` 속성으로 보관해 카운터 증가가 dict 재구성 없이 끝나고,
+    ``stats["key"]`` 형태의 기존 접근도 그대로 지원한다. 목록에 없는 키는 ``_extra`` 에 둔다.
+    ``take_delta`` 는 마지막 전송 이후 바뀐 필드만 모아 UI로 보낼 payload를 만든다.
+    """
+
+    __slots__ = (*STAT_FIELDS, "_extra", "_emitted")
+
+    def __init__(self, **overrides: Any):
+        for name, default in STAT_FIELDS.items():
+            setattr(self, name, _copy_value(default))
+        self._extra: dict[str, Any] = {}
+        self._emitted: Optional[dict[str, Any]] = None
+        for key, value in overrides.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_NAMES:
+            return getattr(self, key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_NAMES:
+            setattr(self, key, value)
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_NAMES:
+            setattr(self, key, _copy_value(STAT_FIELDS[key]))
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from STAT_FIELDS
+        yield from list(self._extra)
+
+    def __len__(self) -> int:
+        return len(STAT_FIELDS) + len(self._extra)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_NAMES or key in self._extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_NAMES:
+            return getattr(self, key)
+        return self._extra.get(key, default)
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """카운터를 ``amount`` 만큼 올리고 새 값을 반환한다."""
+        value = int(self.get(key, 0) or 0) + amount
+        self[key] = value
+        return value
+
+    def raise_to(self, key: str, value: Any) -> None:
+        """현재 값보다 클 때만 갱신한다(최댓값 계열 필드)."""
+        if value > (self.get(key, 0) or 0):
+            self[key] = value
+
+    def snapshot(self) -> dict[str, Any]:
+        """전체 필드를 UI로 넘길 수 있게 복사한다. 목록/사전 값도 복사본이다."""
+        return {key: _copy_value(self[key]) for key in self}
+
+    def take_delta(self) -> dict[str, Any]:
+        """마지막 ``take_delta`` 이후 값이 바뀐 필드만 반환한다. 첫 호출은 전체 필드다."""
+        emitted = self._emitted
+        if emitted is None:
+            emitted = {}
+            self._emitted = emitted
+        delta: dict[str, Any] = {}
+        missing = object()
+        for key in self:
+            value = self[key]
+            previous = emitted.get(key, missing)
+            if previous is missing or previous != value:
+                emitted[key] = _copy_value(value)
+                delta[key] = _copy_value(value)
+        return delta
+
+    def reset_delta(self) -> None:
+        """다음 ``take_delta`` 가 전체 필드를 다시 보내게 한다."""
+        self._emitted = None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
+from collections.abc import Mapping, MutableMapping
+from typing import Any, cast
 
-from src.core.services.gap_analysis import enrich_gap_fields
+from src.core.services.gap_analysis import ListingItemT, enrich_gap_fields
 
 
 def parse_kr_money_to_won(text: str) -> int | None:
@@ -567,9 +570,9 @@ async def fetch_mobile_article_detail(detail_page, article_no: str, *, navigatio
     return final_fields
 
 
-def apply_mobile_detail(item: dict, detail: dict | None) -> dict:
-    if not isinstance(item, dict):
-        return {}
+def apply_mobile_detail(item: ListingItemT, detail: dict | None) -> ListingItemT:
+    if not isinstance(item, MutableMapping):
+        return cast(ListingItemT, {})
     if isinstance(detail, dict):
         meta = dict(detail.get("_detail_meta", {}) or {})
         applied = {key: value for key, value in detail.items() if key != "_detail_meta"}
@@ -587,3 +590,14 @@ def apply_mobile_detail(item: dict, detail: dict | None) -> dict:
             item["상세수집상태"] = parse_state
             item["상세누락필드수"] = missing_count
     return enrich_gap_fields(item)
+
+
+_DETAIL_FINGERPRINT_FIELDS = ("거래유형", "매매가", "보증금", "월세", "층/방향", "타입/특징")
+
+
+def build_detail_fingerprint(item: Mapping[str, Any]) -> str:
+    """상세 캐시 재사용 여부를 판단하는 목록 필드(가격/층/특징) 지문."""
+    if not isinstance(item, Mapping):
+        return ""
+    raw = "\x1f".join(str(item.get(key, "") or "").strip() for key in _DETAIL_FINGERPRINT_FIELDS)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import MutableMapping
+from typing import Any, TypeVar, cast
+
 from src.utils.helpers import PriceConverter
 
+# 매물 dict 또는 ListingRecord 처럼 제자리에서 갱신할 수 있는 매물 매핑.
+ListingItemT = TypeVar("ListingItemT", bound=MutableMapping[str, Any])
+
 
 def sale_price_text_to_won(price_text: str) -> int:
     return max(0, int(PriceConverter.to_int(price_text or "") or 0)) * 10_000
 
 
-def enrich_gap_fields(item: dict) -> dict:
-    if not isinstance(item, dict):
-        return {}
+def enrich_gap_fields(item: ListingItemT) -> ListingItemT:
+    if not isinstance(item, MutableMapping):
+        return cast(ListingItemT, {})
 
     trade_type = str(item.get("거래유형", "") or "")
     prev_jeonse_won = int(item.get("기전세금(원)", 0) or 0)
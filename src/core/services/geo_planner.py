@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import heapq
+from typing import Iterable
+
+from src.utils.constants import (
+    GEO_PLANNER_MAX_DEPTH,
+    GEO_PLANNER_MAX_ZOOM,
+    GEO_PLANNER_SPLIT_MARKER_COUNT,
+)
+
+# (zoom, tile_x, tile_y). 같은 픽셀 크기의 고정 격자에서 줌을 하나 올리면 타일 하나가 정확히 4개로 나뉜다.
+PlannerTile = tuple[int, int, int]
+
+
+def child_tiles(tile: PlannerTile) -> list[PlannerTile]:
+    zoom, tile_x, tile_y = tile
+    return [
+        (zoom + 1, tile_x * 2 + dx, tile_y * 2 + dy)
+        for dy in (0, 1)
+        for dx in (0, 1)
+    ]
+
+
+class QuadtreeSweepPlanner:
+    """마커 밀도에 따라 타일을 4분할하며 탐색 순서를 정하는 planner.
+
+    시작 타일은 모두 먼저 내주고, 이후에는 부모 타일의 마커 밀도가 높은 자식부터 꺼낸다.
+    빈 타일과 기준 미만 타일은 더 내려가지 않는다. 네트워크 요청 수는 ``request_budget``
+    (0이면 무제한) 안에서만 쓰며, 캐시로 채운 타일은 예산을 차감하지 않는다.
+    """
+
+    __slots__ = (
+        "split_marker_count",
+        "max_depth",
+        "max_zoom",
+        "request_budget",
+        "request_count",
+        "tile_count",
+        "split_count",
+        "max_depth_reached",
+        "budget_exhausted",
+        "_heap",
+        "_seq",
+        "_root_count",
+        "_resolved_area",
+        "_unresolved_area",
+    )
+
+    def __init__(
+        self,
+        root_tiles: Iterable[PlannerTile],
+        *,
+        split_marker_count: int = GEO_PLANNER_SPLIT_MARKER_COUNT,
+        max_depth: int = GEO_PLANNER_MAX_DEPTH,
+        max_zoom: int = GEO_PLANNER_MAX_ZOOM,
+        request_budget: int = 0,
+    ):
+        self.split_marker_count = max(1, int(split_marker_count))
+        self.max_depth = max(0, int(max_depth))
+        self.max_zoom = int(max_zoom)
+        self.request_budget = max(0, int(request_budget or 0))
+        self.request_count = 0
+        self.tile_count = 0
+        self.split_count = 0
+        self.max_depth_reached = 0
+        self.budget_exhausted = False
+        self._heap: list[tuple[float, int, int, PlannerTile]] = []
+        self._seq = 0
+        self._root_count = 0
+        self._resolved_area = 0.0
+        self._unresolved_area = 0.0
+        for tile in dict.fromkeys(root_tiles):
+            self._push(tile, 0, float("inf"))
+            self._root_count += 1
+
+    def _push(self, tile: PlannerTile, depth: int, priority: float) -> None:
+        heapq.heappush(self._heap, (-priority, depth, self._seq, tile))
+        self._seq += 1
+
+    @staticmethod
+    def _area(depth: int) -> float:
+        return 0.25 ** depth
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def next_batch(self, size: int) -> list[tuple[PlannerTile, int]]:
+        """우선순위가 높은 타일을 최대 ``size`` 개 꺼낸다."""
+        batch = []
+        while self._heap and len(batch) < max(1, int(size)):
+            _priority, depth, _seq, tile = heapq.heappop(self._heap)
+            batch.append((tile, depth))
+        return batch
+
+    def can_request(self) -> bool:
+        return not self.request_budget or self.request_count < self.request_budget
+
+    def charge_request(self) -> bool:
+        """네트워크 요청 1건을 예산에서 차감한다. 예산이 없으면 False."""
+        if not self.can_request():
+            self.budget_exhausted = True
+            return False
+        self.request_count += 1
+        return True
+
+    def record(self, tile: PlannerTile, depth: int, *, marker_count: int, cluster_count: int = 0) -> bool:
+        """타일 결과를 반영하고, 4분할했으면 True를 반환한다."""
+        self.tile_count += 1
+        self.max_depth_reached = max(self.max_depth_reached, int(depth))
+        markers = max(0, int(marker_count or 0))
+        clusters = max(0, int(cluster_count or 0))
+        dense = markers >= self.split_marker_count or clusters > 0
+        if not dense or depth >= self.max_depth or tile[0] >= self.max_zoom:
+            self._resolved_area += self._area(depth)
+            return False
+        self.split_count += 1
+        priority = float(markers + clusters * self.split_marker_count)
+        for child in child_tiles(tile):
+            self._push(child, depth + 1, priority)
+        return True
+
+    def mark_unresolved(self, tile: PlannerTile, depth: int) -> None:
+        """캐시도 없고 요청도 못 한 타일. 커버리지에서 빠진다."""
+        self._unresolved_area += self._area(depth)
+
+    def drain_unresolved(self) -> int:
+        """남은 대기 타일을 모두 미탐색으로 처리하고 그 수를 반환한다."""
+        remaining = len(self._heap)
+        for _priority, depth, _seq, _tile in self._heap:
+            self._unresolved_area += self._area(depth)
+        self._heap.clear()
+        return remaining
+
+    @property
+    def root_area(self) -> float:
+        return float(self._root_count)
+
+    @property
+    def resolved_area(self) -> float:
+        return self._resolved_area
+
+    def coverage_ratio(self) -> float:
+        """시작 타일 면적 중 더 나눌 필요 없이 확인이 끝난 비율."""
+        if self._root_count <= 0:
+            return 0.0
+        return min(1.0, self._resolved_area / self._root_count)
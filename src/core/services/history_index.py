@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable, Optional
+
+from src.utils.helpers import PriceConverter
+
+
+def _normalize_asset_type(asset_type: Any) -> str:
+    token = str(asset_type or "APT").strip().upper() or "APT"
+    return token if token in {"APT", "VL"} else "APT"
+
+
+def comparable_history_price(price_text: Any, trade_type: str, fallback: int = 0) -> int:
+    """이력의 price_text에서 현재 매물과 비교할 대표 가격(만원)을 구한다.
+
+    월세는 ``보증금/월세`` 중 월세(없으면 보증금)를 쓰고, 파싱할 수 없으면 ``fallback``.
+    """
+    raw = str(price_text or "").strip()
+    fallback_value = int(fallback or 0)
+    if not raw:
+        return fallback_value
+    if trade_type == "월세":
+        deposit_text, _, monthly_text = raw.partition("/")
+        monthly_value = PriceConverter.to_int(monthly_text)
+        if monthly_value > 0:
+            return monthly_value
+        deposit_value = PriceConverter.to_int(deposit_text)
+        if deposit_value > 0:
+            return deposit_value
+        return fallback_value
+    price_value = PriceConverter.to_int(raw)
+    return price_value if price_value > 0 else fallback_value
+
+
+class ArticleHistoryIndex:
+    """가격 변동 판정용 ``article_history`` 상태 인덱스.
+
+    article_id 문자열은 한 번만 정수 키로 intern하고, ``(자산유형, 단지ID, 거래유형)``
+    범위마다 ``{정수 키: 비교용 대표 가격}`` 만 보관한다. 비교 가격은 적재 시점에
+    미리 계산하므로 매물마다 price_text를 다시 파싱하지 않는다. 단지 루프와 지도
+    탐색이 같은 인스턴스를 공유하며, 어떤 범위를 이미 적재했는지 ``mark_loaded`` 로 기록한다.
+    """
+
+    __slots__ = ("_ids", "_scopes", "_loaded")
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._scopes: dict[tuple[str, str, str], dict[int, int]] = {}
+        self._loaded: set[tuple] = set()
+
+    def __len__(self) -> int:
+        return sum(len(scope) for scope in self._scopes.values())
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._scopes.clear()
+        self._loaded.clear()
+
+    def intern(self, article_id: Any) -> int:
+        token = str(article_id or "").strip()
+        key = self._ids.get(token)
+        if key is None:
+            key = len(self._ids)
+            self._ids[sys.intern(token)] = key
+        return key
+
+    @staticmethod
+    def scope_key(asset_type: Any, complex_id: Any, trade_type: Any) -> tuple[str, str, str]:
+        return (
+            _normalize_asset_type(asset_type),
+            str(complex_id or "").strip(),
+            str(trade_type or "").strip(),
+        )
+
+    def is_loaded(self, load_key: tuple) -> bool:
+        return load_key in self._loaded
+
+    def mark_loaded(self, load_key: tuple) -> None:
+        self._loaded.add(load_key)
+
+    def load_rows(self, rows: Iterable[Any]) -> int:
+        """``(asset_type, complex_id, trade_type, article_id, price, price_text)`` 행을 적재한다."""
+        loaded = 0
+        for row in rows or ():
+            try:
+                asset_type, complex_id, trade_type, article_id, price, price_text = tuple(row)[:6]
+            except (TypeError, ValueError):
+                continue
+            if not article_id or not complex_id:
+                continue
+            try:
+                stored_price = int(price or 0)
+            except (TypeError, ValueError):
+                stored_price = 0
+            trade_token = str(trade_type or "").strip()
+            self.record(
+                asset_type,
+                complex_id,
+                trade_token,
+                article_id,
+                comparable_history_price(price_text, trade_token, fallback=stored_price),
+            )
+            loaded += 1
+        return loaded
+
+    def load_state_map(self, asset_type: Any, complex_id: Any, trade_type: Any, state_map: Any) -> int:
+        """``get_article_history_state_bulk`` 형식의 ``{article_id: row}`` 를 적재한다."""
+        if not isinstance(state_map, dict):
+            return 0
+        trade_token = str(trade_type or "").strip()
+        loaded = 0
+        for article_id, row in state_map.items():
+            if not article_id:
+                continue
+            get = row.get if isinstance(row, dict) else (lambda _key, default=None: default)
+            try:
+                stored_price = int(get("price", 0) or 0)
+            except (TypeError, ValueError):
+                stored_price = 0
+            self.record(
+                asset_type,
+                complex_id,
+                trade_token,
+                article_id,
+                comparable_history_price(get("price_text", ""), trade_token, fallback=stored_price),
+            )
+            loaded += 1
+        return loaded
+
+    def lookup(self, asset_type: Any, complex_id: Any, trade_type: Any, article_id: Any) -> Optional[int]:
+        """이전 비교 가격을 반환한다. 이력이 없으면(신규 매물) None."""
+        key = self._ids.get(str(article_id or "").strip())
+        if key is None:
+            return None
+        scope = self._scopes.get(self.scope_key(asset_type, complex_id, trade_type))
+        if scope is None:
+            return None
+        return scope.get(key)
+
+    def record(self, asset_type: Any, complex_id: Any, trade_type: Any, article_id: Any, price: int) -> None:
+        scope_key = self.scope_key(asset_type, complex_id, trade_type)
+        scope = self._scopes.get(scope_key)
+        if scope is None:
+            scope = {}
+            self._scopes[scope_key] = scope
+        scope[self.intern(article_id)] = int(price or 0)
+
+    def memory_bytes(self) -> int:
+        """인덱스가 차지하는 대략적인 메모리(bytes). 공유되는 작은 int는 제외한다."""
+        total = sys.getsizeof(self._ids) + sys.getsizeof(self._scopes) + sys.getsizeof(self._loaded)
+        total += sum(sys.getsizeof(article_id) for article_id in self._ids)
+        for scope_key, scope in self._scopes.items():
+            total += sys.getsizeof(scope_key) + sys.getsizeof(scope)
+            total += sum(sys.getsizeof(price) for price in scope.values() if price > 256)
+        return total
@@ -54,3 +54,87 @@ def build_grid_sweep_coords(
         seen.add(rounded)
         deduped.append(clamped)
     return deduped
+
+
+DEFAULT_VIEWPORT_PX = (1920, 1080)
+
+
+def marker_tile_xy(
+    lat: float,
+    lon: float,
+    zoom: int,
+    tile_px: tuple[int, int] = DEFAULT_VIEWPORT_PX,
+) -> tuple[int, int]:
+    """줌별 고정 격자(뷰포트 크기)에서 좌표가 속한 타일 번호를 반환한다."""
+    x, y = ll_to_pixel(lat, lon, zoom)
+    return int(math.floor(x / max(1, int(tile_px[0])))), int(math.floor(y / max(1, int(tile_px[1]))))
+
+
+def marker_tile_bounds(
+    tile_x: int,
+    tile_y: int,
+    zoom: int,
+    tile_px: tuple[int, int] = DEFAULT_VIEWPORT_PX,
+) -> tuple[float, float, float, float]:
+    """타일 번호의 (leftLon, rightLon, topLat, bottomLat) 를 반환한다."""
+    tile_w = max(1, int(tile_px[0]))
+    tile_h = max(1, int(tile_px[1]))
+    top_lat, left_lon = pixel_to_ll(int(tile_x) * tile_w, int(tile_y) * tile_h, zoom)
+    bottom_lat, right_lon = pixel_to_ll((int(tile_x) + 1) * tile_w, (int(tile_y) + 1) * tile_h, zoom)
+    return round(left_lon, 7), round(right_lon, 7), round(top_lat, 7), round(bottom_lat, 7)
+
+
+def marker_sweep_bounds(
+    center_lat: float,
+    center_lon: float,
+    zoom: int,
+    rings: int = 1,
+    step_px: int = 480,
+    viewport_px: tuple[int, int] = DEFAULT_VIEWPORT_PX,
+) -> tuple[float, float, float, float]:
+    """드래그 탐색의 각 중심점에 뷰포트를 씌운 합집합 범위를 bbox로 반환한다."""
+    cx, cy = ll_to_pixel(center_lat, center_lon, zoom)
+    reach = max(0, int(rings)) * max(0, int(step_px))
+    half_w = reach + max(1, int(viewport_px[0])) / 2.0
+    half_h = reach + max(1, int(viewport_px[1])) / 2.0
+    top_lat, left_lon = clamp_korea(*pixel_to_ll(cx - half_w, cy - half_h, zoom))
+    bottom_lat, right_lon = clamp_korea(*pixel_to_ll(cx + half_w, cy + half_h, zoom))
+    return left_lon, right_lon, top_lat, bottom_lat
+
+
+def build_marker_tile_keys(
+    center_lat: float,
+    center_lon: float,
+    zoom: int,
+    rings: int = 1,
+    step_px: int = 480,
+    viewport_px: tuple[int, int] = DEFAULT_VIEWPORT_PX,
+) -> list[tuple[int, int]]:
+    """드래그 탐색 범위를 덮는 고정 격자 타일 번호 목록.
+
+    격자가 중심 좌표와 무관하게 고정되어 있으므로, 근처를 다시 탐색하면 같은 타일 키가 나와
+    타일 캐시를 그대로 재사용할 수 있다.
+    """
+    left_lon, right_lon, top_lat, bottom_lat = marker_sweep_bounds(
+        center_lat, center_lon, zoom, rings=rings, step_px=step_px, viewport_px=viewport_px
+    )
+    min_x, min_y = marker_tile_xy(top_lat, left_lon, zoom, viewport_px)
+    max_x, max_y = marker_tile_xy(bottom_lat, right_lon, zoom, viewport_px)
+    return [(tile_x, tile_y) for tile_y in range(min_y, max_y + 1) for tile_x in range(min_x, max_x + 1)]
+
+
+def build_marker_tiles(
+    center_lat: float,
+    center_lon: float,
+    zoom: int,
+    rings: int = 1,
+    step_px: int = 480,
+    viewport_px: tuple[int, int] = DEFAULT_VIEWPORT_PX,
+) -> list[tuple[float, float, float, float]]:
+    """``build_marker_tile_keys`` 타일들의 (leftLon, rightLon, topLat, bottomLat) 목록."""
+    return [
+        marker_tile_bounds(tile_x, tile_y, zoom, viewport_px)
+        for tile_x, tile_y in build_marker_tile_keys(
+            center_lat, center_lon, zoom, rings=rings, step_px=step_px, viewport_px=viewport_px
+        )
+    ]
@@ -1,71 +1,327 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional
 
+from src.core.models.crawl_models import listing_prices
 from src.utils.helpers import PriceConverter
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+SKETCH_MAX_BINS = 256
+SNAPSHOT_QUANTILES = (0.5, 0.25, 0.75)
+
 
 def _normalize_asset_type(asset_type: Any) -> str:
     token = str(asset_type or "APT").strip().upper() or "APT"
     return token if token in {"APT", "VL"} else "APT"
 
 
+def _pyeong_group(value: Any) -> float:
+    try:
+        pyeong = float(value or 0)
+    except (TypeError, ValueError):
+        pyeong = 0.0
+    return float(round(pyeong / 5) * 5)
+
+
+def _metric_prices(trade_type: str, sale_price: int, deposit: int, monthly_rent: int) -> list[tuple[str, int]]:
+    if trade_type == "매매":
+        return [("price", sale_price)]
+    if trade_type == "전세":
+        return [("price", deposit)]
+    if trade_type == "월세":
+        return [("deposit", deposit), ("rent", monthly_rent)]
+    return []
+
+
+def _interpolate(lower: float, upper: float, fraction: float) -> int:
+    # numpy.quantile(method="linear")와 같은 보간 후 반올림 규칙을 쓴다.
+    return int(round(lower + (upper - lower) * fraction))
+
+
+class PriceSketch:
+    """가격→빈도 히스토그램 기반 분위수 스케치.
+
+    서로 다른 가격이 ``max_bins`` 이하이면 분위수가 정확하고, 넘으면 해상도를 두 배씩
+    낮춰 인접 가격을 합치므로 근사값이 된다. 압축 때마다 반올림이 누적되므로 분위수 오차는
+    ``resolution`` 미만이다(해상도는 가격 범위 / ``max_bins`` 의 약 두 배 이하).
+    """
+
+    __slots__ = ("_counts", "_resolution", "_max_bins", "_sorted")
+
+    def __init__(self, max_bins: int = SKETCH_MAX_BINS):
+        self._counts: dict[int, int] = {}
+        self._resolution = 1
+        self._max_bins = max(2, int(max_bins))
+        self._sorted: Optional[list[tuple[int, int]]] = None
+
+    def add(self, value: int, count: int = 1) -> None:
+        resolution = self._resolution
+        key = int(value) if resolution == 1 else int(round(value / resolution)) * resolution
+        self._counts[key] = self._counts.get(key, 0) + int(count)
+        self._sorted = None
+        if len(self._counts) > self._max_bins:
+            self._compress()
+
+    def _compress(self) -> None:
+        while len(self._counts) > self._max_bins:
+            self._resolution *= 2
+            resolution = self._resolution
+            merged: dict[int, int] = {}
+            for key, count in self._counts.items():
+                bucket = int(round(key / resolution)) * resolution
+                merged[bucket] = merged.get(bucket, 0) + count
+            self._counts = merged
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def resolution(self) -> int:
+        return self._resolution
+
+    def quantile(self, q: float) -> int:
+        if not self._counts:
+            return 0
+        ordered = self._sorted
+        if ordered is None:
+            ordered = sorted(self._counts.items())
+            self._sorted = ordered
+        total = sum(count for _value, count in ordered)
+        position = (total - 1) * min(1.0, max(0.0, float(q)))
+        lower_rank = int(math.floor(position))
+        fraction = position - lower_rank
+        lower_value = upper_value = ordered[-1][0]
+        seen = 0
+        found_lower = False
+        for value, count in ordered:
+            seen += count
+            if not found_lower and lower_rank < seen:
+                lower_value = value
+                found_lower = True
+            if lower_rank + 1 < seen:
+                upper_value = value
+                break
+        if fraction <= 0:
+            return int(lower_value)
+        return _interpolate(lower_value, upper_value, fraction)
+
+
+class _BucketStats:
+    __slots__ = ("count", "total", "min_price", "max_price", "sketch")
+
+    def __init__(self, max_bins: int):
+        self.count = 0
+        self.total = 0
+        self.min_price = 0
+        self.max_price = 0
+        self.sketch = PriceSketch(max_bins)
+
+    def add(self, price: int) -> None:
+        if self.count == 0:
+            self.min_price = self.max_price = price
+        else:
+            if price < self.min_price:
+                self.min_price = price
+            if price > self.max_price:
+                self.max_price = price
+        self.count += 1
+        self.total += price
+        self.sketch.add(price)
+
+
+class PriceSnapshotAggregator:
+    """수집 배치가 들어올 때마다 평형 구간별 가격 통계를 누적하는 집계기.
+
+    구간 키는 ``(asset_type, 단지ID, 거래유형, 5평 단위 평형, price_metric)`` 이며
+    count/sum/min/max와 분위수 스케치(중앙값, p25, p75)를 유지한다.
+    """
+
+    def __init__(self, max_bins: int = SKETCH_MAX_BINS):
+        self._max_bins = int(max_bins)
+        self._buckets: dict[tuple[str, str, str, float, str], _BucketStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def add_price(self, asset_type: str, complex_id: str, trade_type: str, pyeong: float, metric: str, price: int) -> None:
+        if price <= 0:
+            return
+        key = (asset_type, complex_id, trade_type, pyeong, metric)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _BucketStats(self._max_bins)
+            self._buckets[key] = bucket
+        bucket.add(int(price))
+
+    def add_item(self, item: Mapping) -> bool:
+        if not isinstance(item, Mapping):
+            return False
+        cid = str(item.get("단지ID", "") or "").strip()
+        trade_type = str(item.get("거래유형", "") or "").strip()
+        if not cid or not trade_type:
+            return False
+        asset_type = _normalize_asset_type(item.get("자산유형", "APT"))
+        pyeong = _pyeong_group(item.get("면적(평)", 0))
+        for metric, price in _metric_prices(trade_type, *listing_prices(item)):
+            self.add_price(asset_type, cid, trade_type, pyeong, metric, price)
+        return True
+
+    def add_items(self, items: Iterable[Mapping]) -> int:
+        added = 0
+        for item in items or ():
+            if self.add_item(item):
+                added += 1
+        return added
+
+    def rows(self) -> list[tuple]:
+        """``add_price_snapshots_bulk`` 가 받는 13열 행 목록을 만든다."""
+        rows: list[tuple] = []
+        for (asset_type, cid, trade_type, pyeong, metric), bucket in self._buckets.items():
+            if bucket.count <= 0:
+                continue
+            median, p25, p75 = (bucket.sketch.quantile(q) for q in SNAPSHOT_QUANTILES)
+            rows.append(
+                (
+                    cid,
+                    trade_type,
+                    pyeong,
+                    bucket.min_price,
+                    bucket.max_price,
+                    bucket.total // bucket.count,
+                    bucket.count,
+                    asset_type,
+                    metric,
+                    0,
+                    median,
+                    p25,
+                    p75,
+                )
+            )
+        return rows
+
+
 def build_price_snapshot_rows(items: list[dict] | tuple[dict, ...]) -> list[tuple]:
     """Build daily price snapshot rows from collected crawl items."""
     if not items:
         return []
+    aggregator = PriceSnapshotAggregator()
+    aggregator.add_items(items)
+    return aggregator.rows()
 
-    grouped: dict[tuple[str, str, str, float, str], list[int]] = defaultdict(list)
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        cid = str(item.get("단지ID", "") or "").strip()
-        trade_type = str(item.get("거래유형", "") or "").strip()
-        if not cid or not trade_type:
-            continue
 
-        asset_type = _normalize_asset_type(item.get("자산유형", "APT"))
+def _history_metric_prices(trade_type: str, price: Any, price_text: Any) -> list[tuple[str, int]]:
+    try:
+        stored_price = int(price or 0)
+    except (TypeError, ValueError):
+        stored_price = 0
+    if trade_type != "월세":
+        return _metric_prices(trade_type, stored_price, stored_price, 0)
+    # article_history의 월세 price는 대표값(월세)이므로 보증금/월세는 price_text에서 나눈다.
+    raw = str(price_text or "").strip()
+    deposit_text, _, monthly_text = raw.partition("/")
+    deposit = PriceConverter.to_int(deposit_text)
+    monthly_rent = PriceConverter.to_int(monthly_text) if monthly_text else 0
+    if not monthly_text and deposit <= 0:
+        deposit = stored_price
+    return _metric_prices(trade_type, 0, deposit, monthly_rent)
+
+
+def build_price_snapshot_rows_from_history(rows: Iterable[Any]) -> list[tuple]:
+    """Re-aggregate ``article_history`` rows into price snapshot rows.
+
+    ``rows`` are ``(asset_type, complex_id, trade_type, area_pyeong, price, price_text)``
+    sequences. NumPy가 있으면 구간별 정렬로 정확한 분위수를 계산하고, 없으면
+    ``PriceSnapshotAggregator`` 로 집계한다. count/min/max/avg는 두 경로가 같지만, 구간의
+    서로 다른 가격이 ``SKETCH_MAX_BINS`` 를 넘으면 Python 경로의 분위수는 ``PriceSketch``
+    근사값(오차 < 스케치 해상도)이 된다.
+    """
+    keys: list[tuple[str, str, str, float, str]] = []
+    prices: list[int] = []
+    for row in rows or ():
         try:
-            pyeong = float(item.get("면적(평)", 0) or 0)
+            asset_type, complex_id, trade_type, area_pyeong, price, price_text = tuple(row)[:6]
         except (TypeError, ValueError):
-            pyeong = 0.0
-        pyeong_group = round(pyeong / 5) * 5
-
-        if trade_type == "매매":
-            metric_prices = [("price", PriceConverter.to_int(item.get("매매가", "0")))]
-        elif trade_type == "전세":
-            metric_prices = [("price", PriceConverter.to_int(item.get("보증금", "0")))]
-        elif trade_type == "월세":
-            metric_prices = [
-                ("deposit", PriceConverter.to_int(item.get("보증금", "0"))),
-                ("rent", PriceConverter.to_int(item.get("월세", "0"))),
-            ]
-        else:
-            metric_prices = []
+            continue
+        cid = str(complex_id or "").strip()
+        trade_token = str(trade_type or "").strip()
+        if not cid or not trade_token:
+            continue
+        asset_token = _normalize_asset_type(asset_type)
+        pyeong = _pyeong_group(area_pyeong)
+        for metric, value in _history_metric_prices(trade_token, price, price_text):
+            if value > 0:
+                keys.append((asset_token, cid, trade_token, pyeong, metric))
+                prices.append(int(value))
+    if not prices:
+        return []
+    if not NUMPY_AVAILABLE:
+        aggregator = PriceSnapshotAggregator()
+        for key, value in zip(keys, prices):
+            aggregator.add_price(*key, value)
+        return aggregator.rows()
+    return _aggregate_with_numpy(keys, prices)
 
-        for price_metric, price in metric_prices:
-            if price <= 0:
-                continue
-            key = (asset_type, cid, trade_type, float(pyeong_group), price_metric)
-            grouped[key].append(int(price))
 
-    rows: list[tuple] = []
-    for (asset_type, cid, trade_type, pyeong, price_metric), prices in grouped.items():
-        if not prices:
-            continue
-        rows.append(
+def _aggregate_with_numpy(keys: list[tuple[str, str, str, float, str]], prices: list[int]) -> list[tuple]:
+    assert np is not None
+    key_codes: dict[tuple[str, str, str, float, str], int] = {}
+    codes = np.fromiter(
+        (key_codes.setdefault(key, len(key_codes)) for key in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
+    values = np.asarray(prices, dtype=np.int64)
+    order = np.lexsort((values, codes))
+    codes = codes[order]
+    values = values[order]
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+    totals = np.add.reduceat(values, starts)
+    mins = values[starts]
+    maxs = values[starts + counts - 1]
+
+    quantiles = []
+    for q in SNAPSHOT_QUANTILES:
+        position = (counts - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        fraction = position - lower
+        upper = np.minimum(lower + 1, counts - 1)
+        lower_values = values[starts + lower].astype(np.float64)
+        upper_values = values[starts + upper].astype(np.float64)
+        quantiles.append(lower_values + (upper_values - lower_values) * fraction)
+
+    key_by_code = list(key_codes)
+    result: list[tuple] = []
+    for idx, code in enumerate(codes[starts].tolist()):
+        asset_type, cid, trade_type, pyeong, metric = key_by_code[code]
+        count = int(counts[idx])
+        result.append(
             (
                 cid,
                 trade_type,
                 pyeong,
-                min(prices),
-                max(prices),
-                sum(prices) // len(prices),
-                len(prices),
+                int(mins[idx]),
+                int(maxs[idx]),
+                int(totals[idx]) // count,
+                count,
                 asset_type,
-                price_metric,
+                metric,
                 0,
+                *(int(round(float(values_q[idx]))) for values_q in quantiles),
             )
         )
-    return rows
+    return result
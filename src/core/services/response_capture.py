@@ -87,14 +87,32 @@ def normalize_price_fields(article: dict[str, Any], trade_type: str) -> tuple[st
     return sale_price, deposit, monthly
 
 
+_CLUSTER_MARKER_TYPES = frozenset({"CLUSTER", "GROUP", "COMPLEX_GROUP", "HOUSE_GROUP"})
+
+
+def is_cluster_marker(marker: dict[str, Any]) -> bool:
+    """여러 단지를 하나로 묶어 보여 주는 클러스터 마커인지 판정한다."""
+    if not isinstance(marker, dict):
+        return False
+    marker_type = str(_first(marker, "markerType", "type", default="")).strip().upper()
+    if marker_type in _CLUSTER_MARKER_TYPES:
+        return True
+    try:
+        grouped = int(_first(marker, "complexCount", "markerCount", "groupCount", default=0) or 0)
+    except (TypeError, ValueError):
+        grouped = 0
+    return grouped > 1
+
+
 def normalize_marker_payload(marker: dict[str, Any], asset_type: str = "") -> dict[str, Any]:
-    cid = str(_first(marker, "complexNo", "houseNo", default="")).strip()
-    marker_id = str(_first(marker, "markerId", default="")).strip()
+    # 이미 정규화된 마커(complex_id/marker_id/complex_name)를 다시 넣어도 같은 결과가 나온다.
+    cid = str(_first(marker, "complexNo", "houseNo", "complex_id", default="")).strip()
+    marker_id = str(_first(marker, "markerId", "marker_id", default="")).strip()
     if not cid:
         cid = marker_id
     if not marker_id:
         marker_id = cid
-    name = str(_first(marker, "complexName", "houseName", default="")).strip()
+    name = str(_first(marker, "complexName", "houseName", "complex_name", default="")).strip()
     lat = _to_float(_first(marker, "latitude", "lat", default=0.0))
     lon = _to_float(_first(marker, "longitude", "lon", "lng", default=0.0))
     count = int(_first(marker, "articleCount", "dealCount", "totalCount", "count", "cnt", default=0) or 0)
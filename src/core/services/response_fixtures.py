@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from src.core.services.article_api import DEFAULT_ARTICLE_API_PAGE_SIZE, build_article_api_url
+from src.core.services.response_capture import TRADE_CODE_MAP
+from src.utils.json_store import atomic_write_json
+
+FIXTURE_KINDS = ("article_list", "marker", "detail")
+FIXTURE_MODES = ("record", "replay", "replay_offline")
+_VOLATILE_QUERY_KEYS = frozenset({"_", "ts", "timestamp"})
+_EMPTY_DOCUMENT = "<!doctype html><html><head><title>replay</title></head><body></body></html>"
+
+
+def normalize_fixture_mode(mode: Any) -> str:
+    token = str(mode or "").strip().lower()
+    return token if token in FIXTURE_MODES else ""
+
+
+def classify_fixture_url(url: Any) -> Optional[str]:
+    """녹화/재생 대상 응답이면 fixture 종류를, 아니면 None을 반환한다."""
+    lower_url = str(url or "").lower()
+    if "/api/articles/complex/" in lower_url or "/api/articles/house/" in lower_url:
+        return "article_list"
+    if "complexes/single-markers" in lower_url or "houses/single-markers" in lower_url:
+        return "marker"
+    if "m.land.naver.com/article/info/" in lower_url or "m.land.naver.com/article/view/" in lower_url:
+        return "detail"
+    return None
+
+
+def fixture_key(url: Any) -> str:
+    """host+path와 정렬된 query로 만든 요청 식별자. 캐시 무효화용 query는 무시한다."""
+    parts = urlsplit(str(url or ""))
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _VOLATILE_QUERY_KEYS
+    )
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{urlencode(query)}"
+
+
+class ReplayResponse:
+    """Playwright ``Response``/``APIResponse`` 중 엔진이 쓰는 속성만 흉내 낸 재생 응답."""
+
+    def __init__(self, url: str, status: int = 200, body: Any = None, content_type: str = "application/json"):
+        self.url = str(url)
+        self.status = int(status)
+        self.ok = 200 <= self.status < 400
+        self.headers = {"content-type": content_type}
+        self._body = body
+
+    async def json(self):
+        if isinstance(self._body, (str, bytes)):
+            return json.loads(self._body)
+        return self._body
+
+    async def text(self) -> str:
+        if isinstance(self._body, bytes):
+            return self._body.decode("utf-8", errors="replace")
+        if isinstance(self._body, str):
+            return self._body
+        return json.dumps(self._body, ensure_ascii=False)
+
+
+class ResponseFixtureStore:
+    """매칭된 매물 목록/마커/상세 응답을 종류별 JSON 파일로 저장하고 다시 찾아 준다.
+
+    파일은 ``<root>/<kind>/<sha1(fixture_key)>.json`` 에 ``url/status/content_type/body``
+    로 저장한다. 조회 인덱스는 처음 찾을 때 한 번 디렉터리를 훑어 만든다.
+    """
+
+    def __init__(self, root: Any):
+        self.root = Path(root)
+        self._index: Optional[dict[str, Path]] = None
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def _path_for(self, kind: str, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / kind / f"{digest}.json"
+
+    def _ensure_index(self) -> dict[str, Path]:
+        if self._index is None:
+            index: dict[str, Path] = {}
+            for kind in FIXTURE_KINDS:
+                kind_dir = self.root / kind
+                if not kind_dir.is_dir():
+                    continue
+                for path in kind_dir.glob("*.json"):
+                    index[f"{kind}:{path.stem}"] = path
+            self._index = index
+        return self._index
+
+    def save(self, url: str, body: Any, *, status: int = 200, content_type: str = "application/json", kind: str = "") -> Optional[Path]:
+        fixture_kind = kind or classify_fixture_url(url)
+        if fixture_kind not in FIXTURE_KINDS:
+            return None
+        key = fixture_key(url)
+        path = self._path_for(fixture_kind, key)
+        atomic_write_json(
+            path,
+            {
+                "kind": fixture_kind,
+                "url": str(url),
+                "key": key,
+                "status": int(status),
+                "content_type": str(content_type or "application/json"),
+                "body": body,
+            },
+        )
+        if self._index is not None:
+            self._index[f"{fixture_kind}:{path.stem}"] = path
+        return path
+
+    def load(self, url: str, *, kind: str = "") -> Optional[dict]:
+        fixture_kind = kind or classify_fixture_url(url)
+        if fixture_kind not in FIXTURE_KINDS:
+            return None
+        path = self._path_for(fixture_kind, fixture_key(url))
+        if self._ensure_index().get(f"{fixture_kind}:{path.stem}") is None:
+            self.miss_count += 1
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.miss_count += 1
+            return None
+        self.hit_count += 1
+        return fixture if isinstance(fixture, dict) else None
+
+    def iter_fixtures(self, kind: str) -> Iterable[dict]:
+        for path in sorted((self.root / kind).glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    fixture = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(fixture, dict):
+                yield fixture
+
+    def count(self, kind: str = "") -> int:
+        index = self._ensure_index()
+        if not kind:
+            return len(index)
+        return sum(1 for key in index if key.startswith(f"{kind}:"))
+
+
+def fixture_response(fixture: dict) -> ReplayResponse:
+    return ReplayResponse(
+        str(fixture.get("url", "")),
+        int(fixture.get("status", 200) or 200),
+        fixture.get("body"),
+        str(fixture.get("content_type", "application/json") or "application/json"),
+    )
+
+
+class ReplayRequestContext:
+    """``BrowserContext.request`` 대신 fixture로 응답하는 stand-in.
+
+    APIRequestContext 요청은 ``context.route`` 를 거치지 않으므로 재생 모드에서는 엔진이
+    이 객체를 직접 쓴다. 녹화되지 않은 매물 목록 요청은 빈 마지막 페이지로 응답한다.
+    """
+
+    def __init__(self, store: ResponseFixtureStore):
+        self.store = store
+        self.request_count = 0
+
+    async def get(self, url: str, **_kwargs) -> ReplayResponse:
+        self.request_count += 1
+        fixture = self.store.load(url)
+        if fixture is not None:
+            return fixture_response(fixture)
+        if classify_fixture_url(url) == "article_list":
+            return ReplayResponse(url, 200, {"articleList": [], "isMoreData": False})
+        return ReplayResponse(url, 404, {})
+
+
+class ReplayPage:
+    """브라우저 없이 재생할 때 쓰는 desktop page stand-in.
+
+    응답 리스너 등록/해제만 지원하며, ``dispatch_markers`` 가 저장된 마커 응답을
+    실제 page의 ``response`` 이벤트처럼 리스너에 전달한다.
+    """
+
+    def __init__(self, store: ResponseFixtureStore):
+        self.store = store
+        self.url = "about:blank"
+        self._listeners: dict[str, list[Callable]] = {}
+
+    def on(self, event: str, handler: Callable) -> None:
+        self._listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Callable) -> None:
+        handlers = self._listeners.get(event, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def title(self) -> str:
+        return "replay"
+
+    async def close(self) -> None:
+        self._listeners.clear()
+
+    def dispatch_markers(self, base_kind: str) -> int:
+        token = f"{base_kind}/single-markers"
+        dispatched = 0
+        for fixture in self.store.iter_fixtures("marker"):
+            if token not in str(fixture.get("url", "")):
+                continue
+            response = fixture_response(fixture)
+            for handler in list(self._listeners.get("response", [])):
+                handler(response)
+            dispatched += 1
+        return dispatched
+
+
+class ReplayBrowserContext:
+    def __init__(self, store: ResponseFixtureStore):
+        self.request = ReplayRequestContext(store)
+
+    async def close(self) -> None:
+        return None
+
+    async def storage_state(self, **_kwargs) -> dict:
+        return {}
+
+
+def empty_document_html() -> str:
+    return _EMPTY_DOCUMENT
+
+
+def build_synthetic_fixtures(
+    store: ResponseFixtureStore,
+    *,
+    complex_count: int,
+    trade_codes: Iterable[str] = ("A1", "B1"),
+    articles_per_pair: int = 40,
+    page_size: int = DEFAULT_ARTICLE_API_PAGE_SIZE,
+    lat: float = 37.55,
+    lon: float = 126.99,
+) -> list[tuple[str, str]]:
+    """벤치마크용 합성 단지의 매물 목록 페이지와 지도 마커 응답을 저장한다.
+
+    반환값은 ``(단지명, 단지ID)`` 목록이다.
+    """
+    codes = tuple(trade_codes)
+    targets: list[tuple[str, str]] = []
+    markers: list[dict] = []
+    size = max(1, int(page_size or DEFAULT_ARTICLE_API_PAGE_SIZE))
+    for idx in range(max(0, int(complex_count))):
+        cid = str(900000 + idx)
+        name = f"합성단지{idx:04d}"
+        targets.append((name, cid))
+        markers.append(
+            {
+                "complexNo": cid,
+                "complexName": name,
+                "latitude": lat + (idx % 20) * 0.001,
+                "longitude": lon + (idx // 20) * 0.001,
+                "articleCount": articles_per_pair * len(codes),
+                "realEstateTypeCode": "APT",
+            }
+        )
+        for trade_code in codes:
+            trade_type = TRADE_CODE_MAP.get(trade_code, "매매")
+            articles = []
+            for n in range(max(0, int(articles_per_pair))):
+                base_price = 30000 + (idx * 37 + n * 11) % 90000
+                article = {
+                    "articleNo": f"{cid}{trade_code}{n:04d}",
+                    "articleName": name,
+                    "tradeTypeCode": trade_code,
+                    "tradeTypeName": trade_type,
+                    "realEstateTypeCode": "APT",
+                    "area1": 59 + (n % 4) * 25,
+                    "area2": 45 + (n % 4) * 20,
+                    "floorInfo": f"{1 + n % 20}/25",
+                    "direction": "남향",
+                    "articleFeatureDesc": "합성 매물",
+                }
+                if trade_code == "B2":
+                    article["dealOrWarrantPrc"] = f"{base_price // 10:,}"
+                    article["rentPrc"] = str(50 + n % 150)
+                else:
+                    article["dealOrWarrantPrc"] = f"{base_price:,}"
+                articles.append(article)
+            pages = max(1, -(-len(articles) // size))
+            for page in range(1, pages + 1):
+                chunk = articles[(page - 1) * size:page * size]
+                store.save(
+                    build_article_api_url("complexes", cid, trade_type, "APT", page=page),
+                    {"articleList": chunk, "isMoreData": page < pages, "totalCount": len(articles)},
+                )
+    store.save(
+        "https://new.land.naver.com/api/complexes/single-markers/2.0?" + urlencode({"zoom": 15, "bench": 1}),
+        markers,
+        kind="marker",
+    )
+    return targets
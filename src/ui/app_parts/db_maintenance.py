@@ -86,6 +86,14 @@ class AppDatabaseMaintenanceMixin:
         self._maintenance_mode = False
         self._maintenance_reason = ""
     
+    def _start_db_background_tasks(self: Any):
+        if self._is_shutting_down or self._maintenance_mode:
+            return
+        try:
+            self.db.start_schema_backfills(prune_caches=True)
+        except Exception as e:
+            ui_logger.debug(f"DB 백그라운드 정리 시작 실패 (무시): {e}")
+
     def _backup_db(self: Any):
         path, _ = QFileDialog.getSaveFileName(self, "DB 백업", f"backup_{DateTimeHelper.file_timestamp()}.db", "Database (*.db)")
         if path:
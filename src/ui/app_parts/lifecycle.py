@@ -74,6 +74,12 @@ class AppLifecycleMixin:
             self.status_bar.showMessage(startup_notice, 15000)
             self.show_toast(startup_notice)
 
+        # 남은 스키마 보정·만료 캐시 정리는 창이 뜬 뒤 백그라운드 스레드에서 진행한다.
+        self._db_background_timer = QTimer(self)
+        self._db_background_timer.setSingleShot(True)
+        self._db_background_timer.timeout.connect(self._start_db_background_tasks)
+        self._db_background_timer.start(2000)
+
     def _restore_window_geometry(self: Any):
         geo = settings.get("window_geometry")
         if not geo:
@@ -304,6 +310,8 @@ class AppLifecycleMixin:
                 return False
         if hasattr(self, "schedule_timer") and self.schedule_timer:
             self.schedule_timer.stop()
+        if getattr(self, "_db_background_timer", None) is not None:
+            self._db_background_timer.stop()
         settings.set("window_geometry", [self.x(), self.y(), self.width(), self.height()])
         try:
             self.db.close()
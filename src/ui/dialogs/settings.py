@@ -19,7 +19,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.managers import settings
-from src.utils.constants import CRAWL_SPEED_PRESETS, SHORTCUTS
+from src.utils.constants import CRAWL_SPEED_PRESETS, PLAYWRIGHT_MAX_TARGET_WORKERS, SHORTCUTS
 
 
 
@@ -151,6 +151,16 @@ class SettingsDialog(QDialog):
         self.spin_article_response_wait.setRange(100, 20000)
         self.spin_article_response_wait.setSingleStep(100)
         perf_layout.addWidget(self.spin_article_response_wait, 11, 1)
+
+        perf_layout.addWidget(QLabel("단지 동시 수집 워커 수"), 12, 0)
+        self.spin_playwright_target_workers = QSpinBox()
+        self.spin_playwright_target_workers.setRange(1, PLAYWRIGHT_MAX_TARGET_WORKERS)
+        perf_layout.addWidget(self.spin_playwright_target_workers, 12, 1)
+
+        perf_layout.addWidget(QLabel("상세 캐시 유효시간(시간, 0=끄기):"), 13, 0)
+        self.spin_detail_cache_ttl = QSpinBox()
+        self.spin_detail_cache_ttl.setRange(0, 720)
+        perf_layout.addWidget(self.spin_detail_cache_ttl, 13, 1)
         perf_group.setLayout(perf_layout)
         layout.addWidget(perf_group)
 
@@ -188,6 +198,14 @@ class SettingsDialog(QDialog):
         geo_layout.addLayout(asset_layout, 4, 1)
         self.check_geo_incomplete_safety_mode = QCheckBox("Geo incomplete safety mode")
         geo_layout.addWidget(self.check_geo_incomplete_safety_mode, 5, 0, 1, 2)
+        geo_layout.addWidget(QLabel("마커 타일 캐시(시간, 0=끄기):"), 6, 0)
+        self.spin_geo_tile_cache_ttl = QSpinBox()
+        self.spin_geo_tile_cache_ttl.setRange(0, 168)
+        geo_layout.addWidget(self.spin_geo_tile_cache_ttl, 6, 1)
+        geo_layout.addWidget(QLabel("마커 타일 요청 상한(조합당, 0=무제한):"), 7, 0)
+        self.spin_geo_request_budget = QSpinBox()
+        self.spin_geo_request_budget.setRange(0, 2000)
+        geo_layout.addWidget(self.spin_geo_request_budget, 7, 1)
         geo_group.setLayout(geo_layout)
         layout.addWidget(geo_group)
 
@@ -253,6 +271,12 @@ class SettingsDialog(QDialog):
         self.spin_playwright_workers.setValue(
             int(settings.get("playwright_detail_workers", 12) or 12)
         )
+        self.spin_playwright_target_workers.setValue(
+            min(PLAYWRIGHT_MAX_TARGET_WORKERS, max(1, _int_setting("playwright_target_workers", 1)))
+        )
+        self.spin_detail_cache_ttl.setValue(
+            min(720, max(0, _int_setting("detail_cache_ttl_hours", 24)))
+        )
         self.check_playwright_headless.setChecked(
             bool(settings.get("playwright_headless", False))
         )
@@ -286,6 +310,12 @@ class SettingsDialog(QDialog):
         self.check_geo_incomplete_safety_mode.setChecked(
             bool(settings.get("geo_incomplete_safety_mode", True))
         )
+        self.spin_geo_tile_cache_ttl.setValue(
+            min(168, max(0, _int_setting("geo_tile_cache_ttl_hours", 12)))
+        )
+        self.spin_geo_request_budget.setValue(
+            min(2000, max(0, _int_setting("geo_request_budget", 120)))
+        )
 
     def _save(self):
         asset_types = []
@@ -318,6 +348,8 @@ class SettingsDialog(QDialog):
             "startup_lazy_noncritical_tabs": False,
             "compact_duplicate_listings": self.check_compact_duplicates.isChecked(),
             "playwright_detail_workers": self.spin_playwright_workers.value(),
+            "playwright_target_workers": self.spin_playwright_target_workers.value(),
+            "detail_cache_ttl_hours": self.spin_detail_cache_ttl.value(),
             "playwright_headless": self.check_playwright_headless.isChecked(),
             "playwright_block_heavy_resources": self.check_block_heavy_resources.isChecked(),
             "playwright_response_drain_timeout_ms": self.spin_playwright_drain_timeout.value(),
@@ -331,6 +363,8 @@ class SettingsDialog(QDialog):
             "geo_sweep_dwell_ms": self.spin_geo_dwell.value(),
             "geo_asset_types": asset_types,
             "geo_incomplete_safety_mode": self.check_geo_incomplete_safety_mode.isChecked(),
+            "geo_tile_cache_ttl_hours": self.spin_geo_tile_cache_ttl.value(),
+            "geo_request_budget": self.spin_geo_request_budget.value(),
         }
         settings.update(new)
         self.settings_changed.emit(new)
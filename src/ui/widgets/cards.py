@@ -1,24 +1,27 @@
+from typing import Optional
+
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import (
+    QAbstractScrollArea,
     QFrame,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
-    QWidget,
 )
 
 from src.ui.styles import COLORS
-from src.ui.widgets.components import EmptyStateWidget
 from src.utils.constants import TRADE_COLORS
 from src.utils.helpers import PriceConverter
 
 
 class ArticleCard(QFrame):
-    """매물 카드 위젯 (v13.0)"""
+    """매물 카드 위젯 (v13.0)
+
+    하위 라벨은 한 번만 만들고 ``bind`` 로 내용만 바꾼다. ``CardViewWidget`` 은 스크롤할 때
+    카드를 새로 만들지 않고 이 메서드로 다른 매물에 다시 연결한다.
+    """
 
     clicked = pyqtSignal(dict)
     favorite_toggled = pyqtSignal(str, str, str, bool)
@@ -26,17 +29,95 @@ class ArticleCard(QFrame):
     _TYPE_STYLE_CACHE = {}
     _PRICE_STYLE_CACHE = {}
     _FAVORITE_STYLE_CACHE = {}
+    WIDTH = 280
+    HEIGHT = 210
 
     def __init__(self, data: dict, is_dark: bool = True, parent=None):
         super().__init__(parent)
         self.data = data
         self.is_dark = is_dark
+        self._applied_styles = {}
+        # CardViewWidget 이 이 카드에 연결한 _filtered_data 인덱스 (풀에서 쉬는 중이면 None)
+        self._bound_index: Optional[int] = None
         self._setup_ui()
+        self.bind(data, is_dark)
 
     def _setup_ui(self):
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.setFixedSize(280, 210)
+        self.setFixedSize(self.WIDTH, self.HEIGHT)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+
+        top_layout = QHBoxLayout()
+        self.type_label = QLabel("")
+        top_layout.addWidget(self.type_label)
+        top_layout.addStretch()
+
+        self.dup_badge = QLabel("")
+        self.dup_badge.setStyleSheet("color: #06b6d4; font-weight: 700; font-size: 11px;")
+        top_layout.addWidget(self.dup_badge)
+        self.new_badge = QLabel("NEW")
+        self.new_badge.setStyleSheet("color: #f59e0b; font-weight: 800; font-size: 11px;")
+        top_layout.addWidget(self.new_badge)
+        self.change_badge = QLabel("")
+        top_layout.addWidget(self.change_badge)
+
+        self.fav_btn = QPushButton("")
+        self.fav_btn.setFixedSize(30, 30)
+        self.fav_btn.clicked.connect(self._toggle_favorite)
+        top_layout.addWidget(self.fav_btn)
+
+        layout.addLayout(top_layout)
+
+        self.name_label = QLabel("")
+        self.name_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.name_label.setWordWrap(True)
+        layout.addWidget(self.name_label)
+
+        self.price_label = QLabel("")
+        layout.addWidget(self.price_label)
+
+        self.change_label = QLabel("")
+        layout.addWidget(self.change_label)
+
+        self.info_label = QLabel("")
+        self.info_label.setStyleSheet("font-size: 12px; color: #888;")
+        layout.addWidget(self.info_label)
+
+        self.pprice_label = QLabel("")
+        self.pprice_label.setStyleSheet("font-size: 11px; color: #888;")
+        layout.addWidget(self.pprice_label)
+
+        self.feature_label = QLabel("")
+        self.feature_label.setStyleSheet("font-size: 11px; color: #9ca3af;")
+        self.feature_label.setWordWrap(True)
+        layout.addWidget(self.feature_label)
+
+        layout.addStretch()
+
+    def _set_style(self, widget, key: str, style: str):
+        # 스타일시트 재적용은 비싸므로 값이 바뀐 경우에만 호출한다.
+        if self._applied_styles.get(key) != style:
+            widget.setStyleSheet(style)
+            self._applied_styles[key] = style
+
+    @staticmethod
+    def _price_change_value(data: dict) -> int:
+        price_change = data.get("price_change", 0)
+        if isinstance(price_change, str):
+            try:
+                price_change = int(price_change.replace(",", "").replace("만", ""))
+            except ValueError:
+                price_change = 0
+        return price_change or 0
+
+    def bind(self, data: dict, is_dark=None):
+        """카드 내용을 ``data`` 로 바꾼다. 위젯은 그대로 두고 텍스트·표시 여부·스타일만 갱신한다."""
+        self.data = data
+        if is_dark is not None:
+            self.is_dark = bool(is_dark)
 
         trade_type = self.data.get("거래유형", "매매")
         colors = TRADE_COLORS.get(trade_type, TRADE_COLORS["매매"])
@@ -60,13 +141,9 @@ class ArticleCard(QFrame):
                 "}"
             )
             self._CARD_STYLE_CACHE[style_key] = card_style
-        self.setStyleSheet(card_style)
-
-        layout = QVBoxLayout(self)
-        layout.setSpacing(8)
+        self._set_style(self, "card", card_style)
 
-        top_layout = QHBoxLayout()
-        type_label = QLabel(trade_type)
+        self.type_label.setText(trade_type)
         type_style = self._TYPE_STYLE_CACHE.get(fg_color)
         if type_style is None:
             type_style = (
@@ -74,92 +151,64 @@ class ArticleCard(QFrame):
                 "border-radius: 999px; font-weight: 700; font-size: 11px;"
             )
             self._TYPE_STYLE_CACHE[fg_color] = type_style
-        type_label.setStyleSheet(type_style)
-        top_layout.addWidget(type_label)
-        top_layout.addStretch()
+        self._set_style(self.type_label, "type", type_style)
 
         duplicate_count = int(self.data.get("duplicate_count", 1) or 1)
-        if duplicate_count > 1:
-            dup_badge = QLabel(f"{duplicate_count}건")
-            dup_badge.setStyleSheet("color: #06b6d4; font-weight: 700; font-size: 11px;")
-            top_layout.addWidget(dup_badge)
-        if self.data.get("is_new") or self.data.get("신규여부"):
-            new_badge = QLabel("NEW")
-            new_badge.setStyleSheet("color: #f59e0b; font-weight: 800; font-size: 11px;")
-            top_layout.addWidget(new_badge)
-        price_change = self.data.get("price_change", 0)
-        if isinstance(price_change, str):
-            try:
-                price_change = int(price_change.replace(",", "").replace("만", ""))
-            except ValueError:
-                price_change = 0
+        self.dup_badge.setText(f"{duplicate_count}건" if duplicate_count > 1 else "")
+        self.dup_badge.setVisible(duplicate_count > 1)
+        self.new_badge.setVisible(bool(self.data.get("is_new") or self.data.get("신규여부")))
+
+        price_change = self._price_change_value(self.data)
         if price_change > 0:
-            change_badge = QLabel("▲")
-            change_badge.setStyleSheet("color: #ef4444; font-weight: 800;")
-            top_layout.addWidget(change_badge)
+            self.change_badge.setText("▲")
+            self._set_style(self.change_badge, "change_badge", "color: #ef4444; font-weight: 800;")
         elif price_change < 0:
-            change_badge = QLabel("▼")
-            change_badge.setStyleSheet("color: #22c55e; font-weight: 800;")
-            top_layout.addWidget(change_badge)
+            self.change_badge.setText("▼")
+            self._set_style(self.change_badge, "change_badge", "color: #22c55e; font-weight: 800;")
+        self.change_badge.setVisible(price_change != 0)
 
         theme_key = "dark" if self.is_dark else "light"
         accent = COLORS[theme_key]["accent"]
-        self.fav_btn = QPushButton("")
-        self.fav_btn.setFixedSize(30, 30)
         fav_style = self._FAVORITE_STYLE_CACHE.get(accent)
         if fav_style is None:
             fav_style = f"border: none; font-size: 18px; background: transparent; color: {accent};"
             self._FAVORITE_STYLE_CACHE[accent] = fav_style
-        self.fav_btn.setStyleSheet(fav_style)
+        self._set_style(self.fav_btn, "favorite", fav_style)
         self.set_favorite_state(bool(self.data.get("is_favorite")))
-        self.fav_btn.clicked.connect(self._toggle_favorite)
-        top_layout.addWidget(self.fav_btn)
-
-        layout.addLayout(top_layout)
 
-        name_label = QLabel(self.data.get("단지명", ""))
-        name_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-        name_label.setWordWrap(True)
-        layout.addWidget(name_label)
+        self.name_label.setText(str(self.data.get("단지명", "") or ""))
 
         price_text = self.data.get("매매가") or self.data.get("보증금") or ""
         if self.data.get("월세"):
             price_text += f" / {self.data.get('월세')}"
-        price_label = QLabel(price_text)
+        self.price_label.setText(str(price_text))
         price_style = self._PRICE_STYLE_CACHE.get(fg_color)
         if price_style is None:
             price_style = f"color: {fg_color}; font-size: 18px; font-weight: 800;"
             self._PRICE_STYLE_CACHE[fg_color] = price_style
-        price_label.setStyleSheet(price_style)
-        layout.addWidget(price_label)
+        self._set_style(self.price_label, "price", price_style)
 
         if price_change != 0:
             sign = "+" if price_change > 0 else "-"
             change_text = PriceConverter.to_string(abs(price_change))
-            change_label = QLabel(f"변동 {sign}{change_text}")
+            self.change_label.setText(f"변동 {sign}{change_text}")
             change_color = "#ef4444" if price_change > 0 else "#22c55e"
-            change_label.setStyleSheet(f"font-size: 11px; color: {change_color}; font-weight: 700;")
-            layout.addWidget(change_label)
+            self._set_style(
+                self.change_label, "change", f"font-size: 11px; color: {change_color}; font-weight: 700;"
+            )
+        self.change_label.setVisible(price_change != 0)
 
         area = self.data.get("면적(평)", 0)
         floor = self.data.get("층/방향", "")
-        info_label = QLabel(f"📐 {area}평  •  {floor}")
-        info_label.setStyleSheet("font-size: 12px; color: #888;")
-        layout.addWidget(info_label)
+        self.info_label.setText(f"📐 {area}평  •  {floor}")
 
-        if self.data.get("평당가_표시"):
-            pprice_label = QLabel(f"📊 {self.data.get('평당가_표시')}")
-            pprice_label.setStyleSheet("font-size: 11px; color: #888;")
-            layout.addWidget(pprice_label)
+        pprice = self.data.get("평당가_표시")
+        self.pprice_label.setText(f"📊 {pprice}" if pprice else "")
+        self.pprice_label.setVisible(bool(pprice))
 
         feature = self.data.get("타입/특징", "")
-        if feature:
-            feature_label = QLabel(feature[:30])
-            feature_label.setStyleSheet("font-size: 11px; color: #9ca3af;")
-            feature_label.setWordWrap(True)
-            layout.addWidget(feature_label)
-
-        layout.addStretch()
+        self.feature_label.setText(str(feature)[:30] if feature else "")
+        self.feature_label.setVisible(bool(feature))
 
     def set_favorite_state(self, is_favorite: bool):
         self.data["is_favorite"] = bool(is_favorite)
@@ -179,11 +228,17 @@ class ArticleCard(QFrame):
         super().mousePressEvent(a0)
 
 
-class CardViewWidget(QScrollArea):
-    """카드 뷰 위젯 (v13.0)"""
+class CardViewWidget(QAbstractScrollArea):
+    """카드 뷰 위젯 (v13.0)
+
+    뷰포트에 보이는 행(+위아래 여유 행)만큼의 ``ArticleCard`` 풀만 띄우고, 스크롤바 값을
+    가상 오프셋으로 써서 카드 위치를 계산한다. 전체 높이의 컨테이너를 만들지 않으므로
+    위젯 최대 높이(QWIDGETSIZE_MAX) 제한 없이 결과 수와 무관하게 카드 위젯 수가 일정하다.
+    """
 
     article_clicked = pyqtSignal(dict)
     favorite_toggled = pyqtSignal(str, str, str, bool)
+    _OVERSCAN_ROWS = 1
 
     def __init__(self, is_dark: bool = True, parent=None):
         super().__init__(parent)
@@ -193,31 +248,27 @@ class CardViewWidget(QScrollArea):
         self._search_text_cache = []
         self._filtered_data = []
         self._filter_text = ""
-        self._card_width = 280
+        self._card_width = ArticleCard.WIDTH
+        self._card_height = ArticleCard.HEIGHT
         self._card_spacing = 15
-        self._page_size = 120
-        self._render_cursor = 0
+        self._columns = 1
         self._last_columns = None
+        self._visible_range = (0, 0)
+        self._visible_top = 0
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
-        self.container = QWidget()
-        self.grid_layout = QGridLayout(self.container)
-        self.grid_layout.setSpacing(15)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-
-        self.setWidget(self.container)
-
-        self.empty_label = QLabel("조건에 맞는 매물이 없습니다.")
+        # 빈 결과 안내는 뷰포트에 직접 붙여 콘텐츠 높이와 무관하게 보이게 한다.
+        self.empty_label = QLabel("조건에 맞는 매물이 없습니다.", self.viewport())
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.setStyleSheet("color: #888; padding: 40px;")
-        self.grid_layout.addWidget(self.empty_label, 0, 0)
         self.empty_label.hide()
         scroll_bar = self.verticalScrollBar()
         if scroll_bar is not None:
+            scroll_bar.setSingleStep(40)
             scroll_bar.valueChanged.connect(self._on_scroll)
 
     @staticmethod
@@ -248,15 +299,12 @@ class CardViewWidget(QScrollArea):
         self._search_text_cache.extend(self._build_search_text(a) for a in new_items)
 
         if self._filter_text:
-            self._apply_filter(reset_view=True)
+            self._apply_filter(reset_view=False)
             return
 
-        had_count = len(self._filtered_data)
         self._filtered_data.extend(new_items)
         self.empty_label.setVisible(False)
-
-        if self._render_cursor >= had_count:
-            self._render_next_page()
+        self._relayout_cards()
 
     def update_favorite_state(self, predicate, state_provider):
         if not callable(predicate) or not callable(state_provider):
@@ -275,29 +323,23 @@ class CardViewWidget(QScrollArea):
         if not changed:
             return
 
-        for card in self._cards:
+        for card in self._bound_cards():
             try:
                 if predicate(card.data):
                     card.set_favorite_state(bool(state_provider(card.data)))
             except Exception:
                 continue
 
+    def _bound_cards(self):
+        return [card for card in self._cards if card._bound_index is not None]
+
     def _calc_columns(self) -> int:
         viewport = self.viewport()
         available = max(1, viewport.width() if viewport is not None else self.width())
         return max(1, available // (self._card_width + self._card_spacing))
 
-    def _clear_cards(self):
-        self.container.setUpdatesEnabled(False)
-        try:
-            for card in self._cards:
-                card.deleteLater()
-            self._cards.clear()
-            self.grid_layout.setSpacing(self._card_spacing)
-            self._render_cursor = 0
-            self._last_columns = self._calc_columns()
-        finally:
-            self.container.setUpdatesEnabled(True)
+    def _row_height(self) -> int:
+        return self._card_height + self._card_spacing
 
     def _apply_filter(self, reset_view=False):
         text = (self._filter_text or "").lower()
@@ -309,62 +351,131 @@ class CardViewWidget(QScrollArea):
             self._filtered_data = list(self._all_data)
 
         if reset_view:
-            self._clear_cards()
+            scroll_bar = self.verticalScrollBar()
+            if scroll_bar is not None:
+                scroll_bar.setValue(0)
 
         if not self._filtered_data:
             self._last_columns = None
+            self._relayout_cards(rebind=True)
+            self._place_empty_label()
             self.empty_label.show()
             return
         self.empty_label.hide()
-        if reset_view:
-            self._render_next_page()
-        else:
-            self._relayout_rendered_cards()
+        self._relayout_cards(rebind=True)
+
+    def _place_empty_label(self):
+        viewport = self.viewport()
+        width = max(1, viewport.width() if viewport is not None else self.width())
+        self.empty_label.setGeometry(0, 0, width, max(120, self.empty_label.sizeHint().height()))
 
     def _on_scroll(self, value: int):
-        scroll_bar = self.verticalScrollBar()
-        if scroll_bar is None or scroll_bar.maximum() <= 0:
-            return
-        if value >= (scroll_bar.maximum() - 220):
-            self._render_next_page()
+        self._update_visible_cards()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        # 뷰포트 픽셀을 옮기지 않고 _on_scroll 에서 카드 위치를 다시 계산한다.
+        return
 
-    def _relayout_rendered_cards(self):
+    def _relayout_cards(self, rebind: bool = False):
+        """스크롤바 범위를 전체 행 수에 맞추고 보이는 구간의 카드를 다시 배치한다."""
+        count = len(self._filtered_data)
         cols = self._calc_columns()
-        if not self._cards:
-            self._last_columns = cols
+        columns_changed = cols != self._columns
+        self._columns = cols
+        self._last_columns = cols if count else None
+        rows = (count + cols - 1) // cols
+        content_height = self._card_spacing + rows * self._row_height() if rows else 0
+        viewport = self.viewport()
+        viewport_height = viewport.height() if viewport is not None else self.height()
+        scroll_bar = self.verticalScrollBar()
+        if scroll_bar is not None:
+            # 범위 변경으로 값이 잘려도 valueChanged → _update_visible_cards 가 같은 결과를 만든다.
+            scroll_bar.setPageStep(max(1, viewport_height))
+            scroll_bar.setRange(0, max(0, content_height - viewport_height))
+        self._update_visible_cards(rebind=rebind or columns_changed)
+
+    def _ensure_card_pool(self, size: int):
+        while len(self._cards) < size:
+            card = ArticleCard({}, self.is_dark, self.viewport())
+            card._bound_index = None
+            card.clicked.connect(self.article_clicked.emit)
+            card.favorite_toggled.connect(self.favorite_toggled.emit)
+            card.hide()
+            self._cards.append(card)
+
+    def _card_position(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self._columns)
+        return (
+            self._card_spacing + col * (self._card_width + self._card_spacing),
+            self._card_spacing + row * self._row_height(),
+        )
+
+    def _update_visible_cards(self, rebind: bool = False):
+        count = len(self._filtered_data)
+        if count <= 0:
+            for card in self._cards:
+                card._bound_index = None
+                card.hide()
+            self._visible_range = (0, 0)
+            self._visible_top = 0
             return
-        for i, card in enumerate(self._cards):
-            row, col = divmod(i, cols)
-            self.grid_layout.addWidget(card, row, col)
-        self._last_columns = cols
 
-    def _render_next_page(self):
-        if self._render_cursor >= len(self._filtered_data):
+        viewport = self.viewport()
+        viewport_height = viewport.height() if viewport is not None else self.height()
+        scroll_bar = self.verticalScrollBar()
+        top = scroll_bar.value() if scroll_bar is not None else 0
+        row_height = self._row_height()
+        total_rows = (count + self._columns - 1) // self._columns
+        first_row = max(0, top // row_height - self._OVERSCAN_ROWS)
+        last_row = min(total_rows, (top + max(1, viewport_height)) // row_height + 1 + self._OVERSCAN_ROWS)
+        start = first_row * self._columns
+        end = min(count, last_row * self._columns)
+        if not rebind and (start, end) == self._visible_range and top == self._visible_top:
             return
-        cols = self._calc_columns()
-        end = min(len(self._filtered_data), self._render_cursor + self._page_size)
-        self.container.setUpdatesEnabled(False)
+        self._ensure_card_pool(end - start)
+
+        # 계속 보이는 카드는 위치만 옮기고, 구간을 벗어난 카드만 새 위치의 매물로 다시 바인딩한다.
+        kept = {}
+        free = []
+        for card in self._cards:
+            index = card._bound_index
+            if (
+                not rebind
+                and index is not None
+                and start <= index < end
+                and card.data is self._filtered_data[index]
+            ):
+                kept[index] = card
+            else:
+                free.append(card)
+
+        paint_target = viewport if viewport is not None else self
+        paint_target.setUpdatesEnabled(False)
         try:
-            for i in range(self._render_cursor, end):
-                article = self._filtered_data[i]
-                card = ArticleCard(article, self.is_dark)
-                card.clicked.connect(self.article_clicked.emit)
-                card.favorite_toggled.connect(self.favorite_toggled.emit)
-
-                row, col = divmod(i, cols)
-                self.grid_layout.addWidget(card, row, col)
-                self._cards.append(card)
+            for index in range(start, end):
+                card = kept.get(index)
+                if card is None:
+                    card = free.pop()
+                    card.bind(self._filtered_data[index], self.is_dark)
+                    card._bound_index = index
+                x, y = self._card_position(index)
+                card.move(x, y - top)
+                if card.isHidden():
+                    card.show()
+            for card in free:
+                card._bound_index = None
+                card.hide()
         finally:
-            self.container.setUpdatesEnabled(True)
-        self._render_cursor = end
-        self._last_columns = cols
+            paint_target.setUpdatesEnabled(True)
+        self._visible_range = (start, end)
+        self._visible_top = top
 
     def resizeEvent(self, a0):
         super().resizeEvent(a0)
         if self._filtered_data:
-            cols = self._calc_columns()
-            if cols != self._last_columns:
-                self._relayout_rendered_cards()
+            self._relayout_cards()
+        elif not self.empty_label.isHidden():
+            self._place_empty_label()
 
     def filter_cards(self, text: str):
         self._filter_text = text or ""
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem, QCheckBox, QAbstractItemView, QHeaderView, QTabWidget, 
     QGroupBox, QSplitter, QScrollArea, QFrame, QStackedWidget, QTextBrowser, 
     QDialog, QMessageBox, QFileDialog, QSizePolicy, QStyle, QApplication, QMenu,
-    QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox
+    QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox, QTableView, QProgressDialog
 )
 
 
@@ -15,10 +15,12 @@ import re
 from src.utils.helpers import PriceConverter, DateTimeHelper, get_article_url, get_complex_url
 from src.core.services.price_snapshots import build_price_snapshot_rows
 from src.core.managers import settings
+from src.utils.constants import EXPORT_BACKGROUND_MIN_ROWS
 from src.ui.widgets.components import (
     SearchBar, SpeedSlider, ProgressWidget, SummaryCard, SortableTableWidgetItem
 )
 from src.ui.widgets.cards import CardViewWidget
+from src.ui.widgets.result_table import OrderedRowIndex, ResultFilterProxyModel, ResultRecord, ResultTableModel
 from src.ui.dialogs import (
     MultiSelectDialog,
     URLBatchDialog,
@@ -41,20 +43,60 @@ class PriceSnapshotSaveThread(QThread):
     saved_signal = pyqtSignal(int)
     failed_signal = pyqtSignal(str)
 
-    def __init__(self, db, items, parent=None):
+    def __init__(self, db, items, parent=None, *, rows=None):
         super().__init__(parent)
         self._db = db
         self._items = [dict(item or {}) for item in (items or []) if isinstance(item, dict)]
+        self._rows = list(rows) if rows is not None else None
 
     def run(self):
         try:
-            rows = build_price_snapshot_rows(self._items)
+            rows = self._rows if self._rows is not None else build_price_snapshot_rows(self._items)
             saved = self._db.add_price_snapshots_bulk(rows) if rows else 0
             self.saved_signal.emit(int(saved or 0))
         except Exception as exc:
             self.failed_signal.emit(str(exc))
 
 
+class ExportThread(QThread):
+    """``DataExporter.export`` 를 UI 스레드 밖에서 실행한다.
+
+    ``progress_signal(done, total)`` 은 청크마다, ``done_signal(ExportResult)`` 는 끝에 한 번 온다.
+    ``cancel()`` 은 다음 청크 경계에서 쓰기를 멈추고 임시 파일을 지운다.
+    """
+
+    progress_signal = pyqtSignal(int, int)
+    done_signal = pyqtSignal(object)
+    failed_signal = pyqtSignal(str)
+
+    def __init__(self, exporter, kind, path, template=None, parent=None):
+        super().__init__(parent)
+        self._exporter = exporter
+        self._kind = kind
+        self._path = path
+        self._template = template
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def is_cancel_requested(self):
+        return self._cancel_requested
+
+    def run(self):
+        try:
+            result = self._exporter.export(
+                self._kind,
+                self._path,
+                self._template,
+                progress=lambda done, total: self.progress_signal.emit(int(done), int(total)),
+                should_cancel=self.is_cancel_requested,
+            )
+            self.done_signal.emit(result)
+        except Exception as exc:
+            self.failed_signal.emit(str(exc))
+
+
 def _get_crawler_thread_cls():
     global CrawlerThread
     if CrawlerThread is None:
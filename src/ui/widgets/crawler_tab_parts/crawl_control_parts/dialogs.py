@@ -146,14 +146,14 @@ class CrawlerTabDialogOpsMixin:
         dlg.exec()
 
     def _open_article_url(self: Any):
-        row = self.result_table.currentRow()
+        index = self.result_table.currentIndex()
+        row = self.result_proxy.source_row(index.row()) if index.isValid() else -1
         if row < 0:
             return
-        payload = self._row_payload_cache[row] if row < len(self._row_payload_cache) else {}
+        payload = self.result_model.payload(row)
         if payload and callable(getattr(self, "article_open_handler", None)):
             self.article_open_handler(payload)
             return
-        item = self.result_table.item(row, self.COL_URL)
-        url = item.text() if item else ""
+        url = self.result_model.text(row, self.COL_URL)
         if url:
             webbrowser.open(url)
@@ -34,7 +34,9 @@ class CrawlerTabFinishMixin:
                     f"capture_fail={int(final_stats.get('capture_failed_count', 0) or 0)}, "
                     f"block_like={int(final_stats.get('block_like_redirect_count', 0) or 0)}, "
                     f"detail_partial={int(final_stats.get('detail_partial_count', 0) or 0)}, "
-                    f"detail_fail={int(final_stats.get('detail_fail_count', 0) or 0)}",
+                    f"detail_fail={int(final_stats.get('detail_fail_count', 0) or 0)}, "
+                    f"pacing_wait={int(final_stats.get('pacing_wait_ms_total', 0) or 0)}ms, "
+                    f"nav_rps={float(final_stats.get('pacing_navigation_rps', 0) or 0):.2f}",
                     10,
                 )
 
@@ -78,6 +80,17 @@ class CrawlerTabFinishMixin:
         )
         self.alert_triggered.emit(complex_name, trade_type, price_text, area_pyeong, int(alert_id or 0))
 
+    def _on_stats_delta(self: Any, delta):
+        """크롤 스레드는 바뀐 통계만 보내므로 탭 쪽 사본에 합친 뒤 전체 값으로 화면을 갱신한다."""
+        view = getattr(self, "_crawl_stats_view", None)
+        if view is None:
+            view = {}
+            self._crawl_stats_view = view
+        view.update(delta or {})
+        if "total_found" not in view:
+            return
+        self._update_stats_ui(view)
+
     def _update_stats_ui(self: Any, stats):
         self.summary_card.update_stats(
             total=stats["total_found"],
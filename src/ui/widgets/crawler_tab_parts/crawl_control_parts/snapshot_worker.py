@@ -12,18 +12,37 @@ class CrawlerTabSnapshotWorkerMixin:
 
     def _save_price_snapshots(self: Any, *, async_save: bool = True):
         """크롤링 결과를 가격 스냅샷으로 저장"""
-        items = [dict(item or {}) for item in (self.collected_data or []) if isinstance(item, dict)]
-        if not items:
+        rows = self._streamed_price_snapshot_rows()
+        items = []
+        if rows is None:
+            items = [dict(item or {}) for item in (self.collected_data or []) if isinstance(item, dict)]
+            if not items:
+                return 0
+        elif not rows:
             return 0
         if async_save:
-            return self._start_price_snapshot_worker(items)
+            return self._start_price_snapshot_worker(items, rows=rows)
 
-        rows = build_price_snapshot_rows(items)
+        if rows is None:
+            rows = build_price_snapshot_rows(items)
         saved = self.db.add_price_snapshots_bulk(rows) if rows else 0
         self.append_log(f"📊 가격 스냅샷 {saved}건 저장", 10)
         return int(saved or 0)
 
-    def _start_price_snapshot_worker(self: Any, items):
+    def _streamed_price_snapshot_rows(self: Any):
+        """크롤 스레드가 수집 중 누적한 스냅샷 행. 사용할 수 없으면 None."""
+        thread = getattr(self, "crawler_thread", None)
+        rows_getter = getattr(thread, "price_snapshot_rows", None)
+        if not callable(rows_getter):
+            return None
+        try:
+            rows = rows_getter()
+        except Exception as e:
+            logger.debug(f"누적 가격 스냅샷 조회 실패, 수집 결과로 재계산: {e}")
+            return None
+        return list(rows) if isinstance(rows, list) else None
+
+    def _start_price_snapshot_worker(self: Any, items, rows=None):
         worker = getattr(self, "_price_snapshot_worker", None)
         if worker is not None:
             try:
@@ -33,7 +52,7 @@ class CrawlerTabSnapshotWorkerMixin:
             except Exception:
                 pass
 
-        worker = PriceSnapshotSaveThread(self.db, items, self)
+        worker = PriceSnapshotSaveThread(self.db, items, self, rows=rows)
         self._price_snapshot_worker = worker
         worker.saved_signal.connect(self._on_price_snapshot_saved)
         worker.failed_signal.connect(self._on_price_snapshot_failed)
@@ -71,6 +71,8 @@ class CrawlerTabStartStopMixin:
         self.progress_widget.reset()
         self.summary_card.reset()
         self.collected_data = []
+        if self.crawl_cache:
+            self.crawl_cache.close()
         self.crawl_cache = None
         self._reset_result_state()
         self.card_view.set_data([])
@@ -122,6 +124,7 @@ class CrawlerTabStartStopMixin:
                 ttl_minutes=settings.get("cache_ttl_minutes", 30),
                 write_back_interval_sec=settings.get("cache_write_back_interval_sec", 2),
                 max_entries=settings.get("cache_max_entries", 2000),
+                backend=settings.get("cache_backend", "sqlite"),
             )
         
         # Start Thread
@@ -144,6 +147,8 @@ class CrawlerTabStartStopMixin:
             fallback_engine_enabled=settings.get("fallback_engine_enabled", True),
             playwright_headless=settings.get("playwright_headless", False),
             playwright_detail_workers=settings.get("playwright_detail_workers", 12),
+            playwright_target_workers=settings.get("playwright_target_workers", 1),
+            detail_cache_ttl_hours=settings.get("detail_cache_ttl_hours", 24),
             block_heavy_resources=settings.get("playwright_block_heavy_resources", True),
             playwright_response_drain_timeout_ms=settings.get("playwright_response_drain_timeout_ms", 3000),
             playwright_navigation_timeout_ms=settings.get("playwright_navigation_timeout_ms", 15000),
@@ -154,7 +159,8 @@ class CrawlerTabStartStopMixin:
         self.crawler_thread.log_signal.connect(self.append_log)
         self.crawler_thread.progress_signal.connect(self.progress_widget.update_progress)
         self.crawler_thread.items_signal.connect(self._on_items_batch)
-        self.crawler_thread.stats_signal.connect(self._update_stats_ui)
+        self._crawl_stats_view = {}
+        self.crawler_thread.stats_signal.connect(self._on_stats_delta)
         self.crawler_thread.complex_finished_signal.connect(self._on_complex_finished)
         self.crawler_thread.alert_triggered_signal.connect(self._on_alert_triggered)
         self.crawler_thread.error_signal.connect(lambda msg: self.append_log(f"❌ 크롤링 오류: {msg}", 40))
@@ -17,24 +17,6 @@ class CrawlerTabFiltersSearchMixin:
     def _apply_search_filter(self: Any):
         self._filter_results(self._pending_search_text)
 
-    def _rebuild_row_search_cache_from_table(self: Any):
-        rows = self.result_table.rowCount()
-        self._row_search_cache = []
-        self._row_payload_cache = []
-        self._row_hidden_state = {}
-        payload_lookup = self._build_payload_lookup_by_url()
-        for r in range(rows):
-            values = []
-            for c in range(self.result_table.columnCount()):
-                item = self.result_table.item(r, c)
-                if item:
-                    values.append(item.text())
-            self._row_search_cache.append(" ".join(values).lower())
-            url_item = self.result_table.item(r, self.COL_URL)
-            row_url = url_item.text().strip() if url_item else ""
-            payload = payload_lookup.get(row_url) or self._build_row_payload_from_table(r)
-            self._row_payload_cache.append(payload)
-
     @staticmethod
     def _is_default_advanced_filter(filters: dict) -> bool:
         defaults = {
@@ -178,25 +160,7 @@ class CrawlerTabFiltersSearchMixin:
 
     def _filter_results(self: Any, text):
         self._pending_search_text = text or ""
-        rows = self.result_table.rowCount()
-        updates_enabled = self.result_table.updatesEnabled()
-        self.result_table.setUpdatesEnabled(False)
-        try:
-            for r in range(rows):
-                if r >= len(self._row_search_cache):
-                    values = []
-                    for c in range(self.result_table.columnCount()):
-                        item = self.result_table.item(r, c)
-                        if item:
-                            values.append(item.text())
-                    self._row_search_cache.append(" ".join(values).lower())
-                if r >= len(self._row_payload_cache):
-                    self._row_payload_cache.append(self._build_row_payload_from_table(r))
-                self._apply_current_filter_to_row(r)
-        finally:
-            self.result_table.setUpdatesEnabled(updates_enabled)
-            if updates_enabled:
-                self.result_table.viewport().update()
+        self.result_proxy.refresh_filter()
 
         # Card filtering
         self._apply_card_filters(self._pending_search_text)
@@ -223,7 +187,6 @@ class CrawlerTabFiltersSearchMixin:
 
         col = col_map.get(key, self.COL_COMPLEX)
         order = Qt.SortOrder.AscendingOrder if is_asc else Qt.SortOrder.DescendingOrder
-        self.result_table.sortItems(col, order)
-        self._rebuild_row_search_cache_from_table()
+        self.result_model.sort(col, order)
         self._filter_results(self._pending_search_text)
 
@@ -80,16 +80,12 @@ class CrawlerTabIOActionsMixin:
             lookup.setdefault(key, []).append(dict(item))
 
         visible = []
-        row_count = int(self.result_table.rowCount() or 0)
-        if row_count <= 0:
+        if self.result_model.rowCount() <= 0:
             return [dict(item) for item in source_items]
 
         fallback_items = [dict(item) for item in source_items]
-        for row in range(row_count):
-            if self.result_table.isRowHidden(row):
-                continue
-            url_item = self.result_table.item(row, self.COL_URL)
-            row_url = url_item.text().strip() if url_item else ""
+        for row in self.result_proxy.source_rows():
+            row_url = self.result_model.text(row, self.COL_URL).strip()
             matched = lookup.get(row_url, [])
             if matched:
                 visible.append(matched.pop(0))
@@ -112,10 +108,32 @@ class CrawlerTabIOActionsMixin:
         menu.addAction("원본 Excel 저장", lambda: self.save_excel("raw"))
         menu.addAction("원본 CSV 저장", lambda: self.save_csv("raw"))
         menu.addAction("원본 JSON 저장", lambda: self.save_json("raw"))
+        menu.addAction("원본 JSONL 저장", lambda: self.save_jsonl("raw"))
+        menu.addSeparator()
+        menu.addAction("DB 매물 이력 CSV 저장", lambda: self.save_history("csv"))
+        menu.addAction("DB 매물 이력 JSONL 저장", lambda: self.save_history("jsonl"))
+        menu.addAction("DB 매물 이력 Excel 저장", lambda: self.save_history("excel"))
         menu.addSeparator()
         menu.addAction("엑셀 템플릿 설정", self._show_excel_template_dialog)
         menu.exec(self.btn_save.mapToGlobal(self.btn_save.rect().bottomLeft()))
 
+    _EXPORT_SUFFIXES = {
+        "excel": ("xlsx", "Excel (*.xlsx)"),
+        "csv": ("csv", "CSV (*.csv)"),
+        "json": ("json", "JSON (*.json)"),
+        "jsonl": ("jsonl", "JSON Lines (*.jsonl)"),
+    }
+
+    def _ask_export_path(self: Any, kind: str, label: str, name_key: str):
+        suffix, filter_text = self._EXPORT_SUFFIXES[kind]
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            f"{label} {kind.upper()} 저장",
+            f"부동산_{name_key}_{DateTimeHelper.file_timestamp()}.{suffix}",
+            filter_text,
+        )
+        return path
+
     def _save_with_export_scope(self: Any, kind: str, scope: str = "visible"):
         from pathlib import Path
         from src.ui.widgets.crawler_tab import _get_data_exporter_cls
@@ -127,18 +145,7 @@ class CrawlerTabIOActionsMixin:
             QMessageBox.information(self, "저장", f"{scope_label}으로 저장할 데이터가 없습니다.")
             return
 
-        suffix_map = {
-            "excel": ("xlsx", "Excel (*.xlsx)"),
-            "csv": ("csv", "CSV (*.csv)"),
-            "json": ("json", "JSON (*.json)"),
-        }
-        suffix, filter_text = suffix_map[kind]
-        path, _ = QFileDialog.getSaveFileName(
-            self,
-            f"{scope_label} {kind.upper()} 저장",
-            f"부동산_{scope_key}_{DateTimeHelper.file_timestamp()}.{suffix}",
-            filter_text,
-        )
+        path = self._ask_export_path(kind, scope_label, scope_key)
         if not path:
             return
 
@@ -146,36 +153,101 @@ class CrawlerTabIOActionsMixin:
             exporter_cls = _get_data_exporter_cls()
             exporter = exporter_cls(items)
             template = settings.get("excel_template")
-            if kind == "excel":
-                if hasattr(exporter, "export_excel"):
-                    result = exporter.export_excel(Path(path), template)
-                else:
-                    result = exporter.to_excel(Path(path), template)
-            elif kind == "csv":
-                if hasattr(exporter, "export_csv"):
-                    result = exporter.export_csv(Path(path), template)
+            if len(items) >= EXPORT_BACKGROUND_MIN_ROWS and hasattr(exporter, "export"):
+                self._start_export_worker(exporter, kind, Path(path), template, scope_label)
+                return
+            if kind in {"excel", "csv"}:
+                if hasattr(exporter, f"export_{kind}"):
+                    result = getattr(exporter, f"export_{kind}")(Path(path), template)
                 else:
-                    result = exporter.to_csv(Path(path), template)
+                    result = getattr(exporter, f"to_{kind}")(Path(path), template)
             else:
-                if hasattr(exporter, "export_json"):
-                    result = exporter.export_json(Path(path))
+                if hasattr(exporter, f"export_{kind}"):
+                    result = getattr(exporter, f"export_{kind}")(Path(path))
                 else:
-                    result = exporter.to_json(Path(path))
-
-            ok = bool(getattr(result, "ok", result))
-            error = str(getattr(result, "error", "") or getattr(exporter, "last_error", "") or "")
-            if ok:
-                QMessageBox.information(self, "저장 완료", f"{scope_label} {kind.upper()} 저장 완료\n{path}")
-                return
-
-            if not error:
-                error = f"{kind.upper()} 저장 결과가 실패로 반환되었습니다."
-            QMessageBox.critical(self, "저장 실패", f"{kind.upper()} 저장에 실패했습니다.\n{error}")
-            logger.error(f"{kind.upper()} save failed ({scope_key}): {error}")
+                    result = getattr(exporter, f"to_{kind}")(Path(path))
+            self._report_export_result(kind, scope_label, path, result, getattr(exporter, "last_error", ""))
         except Exception as exc:
             QMessageBox.critical(self, "저장 실패", f"{kind.upper()} 저장 중 오류가 발생했습니다.\n{exc}")
             logger.error(f"{kind.upper()} save error ({scope_key}): {exc}")
 
+    def _report_export_result(self: Any, kind: str, label: str, path, result, fallback_error: str = ""):
+        ok = bool(getattr(result, "ok", result))
+        error = str(getattr(result, "error", "") or fallback_error or "")
+        if ok:
+            QMessageBox.information(self, "저장 완료", f"{label} {kind.upper()} 저장 완료\n{path}")
+            return
+        if getattr(result, "cancelled", False):
+            self.append_log(f"⏹️ {label} {kind.upper()} 저장 취소", 20)
+            return
+
+        if not error:
+            error = f"{kind.upper()} 저장 결과가 실패로 반환되었습니다."
+        QMessageBox.critical(self, "저장 실패", f"{kind.upper()} 저장에 실패했습니다.\n{error}")
+        logger.error(f"{kind.upper()} save failed ({label}): {error}")
+
+    def save_history(self: Any, kind: str = "csv"):
+        """DB ``article_history`` 전체를 커서에서 바로 흘려 내보낸다(수집 결과 메모리와 무관)."""
+        from pathlib import Path
+        from src.core.export import history_rows_to_export_items
+        from src.ui.widgets.crawler_tab import _get_data_exporter_cls
+
+        label = "DB 매물 이력"
+        total = int(self.db.get_article_history_stats().get("total", 0) or 0)
+        if total <= 0:
+            QMessageBox.information(self, "저장", f"{label}으로 저장할 데이터가 없습니다.")
+            return
+        path = self._ask_export_path(kind, label, "history")
+        if not path:
+            return
+        items = history_rows_to_export_items(self.db.iter_article_history_rows())
+        exporter = _get_data_exporter_cls()(items, total=total)
+        self._start_export_worker(exporter, kind, Path(path), settings.get("excel_template"), label)
+
+    def _start_export_worker(self: Any, exporter, kind: str, path, template, label: str):
+        worker = getattr(self, "_export_worker", None)
+        if worker is not None:
+            try:
+                if worker.isRunning():
+                    QMessageBox.information(self, "저장", "다른 내보내기가 진행 중입니다.")
+                    return None
+            except Exception:
+                pass
+
+        total = int(getattr(exporter, "total", 0) or 0)
+        dialog = QProgressDialog(f"{label} {kind.upper()} 저장 중...", "취소", 0, total, self)
+        dialog.setWindowTitle("내보내기")
+        dialog.setMinimumDuration(500)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+
+        worker = ExportThread(exporter, kind, path, template, self)
+        self._export_worker = worker
+        dialog.canceled.connect(worker.cancel)
+
+        def _on_progress(done, expected):
+            if expected > 0:
+                dialog.setMaximum(expected)
+                dialog.setValue(min(done, expected))
+            dialog.setLabelText(f"{label} {kind.upper()} 저장 중... {done:,}건")
+
+        def _on_done(result):
+            dialog.close()
+            self._report_export_result(kind, label, path, result)
+
+        def _on_failed(message):
+            dialog.close()
+            QMessageBox.critical(self, "저장 실패", f"{kind.upper()} 저장 중 오류가 발생했습니다.\n{message}")
+            logger.error(f"{kind.upper()} save error ({label}): {message}")
+
+        worker.progress_signal.connect(_on_progress)
+        worker.done_signal.connect(_on_done)
+        worker.failed_signal.connect(_on_failed)
+        worker.finished.connect(lambda: setattr(self, "_export_worker", None))
+        worker.start()
+        self.append_log(f"💾 {label} {kind.upper()} 저장을 백그라운드에서 진행합니다.", 10)
+        return worker
+
     def save_excel(self: Any, scope: str = "visible"):
         self._save_with_export_scope("excel", scope)
 
@@ -184,3 +256,6 @@ class CrawlerTabIOActionsMixin:
 
     def save_json(self: Any, scope: str = "visible"):
         self._save_with_export_scope("json", scope)
+
+    def save_jsonl(self: Any, scope: str = "visible"):
+        self._save_with_export_scope("jsonl", scope)
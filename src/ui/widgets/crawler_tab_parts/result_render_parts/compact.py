@@ -67,8 +67,9 @@ class CrawlerTabCompactRenderMixin:
         is_asc = "↑" in criterion
         return sort_key, is_asc
 
-    def _compact_sort_value(self: Any, data):
-        sort_key, _is_asc = self._compact_sort_descriptor()
+    def _compact_sort_value(self: Any, data, sort_key=None):
+        if sort_key is None:
+            sort_key, _is_asc = self._compact_sort_descriptor()
         if sort_key == "가격":
             return self._extract_price_values(data)[2]
         if sort_key == "면적":
@@ -77,25 +78,34 @@ class CrawlerTabCompactRenderMixin:
             return str(data.get("거래유형", "") or "")
         return str(data.get("단지명", "") or "")
 
-    def _find_compact_insert_index(self: Any, data):
-        target = self._compact_sort_value(data)
-        _sort_key, is_asc = self._compact_sort_descriptor()
-        for index, current in enumerate(self._compact_rows_data):
-            current_value = self._compact_sort_value(current)
-            if is_asc:
-                if target < current_value:
-                    return index
-            else:
-                if target > current_value:
-                    return index
-        return len(self._compact_rows_data)
-
-    def _reindex_compact_row_map(self: Any, start_row: int = 0):
-        if start_row <= 0:
-            self._compact_row_index_by_key = {}
-            start_row = 0
-        for row in range(start_row, len(self._compact_rows_data)):
-            self._compact_row_index_by_key[self._get_compact_key(self._compact_rows_data[row])] = row
+    def _compact_row_for_key(self: Any, compact_key):
+        order_key = self._compact_order_keys.get(compact_key)
+        if order_key is None:
+            return None
+        row = self._compact_row_order.row_of(order_key)
+        return row if row >= 0 else None
+
+    def _find_compact_insert_index(self: Any, compact_key, data):
+        """새 묶음 행의 정렬 키를 순서 인덱스에 넣고 들어갈 표시 행 번호를 반환한다 (O(log n) 탐색)."""
+        order = self._compact_row_order
+        sort_key, _is_asc = order.descriptor
+        order_key = order.order_key(self._compact_sort_value(data, sort_key), len(self._compact_order_keys))
+        self._compact_order_keys[compact_key] = order_key
+        return order.insert(order_key)
+
+    def _reindex_compact_row_map(self: Any):
+        """현재 정렬 기준으로 묶음 행 순서 인덱스를 다시 만든다. 순번은 묶음이 처음 생긴 순서다."""
+        sort_key, is_asc = self._compact_sort_descriptor()
+        order = OrderedRowIndex(descending=not is_asc, descriptor=(sort_key, is_asc))
+        order_keys = {}
+        for seq, (compact_key, data) in enumerate(self._compact_items_by_key.items()):
+            order_keys[compact_key] = order.order_key(self._compact_sort_value(data, sort_key), seq)
+        self._compact_row_order = OrderedRowIndex(
+            order_keys.values(),
+            descending=order.descending,
+            descriptor=order.descriptor,
+        )
+        self._compact_order_keys = order_keys
 
     def _compact_updates_should_coalesce(self: Any) -> bool:
         thread = getattr(self, "crawler_thread", None)
@@ -127,63 +137,77 @@ class CrawlerTabCompactRenderMixin:
         dirty_keys = [
             key
             for key in self._compact_dirty_keys
-            if key in self._compact_items_by_key and key in self._compact_row_index_by_key
+            if key in self._compact_items_by_key and key in self._compact_order_keys
         ]
         if not dirty_keys:
             self._compact_dirty_keys.clear()
             return
 
-        self.result_table.setSortingEnabled(False)
-        self.result_table.setUpdatesEnabled(False)
-        self.result_table.blockSignals(True)
-        try:
-            for compact_key in dirty_keys:
-                row = self._compact_row_index_by_key.get(compact_key)
-                if row is None:
-                    continue
-                data = self._compact_items_by_key.get(compact_key)
-                if data is None:
-                    continue
-                self._set_result_row(row, data)
-                self._apply_current_filter_to_row(row)
-        finally:
-            self.result_table.blockSignals(False)
-            self.result_table.setUpdatesEnabled(True)
+        for compact_key in dirty_keys:
+            row = self._compact_row_for_key(compact_key)
+            if row is None:
+                continue
+            data = self._compact_items_by_key.get(compact_key)
+            if data is None:
+                continue
+            self._set_result_row(row, data)
         self._compact_dirty_keys.clear()
 
     def _append_rows_compact_batch(self: Any, items):
         if not items:
             return
         self._refresh_result_render_options()
-        self.result_table.setSortingEnabled(False)
         new_rows = []
+        created_keys = set()
         for item in items:
             compact_key, compact_item, created = self._consume_compact_item(item)
             self._recompute_compact_row_favorite(compact_key)
             if created:
                 new_rows.append((compact_key, compact_item))
-            self._compact_dirty_keys.add(compact_key)
+                created_keys.add(compact_key)
+            elif compact_key not in created_keys:
+                self._compact_dirty_keys.add(compact_key)
         if new_rows:
-            start_row = self.result_table.rowCount()
-            self.result_table.setRowCount(start_row + len(new_rows))
-            for offset, (compact_key, compact_item) in enumerate(new_rows):
-                row = start_row + offset
-                self._compact_rows_data.append(compact_item)
-                self._row_search_cache.append("")
-                self._row_payload_cache.append({})
-                self._compact_row_index_by_key[compact_key] = row
+            if self._compact_full_refresh_pending or (
+                self._compact_row_order.descriptor != self._compact_sort_descriptor()
+            ):
+                # 정렬 기준이 바뀐 뒤라면 끝에 붙여 두고 전체 재정렬에서 자리를 잡는다.
+                self._compact_full_refresh_pending = True
+                for _compact_key, compact_item in new_rows:
+                    self._compact_rows_data.append(compact_item)
+                self.result_model.append_records(
+                    [self._build_result_record(compact_item) for _key, compact_item in new_rows]
+                )
+            else:
+                self._insert_compact_rows_sorted(new_rows)
         self._schedule_compact_refresh()
 
+    def _insert_compact_rows_sorted(self: Any, new_rows):
+        """새 묶음 행을 정렬 위치에 끼워 넣는다. 연달아 붙는 행은 한 번에 모델에 넣는다."""
+        run_start = -1
+        run_items = []
+
+        def _flush_run():
+            if not run_items:
+                return
+            self._compact_rows_data[run_start:run_start] = run_items
+            self.result_model.insert_records(
+                run_start, [self._build_result_record(item) for item in run_items]
+            )
+
+        for compact_key, compact_item in new_rows:
+            row = self._find_compact_insert_index(compact_key, compact_item)
+            if run_items and row == run_start + len(run_items):
+                run_items.append(compact_item)
+                continue
+            _flush_run()
+            run_start = row
+            run_items = [compact_item]
+        _flush_run()
+
     def _sort_compact_rows(self: Any, rows):
         sort_key, is_asc = self._compact_sort_descriptor()
-        if sort_key == "가격":
-            rows.sort(key=lambda d: self._extract_price_values(d)[2], reverse=not is_asc)
-        elif sort_key == "면적":
-            rows.sort(key=lambda d: self._area_float(d.get("면적(평)", 0)), reverse=not is_asc)
-        elif sort_key in ("거래", "거래유형"):
-            rows.sort(key=lambda d: str(d.get("거래유형", "")), reverse=not is_asc)
-        else:
-            rows.sort(key=lambda d: str(d.get("단지명", "")), reverse=not is_asc)
+        rows.sort(key=lambda d: self._compact_sort_value(d, sort_key), reverse=not is_asc)
 
     def _render_compact_rows(self: Any):
         self._refresh_result_render_options()
@@ -193,21 +217,7 @@ class CrawlerTabCompactRenderMixin:
         self._sort_compact_rows(rows)
         self._compact_rows_data = rows
 
-        self.result_table.setUpdatesEnabled(False)
-        self.result_table.setSortingEnabled(False)
-        self.result_table.setRowCount(len(rows))
-        self.result_table.blockSignals(True)
-        self._row_search_cache = [""] * len(rows)
-        self._row_payload_cache = [{} for _ in rows]
-        self._row_hidden_state = {}
         self._reindex_compact_row_map()
-
-        try:
-            for row, data in enumerate(rows):
-                self._set_result_row(row, data)
-                self._apply_current_filter_to_row(row)
-        finally:
-            self.result_table.blockSignals(False)
-            self.result_table.setUpdatesEnabled(True)
+        self.result_model.reset_records([self._build_result_record(data) for data in rows])
         self._compact_dirty_keys.clear()
         self._compact_full_refresh_pending = False
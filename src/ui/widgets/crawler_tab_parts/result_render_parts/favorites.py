@@ -79,7 +79,7 @@ class CrawlerTabFavoriteRenderMixin:
                 )
             return
 
-        for payload in self._row_payload_cache:
+        for payload in self.result_model.payloads():
             if not isinstance(payload, dict):
                 continue
             payload_key = (
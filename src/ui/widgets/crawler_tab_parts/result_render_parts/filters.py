@@ -41,15 +41,10 @@ class CrawlerTabFilterRenderMixin:
         else:
             self.status_message.emit("고급 필터 해제됨")
 
-    def _apply_current_filter_to_row(self: Any, row):
+    def _is_result_row_visible(self: Any, row):
         text_lower = (self._pending_search_text or "").lower()
-        searchable = self._row_search_cache[row] if row < len(self._row_search_cache) else ""
-        hidden_by_text = bool(text_lower) and text_lower not in searchable
-        hidden_by_advanced = False
-        payload = self._row_payload_cache[row] if row < len(self._row_payload_cache) else None
-        if self._advanced_filters and payload is not None:
-            hidden_by_advanced = not self._check_advanced_filter(payload)
-        hidden = hidden_by_text or hidden_by_advanced
-        if self._row_hidden_state.get(row) != hidden:
-            self.result_table.setRowHidden(row, hidden)
-            self._row_hidden_state[row] = hidden
+        if text_lower and not self.result_model.row_matches(row, text_lower):
+            return False
+        if self._advanced_filters:
+            return bool(self._check_advanced_filter(self.result_model.payload(row)))
+        return True
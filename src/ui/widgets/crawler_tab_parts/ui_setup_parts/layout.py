@@ -38,15 +38,12 @@ class CrawlerTabLayoutSetupMixin:
         self.collected_data: list[ResultRow] = []
         self.grouped_rows: dict[str, Any] = {}
         self._pending_search_text: str = ""
-        self._row_search_cache: list[str] = []
-        self._row_payload_cache: list[RowPayload] = []
-        self._row_hidden_state: dict[int, bool] = {}
         self._advanced_filters: dict[str, Any] | None = None
-        self._append_chunk_size: int = 200
         self._compact_duplicates: bool = bool(settings.get("compact_duplicate_listings", True))
         self._compact_items_by_key: dict[CompactRowKey, ResultRow] = {}
         self._compact_rows_data: list[ResultRow] = []
-        self._compact_row_index_by_key: dict[CompactRowKey, int] = {}
+        self._compact_row_order = OrderedRowIndex()
+        self._compact_order_keys: dict[CompactRowKey, tuple] = {}
         self._compact_source_keys_by_key: dict[CompactRowKey, set[FavoriteKey]] = {}
         self._compact_key_by_article: dict[FavoriteKey, set[CompactRowKey]] = {}
         self._compact_dirty_keys: set[CompactRowKey] = set()
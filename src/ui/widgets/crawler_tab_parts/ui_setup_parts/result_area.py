@@ -77,16 +77,27 @@ class CrawlerTabResultAreaSetupMixin:
         rl.setContentsMargins(0, 5, 0, 0)
         
         # Table View
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(18)
-        self.result_table.setHorizontalHeaderLabels([
-            "단지명", "거래", "가격", "면적", "평당가", "층/방향", "특징",
-            "묶음", "🆕", "📊 변동", "자산", "기전세금", "갭금액", "갭비율",
-            "시각", "링크", "URL", "가격(숫자)"
-        ])
+        self.result_model = ResultTableModel(
+            [
+                "단지명", "거래", "가격", "면적", "평당가", "층/방향", "특징",
+                "묶음", "🆕", "📊 변동", "자산", "기전세금", "갭금액", "갭비율",
+                "시각", "링크", "URL", "가격(숫자)"
+            ],
+            numeric_columns=(self.COL_AREA, self.COL_PRICE_SORT),
+            parent=self,
+        )
+        self.result_proxy = ResultFilterProxyModel(self)
+        self.result_proxy.setSourceModel(self.result_model)
+        self.result_proxy.set_row_predicate(self._is_result_row_visible)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_proxy)
         self.result_table.setColumnHidden(self.COL_URL, True)
         self.result_table.setColumnHidden(self.COL_PRICE_SORT, True)
         self.result_table.setAlternatingRowColors(True)
+        # 대량 행에서도 행 높이 계산을 생략하도록 고정 높이를 사용한다.
+        result_row_header = self.result_table.verticalHeader()
+        if result_row_header is not None:
+            result_row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.result_table.doubleClicked.connect(self._open_article_url)
         
         # Card View
@@ -35,7 +35,7 @@ class CrawlerTabRuntimeSettingsSetupMixin:
         self.combo_sort.blockSignals(True)
         self.combo_sort.setCurrentIndex(idx)
         self.combo_sort.blockSignals(False)
-        if self.result_table.rowCount() > 0:
+        if self.result_model.rowCount() > 0:
             self._sort_results(self.combo_sort.currentText())
 
     def update_runtime_settings(self: Any):
@@ -1,5 +1,6 @@
 from src.ui.widgets.dashboard_parts.card_view import CardViewWidget
 from src.ui.widgets.dashboard_parts.cards import ArticleCard, StatCard
 from src.ui.widgets.dashboard_parts.dashboard_widget import DashboardWidget, logger, settings
+from src.ui.widgets.dashboard_parts.dashboard_worker import DashboardComputeThread
 
-__all__ = ["ArticleCard", "CardViewWidget", "DashboardWidget", "StatCard", "logger", "settings"]
+__all__ = ["ArticleCard", "CardViewWidget", "DashboardComputeThread", "DashboardWidget", "StatCard", "logger", "settings"]
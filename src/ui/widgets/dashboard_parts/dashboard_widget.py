@@ -2,35 +2,35 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGroupBox,
     QScrollArea, QGridLayout, QPushButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QCursor, QPixmap
 from typing import Optional
 import time
 
-try:
-    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-    from matplotlib.figure import Figure
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    FigureCanvas = None
-    Figure = None
-    MATPLOTLIB_AVAILABLE = False
-
 from src.utils.constants import TRADE_COLORS
 from src.core.managers import settings
-from src.utils.helpers import PriceConverter
 from src.utils.logger import get_logger
-from src.utils.plot import setup_korean_font, sanitize_text_for_matplotlib
+from src.utils.plot import setup_korean_font
 from src.ui.styles import COLORS
 from src.ui.widgets.components import EmptyStateWidget
 
 logger = get_logger("Dashboard")
 
 from src.ui.widgets.dashboard_parts.cards import StatCard
+from src.ui.widgets.dashboard_parts.dashboard_worker import (
+    MATPLOTLIB_AVAILABLE,
+    DashboardComputeThread,
+    DashboardRenderRequest,
+    compute_dashboard_stats,
+)
 
 
 class DashboardWidget(QWidget):
-    """통합 대시보드 (v13.0)"""
+    """통합 대시보드 (v13.0)
+
+    집계·소멸 개수 조회·차트 렌더링은 ``DashboardComputeThread`` 가 맡고, 위젯은 결과 픽스맵과
+    숫자만 붙인다. 데이터가 바뀌면 진행 중인 워커는 취소되고 이전 revision 결과는 버려진다.
+    """
     warning_signal = pyqtSignal(str)
     
     def __init__(self, db, theme="dark", parent=None):
@@ -52,14 +52,11 @@ class DashboardWidget(QWidget):
         self._warning_cache = {}
         self._warning_throttle_seconds = 3.0
         self._korean_font_ok = bool(setup_korean_font()) if MATPLOTLIB_AVAILABLE else True
-        self._trade_chart_layout = None
-        self._price_chart_layout = None
-        self._trade_placeholder = None
-        self._price_placeholder = None
-        self.trade_figure = None
-        self.trade_canvas = None
-        self.price_figure = None
-        self.price_canvas = None
+        self._dashboard_worker = None
+        self._chart_resize_timer = QTimer(self)
+        self._chart_resize_timer.setSingleShot(True)
+        self._chart_resize_timer.setInterval(200)
+        self._chart_resize_timer.timeout.connect(self._rerender_charts)
         self._setup_ui()
 
     def _emit_warning(self, message: str):
@@ -109,16 +106,16 @@ class DashboardWidget(QWidget):
         
         # 거래유형별 파이 차트
         self.trade_chart_frame = QGroupBox("🏠 거래유형별 분포")
-        self._trade_chart_layout = QVBoxLayout(self.trade_chart_frame)
-        self._trade_placeholder = QLabel("데이터 수집 후 차트가 표시됩니다.")
-        self._trade_chart_layout.addWidget(self._trade_placeholder)
+        trade_chart_layout = QVBoxLayout(self.trade_chart_frame)
+        self.trade_chart_view = self._create_chart_view()
+        trade_chart_layout.addWidget(self.trade_chart_view)
         charts_layout.addWidget(self.trade_chart_frame)
         
         # 가격대별 히스토그램
         self.price_chart_frame = QGroupBox("💰 가격대별 분포")
-        self._price_chart_layout = QVBoxLayout(self.price_chart_frame)
-        self._price_placeholder = QLabel("데이터 수집 후 차트가 표시됩니다.")
-        self._price_chart_layout.addWidget(self._price_placeholder)
+        price_chart_layout = QVBoxLayout(self.price_chart_frame)
+        self.price_chart_view = self._create_chart_view()
+        price_chart_layout.addWidget(self.price_chart_view)
         charts_layout.addWidget(self.price_chart_frame)
         
         layout.addLayout(charts_layout)
@@ -179,119 +176,27 @@ class DashboardWidget(QWidget):
 
         return card
 
-    def _ensure_chart_canvases(self):
-        if not MATPLOTLIB_AVAILABLE or Figure is None or FigureCanvas is None:
-            if self._trade_placeholder is not None:
-                self._trade_placeholder.setText("Matplotlib 필요")
-            if self._price_placeholder is not None:
-                self._price_placeholder.setText("Matplotlib 필요")
-            return False
-        if self.trade_canvas is not None and self.price_canvas is not None:
-            return True
-
-        if self._trade_placeholder is not None:
-            self._trade_placeholder.deleteLater()
-            self._trade_placeholder = None
-        if self._price_placeholder is not None:
-            self._price_placeholder.deleteLater()
-            self._price_placeholder = None
-
-        if self._trade_chart_layout is not None:
-            self.trade_figure = Figure(figsize=(4, 3), facecolor="none")
-            self.trade_canvas = FigureCanvas(self.trade_figure)
-            self.trade_figure.patch.set_alpha(0)
-            self._trade_chart_layout.addWidget(self.trade_canvas)
-
-        if self._price_chart_layout is not None:
-            self.price_figure = Figure(figsize=(5, 3), facecolor="none")
-            self.price_canvas = FigureCanvas(self.price_figure)
-            self.price_figure.patch.set_alpha(0)
-            self._price_chart_layout.addWidget(self.price_canvas)
-
-        return self.trade_canvas is not None and self.price_canvas is not None
+    @staticmethod
+    def _create_chart_view() -> QLabel:
+        view = QLabel("데이터 수집 후 차트가 표시됩니다.")
+        view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        view.setMinimumSize(240, 200)
+        return view
 
     def _build_stats_snapshot(self):
         if self._stats_cache_revision == self._data_revision and self._stats_cache is not None:
             return self._stats_cache
-
-        trade_counts = {"매매": 0, "전세": 0, "월세": 0}
-        new_count = 0
-        price_up = 0
-        price_down = 0
-        prices = []
-
-        for item in self._data:
-            trade_type = item.get("거래유형", "")
-            if trade_type in trade_counts:
-                trade_counts[trade_type] += 1
-
-            if item.get("is_new") or item.get("신규여부"):
-                new_count += 1
-
-            change = item.get("price_change", item.get("가격변동", 0))
-            if isinstance(change, str):
-                try:
-                    change = int(change.replace(",", "").replace("만", ""))
-                except ValueError:
-                    change = 0
-            if change > 0:
-                price_up += 1
-            elif change < 0:
-                price_down += 1
-
-            price = PriceConverter.representative_price_int(item)
-            if price > 0:
-                prices.append(price / 10000)
-
-        self._stats_cache = {
-            "total": len(self._data),
-            "trade_counts": trade_counts,
-            "new_count": new_count,
-            "price_up": price_up,
-            "price_down": price_down,
-            "prices": prices,
-        }
+        self._stats_cache = compute_dashboard_stats(self._data)
         self._stats_cache_revision = self._data_revision
         return self._stats_cache
 
-    def _get_disappeared_count(self) -> int:
-        now = time.monotonic()
+    def _cached_disappeared_count(self) -> Optional[int]:
         if (
             self._disappeared_cache_revision == self._data_revision
-            and (now - self._disappeared_cache_loaded_at) < self._disappeared_cache_ttl
+            and (time.monotonic() - self._disappeared_cache_loaded_at) < self._disappeared_cache_ttl
         ):
             return self._disappeared_cache_value
-
-        scoped_targets = []
-        seen_targets = set()
-        for item in self._data or []:
-            if not isinstance(item, dict):
-                continue
-            asset_type = str(item.get("자산유형", item.get("asset_type", "APT")) or "APT").strip().upper() or "APT"
-            if asset_type not in {"APT", "VL"}:
-                asset_type = "APT"
-            complex_id = str(item.get("단지ID", item.get("complex_id", "")) or "").strip()
-            trade_type = str(item.get("거래유형", item.get("trade_type", "")) or "").strip()
-            key = (asset_type, complex_id, trade_type)
-            if not complex_id or not trade_type or key in seen_targets:
-                continue
-            seen_targets.add(key)
-            scoped_targets.append(key)
-
-        try:
-            if scoped_targets and hasattr(self.db, "count_disappeared_articles_for_targets"):
-                disappeared = int(self.db.count_disappeared_articles_for_targets(scoped_targets) or 0)
-            else:
-                disappeared = 0
-        except Exception as e:
-            logger.debug(f"소멸 매물 개수 조회 실패 (무시): {e}")
-            disappeared = 0
-            self._emit_warning("대시보드 소멸 통계를 불러오지 못했습니다.")
-
-        self._disappeared_cache_value = disappeared
-        self._disappeared_cache_revision = self._data_revision
-        self._disappeared_cache_loaded_at = now
-        return disappeared
+        return None
     
     def set_data(self, data: list):
         """대시보드 데이터 설정"""
@@ -316,21 +221,10 @@ class DashboardWidget(QWidget):
         if child is not None:
             child.setText(text)
 
-    def _clear_chart(self, figure, canvas, placeholder, message: str):
-        if placeholder is not None:
-            placeholder.setText(message)
-        if figure is None or canvas is None:
-            return
-        try:
-            figure.clear()
-            ax = figure.add_subplot(111)
-            ax.axis("off")
-            text_color = "white" if self._theme == "dark" else "black"
-            ax.text(0.5, 0.5, message, ha="center", va="center", color=text_color)
-            figure.tight_layout()
-            canvas.draw()
-        except Exception as e:
-            logger.debug(f"대시보드 차트 초기화 실패 (무시): {e}")
+    @staticmethod
+    def _clear_chart(view: QLabel, message: str):
+        view.clear()
+        view.setText(message)
 
     def _clear_dashboard(self):
         self._set_card_value(self.total_card, "0")
@@ -340,8 +234,8 @@ class DashboardWidget(QWidget):
         self._set_card_value(self.disappeared_card, "0")
         self._last_trade_chart_sig = None
         self._last_price_chart_sig = None
-        self._clear_chart(self.trade_figure, self.trade_canvas, self._trade_placeholder, "데이터가 없습니다.")
-        self._clear_chart(self.price_figure, self.price_canvas, self._price_placeholder, "데이터가 없습니다.")
+        self._clear_chart(self.trade_chart_view, "데이터가 없습니다.")
+        self._clear_chart(self.price_chart_view, "데이터가 없습니다.")
         self.trend_label.setText("총 매물 0건\n신규 0건 · 상승 0건 · 하락 0건 · 소멸 0건\n최다 거래유형: 없음")
 
     @staticmethod
@@ -368,18 +262,70 @@ class DashboardWidget(QWidget):
         )
     
     def refresh(self):
-        """대시보드 새로고침"""
+        """대시보드 새로고침. 무거운 집계·렌더링은 워커에서 끝난 뒤 ``_apply_dashboard_result`` 로 반영된다."""
         show_trend = bool(settings.get("show_trend_analysis", True))
         self.trend_frame.setVisible(show_trend)
         if not self._data:
+            self._cancel_dashboard_worker()
             self._clear_dashboard()
             self.empty_label.show()
             return
         self.empty_label.hide()
+        self._set_card_value(self.total_card, str(len(self._data)))
 
-        stats = self._build_stats_snapshot()
-        disappeared_count = self._get_disappeared_count()
+        chart_sig = (self._data_revision, self._theme)
+        charts_current = not MATPLOTLIB_AVAILABLE or (
+            self._last_trade_chart_sig == chart_sig and self._last_price_chart_sig == chart_sig
+        )
+        cached_stats = self._stats_cache if self._stats_cache_revision == self._data_revision else None
+        disappeared = self._cached_disappeared_count()
+        if charts_current and cached_stats is not None and disappeared is not None:
+            self._apply_card_values(cached_stats, disappeared)
+            return
+        if not MATPLOTLIB_AVAILABLE:
+            self._clear_chart(self.trade_chart_view, "Matplotlib 필요")
+            self._clear_chart(self.price_chart_view, "Matplotlib 필요")
+        self._start_dashboard_worker(render_charts=not charts_current)
 
+    @staticmethod
+    def _chart_view_size(view: QLabel, default: tuple[int, int]) -> tuple[int, int]:
+        if view.isVisible() and view.width() > 120 and view.height() > 90:
+            return (view.width(), view.height())
+        return default
+
+    def _start_dashboard_worker(self, *, render_charts: bool = True):
+        self._cancel_dashboard_worker()
+        stats = self._stats_cache if self._stats_cache_revision == self._data_revision else None
+        request = DashboardRenderRequest(
+            revision=self._data_revision,
+            items=self._data,
+            theme=self._theme,
+            korean_font_ok=self._korean_font_ok,
+            db=self.db,
+            stats=stats,
+            disappeared=self._cached_disappeared_count(),
+            render_charts=render_charts,
+            trade_size=self._chart_view_size(self.trade_chart_view, (400, 300)),
+            price_size=self._chart_view_size(self.price_chart_view, (500, 300)),
+            device_pixel_ratio=float(self.devicePixelRatioF() or 1.0),
+        )
+        worker = DashboardComputeThread(request)
+        worker.result_signal.connect(self._apply_dashboard_result)
+        worker.finished.connect(lambda w=worker: self._on_dashboard_worker_finished(w))
+        self._dashboard_worker = worker
+        worker.start()
+
+    def _cancel_dashboard_worker(self):
+        worker = self._dashboard_worker
+        self._dashboard_worker = None
+        if worker is not None:
+            worker.cancel()
+
+    def _on_dashboard_worker_finished(self, worker):
+        if self._dashboard_worker is worker:
+            self._dashboard_worker = None
+
+    def _apply_card_values(self, stats: dict, disappeared_count: int):
         self._set_card_value(self.total_card, str(stats["total"]))
         self._set_card_value(self.new_card, str(stats["new_count"]))
         self._set_card_value(self.up_card, str(stats["price_up"]))
@@ -387,13 +333,44 @@ class DashboardWidget(QWidget):
         self._set_card_value(self.disappeared_card, str(disappeared_count))
         self.trend_label.setText(self._trend_summary_text(stats, disappeared_count))
 
-        if self._ensure_chart_canvases():
-            try:
-                self._update_trade_chart(stats["trade_counts"])
-                self._update_price_chart(stats["prices"])
-            except Exception as e:
-                logger.debug(f"차트 업데이트 실패 (무시): {e}")
-                self._emit_warning("대시보드 차트 렌더링 중 오류가 발생했습니다.")
+    def _apply_dashboard_result(self, revision: int, payload: dict):
+        # 데이터/테마가 그 사이 바뀌었다면 오래된 결과이므로 버린다.
+        if revision != self._data_revision or payload.get("theme") != self._theme or not self._data:
+            return
+        stats = payload["stats"]
+        self._stats_cache = stats
+        self._stats_cache_revision = revision
+        disappeared_count = int(payload.get("disappeared", 0) or 0)
+        if payload.get("disappeared_loaded"):
+            self._disappeared_cache_value = disappeared_count
+            self._disappeared_cache_revision = revision
+            self._disappeared_cache_loaded_at = time.monotonic()
+        if payload.get("disappeared_error"):
+            self._emit_warning("대시보드 소멸 통계를 불러오지 못했습니다.")
+        self._apply_card_values(stats, disappeared_count)
+
+        chart_sig = (revision, self._theme)
+        dpr = float(self.devicePixelRatioF() or 1.0)
+        for view, image_key, sig_attr in (
+            (self.trade_chart_view, "trade_image", "_last_trade_chart_sig"),
+            (self.price_chart_view, "price_image", "_last_price_chart_sig"),
+        ):
+            image = payload.get(image_key)
+            if image is None:
+                continue
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(max(1.0, dpr))
+            view.setPixmap(pixmap)
+            setattr(self, sig_attr, chart_sig)
+        if payload.get("chart_error"):
+            self._emit_warning("대시보드 차트 렌더링 중 오류가 발생했습니다.")
+
+    def _rerender_charts(self):
+        if not self._data or not MATPLOTLIB_AVAILABLE:
+            return
+        self._last_trade_chart_sig = None
+        self._last_price_chart_sig = None
+        self.refresh()
 
     def _calc_stat_columns(self) -> int:
         available = max(1, self.width() - 40)
@@ -418,94 +395,5 @@ class DashboardWidget(QWidget):
     def resizeEvent(self, a0):
         super().resizeEvent(a0)
         self._relayout_stats()
-    
-    def _update_trade_chart(self, trade_counts: dict):
-        """거래유형별 파이 차트 업데이트"""
-        if self.trade_figure is None or self.trade_canvas is None:
-            return
-        signature = (
-            self._data_revision,
-            self._theme,
-            tuple(sorted((k, int(v)) for k, v in trade_counts.items())),
-        )
-        if signature == self._last_trade_chart_sig:
-            return
-        
-        try:
-            self.trade_figure.clear()
-            ax = self.trade_figure.add_subplot(111)
-            
-            labels = []
-            sizes = []
-            colors = ['#ef4444', '#22c55e', '#3b82f6']
-            label_map = {"매매": "Sale", "전세": "Jeonse", "월세": "Monthly"}
-            
-            for i, (label, count) in enumerate(trade_counts.items()):
-                if count > 0:
-                    if self._korean_font_ok:
-                        display = str(label)
-                    else:
-                        display = label_map.get(str(label), sanitize_text_for_matplotlib(str(label), fallback="Type"))
-                    labels.append(f"{display}\n({count})")
-                    sizes.append(count)
-            
-            if sizes:
-                # Set text color based on theme - simplified logic
-                text_color = 'white' if self._theme == 'dark' else 'black'
-                
-                pie_result = ax.pie(
-                    sizes,
-                    labels=labels,
-                    colors=colors[:len(sizes)],
-                    autopct='%1.1f%%',
-                    startangle=90,
-                )
-                texts = pie_result[1]
-                autotexts = pie_result[2] if len(pie_result) > 2 else []
-                ax.axis('equal')
-                
-                for text in texts + autotexts:
-                    text.set_color(text_color)
-            
-            self.trade_figure.tight_layout()
-            self.trade_canvas.draw()
-            self._last_trade_chart_sig = signature
-        except Exception as e:
-            logger.debug(f"거래유형 차트 그리기 실패 (무시): {e}")
-            self._emit_warning("거래유형 차트 렌더링에 실패했습니다.")
-    
-    def _update_price_chart(self, prices: list[float]):
-        """가격대별 히스토그램 업데이트"""
-        if self.price_figure is None or self.price_canvas is None:
-            return
-        signature = (self._data_revision, self._theme)
-        if signature == self._last_price_chart_sig:
-            return
-        
-        try:
-            self.price_figure.clear()
-            ax = self.price_figure.add_subplot(111)
-
-            if prices:
-                ax.hist(prices, bins=10, color='#3b82f6', alpha=0.7, edgecolor='white')
-                if self._korean_font_ok:
-                    ax.set_xlabel('가격 (억원)')
-                    ax.set_ylabel('매물 수')
-                else:
-                    ax.set_xlabel("Price (100M KRW)")
-                    ax.set_ylabel("Listings")
-                
-                # Style update
-                text_color = 'white' if self._theme == 'dark' else 'black'
-                ax.tick_params(colors=text_color)
-                ax.xaxis.label.set_color(text_color)
-                ax.yaxis.label.set_color(text_color)
-                for spine in ax.spines.values():
-                    spine.set_color('#555555')
-            
-            self.price_figure.tight_layout()
-            self.price_canvas.draw()
-            self._last_price_chart_sig = signature
-        except Exception as e:
-            logger.debug(f"가격 차트 그리기 실패 (무시): {e}")
-            self._emit_warning("가격대 차트 렌더링에 실패했습니다.")
+        if self._last_trade_chart_sig is not None:
+            self._chart_resize_timer.start()
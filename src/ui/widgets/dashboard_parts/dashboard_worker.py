@@ -0,0 +1,320 @@
+import atexit
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QImage
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    FigureCanvasAgg = None
+    Figure = None
+    MATPLOTLIB_AVAILABLE = False
+
+from src.utils.helpers import PriceConverter
+from src.utils.logger import get_logger
+from src.utils.plot import sanitize_text_for_matplotlib
+
+logger = get_logger("Dashboard")
+
+PRICE_HISTOGRAM_BINS = 10
+_TRADE_COLORS = ["#ef4444", "#22c55e", "#3b82f6"]
+_TRADE_LABELS_ASCII = {"매매": "Sale", "전세": "Jeonse", "월세": "Monthly"}
+
+
+def _price_change_value(item: dict) -> int:
+    change = item.get("price_change", item.get("가격변동", 0))
+    if isinstance(change, str):
+        try:
+            change = int(change.replace(",", "").replace("만", ""))
+        except ValueError:
+            change = 0
+    return change or 0
+
+
+def histogram_bins(values: list, bins: int = PRICE_HISTOGRAM_BINS) -> tuple[list[int], list[float]]:
+    """``values`` 를 ``bins`` 구간으로 나눈 (개수, 경계) 목록. NumPy가 있으면 ``np.histogram`` 을 쓴다."""
+    if not values:
+        return [], []
+    if np is not None:
+        counts, edges = np.histogram(np.asarray(values, dtype=float), bins=bins)
+        return counts.astype(int).tolist(), edges.astype(float).tolist()
+    low = float(min(values))
+    high = float(max(values))
+    if low == high:
+        low -= 0.5
+        high += 0.5
+    width = (high - low) / bins
+    counts = [0] * bins
+    for value in values:
+        counts[min(int((float(value) - low) / width), bins - 1)] += 1
+    return counts, [low + width * i for i in range(bins + 1)]
+
+
+def compute_dashboard_stats(items: list) -> dict[str, Any]:
+    """대시보드 카드·차트용 집계. 순수 함수라 UI 스레드와 워커 모두에서 호출할 수 있다."""
+    trade_counts = {"매매": 0, "전세": 0, "월세": 0}
+    new_count = 0
+    price_up = 0
+    price_down = 0
+    prices = []
+
+    for item in items:
+        trade_type = item.get("거래유형", "")
+        if trade_type in trade_counts:
+            trade_counts[trade_type] += 1
+
+        if item.get("is_new") or item.get("신규여부"):
+            new_count += 1
+
+        change = _price_change_value(item)
+        if change > 0:
+            price_up += 1
+        elif change < 0:
+            price_down += 1
+
+        price = PriceConverter.representative_price_int(item)
+        if price > 0:
+            prices.append(price / 10000)
+
+    counts, edges = histogram_bins(prices)
+    return {
+        "total": len(items),
+        "trade_counts": trade_counts,
+        "new_count": new_count,
+        "price_up": price_up,
+        "price_down": price_down,
+        "prices": prices,
+        "price_hist_counts": counts,
+        "price_hist_edges": edges,
+    }
+
+
+def disappeared_targets(items: list) -> list[tuple[str, str, str]]:
+    """소멸 매물 집계 대상 (자산유형, 단지ID, 거래유형) 목록."""
+    scoped_targets = []
+    seen_targets = set()
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        asset_type = str(item.get("자산유형", item.get("asset_type", "APT")) or "APT").strip().upper() or "APT"
+        if asset_type not in {"APT", "VL"}:
+            asset_type = "APT"
+        complex_id = str(item.get("단지ID", item.get("complex_id", "")) or "").strip()
+        trade_type = str(item.get("거래유형", item.get("trade_type", "")) or "").strip()
+        key = (asset_type, complex_id, trade_type)
+        if not complex_id or not trade_type or key in seen_targets:
+            continue
+        seen_targets.add(key)
+        scoped_targets.append(key)
+    return scoped_targets
+
+
+def _figure_to_image(figure) -> QImage:
+    assert FigureCanvasAgg is not None
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    renderer = canvas.get_renderer()
+    width, height = int(renderer.width), int(renderer.height)
+    buffer = bytes(canvas.buffer_rgba())
+    # buffer 수명과 분리하려고 copy() 한 QImage를 넘긴다.
+    return QImage(buffer, width, height, width * 4, QImage.Format.Format_RGBA8888).copy()
+
+
+def _new_figure(size: tuple[int, int], device_pixel_ratio: float):
+    dpi = 100.0 * max(1.0, float(device_pixel_ratio or 1.0))
+    width, height = max(120, int(size[0])), max(90, int(size[1]))
+    assert Figure is not None
+    figure = Figure(figsize=(width / 100.0, height / 100.0), dpi=dpi, facecolor="none")
+    figure.patch.set_alpha(0)
+    return figure
+
+
+def render_trade_chart(trade_counts: dict, *, theme: str, korean_font_ok: bool, size, device_pixel_ratio=1.0) -> QImage:
+    """거래유형별 파이 차트를 Agg 버퍼에 그려 QImage로 반환한다."""
+    figure = _new_figure(size, device_pixel_ratio)
+    ax = figure.add_subplot(111)
+    labels = []
+    sizes = []
+    for label, count in trade_counts.items():
+        if count > 0:
+            if korean_font_ok:
+                display = str(label)
+            else:
+                display = _TRADE_LABELS_ASCII.get(str(label), sanitize_text_for_matplotlib(str(label), fallback="Type"))
+            labels.append(f"{display}\n({count})")
+            sizes.append(count)
+
+    if sizes:
+        text_color = "white" if theme == "dark" else "black"
+        # autopct가 있으면 (wedges, texts, autotexts) 로 풀린다(matplotlib 3.11의 PieContainer 포함).
+        _wedges, texts, autotexts = ax.pie(
+            sizes, labels=labels, colors=_TRADE_COLORS[:len(sizes)], autopct="%1.1f%%", startangle=90
+        )
+        ax.axis("equal")
+        for text in list(texts) + list(autotexts):
+            text.set_color(text_color)
+    else:
+        ax.axis("off")
+    figure.tight_layout()
+    return _figure_to_image(figure)
+
+
+def render_price_chart(counts: list, edges: list, *, theme: str, korean_font_ok: bool, size, device_pixel_ratio=1.0) -> QImage:
+    """미리 계산한 구간으로 가격대 히스토그램을 그린다(matplotlib이 다시 binning하지 않는다)."""
+    figure = _new_figure(size, device_pixel_ratio)
+    ax = figure.add_subplot(111)
+    if counts and len(edges) == len(counts) + 1:
+        widths = [edges[i + 1] - edges[i] for i in range(len(counts))]
+        ax.bar(edges[:-1], counts, width=widths, align="edge", color="#3b82f6", alpha=0.7, edgecolor="white")
+        if korean_font_ok:
+            ax.set_xlabel("가격 (억원)")
+            ax.set_ylabel("매물 수")
+        else:
+            ax.set_xlabel("Price (100M KRW)")
+            ax.set_ylabel("Listings")
+        text_color = "white" if theme == "dark" else "black"
+        ax.tick_params(colors=text_color)
+        ax.xaxis.label.set_color(text_color)
+        ax.yaxis.label.set_color(text_color)
+        for spine in ax.spines.values():
+            spine.set_color("#555555")
+    figure.tight_layout()
+    return _figure_to_image(figure)
+
+
+@dataclass
+class DashboardRenderRequest:
+    revision: int
+    items: list
+    theme: str = "dark"
+    korean_font_ok: bool = True
+    db: Any = None
+    stats: Optional[dict] = None
+    disappeared: Optional[int] = None
+    render_charts: bool = True
+    trade_size: tuple[int, int] = (400, 300)
+    price_size: tuple[int, int] = (500, 300)
+    device_pixel_ratio: float = 1.0
+
+
+class _DashboardCancelled(Exception):
+    pass
+
+
+_LIVE_WORKERS: set = set()
+_LIVE_WORKERS_LOCK = threading.Lock()
+
+
+def _wait_live_workers(timeout_ms: int = 3000) -> None:
+    with _LIVE_WORKERS_LOCK:
+        workers = list(_LIVE_WORKERS)
+    for worker in workers:
+        worker.cancel()
+        worker.wait(timeout_ms)
+
+
+atexit.register(_wait_live_workers)
+
+
+class DashboardComputeThread(QThread):
+    """대시보드 집계·소멸 개수 조회·차트 렌더링을 UI 스레드 밖에서 수행한다.
+
+    차트는 Agg 캔버스에 그린 뒤 QImage로 넘기고, 위젯은 픽스맵으로 붙이기만 한다.
+    ``cancel()`` 은 단계 사이에서 작업을 끊으며 취소된 워커는 결과를 보내지 않는다.
+    위젯이 먼저 사라져도 실행 중인 QThread가 파괴되지 않도록 부모 없이 만들고
+    모듈 레지스트리가 종료 시점까지 참조를 유지한다.
+    """
+
+    result_signal = pyqtSignal(int, object)
+
+    def __init__(self, request: DashboardRenderRequest):
+        super().__init__(None)
+        self._request = request
+        self._cancelled = False
+        with _LIVE_WORKERS_LOCK:
+            _LIVE_WORKERS.add(self)
+        self.finished.connect(self._release)
+
+    def _release(self):
+        with _LIVE_WORKERS_LOCK:
+            _LIVE_WORKERS.discard(self)
+        self.deleteLater()
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _check(self):
+        if self._cancelled:
+            raise _DashboardCancelled()
+
+    def run(self):
+        request = self._request
+        payload: dict[str, Any] = {
+            "theme": request.theme,
+            "disappeared_loaded": False,
+            "disappeared_error": False,
+            "chart_error": False,
+            "trade_image": None,
+            "price_image": None,
+        }
+        try:
+            stats = request.stats if request.stats is not None else compute_dashboard_stats(request.items)
+            payload["stats"] = stats
+            self._check()
+
+            disappeared = request.disappeared
+            if disappeared is None:
+                targets = disappeared_targets(request.items)
+                try:
+                    if targets and hasattr(request.db, "count_disappeared_articles_for_targets"):
+                        disappeared = int(request.db.count_disappeared_articles_for_targets(targets) or 0)
+                    else:
+                        disappeared = 0
+                except Exception as e:
+                    logger.debug(f"소멸 매물 개수 조회 실패 (무시): {e}")
+                    disappeared = 0
+                    payload["disappeared_error"] = True
+                payload["disappeared_loaded"] = True
+            payload["disappeared"] = disappeared
+            self._check()
+
+            if request.render_charts and MATPLOTLIB_AVAILABLE:
+                try:
+                    payload["trade_image"] = render_trade_chart(
+                        stats["trade_counts"],
+                        theme=request.theme,
+                        korean_font_ok=request.korean_font_ok,
+                        size=request.trade_size,
+                        device_pixel_ratio=request.device_pixel_ratio,
+                    )
+                    self._check()
+                    payload["price_image"] = render_price_chart(
+                        stats.get("price_hist_counts", []),
+                        stats.get("price_hist_edges", []),
+                        theme=request.theme,
+                        korean_font_ok=request.korean_font_ok,
+                        size=request.price_size,
+                        device_pixel_ratio=request.device_pixel_ratio,
+                    )
+                except _DashboardCancelled:
+                    raise
+                except Exception as e:
+                    logger.debug(f"대시보드 차트 렌더링 실패 (무시): {e}")
+                    payload["chart_error"] = True
+            self._check()
+        except _DashboardCancelled:
+            return
+        self.result_signal.emit(int(request.revision), payload)
@@ -17,7 +17,9 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.models.crawl_models import GeoSweepConfig
+from src.core.services.map_geometry import marker_sweep_bounds
 from src.core.managers import settings
+from src.utils.constants import GEO_PLANNER_REQUEST_BUDGET
 from src.ui.widgets.crawler_tab import (
     CrawlerTab,
     _get_crawl_cache_cls,
@@ -236,6 +238,8 @@ class GeoCrawlerTab(CrawlerTab):
         self.progress_widget.reset()
         self.summary_card.reset()
         self.collected_data = []
+        if self.crawl_cache:
+            self.crawl_cache.close()
         self.crawl_cache = None
         self._reset_result_state()
         self.card_view.set_data([])
@@ -243,6 +247,7 @@ class GeoCrawlerTab(CrawlerTab):
         self.discovered_table.setRowCount(0)
         self._discovered_row_map = {}
         self._last_geo_status_stats = None
+        self._show_known_complexes(asset_types)
         if settings.get("fallback_engine_enabled", True):
             self.append_log("⚠️ Geo 모드는 Playwright 전용이며 Selenium fallback은 지원하지 않습니다.", 30)
 
@@ -271,6 +276,7 @@ class GeoCrawlerTab(CrawlerTab):
                 ttl_minutes=settings.get("cache_ttl_minutes", 30),
                 write_back_interval_sec=settings.get("cache_write_back_interval_sec", 2),
                 max_entries=settings.get("cache_max_entries", 2000),
+                backend=settings.get("cache_backend", "sqlite"),
             )
 
         configured_retry_count = max(0, self._int_setting("max_retry_count", 3))
@@ -285,6 +291,7 @@ class GeoCrawlerTab(CrawlerTab):
             step_px=self.spin_step.value(),
             dwell_ms=self.spin_dwell.value(),
             asset_types=asset_types,
+            request_budget=max(0, self._int_setting("geo_request_budget", GEO_PLANNER_REQUEST_BUDGET)),
         )
         try:
             configured_retry_count = max(0, int(settings.get("max_retry_count", 3)))
@@ -318,6 +325,8 @@ class GeoCrawlerTab(CrawlerTab):
             fallback_engine_enabled=False,
             playwright_headless=settings.get("playwright_headless", False),
             playwright_detail_workers=settings.get("playwright_detail_workers", 12),
+            detail_cache_ttl_hours=settings.get("detail_cache_ttl_hours", 24),
+            geo_tile_cache_ttl_hours=settings.get("geo_tile_cache_ttl_hours", 12),
             block_heavy_resources=settings.get("playwright_block_heavy_resources", True),
             playwright_response_drain_timeout_ms=settings.get("playwright_response_drain_timeout_ms", 3000),
             playwright_navigation_timeout_ms=settings.get("playwright_navigation_timeout_ms", 15000),
@@ -329,7 +338,8 @@ class GeoCrawlerTab(CrawlerTab):
         self.crawler_thread.log_signal.connect(self.append_log)
         self.crawler_thread.progress_signal.connect(self.progress_widget.update_progress)
         self.crawler_thread.items_signal.connect(self._on_items_batch)
-        self.crawler_thread.stats_signal.connect(self._update_stats_ui)
+        self._crawl_stats_view = {}
+        self.crawler_thread.stats_signal.connect(self._on_stats_delta)
         self.crawler_thread.complex_finished_signal.connect(self._on_complex_finished)
         self.crawler_thread.alert_triggered_signal.connect(self._on_alert_triggered)
         self.crawler_thread.discovered_complex_signal.connect(self._on_discovered_complex)
@@ -339,6 +349,25 @@ class GeoCrawlerTab(CrawlerTab):
         self.crawling_started.emit()
         return True
 
+    def _show_known_complexes(self, asset_types) -> int:
+        """이전 탐색에서 좌표가 저장된 단지를 탐색 범위 기준으로 먼저 표에 채운다."""
+        bounds = marker_sweep_bounds(
+            self.spin_lat.value(),
+            self.spin_lon.value(),
+            self.spin_zoom.value(),
+            rings=self.spin_rings.value(),
+            step_px=self.spin_step.value(),
+        )
+        try:
+            rows = self.db.get_known_complexes_in_bounds(bounds, asset_types=asset_types)
+        except Exception:
+            return 0
+        for row in rows:
+            self._on_discovered_complex(dict(row, db_status="known"))
+        if rows:
+            self.append_log(f"🗂 이전 탐색에서 알려진 단지 {len(rows)}개를 먼저 표시합니다.", 10)
+        return len(rows)
+
     def _on_discovered_complex(self, payload: dict):
         asset_type = str(payload.get("asset_type", "") or "")
         complex_id = str(payload.get("complex_id", "") or "")
@@ -365,6 +394,8 @@ class GeoCrawlerTab(CrawlerTab):
             status = "유지"
         elif status == "error":
             status = "오류"
+        elif status == "known":
+            status = "이전"
         self.discovered_table.setItem(row, 0, QTableWidgetItem(status))
         self.discovered_table.setItem(row, 1, QTableWidgetItem(asset_type))
         self.discovered_table.setItem(row, 2, QTableWidgetItem(str(payload.get("complex_name", ""))))
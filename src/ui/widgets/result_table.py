@@ -0,0 +1,518 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Set
+from typing import AbstractSet, Any, Callable, Iterator, NamedTuple, Optional, Sequence
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+
+
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+PAYLOAD_ROLE = Qt.ItemDataRole.UserRole
+
+
+class ResultRecord(NamedTuple):
+    """결과 한 행을 모델에 넣기 위한 입력값. 모델은 이 튜플 자체를 보관하지 않는다."""
+
+    texts: Sequence[str]
+    payload: dict
+    searchable: str
+    sort_values: dict
+
+
+class _TokenVocab:
+    """토큰 사전 한 조각. ``"\n"`` 으로 이어 붙인 문자열에서 ``str.find`` 로 토큰을 찾는다."""
+
+    def __init__(self):
+        self._blob = "\n"
+        self._offsets: list[int] = []
+        self._tokens: list[str] = []
+        self._pending: list[str] = []
+
+    def add(self, token: str) -> None:
+        self._pending.append(token)
+
+    def _sync(self) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        offset = len(self._blob)
+        for token in pending:
+            self._offsets.append(offset)
+            offset += len(token) + 1
+        self._tokens.extend(pending)
+        self._blob += "\n".join(pending) + "\n"
+        self._pending = []
+
+    def find(self, term: str, *, prefix: bool = False, limit: Optional[int] = None) -> Optional[list[str]]:
+        """``term`` 을 포함하는 토큰 목록. ``limit`` 개를 넘으면 None을 반환한다."""
+        self._sync()
+        blob = self._blob
+        offsets = self._offsets
+        tokens = self._tokens
+        needle = "\n" + term if prefix else term
+        shift = 1 if prefix else 0
+        found = []
+        pos = blob.find(needle)
+        while pos >= 0:
+            slot = bisect_right(offsets, pos + shift) - 1
+            token = tokens[slot]
+            found.append(token)
+            if limit is not None and len(found) > limit:
+                return None
+            # 같은 토큰 안의 중복 일치는 건너뛰고 다음 토큰부터 찾는다.
+            pos = blob.find(needle, offsets[slot] + len(token))
+        return found
+
+
+class _SubstringMatches(Set):
+    """질의를 원문에 포함하는 행 ID의 지연 집합.
+
+    선택도가 낮은 질의는 결과 집합을 만드는 비용이 행 수에 비례하므로, 소속 여부를 물을 때
+    행 원문을 바로 확인한다. 필터는 어차피 행마다 한 번씩 묻기 때문에 선형 스캔이 그 순회에
+    합쳐진다.
+    """
+
+    __slots__ = ("_query", "_texts")
+
+    def __init__(self, query: str, texts: dict[int, str]):
+        self._query = query
+        self._texts = texts
+
+    def __contains__(self, row_id: object) -> bool:
+        text = self._texts.get(row_id)  # type: ignore[call-overload]
+        return text is not None and self._query in text
+
+    def __iter__(self) -> Iterator[int]:
+        query = self._query
+        return (row_id for row_id, text in list(self._texts.items()) if query in text)
+
+    def __len__(self) -> int:
+        return sum(1 for _row_id in self)
+
+
+class ResultSearchIndex:
+    """결과 검색 문자열의 공백 토큰 역색인 (토큰 → 행 ID 집합).
+
+    토큰 사전은 ASCII 토큰과 한글 등 비ASCII 토큰을 따로 이어 붙인 문자열로 유지한다.
+    부분 문자열은 ``str.find`` 로 찾고 토큰 시작 오프셋을 이분 탐색해 어떤 토큰에 걸렸는지
+    알아낸다. 한글이 섞인 질의는 비ASCII 사전만 훑으므로 매물ID 같은 대량의 ASCII 토큰에
+    영향을 받지 않고, 조사·복합어가 붙은 한글 토큰도 토큰 내부 부분 일치로 잡힌다.
+    여러 단어 질의는 단어별 행 집합의 교집합을 후보로 쓰고, 공백을 걸치는 일치는 후보 행의
+    원문으로 다시 확인한다. ``"1"`` 처럼 일치 토큰이 ``MAX_TERM_TOKENS`` 를 넘거나, 여러
+    토큰에 걸쳐 전체 행의 ``1/UNSELECTIVE_ROW_DIVISOR`` 이상을 덮는 단어는 posting 합집합이
+    선형 스캔보다 비싸므로 후보 계산에서 빼고, 모든 단어가 그렇다면 원문을 바로 확인하는
+    지연 집합(선형 스캔)을 돌려준다.
+
+    마지막 질의의 결과 집합은 행 추가·교체·삭제 때 바로 갱신하므로, 수집 중 배치가
+    들어와도 같은 검색어로 색인 전체를 다시 훑지 않는다.
+    """
+
+    MAX_TERM_TOKENS = 4096
+    UNSELECTIVE_ROW_DIVISOR = 8
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._row_texts: dict[int, str] = {}
+        self._ascii_vocab = _TokenVocab()
+        self._wide_vocab = _TokenVocab()
+        self._cached_query: Optional[str] = None
+        self._cached_matches: AbstractSet[int] = set()
+        self._cached_shared = False
+        self._cached_live = False
+
+    def __len__(self) -> int:
+        return len(self._row_texts)
+
+    def add(self, row_id: int, text: str) -> None:
+        if row_id in self._row_texts:
+            self.remove(row_id)
+        self._row_texts[row_id] = text
+        query = self._cached_query
+        if query is not None and not self._cached_live and query in text:
+            self._owned_matches().add(row_id)
+        postings = self._postings
+        for token in set(text.split()):
+            ids = postings.get(token)
+            if ids is None:
+                ids = postings[token] = set()
+                (self._ascii_vocab if token.isascii() else self._wide_vocab).add(token)
+            ids.add(row_id)
+
+    def _owned_matches(self) -> set[int]:
+        # 단일 토큰 질의는 posting 집합을 그대로 결과로 공유하다가, 다른 토큰의 행이
+        # 결과에 들어와야 할 때 처음 복사한다. 같은 토큰의 추가·삭제는 공유 집합에 그대로 반영된다.
+        if self._cached_shared:
+            self._cached_matches = set(self._cached_matches)
+            self._cached_shared = False
+        return self._cached_matches  # type: ignore[return-value]
+
+    def remove(self, row_id: int) -> None:
+        text = self._row_texts.pop(row_id, None)
+        if text is None:
+            return
+        for token in set(text.split()):
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(row_id)
+        if not self._cached_live:
+            self._cached_matches.discard(row_id)  # type: ignore[attr-defined]
+
+    def _term_postings(
+        self, term: str, *, prefix: bool = False, limit: Optional[int] = None
+    ) -> Optional[list[set[int]]]:
+        tokens = self._wide_vocab.find(term, prefix=prefix, limit=limit)
+        if tokens is not None and term.isascii():
+            ascii_tokens = self._ascii_vocab.find(
+                term, prefix=prefix, limit=None if limit is None else limit - len(tokens)
+            )
+            tokens = None if ascii_tokens is None else tokens + ascii_tokens
+        if tokens is None:
+            return None
+        postings = self._postings
+        return [ids for ids in (postings.get(token) for token in tokens) if ids]
+
+    def _selective_term_postings(self, term: str) -> Optional[list[set[int]]]:
+        sets = self._term_postings(term, limit=self.MAX_TERM_TOKENS)
+        if sets is None or len(sets) <= 1:
+            # posting 하나는 합집합 없이 그대로 공유·교집합에 쓸 수 있다.
+            return sets
+        if sum(len(ids) for ids in sets) * self.UNSELECTIVE_ROW_DIVISOR > len(self._row_texts):
+            return None
+        return sets
+
+    def term_rows(self, term: str, *, prefix: bool = False) -> set[int]:
+        """``term`` 을 부분 문자열(``prefix=True`` 면 접두어)로 포함하는 토큰의 행 ID 합집합."""
+        if not term:
+            return set(self._row_texts)
+        rows: set[int] = set()
+        for ids in self._term_postings(term, prefix=prefix) or ():
+            rows |= ids
+        return rows
+
+    def search(self, query: str) -> AbstractSet[int]:
+        """소문자 질의를 부분 문자열로 포함하는 행 ID 집합. 호출자는 결과를 수정하지 않는다."""
+        if query == self._cached_query:
+            return self._cached_matches
+        terms = query.split()
+        term_postings = [
+            sets for sets in (self._selective_term_postings(term) for term in set(terms)) if sets is not None
+        ]
+        if not term_postings:
+            self._cached_query = query
+            self._cached_matches = _SubstringMatches(query, self._row_texts)
+            self._cached_shared = False
+            self._cached_live = True
+            return self._cached_matches
+        # 행 수가 가장 적은 단어로 후보를 만들고, 나머지 단어는 후보와의 교집합만 계산한다.
+        term_postings.sort(key=lambda sets: sum(len(ids) for ids in sets))
+        verify = len(terms) > 1 or terms[0] != query
+        if not verify and len(term_postings[0]) == 1:
+            self._cached_query = query
+            self._cached_matches = term_postings[0][0]
+            self._cached_shared = True
+            self._cached_live = False
+            return self._cached_matches
+        matches: set[int] = set()
+        for ids in term_postings[0]:
+            matches |= ids
+        for sets in term_postings[1:]:
+            if not matches:
+                break
+            hits: set[int] = set()
+            for ids in sets:
+                hits |= matches & ids
+            matches = hits
+        if verify:
+            texts = self._row_texts
+            matches = {row_id for row_id in matches if query in texts[row_id]}
+        self._cached_query = query
+        self._cached_matches = matches
+        self._cached_shared = False
+        self._cached_live = False
+        return matches
+
+
+class OrderedRowIndex:
+    """정렬 키 → 표시 행 위치를 답하는 정렬 리스트.
+
+    키는 항상 오름차순 리스트에 두고 ``bisect`` 로 삽입·조회한다. 내림차순 보기는
+    같은 리스트를 뒤집어 읽으며, ``order_key`` 가 순번 부호를 바꿔 두므로 같은 정렬값끼리는
+    ``list.sort(reverse=True)`` 와 마찬가지로 먼저 들어온 행이 위에 온다.
+    ``descriptor`` 는 인덱스를 만든 정렬 기준이며 호출자가 기준 변경을 감지하는 데 쓴다.
+    """
+
+    def __init__(self, keys=(), *, descending: bool = False, descriptor: Any = None):
+        self.descending = bool(descending)
+        self.descriptor = descriptor
+        self._keys: list[tuple] = sorted(keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def order_key(self, value: Any, seq: int) -> tuple:
+        return (value, -seq) if self.descending else (value, seq)
+
+    def _row(self, position: int) -> int:
+        return len(self._keys) - 1 - position if self.descending else position
+
+    def insert(self, key: tuple) -> int:
+        """키를 넣고 그 키가 놓인 표시 행 번호를 반환한다."""
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        return self._row(position)
+
+    def row_of(self, key: tuple) -> int:
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return self._row(position)
+        return -1
+
+
+class ResultTableModel(QAbstractTableModel):
+    """수집 결과를 컬럼 단위 리스트로 보관하는 읽기 전용 테이블 모델.
+
+    셀마다 ``QTableWidgetItem`` 을 만들지 않고 컬럼별 표시 문자열, 숫자 정렬값,
+    행 payload, 검색용 소문자 문자열만 유지한다. ``numeric_columns`` 의 정렬은
+    ``sort_values`` 로 전달된 숫자 값을 사용한다. 검색 문자열은 행마다 안정적인 ID로
+    ``ResultSearchIndex`` 에 색인되어 정렬로 행 순서가 바뀌어도 다시 색인하지 않는다.
+    """
+
+    def __init__(self, headers: Sequence[str], numeric_columns: Sequence[int] = (), parent=None):
+        super().__init__(parent)
+        self._headers = [str(h) for h in headers]
+        self._numeric_columns = tuple(int(c) for c in numeric_columns)
+        self._columns: list[list[str]] = [[] for _ in self._headers]
+        self._sort_columns: dict[int, list[Any]] = {c: [] for c in self._numeric_columns}
+        self._payloads: list[dict] = []
+        self._search_texts: list[str] = []
+        self._row_ids: list[int] = []
+        self._next_row_id = 0
+        self._search_index = ResultSearchIndex()
+
+    # ── Qt model interface ──
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._payloads)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[col][row]
+        if role == SORT_ROLE:
+            return self.sort_value(row, col)
+        if role == PAYLOAD_ROLE:
+            return self._payloads[row]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+            return None
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """컬럼 값으로 저장소 자체를 안정 정렬한다 (동일 값은 기존 순서 유지)."""
+        row_count = len(self._payloads)
+        if row_count <= 1 or not (0 <= column < len(self._headers)):
+            return
+        keys = self._sort_columns.get(column) or self._columns[column]
+        permutation = sorted(
+            range(row_count),
+            key=keys.__getitem__,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self.layoutAboutToBeChanged.emit()
+        self._apply_permutation(permutation)
+        self.layoutChanged.emit()
+
+    # ── store helpers ──
+    def _apply_permutation(self, permutation: list[int]) -> None:
+        old_persistent = self.persistentIndexList()
+        position = [0] * len(permutation)
+        for new_row, old_row in enumerate(permutation):
+            position[old_row] = new_row
+        self._columns = [[column[i] for i in permutation] for column in self._columns]
+        self._sort_columns = {
+            col: [values[i] for i in permutation] for col, values in self._sort_columns.items()
+        }
+        self._payloads = [self._payloads[i] for i in permutation]
+        self._search_texts = [self._search_texts[i] for i in permutation]
+        self._row_ids = [self._row_ids[i] for i in permutation]
+        if old_persistent:
+            new_persistent = [
+                self.index(position[idx.row()], idx.column()) if idx.isValid() else QModelIndex()
+                for idx in old_persistent
+            ]
+            self.changePersistentIndexList(old_persistent, new_persistent)
+
+    def _store_record(self, row: Optional[int], record: ResultRecord) -> None:
+        texts = record.texts
+        sort_values = record.sort_values or {}
+        if row is None:
+            for col, column in enumerate(self._columns):
+                column.append(str(texts[col]) if col < len(texts) else "")
+            for col, values in self._sort_columns.items():
+                values.append(sort_values.get(col, 0))
+            self._payloads.append(record.payload)
+            self._search_texts.append(record.searchable)
+            row_id = self._next_row_id
+            self._next_row_id += 1
+            self._row_ids.append(row_id)
+            self._search_index.add(row_id, record.searchable)
+            return
+        for col, column in enumerate(self._columns):
+            column[row] = str(texts[col]) if col < len(texts) else ""
+        for col, values in self._sort_columns.items():
+            values[row] = sort_values.get(col, 0)
+        self._payloads[row] = record.payload
+        self._search_texts[row] = record.searchable
+        self._search_index.add(self._row_ids[row], record.searchable)
+
+    def append_records(self, records: Sequence[ResultRecord]) -> None:
+        if not records:
+            return
+        start = len(self._payloads)
+        self.beginInsertRows(QModelIndex(), start, start + len(records) - 1)
+        for record in records:
+            self._store_record(None, record)
+        self.endInsertRows()
+
+    def insert_records(self, row: int, records: Sequence[ResultRecord]) -> None:
+        """``row`` 앞에 연속된 행을 끼워 넣는다. 기존 행의 안정 ID와 색인은 그대로 둔다."""
+        if not records:
+            return
+        row = max(0, min(int(row), len(self._payloads)))
+        if row == len(self._payloads):
+            self.append_records(records)
+            return
+        count = len(records)
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        for col, column in enumerate(self._columns):
+            column[row:row] = [str(r.texts[col]) if col < len(r.texts) else "" for r in records]
+        for col, values in self._sort_columns.items():
+            values[row:row] = [(r.sort_values or {}).get(col, 0) for r in records]
+        self._payloads[row:row] = [r.payload for r in records]
+        self._search_texts[row:row] = [r.searchable for r in records]
+        row_ids = list(range(self._next_row_id, self._next_row_id + count))
+        self._next_row_id += count
+        self._row_ids[row:row] = row_ids
+        for row_id, record in zip(row_ids, records):
+            self._search_index.add(row_id, record.searchable)
+        self.endInsertRows()
+
+    def set_record(self, row: int, record: ResultRecord) -> None:
+        if not (0 <= row < len(self._payloads)):
+            return
+        self._store_record(row, record)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def reset_records(self, records: Sequence[ResultRecord] = ()) -> None:
+        self.beginResetModel()
+        self._columns = [[] for _ in self._headers]
+        self._sort_columns = {c: [] for c in self._numeric_columns}
+        self._payloads = []
+        self._search_texts = []
+        self._row_ids = []
+        self._search_index.clear()
+        for record in records:
+            self._store_record(None, record)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.reset_records(())
+
+    def text(self, row: int, column: int) -> str:
+        if 0 <= row < len(self._payloads) and 0 <= column < len(self._headers):
+            return self._columns[column][row]
+        return ""
+
+    def sort_value(self, row: int, column: int):
+        values = self._sort_columns.get(column)
+        if values is not None:
+            return values[row]
+        return self._columns[column][row]
+
+    def payload(self, row: int) -> dict:
+        if 0 <= row < len(self._payloads):
+            return self._payloads[row]
+        return {}
+
+    def payloads(self) -> list[dict]:
+        return self._payloads
+
+    def searchable(self, row: int) -> str:
+        if 0 <= row < len(self._search_texts):
+            return self._search_texts[row]
+        return ""
+
+    def search_matches(self, query: str) -> AbstractSet[int]:
+        """소문자 ``query`` 를 검색 문자열에 포함하는 행의 안정 ID 집합."""
+        return self._search_index.search(query)
+
+    def row_matches(self, row: int, query: str) -> bool:
+        """``query in searchable(row)`` 와 같은 결과를 역색인으로 답한다."""
+        if not (0 <= row < len(self._row_ids)):
+            return False
+        matches = self._search_index.search(query)
+        if isinstance(matches, _SubstringMatches):
+            # 선택도가 낮은 질의는 필터 순회가 곧 선형 스캔이므로 원문을 바로 확인한다.
+            return query in self._search_texts[row]
+        return self._row_ids[row] in matches
+
+
+class ResultFilterProxyModel(QSortFilterProxyModel):
+    """행 단위 predicate(source row → 표시 여부)로 결과를 거르는 proxy.
+
+    정렬은 ``ResultTableModel.sort`` 가 저장소에서 직접 수행하므로 proxy는 필터만 맡는다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_predicate: Optional[Callable[[int], bool]] = None
+        self.setDynamicSortFilter(True)
+
+    def set_row_predicate(self, predicate: Optional[Callable[[int], bool]]) -> None:
+        self._row_predicate = predicate
+        self.refresh_filter()
+
+    def refresh_filter(self) -> None:
+        self.invalidateFilter()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        source = self.sourceModel()
+        if source is not None:
+            source.sort(column, order)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        predicate = self._row_predicate
+        if predicate is None:
+            return True
+        return bool(predicate(source_row))
+
+    def source_row(self, proxy_row: int) -> int:
+        source_index = self.mapToSource(self.index(proxy_row, 0))
+        return source_index.row() if source_index.isValid() else -1
+
+    def source_rows(self) -> list[int]:
+        return [self.source_row(row) for row in range(self.rowCount())]
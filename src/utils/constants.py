@@ -9,6 +9,30 @@ CRAWL_SPEED_PRESETS = {
     "매우 느림": {"min": 8, "max": 12, "desc": "가장 안전"}
 }
 
+# Playwright 엔드포인트별 토큰 버킷 한도 ("보통" 속도 기준 초당 요청 수, 버스트).
+# 데스크톱 페이지 이동(navigation)은 CRAWL_SPEED_PRESETS 간격을 그대로 쓴다.
+PACING_ENDPOINT_LIMITS = {
+    # 버스트는 첫 페이지 + 동시 prefetch 창(MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)을 한 번에 허용한다.
+    "article_api": {"rate": 4.0, "burst": 5},
+    "mobile_detail": {"rate": 3.0, "burst": 3},
+}
+
+# Playwright 단지 모드에서 동시에 수집할 단지(타깃) 워커 수 상한.
+PLAYWRIGHT_MAX_TARGET_WORKERS = 4
+
+# 지도 마커 quadtree 탐색: 타일 마커가 기준 이상이거나 클러스터 마커가 있으면 한 단계 확대해 4분할한다.
+GEO_PLANNER_SPLIT_MARKER_COUNT = 40
+GEO_PLANNER_MAX_DEPTH = 2
+GEO_PLANNER_MAX_ZOOM = 18
+GEO_PLANNER_REQUEST_BUDGET = 120  # (자산, 거래유형) 조합당 마커 타일 요청 상한
+
+# 크롤 통계 UI 전송 최소 간격(ms). 그 사이의 변경은 모아서 바뀐 필드만 보낸다.
+STATS_EMIT_INTERVAL_MS = 250
+
+# 내보내기: 진행률/취소 확인 단위(행)와 백그라운드 스레드로 넘기는 최소 행 수.
+EXPORT_CHUNK_ROWS = 1000
+EXPORT_BACKGROUND_MIN_ROWS = 2000
+
 SHORTCUTS = {
     "start_crawl": "Ctrl+R", "stop_crawl": "Ctrl+Shift+R", 
     "save_excel": "Ctrl+S", "save_csv": "Ctrl+Shift+S",
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from collections.abc import Mapping
 from pathlib import Path
 import os
 import winreg
@@ -96,9 +97,14 @@ class PriceConverter:
     @staticmethod
     def representative_price_int(item, trade_type=None) -> int:
         """Return the comparable price in 만원 for a listing-like payload."""
-        if not isinstance(item, dict):
+        if not isinstance(item, Mapping):
             return 0
-        trade = str(trade_type or item.get("거래유형", item.get("trade_type", "")) or "").strip()
+        item_trade = str(item.get("거래유형", item.get("trade_type", "")) or "").strip()
+        trade = str(trade_type or item_trade or "").strip()
+        # ListingRecord는 정규화 시 계산해 둔 대표 가격을 다시 파싱하지 않는다.
+        parsed = getattr(item, "representative_price", None)
+        if type(parsed) is int and trade == item_trade:
+            return parsed
         if trade == "매매":
             return PriceConverter.to_int(item.get("매매가", item.get("price", "")))
         if trade == "월세":
@@ -11,16 +11,27 @@ from src.utils.logger import get_logger
 logger = get_logger("Paths")
 
 FROZEN_APP_DIR_NAME = "NaverlandScrapperProPlus"
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm")
 RUNTIME_DATA_FILENAMES = (
     "complexes.db",
+    "complexes.db-wal",
+    "complexes.db-shm",
     "settings.json",
     "presets.json",
     "crawl_cache.json",
+    "crawl_cache.db",
+    "crawl_cache.db-wal",
+    "crawl_cache.db-shm",
     "search_history.json",
     "recently_viewed.json",
 )
 
 
+def is_sqlite_sidecar_filename(filename: str) -> bool:
+    """WAL 모드 DB가 옆에 만드는 -wal/-shm 파일인지. 본 DB 파일과 한 단위로 다뤄야 한다."""
+    return str(filename).endswith(SQLITE_SIDECAR_SUFFIXES)
+
+
 def is_frozen_runtime() -> bool:
     return bool(getattr(sys, "frozen", False))
 
@@ -203,6 +214,9 @@ def _migrate_legacy_frozen_runtime_data():
         pass
 
     for filename in RUNTIME_DATA_FILENAMES:
+        if is_sqlite_sidecar_filename(filename):
+            # 본 DB를 backup API로 옮길 때 WAL 내용까지 반영되므로 사이드카는 따로 복사하지 않는다.
+            continue
         source = legacy_data_dir / filename
         target = DATA_DIR / filename
         if not source.exists() or target.exists():
@@ -1,4 +1,5 @@
 import unittest
+from urllib.parse import parse_qs, urlparse
 
 from src.core.services.article_api import (
     DEFAULT_ARTICLE_API_PAGE_SIZE,
@@ -6,9 +7,12 @@ from src.core.services.article_api import (
     article_api_has_more_pages,
     article_api_list_count,
     article_api_path_kind,
+    article_api_prefetch_pages,
     article_api_real_estate_type,
+    article_api_total_pages,
     build_article_api_query_params,
     build_article_api_url,
+    build_single_markers_url,
 )
 
 
@@ -27,6 +31,24 @@ class TestArticleApiHelpers(unittest.TestCase):
         self.assertIn("tradeType=A1", url)
         self.assertIn("realEstateType=APT%3AABYG%3AJGC", url)
 
+    def test_single_markers_url_carries_bbox_and_drops_list_params(self):
+        url = build_single_markers_url(
+            "houses",
+            "전세",
+            "VL",
+            zoom=15,
+            bounds=(126.98, 127.0, 37.56, 37.54),
+        )
+        query = parse_qs(urlparse(url).query, keep_blank_values=True)
+        self.assertTrue(url.startswith("https://new.land.naver.com/api/houses/single-markers/2.0?"))
+        self.assertEqual(query["zoom"], ["15"])
+        self.assertEqual(query["leftLon"], ["126.9800000"])
+        self.assertEqual(query["bottomLat"], ["37.5400000"])
+        self.assertEqual(query["tradeType"], ["B1"])
+        self.assertEqual(query["realEstateType"], ["VL:DDDGG:JWJT:SGJT"])
+        self.assertNotIn("page", query)
+        self.assertNotIn("order", query)
+
     def test_query_params_default_page_is_one(self):
         params = build_article_api_query_params("전세", "APT")
         self.assertEqual(params["page"], "1")
@@ -53,6 +75,18 @@ class TestArticleApiHelpers(unittest.TestCase):
             "post-filter normalized count must not drive pagination termination",
         )
 
+    def test_total_pages_from_total_count(self):
+        self.assertEqual(article_api_total_pages({"totalCount": 41, "articleList": []}), 3)
+        self.assertEqual(article_api_total_pages({"totalCount": 40}), 2)
+        self.assertEqual(article_api_total_pages({"isMoreData": True}), 0)
+        self.assertEqual(article_api_total_pages({"totalCount": "bad"}), 0)
+
+    def test_prefetch_pages_respects_window_total_and_cap(self):
+        self.assertEqual(article_api_prefetch_pages(2, window=4), [2, 3, 4, 5])
+        self.assertEqual(article_api_prefetch_pages(2, window=4, total_pages=3), [2, 3])
+        self.assertEqual(article_api_prefetch_pages(4, window=4, max_pages=5), [4, 5])
+        self.assertEqual(article_api_prefetch_pages(6, window=4, max_pages=5), [])
+
     def test_safety_cap_constant_is_reasonable(self):
         self.assertGreaterEqual(MAX_ARTICLE_API_PAGES, 5)
 
@@ -0,0 +1,105 @@
+import time
+import unittest
+
+from src.core.crawler import CrawlerThread
+from src.core.services.crawl_stats import STAT_FIELDS, CrawlStats
+
+
+class TestCrawlStats(unittest.TestCase):
+    def test_counters_keep_mapping_access_and_extra_keys(self):
+        stats = CrawlStats(total_found=3)
+        stats.incr("total_found")
+        stats.incr("detail_cache_hit_count", 5)
+        stats.incr("fixture_recorded_count")
+        stats["by_trade_type"]["전세"] += 2
+
+        self.assertEqual(stats["total_found"], 4)
+        self.assertEqual(stats.get("detail_cache_hit_count"), 5)
+        self.assertEqual(stats.get("fixture_recorded_count"), 1)
+        self.assertEqual(stats.get("missing_key", "기본"), "기본")
+        self.assertIn("fixture_recorded_count", stats)
+        self.assertEqual(len(dict(stats)), len(STAT_FIELDS) + 1)
+        self.assertFalse(hasattr(stats, "__dict__"))
+
+    def test_delta_contains_only_changed_fields(self):
+        stats = CrawlStats()
+        first = stats.take_delta()
+        self.assertEqual(set(first), set(STAT_FIELDS))
+
+        self.assertEqual(stats.take_delta(), {})
+        stats.incr("total_found")
+        stats["by_trade_type"]["매매"] += 1
+        stats["geo_incomplete_reasons"].append("marker_tile_fail")
+        stats.raise_to("geo_plan_max_depth", 2)
+        stats.raise_to("geo_plan_max_depth", 1)
+
+        delta = stats.take_delta()
+        self.assertEqual(
+            delta,
+            {
+                "total_found": 1,
+                "geo_plan_max_depth": 2,
+                "geo_incomplete_reasons": ["marker_tile_fail"],
+                "by_trade_type": {"매매": 1, "전세": 0, "월세": 0},
+            },
+        )
+        delta["by_trade_type"]["매매"] = 99
+        self.assertEqual(stats["by_trade_type"]["매매"], 1)
+
+
+class TestCrawlerStatsEmission(unittest.TestCase):
+    def _thread(self):
+        return CrawlerThread(
+            targets=[],
+            trade_types=["매매"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=None,
+            cache=None,
+            max_retry_count=0,
+        )
+
+    def test_emit_stats_is_coalesced_within_interval(self):
+        thread = self._thread()
+        emitted = []
+        thread.stats_signal.connect(emitted.append)
+
+        for _ in range(200):
+            thread.stats.incr("response_seen_count")
+            thread.emit_stats()
+
+        self.assertEqual(len(emitted), 1)
+        self.assertEqual(emitted[0]["response_seen_count"], 1)
+        self.assertIn("total_found", emitted[0])
+
+        thread.emit_stats(force=True)
+        self.assertEqual(emitted[-1], {"response_seen_count": 200})
+
+        thread._last_stats_emit_at = time.monotonic() - thread.stats_emit_interval_ms / 1000.0
+        thread.emit_stats()
+        self.assertEqual(len(emitted), 2)
+
+    def test_batch_flush_sends_deferred_stats_without_pending_items(self):
+        thread = self._thread()
+        emitted = []
+        thread.stats_signal.connect(emitted.append)
+
+        thread.emit_stats()
+        thread.stats.incr("response_seen_count")
+        thread.emit_stats()
+        self.assertEqual(len(emitted), 1)
+        self.assertTrue(thread._stats_emit_pending)
+
+        thread._flush_pending_items_if_needed()
+        self.assertEqual(len(emitted), 1)
+
+        thread._flush_pending_items_if_needed(force=True)
+        self.assertEqual(emitted[-1], {"response_seen_count": 1})
+        self.assertFalse(thread._stats_emit_pending)
+
+        thread._flush_pending_items_if_needed(force=True)
+        self.assertEqual(len(emitted), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,25 @@
 import os
 import sys
+import threading
 import time
 import unittest
-from typing import Any
+from typing import Any, cast
 from unittest.mock import patch
 
+from PyQt6.QtCore import Qt
+
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.core.crawler import CrawlerThread
+from src.core.crawler_parts.db_writer import DbWriteBehind
+from src.core.models.crawl_models import ListingRecord, listing_prices
+from src.utils.helpers import PriceConverter
+
+
+def _connect_direct(signal, slot) -> None:
+    """writer 스레드에서 emit 되는 시그널을 이벤트 루프 없이 바로 받는다."""
+    cast(Any, signal).connect(slot, Qt.ConnectionType.DirectConnection)
 
 
 class _DBStub:
@@ -159,6 +170,87 @@ class TestCrawlerRegressions(unittest.TestCase):
         self.assertIn(("매매", "APT"), db.calls)
         self.assertIn(("전세", "APT"), db.calls)
 
+    def test_history_index_preloads_targets_in_one_query(self):
+        class _PreloadDB(_DBStub):
+            def __init__(self):
+                self.preload_calls = []
+
+            def get_article_history_states(self, complex_ids):
+                self.preload_calls.append(list(complex_ids))
+                return [
+                    ("APT", "91001", "매매", "A1", 10000, "1억"),
+                    ("APT", "91002", "월세", "B1", 100, "5000/100"),
+                ]
+
+            def get_article_history_state_bulk(self, *_args, **_kwargs):
+                raise AssertionError("per-scope history query should not run after preload")
+
+        db = _PreloadDB()
+        thread = CrawlerThread(
+            targets=[("단지1", "91001"), ("단지2", "91002")],
+            trade_types=["매매", "월세"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=db,
+            cache=None,
+            max_retry_count=0,
+        )
+
+        self.assertEqual(thread._preload_history_index(), 2)
+        sale_out = thread._enrich_item_with_history_and_alerts(
+            {"단지ID": "91001", "매물ID": "A1", "거래유형": "매매", "매매가": "1억 1,000", "면적(평)": 24.0}
+        )
+        rent_out = thread._enrich_item_with_history_and_alerts(
+            {"단지ID": "91002", "매물ID": "B1", "거래유형": "월세", "보증금": "5000", "월세": "90", "면적(평)": 24.0}
+        )
+        new_out = thread._enrich_item_with_history_and_alerts(
+            {"단지ID": "91002", "매물ID": "B2", "거래유형": "월세", "보증금": "5000", "월세": "90", "면적(평)": 24.0}
+        )
+
+        self.assertEqual(db.preload_calls, [["91001", "91002"]])
+        self.assertEqual(sale_out["price_change"], 1000)
+        self.assertEqual(rent_out["price_change"], -10)
+        self.assertTrue(new_out["is_new"])
+        self.assertEqual(thread.stats["history_index_size"], 2)
+        self.assertGreater(thread.stats["history_index_bytes"], 0)
+
+    def test_cache_hit_warms_history_for_complexes_in_cached_rows(self):
+        class _WarmDB(_DBStub):
+            def __init__(self):
+                self.preload_calls = []
+
+            def get_article_history_states(self, complex_ids):
+                self.preload_calls.append(list(complex_ids))
+                return [("APT", "92001", "매매", "A1", 10000, "1억")]
+
+            def get_article_history_state_bulk(self, *_args, **_kwargs):
+                raise AssertionError("cache warm should load the cached complexes in one query")
+
+        db = _WarmDB()
+        thread = CrawlerThread(
+            targets=[],
+            trade_types=["매매"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=db,
+            cache=None,
+            max_retry_count=0,
+        )
+        cached = [
+            {"단지ID": "92001", "매물ID": "A1", "거래유형": "매매", "매매가": "1억 500"},
+            {"단지ID": "92002", "매물ID": "B1", "거래유형": "매매", "매매가": "2억"},
+            {"단지ID": "92003", "거래유형": "매매", "매매가": "3억"},
+        ]
+
+        self.assertEqual(thread._warm_history_index_for_cache_hit(cached, "매매"), 2)
+        self.assertEqual(thread._warm_history_index_for_cache_hit(cached, "매매"), 0)
+        self.assertEqual(thread._warm_history_index_for_cache_hit([{"단지ID": "92009"}], "매매"), 0)
+        out = thread._enrich_item_with_history_and_alerts(dict(cached[0]))
+
+        self.assertEqual(db.preload_calls, [["92001", "92002"]])
+        self.assertEqual(out["price_change"], 500)
+        self.assertEqual(int(thread.stats.get("history_index_cache_warm_count", 0)), 1)
+
     def test_stats_payload_includes_geo_marker_switch_counts(self):
         thread = CrawlerThread(
             targets=[],
@@ -429,6 +521,235 @@ class TestCrawlerRegressions(unittest.TestCase):
         self.assertEqual(db.scoped_calls, 1)
         self.assertEqual(db.global_calls, 0)
 
+    def test_db_writer_batches_writes_and_barrier_precedes_disappeared_marking(self):
+        class _WriteBehindDB(_DBStub):
+            def __init__(self):
+                self.events = []
+                self.writer_threads = set()
+
+            def get_enabled_alert_rules(self, _complex_id, _trade_type, asset_type=None):
+                return [{"id": 7, "complex_name": "테스트단지", "area_min": 0, "area_max": 100, "price_min": 0, "price_max": 999999999}]
+
+            def upsert_article_history_bulk(self, rows):
+                self.writer_threads.add(threading.get_ident())
+                time.sleep(0.02)
+                self.events.append(("history", len(rows)))
+                return len(rows)
+
+            def record_alert_notification(self, **kwargs):
+                self.writer_threads.add(threading.get_ident())
+                self.events.append(("alert", kwargs["article_id"]))
+                return kwargs["article_id"] != "A2"
+
+            def add_crawl_history(self, *args, **kwargs):
+                self.events.append(("crawl_history", args[1]))
+                return True
+
+            def mark_disappeared_articles_for_targets(self, rows):
+                self.events.append(("disappeared", len(rows)))
+                return 0
+
+        db = _WriteBehindDB()
+        thread = CrawlerThread(
+            targets=[],
+            trade_types=["매매"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=db,
+            cache=None,
+            max_retry_count=0,
+        )
+        emitted = []
+        _connect_direct(thread.alert_triggered_signal, lambda *args: emitted.append(args[-1]))
+        thread._start_db_writer()
+        try:
+            for article_id in ("A1", "A2"):
+                thread._enrich_item_with_history_and_alerts(
+                    {
+                        "단지명": "테스트단지",
+                        "단지ID": "10001",
+                        "매물ID": article_id,
+                        "거래유형": "매매",
+                        "매매가": "5억",
+                        "면적(평)": 30.0,
+                        "자산유형": "APT",
+                    }
+                )
+            thread.record_crawl_history("테스트단지", "10001", "매매", 2)
+            thread._finalize_disappeared_articles({("APT", "10001", "매매")})
+        finally:
+            thread._stop_db_writer()
+
+        self.assertNotIn(threading.get_ident(), db.writer_threads)
+        self.assertEqual(db.events[-1], ("disappeared", 1))
+        self.assertIn(("history", 2), db.events)
+        self.assertLess(db.events.index(("history", 2)), db.events.index(("disappeared", 1)))
+        self.assertIn(("crawl_history", "10001"), db.events)
+        self.assertEqual(emitted, [7])
+        self.assertIsNone(thread._db_writer)
+        self.assertGreaterEqual(int(thread.stats.get("db_write_batch_count", 0)), 1)
+        self.assertIn("db_write_backpressure_count", thread._build_stats_payload())
+
+    def test_alert_notifications_are_batched_and_deduped_on_flush(self):
+        class _AlertDB(_DBStub):
+            def __init__(self):
+                self.bulk_calls = []
+                self.rule_calls = 0
+
+            def get_enabled_alert_rules(self, _complex_id, _trade_type, asset_type=None):
+                self.rule_calls += 1
+                return [
+                    {"id": 3, "complex_name": "큰평형", "area_min": 40, "area_max": 60, "price_min": 0, "price_max": 0},
+                    {"id": 1, "complex_name": "", "area_min": 20, "area_max": 35, "price_min": 40000, "price_max": 60000},
+                    {"id": 2, "complex_name": "", "area_min": 0, "area_max": 0, "price_min": 0, "price_max": 0},
+                ]
+
+            def record_alert_notifications_bulk(self, rows):
+                self.bulk_calls.append(list(rows))
+                return [article_id != "A2" for _alert_id, article_id, _cid, _asset in rows]
+
+        db = _AlertDB()
+        thread = CrawlerThread(
+            targets=[],
+            trade_types=["매매"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=db,
+            cache=None,
+            max_retry_count=0,
+        )
+        emitted = []
+        thread.alert_triggered_signal.connect(lambda *args: emitted.append((args[0], args[-1])))
+        for article_id in ("A1", "A2"):
+            thread._enrich_item_with_history_and_alerts(
+                {
+                    "단지명": "테스트단지",
+                    "단지ID": "10001",
+                    "매물ID": article_id,
+                    "거래유형": "매매",
+                    "매매가": "5억",
+                    "면적(평)": 30.0,
+                    "자산유형": "APT",
+                }
+            )
+        self.assertEqual(emitted, [])
+        thread._flush_history_updates(force=True)
+
+        self.assertEqual(db.rule_calls, 1)
+        self.assertEqual(len(db.bulk_calls), 1)
+        self.assertEqual([row[:2] for row in db.bulk_calls[0]], [(1, "A1"), (2, "A1"), (1, "A2"), (2, "A2")])
+        self.assertEqual(emitted, [("테스트단지", 1), ("테스트단지", 2)])
+
+    def test_db_writer_drains_queued_kinds_in_one_transaction_and_logs_saved_count(self):
+        class _BatchDB(_DBStub):
+            def __init__(self):
+                self.batches = []
+
+            def apply_crawl_write_batch(self, **kwargs):
+                self.batches.append(kwargs)
+                return {
+                    "history_saved": len(kwargs["history_rows"]),
+                    "complex_statuses": ["inserted", "error"],
+                    "alert_flags": [],
+                    "crawl_saved": len(kwargs["crawl_rows"]),
+                }
+
+            def add_complex(self, *_args, **_kwargs):
+                raise AssertionError("batched writes must not fall back to per-kind writes")
+
+        db = _BatchDB()
+        thread = CrawlerThread(
+            targets=[],
+            trade_types=["매매"],
+            area_filter={"enabled": False},
+            price_filter={"enabled": False},
+            db=db,
+            cache=None,
+            max_retry_count=0,
+        )
+        logs = []
+        statuses = []
+        _connect_direct(thread.log_signal, lambda msg, _level: logs.append(msg))
+        _connect_direct(
+            thread.discovered_complex_signal,
+            lambda payload: statuses.append((payload["complex_id"], payload["db_status"])),
+        )
+        thread._start_db_writer()
+        try:
+            for cid in ("20001", "20002"):
+                thread.register_discovered_complex({"complex_id": cid, "complex_name": f"단지{cid}", "asset_type": "APT"})
+            self.assertEqual(thread._flush_discovered_complex_registrations(), 0)
+            thread._db_write_barrier()
+        finally:
+            thread._stop_db_writer()
+
+        self.assertIn(("20001", "inserted"), statuses)
+        self.assertIn(("20002", "error"), statuses)
+        self.assertIn("   geo discovered complexes registered: 1", logs)
+
+        db.batches.clear()
+        thread._apply_db_write_batch(
+            [
+                ("history", [{"article_id": "A1", "complex_id": "10001"}]),
+                ("discovered_complexes", {"APT:20003": {"complex_id": "20003", "complex_name": "단지", "asset_type": "APT"}}),
+                ("crawl_history", (("테스트단지", "10001", "매매", 1), {})),
+                ("history", [{"article_id": "A2", "complex_id": "10001"}]),
+            ]
+        )
+        self.assertEqual(len(db.batches), 1)
+        self.assertEqual([row["article_id"] for row in db.batches[0]["history_rows"]], ["A1", "A2"])
+        self.assertEqual(db.batches[0]["complexes"], [("단지", "20003", "APT")])
+        self.assertEqual(len(db.batches[0]["crawl_rows"]), 1)
+
+    def test_db_write_barrier_logs_when_flush_times_out(self):
+        thread = self._build_thread(price_filter={"enabled": False})
+        release = threading.Event()
+
+        def _blocking_handler(_batch) -> None:
+            release.wait(2)
+
+        writer = DbWriteBehind(_blocking_handler)
+        writer.start()
+        thread._db_writer = writer
+        logs = []
+        _connect_direct(thread.log_signal, lambda msg, level: logs.append((msg, level)))
+        try:
+            writer.submit("history", [])
+            with patch("src.core.crawler.DB_WRITE_FLUSH_TIMEOUT_SEC", 0.05):
+                thread._db_write_barrier()
+        finally:
+            release.set()
+            thread._stop_db_writer()
+
+        self.assertTrue(any("시간 초과" in msg and level == 30 for msg, level in logs))
+
+    def test_db_writer_reports_backpressure_when_queue_is_full(self):
+        release = threading.Event()
+        processed = []
+
+        def _handler(batch):
+            release.wait(2)
+            processed.extend(payload for _kind, payload in batch)
+
+        writer = DbWriteBehind(_handler, max_queue=1, batch_max=1)
+        writer.start()
+        try:
+            writer.submit("history", 1)
+            time.sleep(0.05)
+            writer.submit("history", 2)
+            timer = threading.Timer(0.05, release.set)
+            timer.start()
+            writer.submit("history", 3)
+            self.assertTrue(writer.flush(timeout=2))
+        finally:
+            release.set()
+            writer.close(timeout=2)
+
+        snapshot = writer.snapshot()
+        self.assertEqual(processed, [1, 2, 3])
+        self.assertEqual(snapshot["db_write_backpressure_count"], 1)
+        self.assertEqual(snapshot["db_write_queue_depth"], 0)
+
     def test_blocked_page_detection_signal(self):
         thread = self._build_thread(price_filter={"enabled": False})
         signal = thread._detect_block_signal("Access Denied", "<html>captcha required</html>")
@@ -648,6 +969,127 @@ class TestCrawlerRegressions(unittest.TestCase):
         self.assertEqual(matched, 1)
         self.assertEqual(int(thread.stats.get("total_found", 0)), 1)
         self.assertEqual(len(thread.collected_data), 1)
+        snapshot_rows = thread.price_snapshot_rows()
+        self.assertEqual(len(snapshot_rows), 1)
+        self.assertEqual(snapshot_rows[0][6], 1)
+        self.assertEqual(snapshot_rows[0][10], 10000)
+
+    def test_process_raw_items_pushes_plain_dicts_with_parsed_price(self):
+        thread = self._build_thread(price_filter={"enabled": False})
+        raw_items = [
+            {
+                "단지명": "테스트단지",
+                "단지ID": "12345",
+                "매물ID": "A-2",
+                "거래유형": "월세",
+                "매매가": "",
+                "보증금": "1억",
+                "월세": "150",
+                "면적(평)": "24",
+                "자산유형": "vl",
+                "raw_flag": True,
+            }
+        ]
+
+        thread._process_raw_items(raw_items, "월세")
+
+        self.assertEqual(len(thread.collected_data), 1)
+        pushed = thread.collected_data[0]
+        self.assertIs(type(pushed), dict)
+        self.assertNotIn("price_int", pushed)
+        self.assertEqual(PriceConverter.representative_price_int(pushed), 150)
+        # 수집 결과에는 원본 값이 그대로 남고, 파이프라인이 붙인 키만 더해진다.
+        self.assertEqual({key: pushed[key] for key in raw_items[0]}, raw_items[0])
+        self.assertEqual(pushed["자산유형"], "vl")
+        self.assertEqual(pushed["면적(평)"], "24")
+
+
+class TestListingRecord(unittest.TestCase):
+    def test_parses_prices_and_areas_once(self):
+        record = ListingRecord(
+            {
+                "단지명": "A",
+                "매물ID": 77,
+                "거래유형": "매매",
+                "매매가": "10억 2,000만",
+                "면적(평)": "34",
+                "면적(㎡)": "112.4",
+            }
+        )
+
+        self.assertEqual(record.sale_price, 102000)
+        self.assertEqual(record.representative_price, 102000)
+        self.assertEqual(record.article_id, "77")
+        self.assertEqual(record.area_pyeong, 34.0)
+        self.assertEqual(record.area_sqm, 112.4)
+        self.assertEqual(listing_prices(record), (102000, 0, 0))
+
+        record["매매가"] = "9억"
+        self.assertEqual(record.sale_price, 90000)
+        self.assertEqual(record.price_text, "9억")
+
+    def test_behaves_like_the_legacy_dict(self):
+        source = {"단지명": "A", "거래유형": "전세", "보증금": "3억", "월세": "", "memo": "x"}
+        record = ListingRecord(source)
+
+        self.assertEqual(record["보증금"], "3억")
+        self.assertEqual(record.get("memo"), "x")
+        self.assertEqual(record.get("missing", "d"), "d")
+        self.assertIn("memo", record)
+        self.assertNotIn("missing", record)
+        self.assertNotIn("매매가", record)
+        self.assertIsNone(record.get("매매가"))
+        self.assertEqual(record.get("매물ID", "none"), "none")
+        with self.assertRaises(KeyError):
+            record["매물ID"]
+        self.assertEqual(dict(record), source)
+        self.assertEqual(len(record), len(source))
+        self.assertEqual(PriceConverter.representative_price_int(record), 30000)
+        record["isNew"] = True
+        record.update({"memo": "y"})
+        self.assertEqual(record["memo"], "y")
+        del record["isNew"]
+        self.assertNotIn("isNew", record)
+
+        as_dict = record.to_dict()
+        self.assertIs(type(as_dict), dict)
+        self.assertEqual(as_dict, dict(source, memo="y"))
+        del record["월세"]
+        self.assertNotIn("월세", record)
+        self.assertEqual(record.monthly_rent, 0)
+        self.assertEqual(dict(record.copy()), dict(record))
+
+    def test_round_trips_the_source_values(self):
+        source = {"단지ID": 12345, "면적(평)": "25.3", "면적(㎡)": None, "층/방향": None, "자산유형": "vl"}
+        record = ListingRecord(source)
+
+        self.assertEqual(dict(record), source)
+        self.assertEqual(record.to_dict(), source)
+        self.assertEqual(record.complex_id, "12345")
+        self.assertEqual(record.area_pyeong, 25.3)
+        self.assertEqual(record.area_sqm, 0.0)
+        self.assertEqual(record.asset_type, "VL")
+
+    def test_parses_prices_lazily_and_only_once(self):
+        record = ListingRecord({"거래유형": "매매", "매매가": "5억", "보증금": "1억", "월세": "50"})
+
+        with patch(
+            "src.core.models.crawl_models.PriceConverter.to_int",
+            side_effect=lambda text: 50000 if text == "5억" else 1,
+        ) as to_int:
+            self.assertEqual(record.representative_price, 50000)
+            self.assertEqual(record.sale_price, 50000)
+            self.assertEqual(to_int.call_count, 1)
+            record["매매가"] = "5억"
+            self.assertEqual(record.sale_price, 50000)
+            self.assertEqual(to_int.call_count, 2)
+
+    def test_uses_slots_instead_of_instance_dict(self):
+        record = ListingRecord({"단지명": "A", "매매가": "1억"})
+
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.unexpected = 1  # type: ignore[attr-defined]
 
 
 if __name__ == "__main__":
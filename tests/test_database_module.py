@@ -1,6 +1,7 @@
 import os
 import sqlite3
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -221,6 +222,79 @@ class TestComplexDatabase(unittest.TestCase):
         self.assertEqual(int(apt_rows[0][5]), 11000)
         self.assertEqual(int(vl_rows[0][5]), 22000)
 
+    def test_get_article_history_states_loads_many_complexes(self):
+        self.db.upsert_article_history_bulk(
+            [
+                {"article_id": "S1", "complex_id": "74001", "trade_type": "매매", "price": 10000, "price_text": "1억"},
+                {"article_id": "S2", "complex_id": "74002", "trade_type": "월세", "price": 90,
+                 "price_text": "5000/90", "asset_type": "VL"},
+                {"article_id": "S3", "complex_id": "74003", "trade_type": "전세", "price": 30000, "price_text": "3억"},
+            ]
+        )
+
+        rows = self.db.get_article_history_states(["74001", "74002", "74001", ""])
+
+        self.assertEqual(
+            sorted(rows),
+            [
+                ("APT", "74001", "매매", "S1", 10000, "1억"),
+                ("VL", "74002", "월세", "S2", 90, "5000/90"),
+            ],
+        )
+        self.assertEqual(self.db.get_article_history_states([]), [])
+
+    def test_price_snapshot_quartiles_roundtrip_and_history_rebuild(self):
+        saved = self.db.add_price_snapshots_bulk(
+            [("73001", "매매", 34.0, 10000, 20000, 13200, 5, "APT", "price", 0, 12000, 11000, 13000)]
+        )
+        self.assertEqual(saved, 1)
+
+        rows = self.db.upsert_article_history_bulk(
+            [
+                {"article_id": f"R{idx}", "complex_id": "73002", "trade_type": "매매",
+                 "price": price, "price_text": str(price), "area": 24.0}
+                for idx, price in enumerate((30000, 32000, 34000, 40000))
+            ]
+        )
+        self.assertEqual(rows, 4)
+        self.assertEqual(self.db.rebuild_price_snapshots_from_history(["73002"]), 1)
+
+        conn = self.db._pool.get_connection()
+        try:
+            stored = {
+                row["complex_id"]: tuple(row)[1:]
+                for row in conn.execute(
+                    "SELECT complex_id, item_count, avg_price, median_price, p25_price, p75_price "
+                    "FROM price_snapshots WHERE complex_id IN ('73001', '73002')"
+                ).fetchall()
+            }
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertEqual(stored["73001"], (5, 13200, 12000, 11000, 13000))
+        self.assertEqual(stored["73002"], (4, 34000, 33000, 31500, 35500))
+
+    def test_missing_snapshot_quartiles_are_rebuilt_from_todays_history(self):
+        self.db.add_price_snapshots_bulk([("73101", "매매", 25.0, 30000, 40000, 34000, 4)])
+        self.db.upsert_article_history_bulk(
+            [
+                {"article_id": f"Q{idx}", "complex_id": "73101", "trade_type": "매매",
+                 "price": price, "price_text": str(price), "area": 24.0}
+                for idx, price in enumerate((30000, 32000, 34000, 40000))
+            ]
+        )
+
+        self.assertEqual(self.db.rebuild_missing_price_snapshot_quartiles(), 1)
+        self.assertEqual(self.db.rebuild_missing_price_snapshot_quartiles(), 0)
+
+        conn = self.db._pool.get_connection()
+        try:
+            row = conn.execute(
+                "SELECT median_price, p25_price, p75_price FROM price_snapshots WHERE complex_id = '73101'"
+            ).fetchone()
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertEqual(tuple(row), (33000, 31500, 35500))
+
     def test_add_price_snapshots_bulk_accepts_legacy_and_asset_rows(self):
         saved = self.db.add_price_snapshots_bulk(
             [
@@ -823,6 +897,66 @@ class TestComplexDatabase(unittest.TestCase):
         self.assertTrue(third)
         self.assertTrue(fourth)
 
+    def test_record_alert_notifications_bulk_dedupes_within_and_across_batches(self):
+        self.assertTrue(
+            self.db.record_alert_notification(
+                alert_id=11,
+                article_id="B100",
+                complex_id="C200",
+                asset_type="APT",
+                notified_on="2026-02-21",
+            )
+        )
+        flags = self.db.record_alert_notifications_bulk(
+            [
+                (11, "B100", "C200", "APT"),
+                (11, "B101", "C200", "APT"),
+                (11, "B101", "C200", "APT"),
+                (11, "B101", "C200", "VL"),
+                (0, "B102", "C200", "APT"),
+            ],
+            notified_on="2026-02-21",
+        )
+        self.assertEqual(flags, [False, True, False, True, False])
+        again = self.db.record_alert_notifications_bulk(
+            [(11, "B101", "C200", "APT")],
+            notified_on="2026-02-21",
+        )
+        self.assertEqual(again, [False])
+
+    def test_apply_crawl_write_batch_commits_all_kinds_in_one_transaction(self):
+        self.assertTrue(self.db.add_complex("Existing", "95001"))
+        batch = dict(
+            history_rows=[{"article_id": "W1", "complex_id": "95002", "trade_type": "매매", "price": 10000, "price_text": "1억"}],
+            complexes=[("Existing", "95001", "APT"), ("Found", "95002", "APT")],
+            alert_rows=[(5, "W1", "95002", "APT"), (5, "W1", "95002", "APT")],
+            crawl_rows=[(("Found", "95002", "매매", 1), {"engine": "playwright", "asset_type": "APT"})],
+        )
+
+        result = self.db.apply_crawl_write_batch(**batch)
+
+        self.assertEqual(
+            result,
+            {
+                "history_saved": 1,
+                "complex_statuses": ["existing", "inserted"],
+                "alert_flags": [True, False],
+                "crawl_saved": 1,
+            },
+        )
+        self.assertEqual([row[3] for row in self.db.get_article_history_states(["95002"])], ["W1"])
+        self.assertEqual(self.db.get_crawl_history(limit=1)[0]["complex_id"], "95002")
+
+        with patch.object(self.db, "_insert_crawl_history_row", side_effect=sqlite3.DatabaseError("boom")):
+            failed = self.db.apply_crawl_write_batch(
+                history_rows=[{"article_id": "W2", "complex_id": "95003", "trade_type": "매매", "price": 1, "price_text": "1"}],
+                complexes=[("Rolled", "95003", "APT")],
+                crawl_rows=[(("Rolled", "95003", "매매", 1), {})],
+            )
+        self.assertIsNone(failed)
+        self.assertEqual(self.db.get_article_history_states(["95003"]), [])
+        self.assertNotIn("95003", [str(row[3]) for row in self.db.get_all_complexes()])
+
     def test_get_enabled_alert_rules_respects_asset_scope_and_all(self):
         self.assertTrue(
             self.db.add_alert_setting("88008", "ScopeApt", "매매", 0, 100, 0, 999999, asset_type="APT")
@@ -1044,6 +1178,169 @@ class TestComplexDatabase(unittest.TestCase):
         finally:
             migrated_db.close()
 
+    def test_schema_version_reopen_skips_migrations(self):
+        conn = self.db._pool.get_connection()
+        try:
+            version = conn.cursor().execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertEqual(version, ComplexDatabase._SCHEMA_VERSION)
+        self.db.close()
+
+        with (
+            patch.object(ComplexDatabase, "_create_schema_tables", side_effect=AssertionError("tables")),
+            patch.object(ComplexDatabase, "_ensure_schema_indexes", side_effect=AssertionError("indexes")),
+            patch.object(ComplexDatabase, "_normalize_price_snapshot_rows", side_effect=AssertionError("cleanup")),
+        ):
+            self.db = ComplexDatabase(self.db_path)
+        self.assertTrue(self.db.add_complex("ReopenComplex", "71001"))
+        self.assertEqual(len(self.db.get_all_complexes()), 1)
+
+    def test_asset_scope_backfill_runs_in_resumable_batches(self):
+        self.db.close()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                "INSERT INTO article_history (article_id, complex_id, trade_type, price, asset_type) VALUES (?, ?, '매매', 1000, ?)",
+                [(f"B{i}", "72001", "" if i % 2 else "VL") for i in range(7)],
+            )
+            conn.execute("DROP TABLE schema_backfills")
+            conn.execute("PRAGMA user_version = 4")
+            conn.commit()
+        finally:
+            conn.close()
+
+        with patch.object(ComplexDatabase, "start_schema_backfills", return_value=True) as mock_start:
+            self.db = ComplexDatabase(self.db_path)
+        mock_start.assert_called_once_with()
+        progress = self.db.get_schema_backfill_progress()
+        self.assertEqual(progress["article_history_asset_type"]["target_id"], 7)
+        self.assertFalse(progress["article_history_asset_type"]["done"])
+        self.assertTrue(progress["article_favorites_asset_type"]["done"])
+
+        seen = []
+        self.assertFalse(
+            self.db.run_schema_backfills(
+                batch_rows=3, max_batches=1, progress=lambda name, cur, total: seen.append((name, cur, total))
+            )
+        )
+        self.assertEqual(seen, [("article_history_asset_type", 3, 7)])
+        self.db.close()
+
+        with patch.object(ComplexDatabase, "start_schema_backfills", return_value=True) as mock_start:
+            self.db = ComplexDatabase(self.db_path)
+        mock_start.assert_called_once_with()
+        self.assertTrue(self.db._legacy_asset_scope_predicates)
+        self.assertEqual(len(self.db.get_article_history_state_bulk("72001", "매매", "APT")), 3)
+        self.assertEqual(self.db.get_schema_backfill_progress()["article_history_asset_type"]["cursor_id"], 3)
+        self.assertTrue(self.db.run_schema_backfills(batch_rows=3))
+        progress = self.db.get_schema_backfill_progress()["article_history_asset_type"]
+        self.assertTrue(progress["done"])
+        self.assertEqual(progress["updated_rows"], 3)
+        self.assertFalse(self.db._legacy_asset_scope_predicates)
+        self.assertEqual(len(self.db.get_article_history_state_bulk("72001", "매매", "APT")), 3)
+
+        conn = self.db._pool.get_connection()
+        try:
+            rows = conn.cursor().execute("SELECT asset_type, COUNT(*) FROM article_history GROUP BY asset_type").fetchall()
+            version = conn.cursor().execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertEqual({row[0]: row[1] for row in rows}, {"APT": 3, "VL": 4})
+        self.assertEqual(version, ComplexDatabase._SCHEMA_VERSION)
+
+    def test_start_schema_backfills_is_noop_after_close(self):
+        self.db.close()
+        self.assertTrue(self.db._pool.is_closing)
+        self.assertFalse(self.db.start_schema_backfills(prune_caches=True))
+        self.assertIsNone(getattr(self.db, "_schema_backfill_thread", None))
+
+    def test_schema_background_worker_tolerates_pool_closing(self):
+        self.db._schema_backfill_stop = threading.Event()
+        self.db._pool.close_all()
+        with patch.object(ComplexDatabase, "run_schema_backfills") as mock_run:
+            self.db._schema_background_worker(True)
+        mock_run.assert_not_called()
+
+    def test_schema_background_worker_ignores_pool_closed_mid_run(self):
+        self.db._schema_backfill_stop = threading.Event()
+
+        def _close_then_lease(**_kwargs):
+            self.db._pool.close_all()
+            self.db._pool.get_connection()
+
+        with patch.object(ComplexDatabase, "run_schema_backfills", side_effect=_close_then_lease):
+            self.db._schema_background_worker(False)
+
+    def test_hot_asset_scoped_queries_use_indexes(self):
+        self.assertFalse(self.db._legacy_asset_scope_predicates)
+        statements = []
+        for conn in list(self.db._pool._all_connections.values()):
+            conn.set_trace_callback(statements.append)
+        try:
+            self.db.get_article_history_state_bulk("73001", "매매", "APT")
+            self.db.get_price_snapshots("73001", "매매", asset_type="APT")
+        finally:
+            for conn in list(self.db._pool._all_connections.values()):
+                conn.set_trace_callback(None)
+
+        hot = [sql for sql in statements if "FROM article_history" in sql or "FROM price_snapshots" in sql]
+        self.assertEqual(len(hot), 2)
+        conn = self.db._pool.get_connection()
+        try:
+            plans = [
+                " | ".join(str(row[-1]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall())
+                for sql in hot
+            ]
+        finally:
+            self.db._pool.return_connection(conn)
+
+        for sql, plan in zip(hot, plans):
+            self.assertNotIn("COALESCE(asset_type", sql)
+            self.assertNotIn("SCAN article_history", plan)
+            self.assertNotIn("SCAN price_snapshots", plan)
+        self.assertIn("USING INDEX idx_article_complex (asset_type=? AND complex_id=?)", plans[0])
+        self.assertRegex(plans[1], r"SEARCH price_snapshots USING INDEX idx_price_snapshots_\w+ \(asset_type=\? AND complex_id=\?")
+
+    def test_disappeared_target_queries_run_as_one_indexed_temp_join(self):
+        targets = [("APT", f"D{i:04d}", "매매") for i in range(520)] + [("VL", "D0001", "매매")]
+        statements = []
+        for conn in list(self.db._pool._all_connections.values()):
+            conn.set_trace_callback(statements.append)
+        try:
+            self.db.mark_disappeared_articles_for_targets(targets)
+            self.db.count_disappeared_articles_for_targets(targets)
+        finally:
+            for conn in list(self.db._pool._all_connections.values()):
+                conn.set_trace_callback(None)
+
+        joins = [sql for sql in statements if "article_history" in sql]
+        self.assertEqual(len(joins), 2)
+        self.assertTrue(joins[0].lstrip().startswith("UPDATE article_history"))
+        self.assertIn("SELECT COUNT(*)", joins[1])
+
+        conn = self.db._pool.get_connection()
+        try:
+            c = conn.cursor()
+            self.db._load_disappeared_targets(c, targets)
+            plans = [
+                " | ".join(str(row[-1]) for row in c.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall())
+                for sql in joins
+            ]
+            conn.rollback()
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertIn(
+            "SEARCH h USING COVERING INDEX idx_article_disappeared_scope "
+            "(status=? AND asset_type=? AND complex_id=? AND trade_type=? AND last_seen<?)",
+            plans[0],
+        )
+        self.assertIn(
+            "SEARCH h USING COVERING INDEX idx_article_disappeared_scope "
+            "(status=? AND asset_type=? AND complex_id=? AND trade_type=?)",
+            plans[1],
+        )
+
     def test_migrate_legacy_article_history_and_favorites_asset_scope_schema_creates_backup(self):
         legacy_path = os.path.join(self.tmp.name, "legacy_article_scope.db")
         conn = sqlite3.connect(legacy_path)
@@ -1440,5 +1737,78 @@ class TestComplexDatabase(unittest.TestCase):
         self.assertEqual(int(deduped_rows[0][5]), 16500)
 
 
+    def test_article_detail_cache_roundtrip_scopes_asset_type_and_ttl(self):
+        detail = {"부동산상호": "테스트공인중개사", "_detail_meta": {"detail_parse_state": "success"}}
+        stored = self.db.upsert_article_detail_cache(
+            [
+                ("APT", "D1", "fp-1", detail),
+                ("VL", "D1", "fp-vl", {"부동산상호": "빌라부동산"}),
+                ("APT", "", "fp-empty", detail),
+            ]
+        )
+        self.assertEqual(stored, 2)
+
+        cached = self.db.get_article_detail_cache([("APT", "D1"), ("VL", "D1"), ("APT", "D2")], max_age_seconds=3600)
+        self.assertEqual(set(cached.keys()), {("APT", "D1"), ("VL", "D1")})
+        self.assertEqual(cached[("APT", "D1")][0], "fp-1")
+        self.assertEqual(cached[("APT", "D1")][1]["부동산상호"], "테스트공인중개사")
+        self.assertEqual(cached[("VL", "D1")][1]["부동산상호"], "빌라부동산")
+
+        conn = self.db._pool.get_connection()
+        try:
+            conn.cursor().execute(
+                "UPDATE article_detail_cache SET fetched_at = fetched_at - 7200 WHERE asset_type = 'APT'"
+            )
+            conn.commit()
+        finally:
+            self.db._pool.return_connection(conn)
+
+        expired = self.db.get_article_detail_cache([("APT", "D1"), ("VL", "D1")], max_age_seconds=3600)
+        self.assertEqual(set(expired.keys()), {("VL", "D1")})
+
+        self.db.upsert_article_detail_cache([("APT", "D1", "fp-2", {"부동산상호": "새중개사"})])
+        refreshed = self.db.get_article_detail_cache([("APT", "D1")], max_age_seconds=3600)
+        self.assertEqual(refreshed[("APT", "D1")][0], "fp-2")
+
+    def test_geo_marker_tile_cache_roundtrip_and_bbox_lookup(self):
+        markers = [
+            {"complex_id": "1001", "complex_name": "단지A", "asset_type": "APT", "marker_id": "1001", "count": 7, "lat": 37.561, "lon": 126.989},
+            {"complex_id": "1002", "complex_name": "단지B", "asset_type": "APT", "marker_id": "1002", "count": 2, "lat": 37.70, "lon": 127.20},
+            {"complex_id": "1003", "complex_name": "좌표없음", "asset_type": "APT", "count": 1, "lat": 0, "lon": 0},
+        ]
+        stored = self.db.upsert_geo_marker_tiles(
+            [
+                ("APT", "매매", 15, 10, 20, markers),
+                ("APT", "전세", 15, 10, 20, markers[:1]),
+            ]
+        )
+        self.assertEqual(stored, 2)
+
+        cached = self.db.get_geo_marker_tiles("APT", "매매", 15, [(10, 20), (10, 21), (11, 20)], max_age_seconds=3600)
+        self.assertEqual(set(cached), {(10, 20)})
+        self.assertEqual([m["complex_id"] for m in cached[(10, 20)]], ["1001", "1002", "1003"])
+        self.assertEqual(self.db.get_geo_marker_tiles("VL", "매매", 15, [(10, 20)], max_age_seconds=3600), {})
+        self.assertEqual(self.db.get_geo_marker_tiles("APT", "매매", 16, [(10, 20)], max_age_seconds=3600), {})
+
+        conn = self.db._pool.get_connection()
+        try:
+            conn.cursor().execute("UPDATE geo_marker_tiles SET fetched_at = fetched_at - 7200 WHERE trade_type = '매매'")
+            conn.commit()
+        finally:
+            self.db._pool.return_connection(conn)
+        self.assertEqual(self.db.get_geo_marker_tiles("APT", "매매", 15, [(10, 20)], max_age_seconds=3600), {})
+
+        known = self.db.get_known_complexes_in_bounds((126.98, 127.0, 37.57, 37.55))
+        self.assertEqual([row["complex_id"] for row in known], ["1001"])
+        self.assertEqual(known[0]["count"], 7)
+        self.assertEqual(self.db.get_known_complexes_in_bounds((126.98, 127.0, 37.57, 37.55), asset_types=["VL"]), [])
+
+        self.db.upsert_geo_known_complexes(
+            [{"complex_id": "2001", "complex_name": "빌라C", "asset_type": "VL", "count": 3, "lat": 37.56, "lon": 126.99}]
+        )
+        wide = self.db.get_known_complexes_in_bounds((126.9, 127.3, 37.8, 37.5))
+        self.assertEqual([row["complex_id"] for row in wide], ["1001", "2001", "1002"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,16 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
-from src.core.export import DataExporter, ExcelTemplate, ExportResult, OPENPYXL_AVAILABLE
+import json
+
+from src.core.database import ComplexDatabase
+from src.core.export import (
+    DataExporter,
+    ExcelTemplate,
+    ExportResult,
+    OPENPYXL_AVAILABLE,
+    history_rows_to_export_items,
+)
 from src.utils.helpers import PriceConverter
 
 
@@ -205,6 +214,150 @@ class TestExportModule(unittest.TestCase):
 
         self.assertEqual(values, ["'=cmd", "'+office"])
 
+    @unittest.skipUnless(OPENPYXL_AVAILABLE, "openpyxl not installed")
+    def test_excel_write_only_keeps_styles_with_bounded_named_styles(self):
+        from openpyxl import load_workbook
+
+        data = [
+            {"단지명": f"단지{i}", "거래유형": ("매매", "전세", "월세")[i % 3], "price_change": (i % 3) - 1, "is_new": i % 5 == 0}
+            for i in range(300)
+        ]
+        template = {"order": ["단지명", "거래유형", "가격변동"], "columns": {"단지명": True, "거래유형": True, "가격변동": True}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.xlsx")
+            result = DataExporter(iter(data), chunk_rows=64).export_excel(path, template)
+            self.assertTrue(result.ok)
+            self.assertEqual(result.count, 300)
+            self.assertFalse(os.path.exists(path + ".part"))
+            wb = load_workbook(path)
+            ws = wb.active
+            assert ws is not None
+            header_font = ws.cell(row=1, column=1).font
+            new_fill = ws.cell(row=2, column=1).fill.fgColor.rgb
+            trade_fill = ws.cell(row=3, column=2).fill.fgColor.rgb
+            up_font = ws.cell(row=4, column=3).font.color.rgb
+            freeze = ws.freeze_panes
+            style_names = list(wb.named_styles)
+            max_row = ws.max_row
+            wb.close()
+
+        self.assertTrue(header_font.b)
+        self.assertEqual(new_fill[-6:], "FFF3CD")
+        self.assertEqual(trade_fill[-6:], "CCFFCC")
+        self.assertEqual(up_font[-6:], "FF0000")
+        self.assertEqual(freeze, "A2")
+        self.assertEqual(max_row, 301)
+        self.assertLessEqual(len([name for name in style_names if name.startswith("export_")]), 16)
+
+    def test_csv_and_jsonl_stream_from_generator_with_progress(self):
+        data = ({"단지명": f"단지{i}", "매물ID": str(i), "price_change": 0} for i in range(2500))
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "export.csv")
+            result = DataExporter(data, total=2500).export_csv(
+                csv_path,
+                {"order": ["단지명", "매물ID"], "columns": {"단지명": True, "매물ID": True}},
+                progress=lambda done, total: progress.append((done, total)),
+            )
+            with open(csv_path, newline="", encoding="utf-8-sig") as f:
+                rows = list(csv.DictReader(f))
+
+            jsonl_path = os.path.join(tmp, "export.jsonl")
+            jsonl_result = DataExporter([{"단지명": "A", "is_new": True}, {"단지명": "B"}]).export_jsonl(jsonl_path)
+            with open(jsonl_path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertTrue(result.ok)
+        self.assertEqual(len(rows), 2500)
+        self.assertEqual(rows[-1]["매물ID"], "2499")
+        self.assertEqual(progress, [(1000, 2500), (2000, 2500), (2500, 2500)])
+        self.assertTrue(jsonl_result.ok)
+        self.assertEqual([line["단지명"] for line in lines], ["A", "B"])
+
+    def test_json_stream_keeps_summary_fields(self):
+        data = [{"단지명": "A", "is_new": True, "price_change": 500}, {"단지명": "B", "price_change": 0}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.json")
+            result = DataExporter(iter(data)).export_json(path)
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+
+        self.assertTrue(result.ok)
+        self.assertEqual(payload["total_count"], 2)
+        self.assertEqual(payload["new_count"], 1)
+        self.assertEqual(payload["price_change_count"], 1)
+        self.assertEqual(payload["data"], data)
+        self.assertIn("exported_at", payload)
+
+    def test_cancelled_export_keeps_existing_file_and_removes_partial(self):
+        checks = []
+
+        def _should_cancel():
+            checks.append(True)
+            return len(checks) > 1
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("old")
+            exporter = DataExporter(({"단지명": str(i)} for i in range(5000)), chunk_rows=100)
+            result = exporter.export_csv(path, should_cancel=_should_cancel)
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            leftovers = os.listdir(tmp)
+
+        self.assertFalse(result.ok)
+        self.assertTrue(result.cancelled)
+        self.assertIn("취소", result.error)
+        self.assertEqual(exporter.exported_count, 100)
+        self.assertEqual(content, "old")
+        self.assertEqual(leftovers, ["export.csv"])
+
+
+class TestArticleHistoryExport(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = ComplexDatabase(os.path.join(self._tmp.name, "export.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def test_history_iterator_pages_by_id_and_maps_to_export_columns(self):
+        for i in range(7):
+            self.assertTrue(
+                self.db.update_article_history(
+                    f"A{i}", "1001" if i < 5 else "1002", "테스트단지", "월세" if i == 0 else "매매",
+                    10000 + i, "1000/50" if i == 0 else "1억", 24.0, "3/15", "남향",
+                    extra={"asset_type": "APT"},
+                )
+            )
+
+        all_rows = list(self.db.iter_article_history_rows(batch_size=3))
+        scoped = list(self.db.iter_article_history_rows(complex_id="1001", batch_size=2))
+        items = list(history_rows_to_export_items(scoped))
+
+        self.assertEqual(len(all_rows), 7)
+        self.assertEqual([row["id"] for row in all_rows], sorted(row["id"] for row in all_rows))
+        self.assertEqual(len(items), 5)
+        self.assertEqual((items[0]["보증금"], items[0]["월세"]), ("1000", "50"))
+        self.assertEqual(items[1]["매매가"], "1억")
+        self.assertEqual(items[1]["단지ID"], "1001")
+        self.assertTrue(items[1]["is_new"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.csv")
+            result = DataExporter(
+                history_rows_to_export_items(self.db.iter_article_history_rows(batch_size=2)),
+                total=7,
+            ).export_csv(path)
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                rows = list(csv.DictReader(f))
+
+        self.assertTrue(result.ok)
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[0]["단지명"], "테스트단지")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from typing import Any, cast
+
+from src.core.services.geo_planner import QuadtreeSweepPlanner, child_tiles
+from src.core.services.response_capture import is_cluster_marker
+
+
+class TestQuadtreeSweepPlanner(unittest.TestCase):
+    def test_child_tiles_cover_parent_at_next_zoom(self):
+        self.assertEqual(
+            child_tiles((15, 10, 20)),
+            [(16, 20, 40), (16, 21, 40), (16, 20, 41), (16, 21, 41)],
+        )
+
+    def test_dense_tile_splits_and_children_come_out_densest_first(self):
+        planner = QuadtreeSweepPlanner([(15, 0, 0), (15, 1, 0)], split_marker_count=10, max_depth=2)
+        batch = planner.next_batch(8)
+        self.assertEqual([tile for tile, _depth in batch], [(15, 0, 0), (15, 1, 0)])
+
+        self.assertTrue(planner.record((15, 0, 0), 0, marker_count=12))
+        self.assertTrue(planner.record((15, 1, 0), 0, marker_count=3, cluster_count=2))
+        children = planner.next_batch(8)
+
+        self.assertEqual(len(children), 8)
+        self.assertEqual([tile for tile, _depth in children[:4]], child_tiles((15, 1, 0)))
+        self.assertTrue(all(depth == 1 for _tile, depth in children))
+        self.assertEqual(planner.split_count, 2)
+
+    def test_sparse_tiles_and_depth_limit_stop_descent(self):
+        planner = QuadtreeSweepPlanner([(15, 0, 0)], split_marker_count=10, max_depth=1)
+        planner.next_batch(1)
+        planner.record((15, 0, 0), 0, marker_count=50)
+        for tile, depth in planner.next_batch(4):
+            self.assertFalse(planner.record(tile, depth, marker_count=50))
+
+        self.assertEqual(len(planner), 0)
+        self.assertEqual(planner.max_depth_reached, 1)
+        self.assertEqual(planner.coverage_ratio(), 1.0)
+
+        sparse = QuadtreeSweepPlanner([(18, 0, 0)], split_marker_count=10, max_depth=3, max_zoom=18)
+        sparse.next_batch(1)
+        self.assertFalse(sparse.record((18, 0, 0), 0, marker_count=99))
+        self.assertEqual(len(sparse), 0)
+
+    def test_request_budget_limits_network_and_lowers_coverage(self):
+        planner = QuadtreeSweepPlanner([(15, 0, 0)], split_marker_count=10, request_budget=3)
+        planner.next_batch(1)
+        self.assertTrue(planner.charge_request())
+        planner.record((15, 0, 0), 0, marker_count=20)
+
+        for tile, depth in planner.next_batch(4):
+            if planner.charge_request():
+                planner.record(tile, depth, marker_count=1)
+            else:
+                planner.mark_unresolved(tile, depth)
+
+        self.assertEqual(planner.request_count, 3)
+        self.assertTrue(planner.budget_exhausted)
+        self.assertAlmostEqual(planner.coverage_ratio(), 0.5)
+
+    def test_cluster_marker_detection(self):
+        self.assertTrue(is_cluster_marker({"markerType": "cluster", "complexCount": 1}))
+        self.assertTrue(is_cluster_marker({"complexCount": 7}))
+        self.assertFalse(is_cluster_marker({"complexNo": "1001", "markerType": "COMPLEX"}))
+        self.assertFalse(is_cluster_marker(cast(Any, "not-a-marker")))
+
+
+if __name__ == "__main__":
+    unittest.main()
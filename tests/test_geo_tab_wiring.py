@@ -112,6 +112,43 @@ class TestGeoTabWiring(unittest.TestCase):
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_geo_tab_prefills_known_complexes_inside_sweep_bounds(self):
+        from src.core.database import ComplexDatabase
+
+        try:
+            from src.ui.widgets.geo_crawler_tab import GeoCrawlerTab
+        except ImportError as exc:
+            if "_imaging" in str(exc):
+                self.skipTest("Pillow DLL blocked in this environment")
+            raise
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "geo_known.db"))
+            db.upsert_geo_known_complexes(
+                [
+                    {"complex_id": "1001", "complex_name": "근처단지", "asset_type": "APT", "count": 4, "lat": 37.551, "lon": 126.991},
+                    {"complex_id": "1002", "complex_name": "먼단지", "asset_type": "APT", "count": 9, "lat": 35.1, "lon": 129.0},
+                ]
+            )
+            tab = GeoCrawlerTab(db)
+            tab.spin_lat.setValue(37.55)
+            tab.spin_lon.setValue(126.99)
+            tab.check_trade.setChecked(True)
+
+            with (
+                patch("src.ui.widgets.geo_crawler_tab.settings.get", side_effect=lambda key, default=None: default),
+                patch("src.ui.widgets.geo_crawler_tab.CrawlerThread"),
+            ):
+                tab.start_crawling()
+
+            self.assertEqual(tab.discovered_table.rowCount(), 1)
+            self.assertEqual(_table_text(tab.discovered_table, 0, 0), "이전")
+            self.assertEqual(_table_text(tab.discovered_table, 0, 2), "근처단지")
+
+            db.close()
+            tab.deleteLater()
+            self._qt_app.processEvents()
+
     def test_geo_tab_disables_retry_when_retry_setting_off(self):
         from src.core.database import ComplexDatabase
 
@@ -0,0 +1,54 @@
+import unittest
+
+from src.core.services.history_index import ArticleHistoryIndex, comparable_history_price
+
+
+class TestArticleHistoryIndex(unittest.TestCase):
+    def test_comparable_price_uses_rent_for_monthly_rows(self):
+        self.assertEqual(comparable_history_price("2억/100", "월세"), 100)
+        self.assertEqual(comparable_history_price("2억", "월세"), 20000)
+        self.assertEqual(comparable_history_price("10억", "매매"), 100000)
+        self.assertEqual(comparable_history_price("", "매매", fallback=777), 777)
+
+    def test_rows_are_scoped_by_asset_complex_and_trade(self):
+        index = ArticleHistoryIndex()
+        loaded = index.load_rows(
+            [
+                ("APT", "C1", "매매", "A1", 10000, "1억"),
+                ("APT", "C1", "월세", "A1", 100, "5000/100"),
+                ("VL", "C1", "매매", "A1", 8000, "8000"),
+                ("", "C2", "전세", "B1", 0, "3억"),
+            ]
+        )
+
+        self.assertEqual(loaded, 4)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.lookup("APT", "C1", "매매", "A1"), 10000)
+        self.assertEqual(index.lookup("APT", "C1", "월세", "A1"), 100)
+        self.assertEqual(index.lookup("VL", "C1", "매매", "A1"), 8000)
+        self.assertEqual(index.lookup("APT", "C2", "전세", "B1"), 30000)
+        self.assertIsNone(index.lookup("APT", "C1", "전세", "A1"))
+        self.assertIsNone(index.lookup("APT", "C1", "매매", "missing"))
+
+    def test_article_ids_are_interned_once_across_scopes(self):
+        index = ArticleHistoryIndex()
+        index.record("APT", "C1", "매매", "A1", 100)
+        index.record("APT", "C1", "전세", "A1", 50)
+        index.record("APT", "C1", "매매", "A1", 120)
+
+        self.assertEqual(index.intern("A1"), 0)
+        self.assertEqual(index.intern("A2"), 1)
+        self.assertEqual(index.lookup("APT", "C1", "매매", "A1"), 120)
+        self.assertEqual(len(index), 2)
+
+    def test_memory_footprint_grows_with_entries(self):
+        index = ArticleHistoryIndex()
+        empty_bytes = index.memory_bytes()
+        index.load_rows(("APT", "C1", "매매", f"A{i}", 10000 + i, "") for i in range(2000))
+
+        self.assertGreater(index.memory_bytes(), empty_bytes)
+        self.assertLess(index.memory_bytes(), 2000 * 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ import sys
 import tempfile
 import unittest
 import json
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -83,7 +85,7 @@ class TestCacheAndManagers(unittest.TestCase):
     def test_crawl_cache_write_back_flush(self):
         cache_path = self.tmp_path / "crawl_cache.json"
         with patch("src.core.cache.CACHE_PATH", cache_path):
-            cache = CrawlCache(ttl_minutes=30, write_back_interval_sec=999, max_entries=2000)
+            cache = CrawlCache(ttl_minutes=30, write_back_interval_sec=999, max_entries=2000, backend="json")
             with patch.object(cache, "_save", wraps=cache._save) as mock_save:
                 for i in range(10):
                     cache.set(f"1{i}", "매매", [{"id": i}])
@@ -103,7 +105,7 @@ class TestCacheAndManagers(unittest.TestCase):
         cache_path.write_text(json.dumps(legacy_payload, ensure_ascii=False), encoding="utf-8")
 
         with patch("src.core.cache.CACHE_PATH", cache_path):
-            cache = CrawlCache(ttl_minutes=30)
+            cache = CrawlCache(ttl_minutes=30, backend="json")
             data = cache.get("12345", "매매")
             assert data is not None
             self.assertEqual(data[0]["id"], 7)
@@ -137,6 +139,7 @@ class TestCacheAndManagers(unittest.TestCase):
             self.assertTrue(settings.get("playwright_article_api_fast_path"))
             self.assertEqual(settings.get("playwright_article_api_timeout_ms"), 2500)
             self.assertEqual(settings.get("playwright_article_response_wait_ms"), 1200)
+            self.assertEqual(settings.get("playwright_target_workers"), 1)
             self.assertTrue(settings.get("geo_incomplete_safety_mode"))
             self.assertFalse(settings.get("startup_lazy_noncritical_tabs"))
             self.assertTrue(settings.get("compact_duplicate_listings"))
@@ -288,7 +291,7 @@ class TestCacheAndManagers(unittest.TestCase):
         cache_path.write_text("{broken", encoding="utf-8")
 
         with patch("src.core.cache.CACHE_PATH", cache_path):
-            cache = CrawlCache(ttl_minutes=30)
+            cache = CrawlCache(ttl_minutes=30, backend="json")
             self.assertIsNone(cache.get("12345", "매매"))
             backups = list(self.tmp_path.glob("crawl_cache.json.broken.crawl_cache.*"))
             self.assertEqual(len(backups), 1)
@@ -300,6 +303,77 @@ class TestCacheAndManagers(unittest.TestCase):
         self.assertIn("12345_매매", stored)
         self.assertFalse((self.tmp_path / "crawl_cache.json.tmp").exists())
 
+    def test_crawl_cache_sqlite_backend_writes_per_key_and_loads_payload_lazily(self):
+        cache_path = self.tmp_path / "crawl_cache.json"
+        with patch("src.core.cache.CACHE_PATH", cache_path):
+            cache = CrawlCache(ttl_minutes=30, write_back_interval_sec=999)
+            self.assertEqual(cache.get_stats()["backend"], "sqlite")
+            cache.set("12345", "매매", [{"id": 1}], mode="complex", asset_type="APT")
+            cache.set("67890", "전세", [{"id": 2}])
+            cache.flush()
+            with patch.object(cache._backend, "write", wraps=cache._backend.write) as mock_write:
+                cache.set("67890", "전세", [{"id": 3}])
+                cache.flush()
+                dirty_keys = mock_write.call_args.args[1]
+            self.assertEqual(dirty_keys, {"67890_전세"})
+            cache.close()
+            self.assertFalse(cache_path.exists())
+
+            reopened = CrawlCache(ttl_minutes=30)
+            try:
+                self.assertEqual(reopened.get_stats()["total_entries"], 2)
+                self.assertNotIn("raw_items", reopened._cache["67890_전세"])
+                self.assertEqual(reopened.get("67890", "전세"), [{"id": 3}])
+                self.assertEqual(
+                    reopened.get("12345", "매매", mode="complex", asset_type="APT"),
+                    [{"id": 1}],
+                )
+                self.assertIsNone(reopened.get("12345", "매매"))
+            finally:
+                reopened.close()
+
+    def test_crawl_cache_sqlite_backend_creates_db_file_on_first_write(self):
+        cache_path = self.tmp_path / "crawl_cache.json"
+        db_path = cache_path.with_suffix(".db")
+        with patch("src.core.cache.CACHE_PATH", cache_path):
+            cache = CrawlCache(ttl_minutes=30, write_back_interval_sec=999)
+            try:
+                self.assertIsNone(cache.get("12345", "매매"))
+                cache.flush()
+                self.assertFalse(db_path.exists())
+                cache.set("12345", "매매", [{"id": 1}])
+                cache.flush()
+                self.assertTrue(db_path.exists())
+            finally:
+                cache.close()
+
+    def test_crawl_cache_sqlite_backend_imports_legacy_json_and_compacts_expired(self):
+        cache_path = self.tmp_path / "crawl_cache.json"
+        legacy_payload = {
+            "12345_매매": {"cached_at": datetime.now().isoformat(), "items": [{"id": 7}]},
+            "55555_매매": {"cached_at": "2000-01-01T00:00:00", "raw_items": [{"id": 8}]},
+        }
+        cache_path.write_text(json.dumps(legacy_payload, ensure_ascii=False), encoding="utf-8")
+
+        with patch("src.core.cache.CACHE_PATH", cache_path):
+            cache = CrawlCache(ttl_minutes=30)
+            try:
+                self.assertFalse(cache_path.exists())
+                self.assertEqual(cache.get("12345", "매매"), [{"id": 7}])
+                self.assertIsNone(cache.get("55555", "매매"))
+            finally:
+                cache.close()
+
+            reopened = CrawlCache(ttl_minutes=30)
+            try:
+                with closing(sqlite3.connect(str(cache_path.with_suffix(".db")))) as conn:
+                    rows = conn.execute("SELECT cache_key FROM crawl_cache").fetchall()
+                self.assertEqual([row[0] for row in rows], ["12345_매매"])
+                reopened.clear()
+                self.assertIsNone(reopened.get("12345", "매매"))
+            finally:
+                reopened.close()
+
 
 if __name__ == "__main__":
     unittest.main()
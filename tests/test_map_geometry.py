@@ -2,9 +2,14 @@ import math
 import unittest
 
 from src.core.services.map_geometry import (
+    DEFAULT_VIEWPORT_PX,
     build_grid_sweep_coords,
+    build_marker_tile_keys,
+    build_marker_tiles,
     clamp_korea,
     ll_to_pixel,
+    marker_tile_bounds,
+    marker_tile_xy,
     pixel_to_ll,
 )
 
@@ -24,6 +29,31 @@ class TestMapGeometry(unittest.TestCase):
         for lat, lon in coords:
             self.assertEqual((lat, lon), clamp_korea(lat, lon))
 
+    def test_marker_tiles_cover_every_drag_sweep_viewport(self):
+        lat, lon, zoom, rings, step_px = 37.5608, 126.9888, 15, 3, 480
+        tiles = build_marker_tiles(lat, lon, zoom, rings=rings, step_px=step_px)
+        coords = build_grid_sweep_coords(lat, lon, zoom, rings=rings, step_px=step_px)
+        self.assertLess(len(tiles), len(coords))
+        half_w, half_h = DEFAULT_VIEWPORT_PX[0] / 2 - 1, DEFAULT_VIEWPORT_PX[1] / 2 - 1
+        for c_lat, c_lon in coords:
+            x, y = ll_to_pixel(c_lat, c_lon, zoom)
+            for dx, dy in ((-half_w, -half_h), (half_w, half_h), (-half_w, half_h), (half_w, -half_h)):
+                p_lat, p_lon = pixel_to_ll(x + dx, y + dy, zoom)
+                self.assertTrue(
+                    any(left <= p_lon <= right and bottom <= p_lat <= top for left, right, top, bottom in tiles),
+                    (p_lat, p_lon),
+                )
+
+    def test_marker_tiles_snap_to_fixed_grid(self):
+        near = build_marker_tile_keys(37.5608, 126.9888, 15, rings=0)
+        shifted = build_marker_tile_keys(37.5612, 126.9893, 15, rings=0)
+        self.assertLessEqual(len(near), 4)
+        self.assertTrue(set(near) & set(shifted))
+        tile_x, tile_y = marker_tile_xy(37.5608, 126.9888, 15)
+        self.assertIn((tile_x, tile_y), near)
+        left, right, top, bottom = marker_tile_bounds(tile_x, tile_y, 15)
+        self.assertTrue(left <= 126.9888 <= right and bottom <= 37.5608 <= top)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import time
+import unittest
+
+if os.environ.get("NAVERLAND_SKIP_PLAYWRIGHT_TESTS", "").strip().lower() in {"1", "true", "yes", "on"}:
+    raise unittest.SkipTest("Playwright engine tests are skipped in this CI environment")
+
+from src.core.engines.playwright_parts.runtime_parts.pacing import AsyncTokenBucket, EndpointPacer
+from src.utils.constants import CRAWL_SPEED_PRESETS
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAsyncTokenBucket(unittest.IsolatedAsyncioTestCase):
+    def test_reserve_allows_burst_then_spaces_requests(self):
+        clock = _FakeClock()
+        bucket = AsyncTokenBucket(1.0, 1.0, burst=3, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0, 1.0, 2.0])
+        clock.now += 10.0
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0.0, 0.0, 0.0, 1.0])
+
+    def test_reserve_jitters_within_interval_range(self):
+        clock = _FakeClock()
+        bucket = AsyncTokenBucket(3.0, 5.0, clock=clock)
+
+        bucket.reserve()
+        for _ in range(20):
+            wait = bucket.reserve()
+            self.assertGreaterEqual(wait, 3.0)
+            clock.now += wait
+        self.assertLessEqual(clock.now - 100.0, 20 * 5.0)
+
+    async def test_waiting_does_not_block_other_coroutines(self):
+        bucket = AsyncTokenBucket.per_second(4.0)
+        ticks = 0
+        done = asyncio.Event()
+
+        async def _ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(_ticker())
+        started = time.perf_counter()
+        self.assertTrue(await bucket.acquire())
+        self.assertTrue(await bucket.acquire())
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ticker
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertGreater(ticks, 10)
+        self.assertGreater(bucket.wait_seconds_total, 0.2)
+        self.assertGreater(bucket.effective_rps, 2.0)
+        self.assertLess(bucket.effective_rps, 6.0)
+
+    async def test_stop_request_interrupts_wait(self):
+        bucket = AsyncTokenBucket(30.0)
+        self.assertTrue(await bucket.acquire())
+        stop = {"value": False}
+
+        async def _request_stop():
+            await asyncio.sleep(0.05)
+            stop["value"] = True
+
+        stopper = asyncio.create_task(_request_stop())
+        started = time.perf_counter()
+        acquired = await bucket.acquire(lambda: stop["value"])
+        await stopper
+
+        self.assertFalse(acquired)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(bucket.acquired_count, 1)
+
+
+class TestEndpointPacer(unittest.IsolatedAsyncioTestCase):
+    def test_speed_preset_drives_navigation_interval_and_api_scale(self):
+        normal = EndpointPacer.for_speed("보통", navigation_slots=2)
+        slow = EndpointPacer.for_speed("매우 느림")
+
+        navigation = normal.bucket("navigation")
+        assert navigation is not None
+        self.assertEqual(navigation.burst, 2)
+        self.assertAlmostEqual(navigation.min_interval, CRAWL_SPEED_PRESETS["보통"]["min"] / 2)
+        self.assertAlmostEqual(navigation.max_interval, CRAWL_SPEED_PRESETS["보통"]["max"] / 2)
+        normal_api = normal.bucket("article_api")
+        slow_api = slow.bucket("article_api")
+        assert normal_api is not None and slow_api is not None
+        self.assertGreater(slow_api.min_interval, normal_api.min_interval)
+
+    async def test_export_stats_reports_counts_wait_and_rps(self):
+        pacer = EndpointPacer({"mobile_detail": AsyncTokenBucket.per_second(20.0)})
+        for _ in range(3):
+            self.assertTrue(await pacer.acquire("mobile_detail"))
+        self.assertTrue(await pacer.acquire("unknown-family"))
+        stats: dict = {}
+
+        pacer.export_stats(stats)
+
+        self.assertEqual(stats["pacing_mobile_detail_count"], 3)
+        self.assertGreaterEqual(stats["pacing_mobile_detail_wait_ms"], 80)
+        self.assertGreater(stats["pacing_mobile_detail_rps"], 10.0)
+        self.assertEqual(stats["pacing_wait_ms_total"], stats["pacing_mobile_detail_wait_ms"])
+        self.assertNotIn("pacing_navigation_count", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -76,6 +76,49 @@ class TestRuntimePaths(unittest.TestCase):
 
             self._reload_paths()
 
+    def test_ensure_directories_migrates_wal_cache_as_one_unit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            exe_dir = Path(tmp) / "dist"
+            legacy_data_dir = exe_dir / "data"
+            legacy_data_dir.mkdir(parents=True, exist_ok=True)
+            exe_path = exe_dir / "naverland.exe"
+            exe_path.write_text("", encoding="utf-8")
+            appdata_root = Path(tmp) / "LocalAppData"
+            appdata_root.mkdir(parents=True, exist_ok=True)
+
+            legacy_cache = legacy_data_dir / "crawl_cache.db"
+            writer = sqlite3.connect(str(legacy_cache))
+            try:
+                writer.execute("PRAGMA journal_mode=WAL")
+                writer.execute("PRAGMA wal_autocheckpoint=0")
+                writer.execute("CREATE TABLE crawl_cache (cache_key TEXT PRIMARY KEY)")
+                writer.execute("INSERT INTO crawl_cache VALUES ('wal-only')")
+                writer.commit()
+                self.assertTrue((legacy_data_dir / "crawl_cache.db-wal").exists())
+
+                with (
+                    patch.object(sys, "frozen", True, create=True),
+                    patch.object(sys, "executable", str(exe_path)),
+                    patch.dict(os.environ, {"LOCALAPPDATA": str(appdata_root)}, clear=False),
+                ):
+                    paths = self._reload_paths()
+                    self.assertIn("crawl_cache.db-wal", paths.RUNTIME_DATA_FILENAMES)
+                    self.assertIn("crawl_cache.db-shm", paths.RUNTIME_DATA_FILENAMES)
+                    paths.ensure_directories()
+
+                    migrated = paths.DATA_DIR / "crawl_cache.db"
+                    self.assertFalse((paths.DATA_DIR / "crawl_cache.db-shm").exists())
+                    check_conn = sqlite3.connect(str(migrated))
+                    try:
+                        row = check_conn.execute("SELECT cache_key FROM crawl_cache").fetchone()
+                    finally:
+                        check_conn.close()
+                    self.assertEqual(row[0], "wal-only")
+            finally:
+                writer.close()
+
+            self._reload_paths()
+
     def test_frozen_runtime_uses_xdg_data_home_on_linux(self):
         with tempfile.TemporaryDirectory() as tmp:
             exe_dir = Path(tmp) / "dist"
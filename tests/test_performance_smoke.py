@@ -3,6 +3,7 @@ import os
 import tempfile
 import time
 import unittest
+from unittest.mock import patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -15,26 +16,48 @@ class TestPerformanceSmoke(unittest.TestCase):
 
         cls._qt_app = QApplication.instance() or QApplication([])
 
+    def setUp(self):
+        from src.core.database import ComplexDatabase
+
+        # 테스트가 띄운 DB의 스키마 보정 스레드를 모아 두었다가 tearDown 에서 멈춘다.
+        self._schema_backfill_dbs = []
+        start_backfills = ComplexDatabase.start_schema_backfills
+
+        def _tracking_start(db, *args, **kwargs):
+            self._schema_backfill_dbs.append(db)
+            return start_backfills(db, *args, **kwargs)
+
+        patcher = patch.object(ComplexDatabase, "start_schema_backfills", _tracking_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for db in self._schema_backfill_dbs:
+            self.assertTrue(db._stop_schema_backfills())
+
     def test_result_filter_miss_10k_smoke(self):
-        from PyQt6.QtWidgets import QTableWidgetItem
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab
+        from src.ui.widgets.result_table import ResultRecord
 
         with tempfile.TemporaryDirectory() as tmp:
             db = ComplexDatabase(os.path.join(tmp, "perf_filter.db"))
             tab = CrawlerTab(db)
             try:
                 rows = 10000
-                cols = tab.result_table.columnCount()
-                tab.result_table.setRowCount(rows)
-                tab._row_search_cache = []
+                cols = tab.result_model.columnCount()
+                records = []
                 for r in range(rows):
-                    values = []
-                    for c in range(cols):
-                        text = f"row{r} col{c} alpha"
-                        values.append(text)
-                        tab.result_table.setItem(r, c, QTableWidgetItem(text))
-                    tab._row_search_cache.append(" ".join(values).lower())
+                    values = [f"row{r} col{c} alpha" for c in range(cols)]
+                    records.append(
+                        ResultRecord(
+                            texts=values,
+                            payload={},
+                            searchable=" ".join(values).lower(),
+                            sort_values={},
+                        )
+                    )
+                tab.result_model.append_records(records)
 
                 self._qt_app.processEvents()
                 # Warm one no-op pass so Qt lazily-created table/card internals do not
@@ -84,13 +107,92 @@ class TestPerformanceSmoke(unittest.TestCase):
             self._qt_app.processEvents()
             elapsed = time.perf_counter() - start
 
-            self.assertEqual(tab.result_table.rowCount(), 3000)
+            self.assertEqual(tab.result_model.rowCount(), 3000)
             self.assertLess(elapsed, 1.5)
 
             db.close()
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_result_model_50k_append_and_filter_smoke(self):
+        from src.core.database import ComplexDatabase
+        from src.ui.widgets.crawler_tab import CrawlerTab
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "perf_model_50k.db"))
+            tab = CrawlerTab(db)
+            try:
+                tab._compact_duplicates = False
+                batch_size = 500
+                start = time.perf_counter()
+                for batch_start in range(0, 50000, batch_size):
+                    tab._on_items_batch(
+                        [
+                            {
+                                "단지명": f"대량단지{i % 200}",
+                                "단지ID": str(10000 + i % 200),
+                                "거래유형": "매매",
+                                "매매가": str(10000 + i),
+                                "면적(평)": 34.0,
+                                "층/방향": "10층 남향",
+                                "타입/특징": "gamma" if i % 2 else "delta",
+                                "매물ID": f"L{i}",
+                                "수집시각": "2026-02-20 10:00:00",
+                            }
+                            for i in range(batch_start, batch_start + batch_size)
+                        ]
+                    )
+                self._qt_app.processEvents()
+                append_elapsed = time.perf_counter() - start
+
+                start = time.perf_counter()
+                tab._filter_results("gamma")
+                self._qt_app.processEvents()
+                filter_elapsed = time.perf_counter() - start
+
+                self.assertEqual(tab.result_model.rowCount(), 50000)
+                self.assertEqual(tab.result_proxy.rowCount(), 25000)
+                self.assertLess(append_elapsed, 20.0)
+                self.assertLess(filter_elapsed, 2.0)
+            finally:
+                db.close()
+                tab.deleteLater()
+                self._qt_app.processEvents()
+
+    def test_result_search_index_query_under_frame_budget(self):
+        from src.ui.widgets.result_table import ResultSearchIndex
+
+        rows = 200000
+        index = ResultSearchIndex()
+        for i in range(rows):
+            index.add(
+                i,
+                f"대량단지{i % 500} {('매매', '전세', '월세')[i % 3]} {i % 30}층 남향 "
+                f"{'gamma' if i % 2 else 'delta'} 중개사{i % 800} l{i}",
+            )
+
+        queries = (
+            ("gamma", rows // 2),
+            ("단지499", None),
+            ("전세 1층", None),
+            ("zzzzz_not_found", 0),
+            # 선택도가 낮은 1글자 질의는 색인 대신 선형 스캔으로 넘어가야 한다.
+            ("1", None),
+            ("l", rows),
+        )
+        for query, expected in queries:
+            best = float("inf")
+            matches = index.search(query)
+            for _ in range(3):
+                index.search("warm")
+                start = time.perf_counter()
+                matches = index.search(query)
+                best = min(best, time.perf_counter() - start)
+            if expected is not None:
+                self.assertEqual(len(matches), expected)
+            # 한 프레임(16ms) 안에 검색 결과 집합이 나와야 한다.
+            self.assertLess(best, 0.016, query)
+
     def test_compact_unique_batches_large_smoke(self):
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab
@@ -143,8 +245,8 @@ class TestPerformanceSmoke(unittest.TestCase):
             self._qt_app.processEvents()
             compact_elapsed = time.perf_counter() - compact_start
 
-            self.assertEqual(plain_tab.result_table.rowCount(), 3000)
-            self.assertEqual(compact_tab.result_table.rowCount(), 3000)
+            self.assertEqual(plain_tab.result_model.rowCount(), 3000)
+            self.assertEqual(compact_tab.result_model.rowCount(), 3000)
             self.assertLess(compact_elapsed, max(plain_elapsed * 12, 5.0))
 
             db.close()
@@ -184,6 +286,49 @@ class TestPerformanceSmoke(unittest.TestCase):
             finally:
                 db.close()
 
+    def test_price_snapshot_query_time_does_not_grow_with_table_size(self):
+        import sqlite3
+
+        from src.core.database import ComplexDatabase
+
+        def _avg_query_seconds(total_complexes: int) -> float:
+            with tempfile.TemporaryDirectory() as tmp:
+                db_path = os.path.join(tmp, f"perf_snapshot_scope_{total_complexes}.db")
+                ComplexDatabase(db_path).close()
+                conn = sqlite3.connect(db_path)
+                conn.executemany(
+                    """
+                    INSERT INTO price_snapshots (
+                        complex_id, trade_type, pyeong, min_price, max_price, avg_price, item_count,
+                        asset_type, price_metric, legacy_monthly, snapshot_date
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, 'APT', 'price', 0, ?)
+                    """,
+                    (
+                        (f"C{cid}", "매매", pyeong, 10000, 12000, 11000, 2, f"2024-01-{day:02d}")
+                        for cid in range(total_complexes)
+                        for day in range(1, 29)
+                        for pyeong in (20.0, 25.0, 30.0, 35.0)
+                    ),
+                )
+                conn.commit()
+                conn.close()
+                db = ComplexDatabase(db_path)
+                try:
+                    rows = db.get_price_snapshots("C1", "매매", asset_type="APT")
+                    self.assertEqual(len(rows), 28 * 4)
+                    start = time.perf_counter()
+                    for _ in range(20):
+                        db.get_price_snapshots("C1", "매매", asset_type="APT")
+                        db.get_price_snapshot_pyeongs("C1", asset_type="APT", trade_type="매매")
+                    return (time.perf_counter() - start) / 40
+                finally:
+                    db.close()
+
+        small = _avg_query_seconds(50)
+        large = _avg_query_seconds(1500)
+
+        self.assertLess(large, small * 4 + 0.005)
+
 
 if __name__ == "__main__":
     unittest.main()
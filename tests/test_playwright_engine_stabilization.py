@@ -5,14 +5,19 @@ import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, cast
-from unittest.mock import AsyncMock, patch
+from typing import Any, Callable, cast
+from urllib.parse import parse_qs, urlparse
+from unittest.mock import AsyncMock, MagicMock, patch
 
 if os.environ.get("NAVERLAND_SKIP_PLAYWRIGHT_TESTS", "").strip().lower() in {"1", "true", "yes", "on"}:
     raise unittest.SkipTest("Playwright engine tests are skipped in this CI environment")
 
 from src.core.engines.playwright_engine import PlaywrightCrawlerEngine
+from src.core.services.article_api import MAX_ARTICLE_API_PREFETCH_IN_FLIGHT
+from src.core.services.detail_fetcher import build_detail_fingerprint
+from src.core.services.map_geometry import build_marker_tile_keys
 from src.core.services.response_capture import TRADE_CODE_MAP, normalize_marker_payload
+from src.utils.constants import GEO_PLANNER_SPLIT_MARKER_COUNT
 
 _LEGACY_ARTICLE_ID_KEY = "\uf9cd\u317b\u042aID"
 
@@ -66,6 +71,7 @@ class _ThreadStub:
     def __init__(self):
         self.playwright_headless = True
         self.playwright_detail_workers = 1
+        self.playwright_target_workers = 1
         self.playwright_response_drain_timeout_ms = 3000
         self.playwright_navigation_timeout_ms = 15000
         self.playwright_article_api_fast_path = True
@@ -80,6 +86,9 @@ class _ThreadStub:
         self.geo_incomplete_reasons = []
         self.geo_incomplete_count = 0
         self.cache: Any | None = None
+        self.db: Any | None = None
+        self.detail_cache_ttl_hours = 0
+        self.geo_tile_cache_ttl_hours = 0
         self.negative_cache_ttl_minutes = 5
         self.trade_types = [TRADE_CODE_MAP.get("A1", "매매"), TRADE_CODE_MAP.get("B1", "전세")]
         self.targets = [("테스트단지", "12345")]
@@ -128,10 +137,13 @@ class _ThreadStub:
         self.finalized_pairs = None
         self.stats_emitted = 0
         self.history_calls = []
+        self.history_warm_calls = []
         self._pair_sequence = []
         self._processed_pairs = set()
         self._current_pair = None
         self._fallback_prefill_processed_target_pairs = set()
+        self._fallback_prefill_complexes: dict[Any, Any] = {}
+        self._run_fallback_selenium: Callable[..., Any] = lambda **kwargs: None
         self._pending_discovered_complexes = {}
         self._discovered_complex_status = {}
         self._registered_discovered_complex_keys = set()
@@ -240,6 +252,10 @@ class _ThreadStub:
     def _flush_history_updates(self, force=False):
         return 0
 
+    def _warm_history_index_for_cache_hit(self, cached_items, trade_type, asset_type="APT"):
+        self.history_warm_calls.append((list(cached_items or []), trade_type, asset_type))
+        return 0
+
     def _flush_pending_items_if_needed(self, force=False):
         return None
 
@@ -432,6 +448,72 @@ class _FakeRequestContext:
         return response
 
 
+class _PagedRequestContext:
+    def __init__(self, payload_by_page, delay_sec=0.01, delay_by_page=None):
+        self._payload_by_page = dict(payload_by_page)
+        self._delay_sec = float(delay_sec)
+        self._delay_by_page = dict(delay_by_page or {})
+        self.pages = []
+        self.completed_pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, **kwargs):
+        page = int(parse_qs(urlparse(url).query).get("page", ["1"])[0])
+        self.pages.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(float(self._delay_by_page.get(page, self._delay_sec)))
+        finally:
+            self.in_flight -= 1
+            self.completed_pages.append(page)
+        payload = self._payload_by_page.get(page, {"isMoreData": False, "articleList": []})
+        return _FakeResponse(url=url, payload=payload)
+
+
+class _MarkerTileRequestContext:
+    def __init__(self, markers_by_kind, failing_kinds=(), delay_sec=0.01):
+        self._markers_by_kind = dict(markers_by_kind)
+        self._failing_kinds = set(failing_kinds)
+        self._delay_sec = float(delay_sec)
+        self.urls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, **kwargs):
+        self.urls.append(url)
+        kind = "houses" if "/houses/single-markers" in url else "complexes"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay_sec)
+        finally:
+            self.in_flight -= 1
+        if kind in self._failing_kinds:
+            return _FakeResponse(url=url, payload={}, status=500)
+        return _FakeResponse(url=url, payload=list(self._markers_by_kind.get(kind, [])))
+
+
+class _DenseRootMarkerRequestContext:
+    """시작 줌 타일은 마커가 빽빽하고, 확대한 타일은 한두 개만 돌려준다."""
+
+    def __init__(self, root_zoom, dense_count):
+        self._root_zoom = int(root_zoom)
+        self._dense_count = int(dense_count)
+        self.zooms = []
+
+    async def get(self, url, **kwargs):
+        zoom = int(parse_qs(urlparse(url).query)["zoom"][0])
+        self.zooms.append(zoom)
+        count = self._dense_count if zoom == self._root_zoom else 1
+        payload = [
+            {"complexNo": f"{zoom}{len(self.zooms)}{idx:03d}", "complexName": f"단지{idx}", "articleCount": 1}
+            for idx in range(count)
+        ]
+        return _FakeResponse(url=url, payload=payload)
+
+
 class _FakeContextWithRequest:
     def __init__(self, request):
         self.request = request
@@ -876,6 +958,217 @@ class TestPlaywrightEngineStabilization(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(result.get("raw_items", [])), 2)
         self.assertEqual(int(thread.stats.get("article_api_page_cap_truncated_count", 0)), 1)
 
+    async def test_article_api_prefetches_remaining_pages_concurrently_when_total_known(self):
+        thread = _ThreadStub()
+        trade_type = thread.trade_types[0]
+        engine = PlaywrightCrawlerEngine(thread)
+        payload_by_page = {}
+        for page in range(1, 6):
+            payload_by_page[page] = {
+                "totalCount": 100,
+                "isMoreData": page < 5,
+                "articleList": [
+                    {"articleNo": f"P{page}-{idx}", "tradeTypeCode": "A1"} for idx in range(20)
+                ],
+            }
+        # 페이지 경계에 걸친 중복 매물은 페이지 순서대로 한 번만 남아야 한다.
+        payload_by_page[3]["articleList"][0] = {"articleNo": "P2-0", "tradeTypeCode": "A1"}
+        request = _PagedRequestContext(payload_by_page)
+        engine._desktop_context = _FakeContextWithRequest(request)
+        engine._article_api_auth_header = "Bearer prefetch-token"
+
+        try:
+            with (
+                patch("src.core.engines.playwright_engine.detect_trade_type", return_value=trade_type),
+                patch(
+                    "src.core.engines.playwright_engine.normalize_article_payload",
+                    side_effect=lambda article, **kwargs: {
+                        "매물ID": str(article.get("articleNo", "")),
+                        _LEGACY_ARTICLE_ID_KEY: str(article.get("articleNo", "")),
+                    },
+                ),
+            ):
+                result = await engine._fetch_article_api_fast_path(
+                    name="테스트단지",
+                    cid="12345",
+                    trade_type=trade_type,
+                    base_kind="complexes",
+                    path_asset="APT",
+                    target_url="https://new.land.naver.com/complexes/12345",
+                    mode="complex",
+                    source_lat=None,
+                    source_lon=None,
+                    source_zoom=None,
+                    marker_id="",
+                    seen_ids=set(),
+                )
+        finally:
+            engine._loop.close()
+
+        assert result is not None
+        ids = [item["매물ID"] for item in result.get("raw_items", [])]
+        self.assertEqual(len(ids), 99)
+        self.assertEqual(ids[:2], ["P1-0", "P1-1"])
+        self.assertEqual(ids[20], "P2-0")
+        self.assertEqual(ids[-1], "P5-19")
+        self.assertEqual(sorted(request.pages), [1, 2, 3, 4, 5])
+        self.assertEqual(request.max_in_flight, 4)
+        self.assertEqual(int(result.get("response_match_count", 0)), 5)
+
+    async def test_article_api_slow_page_does_not_stall_later_prefetches(self):
+        thread = _ThreadStub()
+        trade_type = thread.trade_types[0]
+        engine = PlaywrightCrawlerEngine(thread)
+        payload_by_page = {
+            page: {
+                "totalCount": 160,
+                "isMoreData": page < 8,
+                "articleList": [{"articleNo": f"L{page}-{idx}", "tradeTypeCode": "A1"} for idx in range(20)],
+            }
+            for page in range(1, 9)
+        }
+        request = _PagedRequestContext(payload_by_page, delay_sec=0.005, delay_by_page={2: 0.2})
+        engine._desktop_context = _FakeContextWithRequest(request)
+        engine._pacer = None
+        engine._article_api_auth_header = "Bearer slow-page-token"
+
+        try:
+            with (
+                patch("src.core.engines.playwright_engine.detect_trade_type", return_value=trade_type),
+                patch(
+                    "src.core.engines.playwright_engine.normalize_article_payload",
+                    side_effect=lambda article, **kwargs: {
+                        "매물ID": str(article.get("articleNo", "")),
+                        _LEGACY_ARTICLE_ID_KEY: str(article.get("articleNo", "")),
+                    },
+                ),
+            ):
+                result = await engine._fetch_article_api_fast_path(
+                    name="테스트단지",
+                    cid="12345",
+                    trade_type=trade_type,
+                    base_kind="complexes",
+                    path_asset="APT",
+                    target_url="https://new.land.naver.com/complexes/12345",
+                    mode="complex",
+                    source_lat=None,
+                    source_lon=None,
+                    source_zoom=None,
+                    marker_id="",
+                    seen_ids=set(),
+                )
+        finally:
+            engine._loop.close()
+
+        assert result is not None
+        ids = [item["매물ID"] for item in result.get("raw_items", [])]
+        self.assertEqual(len(ids), 160)
+        self.assertEqual(ids[20], "L2-0")
+        # 2페이지가 끝나기 전에 나머지 페이지가 in-flight 상한 안에서 모두 끝나야 한다.
+        self.assertEqual(request.completed_pages[-1], 2)
+        self.assertLessEqual(request.max_in_flight, MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)
+
+    async def test_article_api_marks_truncation_when_total_pages_end_with_more_data(self):
+        thread = _ThreadStub()
+        trade_type = thread.trade_types[0]
+        engine = PlaywrightCrawlerEngine(thread)
+        payload_by_page = {
+            page: {
+                "totalCount": 40,
+                "isMoreData": True,
+                "articleList": [
+                    {"articleNo": f"T{page}-{idx}", "tradeTypeCode": "A1"} for idx in range(20)
+                ],
+            }
+            for page in range(1, 4)
+        }
+        request = _PagedRequestContext(payload_by_page)
+        engine._desktop_context = _FakeContextWithRequest(request)
+        engine._article_api_auth_header = "Bearer total-token"
+
+        try:
+            with (
+                patch("src.core.engines.playwright_engine.detect_trade_type", return_value=trade_type),
+                patch(
+                    "src.core.engines.playwright_engine.normalize_article_payload",
+                    side_effect=lambda article, **kwargs: {
+                        "매물ID": str(article.get("articleNo", "")),
+                        _LEGACY_ARTICLE_ID_KEY: str(article.get("articleNo", "")),
+                    },
+                ),
+            ):
+                result = await engine._fetch_article_api_fast_path(
+                    name="테스트단지",
+                    cid="12345",
+                    trade_type=trade_type,
+                    base_kind="complexes",
+                    path_asset="APT",
+                    target_url="https://new.land.naver.com/complexes/12345",
+                    mode="complex",
+                    source_lat=None,
+                    source_lon=None,
+                    source_zoom=None,
+                    marker_id="",
+                    seen_ids=set(),
+                )
+        finally:
+            engine._loop.close()
+
+        assert result is not None
+        self.assertEqual(len(result.get("raw_items", [])), 40)
+        self.assertEqual(sorted(request.pages), [1, 2])
+        self.assertEqual(int(thread.stats.get("article_api_page_cap_truncated_count", 0)), 1)
+
+    async def test_article_api_speculative_prefetch_discards_pages_after_last(self):
+        thread = _ThreadStub()
+        trade_type = thread.trade_types[0]
+        engine = PlaywrightCrawlerEngine(thread)
+        payload_by_page = {
+            page: {
+                "isMoreData": page < 3,
+                "articleList": [{"articleNo": f"S{page}", "tradeTypeCode": "A1"}],
+            }
+            for page in range(1, 4)
+        }
+        request = _PagedRequestContext(payload_by_page)
+        engine._desktop_context = _FakeContextWithRequest(request)
+        engine._article_api_auth_header = "Bearer speculative-token"
+
+        try:
+            with (
+                patch("src.core.engines.playwright_engine.detect_trade_type", return_value=trade_type),
+                patch(
+                    "src.core.engines.playwright_engine.normalize_article_payload",
+                    side_effect=lambda article, **kwargs: {
+                        "매물ID": str(article.get("articleNo", "")),
+                        _LEGACY_ARTICLE_ID_KEY: str(article.get("articleNo", "")),
+                    },
+                ),
+            ):
+                result = await engine._fetch_article_api_fast_path(
+                    name="테스트단지",
+                    cid="12345",
+                    trade_type=trade_type,
+                    base_kind="complexes",
+                    path_asset="APT",
+                    target_url="https://new.land.naver.com/complexes/12345",
+                    mode="complex",
+                    source_lat=None,
+                    source_lon=None,
+                    source_zoom=None,
+                    marker_id="",
+                    seen_ids=set(),
+                )
+        finally:
+            engine._loop.close()
+
+        assert result is not None
+        self.assertEqual([item["매물ID"] for item in result.get("raw_items", [])], ["S1", "S2", "S3"])
+        self.assertEqual(request.pages, [1, 2, 3, 4])
+        self.assertEqual(int(result.get("response_match_count", 0)), 3)
+        self.assertEqual(int(thread.stats.get("article_api_prefetch_discarded_count", 0)), 1)
+        self.assertEqual(int(thread.stats.get("article_api_page_cap_truncated_count", 0)), 0)
+
     async def test_response_capture_supplements_after_browser_capture_with_is_more_data(self):
         thread = _ThreadStub()
         trade_type = thread.trade_types[0]
@@ -1103,6 +1396,260 @@ class TestPlaywrightEngineStabilization(unittest.IsolatedAsyncioTestCase):
             [("APT", thread.trade_types[0]), ("APT", thread.trade_types[1]), ("VL", thread.trade_types[0]), ("VL", thread.trade_types[1])],
         )
 
+    async def test_geo_sweep_fetches_marker_tiles_via_api_without_dragging(self):
+        thread = _ThreadStub()
+        thread.geo_config.rings = 1
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._pacer = None
+        engine._desktop_page = _FakePage(responses=[])
+        engine._article_api_auth_header = "Bearer unit-token"
+        request = _MarkerTileRequestContext(
+            {
+                "complexes": [{"complexNo": "1001", "complexName": "단지A", "articleCount": 3}],
+                "houses": [{"complexNo": "2002", "complexName": "빌라B", "articleCount": 1}],
+            }
+        )
+        engine._desktop_context = _FakeContextWithRequest(request)
+        scanned = []
+        crawled = []
+
+        async def _noop_started():
+            return None
+
+        async def _scan(asset_type, trade_type, lat, lon, zoom, geo):
+            scanned.append((asset_type, trade_type))
+            return True
+
+        async def _crawl(name, cid, trade_type, **kwargs):
+            crawled.append((cid, trade_type, kwargs.get("asset_type")))
+            return {"count": 0}
+
+        engine._ensure_started = _noop_started
+        engine._scan_geo_asset_type = _scan
+        engine._crawl_target_with_cache = _crawl
+
+        try:
+            await engine._run_geo()
+        finally:
+            engine._loop.close()
+
+        tile_count = len(build_marker_tile_keys(37.55, 126.99, 15, rings=1, step_px=thread.geo_config.step_px))
+        self.assertEqual(scanned, [])
+        self.assertEqual(thread.stats["geo_discovered_count"], 2)
+        self.assertEqual(len(request.urls), 4 * tile_count)
+        self.assertEqual(sum("/houses/single-markers" in url for url in request.urls), 2 * tile_count)
+        self.assertGreater(request.max_in_flight, 1)
+        self.assertLessEqual(request.max_in_flight, MAX_ARTICLE_API_PREFETCH_IN_FLIGHT)
+        self.assertEqual(thread.stats["geo_api_tile_count"], 4 * tile_count)
+        self.assertIn(("2002", thread.trade_types[0], "VL"), crawled)
+        self.assertIsNone(engine._geo_marker_handler)
+
+    async def test_geo_sweep_falls_back_to_map_drag_when_marker_tiles_fail(self):
+        thread = _ThreadStub()
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._pacer = None
+        engine._desktop_page = _FakePage(responses=[])
+        engine._article_api_auth_header = "Bearer unit-token"
+        engine._desktop_context = _FakeContextWithRequest(
+            _MarkerTileRequestContext(
+                {"complexes": [{"complexNo": "1001", "complexName": "단지A", "articleCount": 3}]},
+                failing_kinds={"houses"},
+            )
+        )
+        scanned = []
+
+        async def _noop_started():
+            return None
+
+        async def _call(label, func, *, attempts=3):
+            return await func()
+
+        async def _scan(asset_type, trade_type, lat, lon, zoom, geo):
+            scanned.append((asset_type, trade_type))
+            return True
+
+        async def _crawl(name, cid, trade_type, **kwargs):
+            return {"count": 0}
+
+        engine._ensure_started = _noop_started
+        engine._async_retry = _call
+        engine._scan_geo_asset_type = _scan
+        engine._crawl_target_with_cache = _crawl
+
+        try:
+            await engine._run_geo()
+        finally:
+            engine._loop.close()
+
+        self.assertEqual(scanned, [("VL", thread.trade_types[0]), ("VL", thread.trade_types[1])])
+        tile_count = len(build_marker_tile_keys(37.55, 126.99, 15, rings=0, step_px=thread.geo_config.step_px))
+        self.assertEqual(thread.stats["geo_api_fallback_count"], 2)
+        self.assertEqual(thread.stats["geo_api_tile_fail_count"], 2 * tile_count)
+        self.assertFalse(thread.geo_incomplete)
+
+    async def test_geo_sweep_reuses_fresh_marker_tiles_from_cache(self):
+        from src.core.database import ComplexDatabase
+
+        async def _noop_started():
+            return None
+
+        async def _crawl(name, cid, trade_type, **kwargs):
+            return {"count": 0}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "geo_tiles.db"))
+            try:
+                runs = []
+                for auth_header in ("Bearer unit-token", ""):
+                    thread = _ThreadStub()
+                    thread.db = db
+                    thread.geo_tile_cache_ttl_hours = 12
+                    thread.geo_config.asset_types = ["APT"]
+                    engine = PlaywrightCrawlerEngine(thread)
+                    engine._pacer = None
+                    engine._desktop_page = _FakePage(responses=[])
+                    engine._article_api_auth_header = auth_header
+                    request = _MarkerTileRequestContext(
+                        {"complexes": [{"complexNo": "1001", "complexName": "단지A", "articleCount": 3, "latitude": 37.551, "longitude": 126.991}]}
+                    )
+                    engine._desktop_context = _FakeContextWithRequest(request)
+                    scanned = []
+
+                    async def _scan(*args, _scanned=scanned):
+                        _scanned.append(args[:2])
+                        return True
+
+                    engine._ensure_started = _noop_started
+                    cast(Any, engine)._scan_geo_asset_type = _scan
+                    engine._crawl_target_with_cache = _crawl
+                    try:
+                        await engine._run_geo()
+                    finally:
+                        engine._loop.close()
+                    runs.append((thread, request, scanned))
+                known = db.get_known_complexes_in_bounds((126.9, 127.1, 37.6, 37.5))
+            finally:
+                db.close()
+
+        tile_count = len(build_marker_tile_keys(37.55, 126.99, 15, rings=0, step_px=320))
+        (first, first_request, first_scanned), (second, second_request, second_scanned) = runs
+        self.assertEqual(len(first_request.urls), 2 * tile_count)
+        self.assertEqual(first.stats["geo_tile_cache_miss_count"], 2 * tile_count)
+        self.assertEqual(first_scanned, [])
+        self.assertEqual(second_request.urls, [])
+        self.assertEqual(second_scanned, [])
+        self.assertEqual(second.stats["geo_tile_cache_hit_count"], 2 * tile_count)
+        self.assertEqual(second.stats["geo_discovered_count"], 1)
+        self.assertEqual([row["complex_id"] for row in known], ["1001"])
+
+    async def _run_planned_geo_sweep(self, request_budget):
+        thread = _ThreadStub()
+        thread.geo_config.asset_types = ["APT"]
+        thread.geo_config.request_budget = request_budget
+        thread.trade_types = thread.trade_types[:1]
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._pacer = None
+        engine._desktop_page = _FakePage(responses=[])
+        engine._article_api_auth_header = "Bearer unit-token"
+        request = _DenseRootMarkerRequestContext(15, GEO_PLANNER_SPLIT_MARKER_COUNT)
+        engine._desktop_context = _FakeContextWithRequest(request)
+        scanned = []
+
+        async def _noop_started():
+            return None
+
+        async def _scan(*args):
+            scanned.append(args[:2])
+            return True
+
+        async def _crawl(name, cid, trade_type, **kwargs):
+            return {"count": 0}
+
+        engine._ensure_started = _noop_started
+        cast(Any, engine)._scan_geo_asset_type = _scan
+        engine._crawl_target_with_cache = _crawl
+        try:
+            await engine._run_geo()
+        finally:
+            engine._loop.close()
+        return thread, request, scanned
+
+    async def test_geo_sweep_splits_dense_marker_tiles_into_zoomed_children(self):
+        thread, request, scanned = await self._run_planned_geo_sweep(0)
+
+        tile_count = len(build_marker_tile_keys(37.55, 126.99, 15, rings=0, step_px=320))
+        self.assertEqual(scanned, [])
+        self.assertEqual(request.zooms.count(15), tile_count)
+        self.assertEqual(request.zooms.count(16), 4 * tile_count)
+        self.assertNotIn(17, request.zooms)
+        self.assertEqual(thread.stats["geo_plan_split_count"], tile_count)
+        self.assertEqual(thread.stats["geo_plan_max_depth"], 1)
+        self.assertEqual(thread.stats["geo_plan_coverage_pct"], 100.0)
+        self.assertGreater(thread.stats["geo_complexes_per_request"], 0)
+        self.assertFalse(thread.geo_incomplete)
+
+    async def test_geo_sweep_stops_descending_at_request_budget(self):
+        tile_count = len(build_marker_tile_keys(37.55, 126.99, 15, rings=0, step_px=320))
+        thread, request, scanned = await self._run_planned_geo_sweep(tile_count + 2)
+
+        self.assertEqual(scanned, [])
+        self.assertEqual(len(request.zooms), tile_count + 2)
+        self.assertEqual(thread.stats["geo_plan_request_count"], tile_count + 2)
+        self.assertEqual(thread.stats["geo_plan_budget_exhausted_count"], 1)
+        self.assertLess(thread.stats["geo_plan_coverage_pct"], 100.0)
+        self.assertTrue(thread.geo_incomplete)
+        self.assertIn("marker_plan_budget", thread.geo_incomplete_reasons)
+
+    async def test_geo_scan_switches_to_marker_api_once_page_marker_reveals_auth(self):
+        thread = _ThreadStub()
+        thread.crawl_mode = "geo_sweep"
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._pacer = None
+        engine._desktop_page = _FakePage(
+            responses=[
+                _FakeResponse(
+                    url="https://new.land.naver.com/api/complexes/single-markers/2.0?zoom=15",
+                    payload=[{"complexNo": "1001", "complexName": "단지A", "articleCount": 3}],
+                    request_headers={"authorization": "Bearer page-token"},
+                )
+            ]
+        )
+        request = _MarkerTileRequestContext(
+            {"complexes": [{"complexNo": "1002", "complexName": "단지B", "articleCount": 2}]}
+        )
+        engine._desktop_context = _FakeContextWithRequest(request)
+        discovered = {}
+        handler, pending_tasks, _stats = engine._build_marker_handler(discovered)
+        engine._desktop_page.on("response", handler)
+        engine._geo_marker_handler = handler
+        drags = []
+
+        async def _call(label, func, *, attempts=3):
+            return await func()
+
+        async def _drag(lat, lon):
+            drags.append((lat, lon))
+
+        async def _switch():
+            raise AssertionError("marker switch should not run after API sweep")
+
+        engine._async_retry = _call
+        cast(Any, engine)._drag_to_latlon = _drag
+        engine._switch_to_listing_markers = _switch
+
+        try:
+            await asyncio.sleep(0)
+            result = await engine._scan_geo_asset_type("APT", thread.trade_types[0], 37.55, 126.99, 15, thread.geo_config)
+            await engine._drain_pending_response_tasks(pending_tasks, label="test_marker_api")
+        finally:
+            engine._loop.close()
+
+        self.assertTrue(result)
+        self.assertEqual(engine._article_api_auth_header, "Bearer page-token")
+        self.assertEqual(drags, [])
+        self.assertEqual(set(discovered), {"APT:1001", "APT:1002"})
+        self.assertTrue(all("/complexes/single-markers/2.0?" in url for url in request.urls))
+
     async def test_detail_enrich_cancels_pending_tasks_on_stop(self):
         thread = _ThreadStub()
         thread.playwright_detail_workers = 2
@@ -1276,6 +1823,7 @@ class TestPlaywrightEngineStabilization(unittest.IsolatedAsyncioTestCase):
 
         self.assertTrue(result["cache_hit"])
         self.assertEqual(result["raw_count"], 1)
+        self.assertEqual(thread.history_warm_calls, [(shared_items, trade_type, "APT")])
 
     async def test_negative_cache_written_only_on_confirmed_empty(self):
         thread = _ThreadStub()
@@ -1610,6 +2158,97 @@ class TestPlaywrightEngineStabilization(unittest.IsolatedAsyncioTestCase):
         finally:
             engine._loop.close()
 
+    async def test_detail_cache_hit_skips_mobile_detail_navigation(self):
+        thread = _ThreadStub()
+        thread.detail_cache_ttl_hours = 24
+        item_hit = {"매물ID": "C-1", "자산유형": "APT", "매매가": "5억", "층/방향": "10/20"}
+        item_changed = {"매물ID": "C-2", "자산유형": "APT", "매매가": "6억", "층/방향": "3/20"}
+        cached_detail = {"부동산상호": "캐시부동산", "_detail_meta": {"detail_source": "fin_article", "detail_parse_state": "success"}}
+        stale_fingerprint = build_detail_fingerprint(dict(item_changed, 매매가="5억 5,000"))
+        thread.db = MagicMock()
+        thread.db.get_article_detail_cache.return_value = {
+            ("APT", "C-1"): (build_detail_fingerprint(item_hit), cached_detail),
+            ("APT", "C-2"): (stale_fingerprint, cached_detail),
+        }
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._page_pool = asyncio.Queue()
+        await engine._page_pool.put(object())
+
+        async def _no_retry(label: str, func, *, attempts=3):
+            return await func()
+
+        engine._async_retry = _no_retry
+        fresh_detail = {"부동산상호": "새부동산", "_detail_meta": {"detail_parse_state": "success"}}
+        with patch(
+            "src.core.engines.playwright_engine.fetch_mobile_article_detail",
+            new=AsyncMock(return_value=fresh_detail),
+        ) as fetch_mock:
+            result = await engine._enrich_items_with_mobile_details([dict(item_hit), dict(item_changed)])
+        try:
+            self.assertEqual(fetch_mock.await_count, 1)
+            await_args = fetch_mock.await_args
+            assert await_args is not None
+            self.assertEqual(await_args.args[1], "C-2")
+            by_id = {row["매물ID"]: row for row in result}
+            self.assertEqual(by_id["C-1"]["부동산상호"], "캐시부동산")
+            self.assertEqual(by_id["C-2"]["부동산상호"], "새부동산")
+            self.assertEqual(thread.stats.get("detail_cache_hit_count"), 1)
+            self.assertEqual(thread.stats.get("detail_cache_miss_count"), 1)
+            thread.db.get_article_detail_cache.assert_called_once_with(
+                [("APT", "C-1"), ("APT", "C-2")],
+                max_age_seconds=24 * 3600,
+            )
+            stored_rows = thread.db.upsert_article_detail_cache.call_args.args[0]
+            self.assertEqual(
+                stored_rows,
+                [("APT", "C-2", build_detail_fingerprint(item_changed), fresh_detail)],
+            )
+        finally:
+            engine._loop.close()
+
+    async def test_detail_cache_hits_keep_input_order_and_read_off_the_event_loop(self):
+        import threading
+
+        thread = _ThreadStub()
+        thread.detail_cache_ttl_hours = 24
+        items = [
+            {"매물ID": "O-1", "자산유형": "APT", "매매가": "5억", "층/방향": "1/20"},
+            {"매물ID": "O-2", "자산유형": "APT", "매매가": "6억", "층/방향": "2/20"},
+            {"매물ID": "O-3", "자산유형": "APT", "매매가": "7억", "층/방향": "3/20"},
+        ]
+        cached_detail = {"부동산상호": "캐시부동산", "_detail_meta": {"detail_parse_state": "success"}}
+        loop_thread = threading.get_ident()
+        lookup_threads = []
+
+        def _lookup(keys, *, max_age_seconds):
+            lookup_threads.append(threading.get_ident())
+            return {("APT", "O-2"): (build_detail_fingerprint(items[1]), cached_detail)}
+
+        thread.db = MagicMock()
+        thread.db.get_article_detail_cache.side_effect = _lookup
+        engine = PlaywrightCrawlerEngine(thread)
+        engine._page_pool = asyncio.Queue()
+        await engine._page_pool.put(object())
+
+        async def _no_retry(label: str, func, *, attempts=3):
+            return await func()
+
+        engine._async_retry = _no_retry
+        fresh_detail = {"부동산상호": "새부동산", "_detail_meta": {"detail_parse_state": "success"}}
+        try:
+            with patch(
+                "src.core.engines.playwright_engine.fetch_mobile_article_detail",
+                new=AsyncMock(return_value=fresh_detail),
+            ):
+                result = await engine._enrich_items_with_mobile_details([dict(item) for item in items])
+        finally:
+            engine._loop.close()
+
+        self.assertEqual([row["매물ID"] for row in result], ["O-1", "O-2", "O-3"])
+        self.assertEqual([row["부동산상호"] for row in result], ["새부동산", "캐시부동산", "새부동산"])
+        self.assertEqual(len(lookup_threads), 1)
+        self.assertNotEqual(lookup_threads[0], loop_thread)
+
     async def test_filter_miss_skips_detail_fetch_and_history_tracking(self):
         thread = _ThreadStub()
         thread.filtered_ids = {"MISS-1"}
@@ -2081,6 +2720,114 @@ class TestPlaywrightEngineStabilization(unittest.IsolatedAsyncioTestCase):
         finally:
             engine._loop.close()
 
+    async def test_complex_mode_runs_targets_concurrently_with_target_workers(self):
+        thread = _ThreadStub()
+        thread.playwright_target_workers = 3
+        thread.targets = [(f"단지{i}", str(1000 + i)) for i in range(6)]
+        engine = PlaywrightCrawlerEngine(thread)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _noop_started():
+            return None
+
+        async def _noop_memory(reason):
+            return None
+
+        async def _crawl(name, cid, trade_type, *args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"count": 1}
+
+        engine._ensure_started = _noop_started
+        engine._check_memory_and_recycle_if_needed = _noop_memory
+        engine._crawl_target_with_cache = _crawl
+
+        try:
+            await engine._run_complex_mode()
+        finally:
+            engine._loop.close()
+
+        self.assertEqual(max_in_flight, 3)
+        self.assertEqual(len(thread.history_calls), 6)
+        self.assertTrue(all(kwargs["run_status"] == "success" for _args, kwargs in thread.history_calls))
+        self.assertEqual(len(thread.finalized_pairs or set()), 12)
+        self.assertEqual(len(thread.progress_signal.calls), 12)
+        self.assertEqual(thread.progress_signal.calls[-1][0], 100)
+        self.assertIsNone(engine._target_gate)
+
+    async def test_concurrent_complex_mode_defers_fallback_until_workers_finish(self):
+        thread = _ThreadStub()
+        thread.playwright_target_workers = 2
+        thread.fallback_engine_enabled = True
+        thread.targets = [("실패단지", "2001"), ("정상단지", "2002")]
+        thread._fallback_prefill_complexes = {}
+        fallback_calls = []
+        thread._run_fallback_selenium = lambda **kwargs: fallback_calls.append(dict(kwargs))
+        engine = PlaywrightCrawlerEngine(thread)
+
+        async def _noop_started():
+            return None
+
+        async def _noop_memory(reason):
+            return None
+
+        async def _crawl(name, cid, trade_type, *args, **kwargs):
+            if cid == "2001":
+                await asyncio.sleep(0.005)
+                raise RuntimeError("capture failed")
+            await asyncio.sleep(0.02)
+            return {"count": 2}
+
+        engine._ensure_started = _noop_started
+        engine._check_memory_and_recycle_if_needed = _noop_memory
+        engine._crawl_target_with_cache = _crawl
+
+        try:
+            await engine._run_complex_mode()
+        finally:
+            engine._loop.close()
+
+        self.assertEqual(len(fallback_calls), 1)
+        self.assertEqual(fallback_calls[0]["start_cid"], "2001")
+        self.assertIn(("APT", "2002", thread.trade_types[0]), fallback_calls[0]["prefill_processed_target_pairs"])
+        self.assertEqual(thread.history_calls, [])
+        self.assertEqual(
+            thread._fallback_prefill_complexes[("정상단지", "2002")]["trade_types"],
+            [thread.trade_types[0]],
+        )
+        self.assertIsNone(thread.finalized_pairs)
+
+    async def test_target_worker_gate_exclusive_waits_for_active_pairs(self):
+        from src.core.engines.playwright_parts.runtime_parts.target_workers import TargetWorkerGate
+
+        gate = TargetWorkerGate()
+        events = []
+
+        async def _pair_worker():
+            async with gate.pair():
+                events.append("pair_start")
+                await asyncio.sleep(0.02)
+                events.append("pair_end")
+
+        async def _exclusive_worker():
+            await asyncio.sleep(0.005)
+            async with gate.exclusive():
+                events.append("exclusive")
+
+        async def _late_pair():
+            await asyncio.sleep(0.01)
+            async with gate.pair():
+                events.append("late_pair")
+
+        await asyncio.gather(_pair_worker(), _exclusive_worker(), _late_pair())
+
+        self.assertEqual(events, ["pair_start", "pair_end", "exclusive", "late_pair"])
+        self.assertEqual(gate.active_count, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from src.core.services import price_snapshots
+from src.core.services.price_snapshots import (
+    PriceSketch,
+    PriceSnapshotAggregator,
+    build_price_snapshot_rows,
+    build_price_snapshot_rows_from_history,
+)
+
+
+def _item(cid, trade, area, **prices):
+    item = {"단지ID": cid, "거래유형": trade, "면적(평)": area, "자산유형": "APT"}
+    item.update(prices)
+    return item
+
+
+class TestPriceSnapshots(unittest.TestCase):
+    def test_rows_include_count_min_max_avg_and_quartiles(self):
+        items = [_item("C1", "매매", 34, 매매가=str(price)) for price in (10000, 11000, 12000, 13000, 20000)]
+
+        rows = build_price_snapshot_rows(items)
+
+        self.assertEqual(
+            rows,
+            [("C1", "매매", 35.0, 10000, 20000, 13200, 5, "APT", "price", 0, 12000, 11000, 13000)],
+        )
+
+    def test_monthly_items_split_deposit_and_rent_metrics(self):
+        items = [
+            _item("C2", "월세", 24, 보증금="1억", 월세="100"),
+            _item("C2", "월세", 24, 보증금="2억", 월세="150"),
+        ]
+
+        rows = {row[8]: row for row in build_price_snapshot_rows(items)}
+
+        self.assertEqual(rows["deposit"][3:7], (10000, 20000, 15000, 2))
+        self.assertEqual(rows["deposit"][10], 15000)
+        self.assertEqual(rows["rent"][3:7], (100, 150, 125, 2))
+        self.assertEqual(rows["rent"][11:13], (112, 138))
+
+    def test_streaming_batches_match_single_pass(self):
+        rng = random.Random(7)
+        items = [
+            _item(f"C{rng.randint(1, 3)}", "매매", rng.choice([24, 34]), 매매가=str(rng.randint(5000, 90000)))
+            for _ in range(600)
+        ]
+        aggregator = PriceSnapshotAggregator()
+        for start in range(0, len(items), 37):
+            aggregator.add_items(items[start:start + 37])
+
+        self.assertEqual(sorted(aggregator.rows()), sorted(build_price_snapshot_rows(items)))
+
+    def test_sketch_stays_bounded_and_close_to_exact_quantiles(self):
+        rng = random.Random(11)
+        values = [rng.randint(1, 500000) for _ in range(5000)]
+        sketch = PriceSketch(max_bins=128)
+        for value in values:
+            sketch.add(value)
+
+        self.assertLessEqual(len(sketch), 128)
+        ordered = sorted(values)
+        exact_median = ordered[len(ordered) // 2]
+        self.assertLess(abs(sketch.quantile(0.5) - exact_median), 500000 / 64)
+
+    def test_history_bulk_path_matches_python_aggregation(self):
+        rng = random.Random(3)
+        history_rows = []
+        for idx in range(400):
+            trade = rng.choice(["매매", "전세", "월세"])
+            if trade == "월세":
+                deposit, rent = rng.randint(1000, 30000), rng.randint(30, 300)
+                history_rows.append(("APT", f"H{idx % 4}", trade, 24.0, rent, f"{deposit}/{rent}"))
+            else:
+                price = rng.randint(10000, 150000)
+                history_rows.append(("VL", f"H{idx % 4}", trade, 33.0, price, str(price)))
+
+        numpy_rows = build_price_snapshot_rows_from_history(history_rows)
+        with patch.object(price_snapshots, "NUMPY_AVAILABLE", False):
+            python_rows = build_price_snapshot_rows_from_history(history_rows)
+
+        self.assertTrue(numpy_rows)
+        self.assertEqual(sorted(numpy_rows), sorted(python_rows))
+
+    def test_python_path_quartiles_stay_within_sketch_resolution_when_bins_overflow(self):
+        rng = random.Random(5)
+        prices = [rng.randint(10000, 400000) for _ in range(3000)]
+        history_rows = [("APT", "H1", "매매", 34.0, price, str(price)) for price in prices]
+        sketch = PriceSketch()
+        for price in prices:
+            sketch.add(price)
+
+        (numpy_row,) = build_price_snapshot_rows_from_history(history_rows)
+        with patch.object(price_snapshots, "NUMPY_AVAILABLE", False):
+            (python_row,) = build_price_snapshot_rows_from_history(history_rows)
+
+        self.assertGreater(sketch.resolution, 1)
+        self.assertLessEqual(sketch.resolution, 2 * (max(prices) - min(prices)) / (price_snapshots.SKETCH_MAX_BINS - 1) + 1)
+        self.assertEqual(python_row[:10], numpy_row[:10])
+        for exact, approx in zip(numpy_row[10:], python_row[10:]):
+            self.assertLess(abs(exact - approx), sketch.resolution)
+
+
+if __name__ == "__main__":
+    unittest.main()
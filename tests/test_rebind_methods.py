@@ -29,6 +29,7 @@ class TestMixinMethodRebinding(unittest.TestCase):
             ComplexDatabaseComplexGroupOpsMixin,
             ComplexDatabaseCrawlSnapshotOpsMixin,
             ComplexDatabaseSchemaMixin,
+            ComplexDatabaseWriteBatchOpsMixin,
         )
         from src.core.crawler import (
             CrawlerDomScrollParseMixin,
@@ -70,6 +71,7 @@ class TestMixinMethodRebinding(unittest.TestCase):
                 ComplexDatabaseArticleOpsMixin,
                 ComplexDatabaseAlertOpsMixin,
                 ComplexDatabaseBackupRestoreOpsMixin,
+                ComplexDatabaseWriteBatchOpsMixin,
             ],
         )
         self.assert_all_mixin_methods_rebound(
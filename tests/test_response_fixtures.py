@@ -0,0 +1,128 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.crawler import CrawlerThread
+from src.core.database import ComplexDatabase
+from src.core.services.article_api import build_article_api_url
+from src.core.services.response_fixtures import (
+    ReplayRequestContext,
+    ResponseFixtureStore,
+    build_synthetic_fixtures,
+    classify_fixture_url,
+    fixture_key,
+    normalize_fixture_mode,
+)
+
+
+class TestResponseFixtureStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_classifies_matched_responses(self):
+        self.assertEqual(classify_fixture_url(build_article_api_url("complexes", "1", "매매")), "article_list")
+        self.assertEqual(classify_fixture_url(build_article_api_url("houses", "1", "전세", "VL")), "article_list")
+        self.assertEqual(
+            classify_fixture_url("https://new.land.naver.com/api/complexes/single-markers/2.0?zoom=15"),
+            "marker",
+        )
+        self.assertEqual(classify_fixture_url("https://m.land.naver.com/article/info/123"), "detail")
+        self.assertIsNone(classify_fixture_url("https://new.land.naver.com/complexes/1"))
+        self.assertEqual(normalize_fixture_mode(" Replay_Offline "), "replay_offline")
+        self.assertEqual(normalize_fixture_mode("live"), "")
+
+    def test_fixture_key_ignores_query_order_and_cache_busters(self):
+        self.assertEqual(
+            fixture_key("https://new.land.naver.com/api/articles/complex/1?b=2&a=1&_=999"),
+            fixture_key("https://NEW.land.naver.com/api/articles/complex/1/?a=1&b=2"),
+        )
+
+    def test_save_and_load_roundtrip_across_instances(self):
+        url = build_article_api_url("complexes", "77", "매매", page=2)
+        store = ResponseFixtureStore(self.root)
+        store.save(url, {"articleList": [{"articleNo": "A1"}], "isMoreData": False})
+        store.save("https://m.land.naver.com/article/info/A1", "<html>상세</html>", content_type="text/html")
+
+        reloaded = ResponseFixtureStore(self.root)
+        fixture = reloaded.load(url)
+
+        assert fixture is not None
+        self.assertEqual(fixture["body"]["articleList"][0]["articleNo"], "A1")
+        self.assertEqual(reloaded.count("article_list"), 1)
+        self.assertEqual(reloaded.count("detail"), 1)
+        self.assertIsNone(reloaded.load(build_article_api_url("complexes", "77", "매매", page=3)))
+        self.assertEqual((reloaded.hit_count, reloaded.miss_count), (1, 1))
+
+    def test_replay_request_context_answers_missing_article_pages_as_empty(self):
+        store = ResponseFixtureStore(self.root)
+        targets = build_synthetic_fixtures(store, complex_count=2, articles_per_pair=25)
+        request = ReplayRequestContext(store)
+
+        async def _fetch(url):
+            response = await request.get(url)
+            return response.status, await response.json()
+
+        first_cid = targets[0][1]
+        status, payload = asyncio.run(_fetch(build_article_api_url("complexes", first_cid, "매매", page=2)))
+        self.assertEqual(status, 200)
+        self.assertEqual(len(payload["articleList"]), 5)
+        self.assertFalse(payload["isMoreData"])
+        status, payload = asyncio.run(_fetch(build_article_api_url("complexes", "404404", "매매")))
+        self.assertEqual((status, payload["articleList"]), (200, []))
+
+
+class TestOfflineReplayCrawl(unittest.TestCase):
+    def _run(self, crawl_mode):
+        with tempfile.TemporaryDirectory() as tmp:
+            fixture_dir = os.path.join(tmp, "fixtures")
+            targets = build_synthetic_fixtures(
+                ResponseFixtureStore(fixture_dir),
+                complex_count=3,
+                trade_codes=("A1", "B1"),
+                articles_per_pair=25,
+            )
+            db = ComplexDatabase(os.path.join(tmp, "replay.db"))
+            try:
+                thread = CrawlerThread(
+                    targets=targets,
+                    trade_types=["매매", "전세"],
+                    area_filter={"enabled": False},
+                    price_filter={"enabled": False},
+                    db=db,
+                    cache=None,
+                    engine_name="playwright",
+                    crawl_mode=crawl_mode,
+                    geo_config={"lat": 37.55, "lon": 126.99, "zoom": 15, "rings": 0, "asset_types": ["APT"]},
+                    fallback_engine_enabled=False,
+                    detail_cache_ttl_hours=0,
+                    playwright_fixture_mode="replay_offline",
+                    playwright_fixture_dir=fixture_dir,
+                )
+                thread.run()
+            finally:
+                db.close()
+        return thread
+
+    def test_complex_mode_replays_all_pages_without_browser(self):
+        thread = self._run("complex")
+
+        self.assertEqual(len(thread.collected_data), 3 * 2 * 25)
+        self.assertEqual(thread.stats["playwright_browser_source"], "fixture_replay")
+        self.assertEqual(thread.stats["article_api_fast_path_hit_count"], 6)
+        self.assertEqual(thread.stats.get("pacing_wait_ms_total", 0), 0)
+
+    def test_geo_mode_discovers_markers_from_fixtures(self):
+        thread = self._run("geo_sweep")
+
+        self.assertEqual(thread.stats["geo_discovered_count"], 3)
+        self.assertEqual(len(thread.collected_data), 3 * 2 * 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,25 @@ class TestUIRuntimeSmoke(unittest.TestCase):
 
         cls._qt_app = QApplication.instance() or QApplication([])
 
+    def setUp(self):
+        from src.core.database import ComplexDatabase
+
+        # 테스트가 띄운 DB의 스키마 보정 스레드를 모아 두었다가 tearDown 에서 멈춘다.
+        self._schema_backfill_dbs = []
+        start_backfills = ComplexDatabase.start_schema_backfills
+
+        def _tracking_start(db, *args, **kwargs):
+            self._schema_backfill_dbs.append(db)
+            return start_backfills(db, *args, **kwargs)
+
+        patcher = patch.object(ComplexDatabase, "start_schema_backfills", _tracking_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for db in self._schema_backfill_dbs:
+            self.assertTrue(db._stop_schema_backfills())
+
     def test_real_estate_app_instantiation(self):
         from src.ui.app import RealEstateApp
 
@@ -226,6 +245,191 @@ class TestUIRuntimeSmoke(unittest.TestCase):
                 widget.deleteLater()
                 self._qt_app.processEvents()
 
+    def _drain_dashboard_worker(self, widget):
+        worker = widget._dashboard_worker
+        if worker is not None:
+            self.assertTrue(worker.wait(20000))
+        self._qt_app.processEvents()
+
+    @staticmethod
+    def _card_value_text(card) -> str:
+        label = card._value_label
+        assert label is not None
+        return label.text()
+
+    def test_dashboard_computes_and_renders_charts_off_thread(self):
+        from src.core.database import ComplexDatabase
+        from src.ui.widgets.dashboard import DashboardWidget
+        from src.ui.widgets.dashboard_parts.dashboard_worker import MATPLOTLIB_AVAILABLE
+
+        def _items(prefix, count):
+            return [
+                {
+                    "단지명": f"{prefix}단지",
+                    "단지ID": "60101",
+                    "매물ID": f"{prefix}{i}",
+                    "거래유형": ("매매", "전세")[i % 2],
+                    "매매가": "3억" if i % 2 == 0 else "",
+                    "보증금": "" if i % 2 == 0 else "2억",
+                    "월세": "",
+                    "is_new": i == 0,
+                    "price_change": -100 if i == 1 else 0,
+                }
+                for i in range(count)
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "dashboard_worker.db"))
+            widget = DashboardWidget(db)
+            try:
+                with patch.object(db, "count_disappeared_articles_for_targets", return_value=4) as count_mock:
+                    widget.set_data(_items("old", 3))
+                    stale_worker = widget._dashboard_worker
+                    widget.set_data(_items("new", 8))
+                    self.assertIsNotNone(stale_worker)
+                    assert stale_worker is not None
+                    self.assertTrue(stale_worker.is_cancelled())
+                    self._drain_dashboard_worker(widget)
+                    stale_worker.wait(20000)
+                    self._qt_app.processEvents()
+
+                self.assertEqual(self._card_value_text(widget.total_card), "8")
+                self.assertEqual(self._card_value_text(widget.new_card), "1")
+                self.assertEqual(self._card_value_text(widget.down_card), "1")
+                self.assertEqual(self._card_value_text(widget.disappeared_card), "4")
+                self.assertIn("소멸 4건", widget.trend_label.text())
+                snapshot = widget._build_stats_snapshot()
+                self.assertEqual(sum(snapshot["price_hist_counts"]), 8)
+                if MATPLOTLIB_AVAILABLE:
+                    self.assertFalse(widget.trade_chart_view.pixmap().isNull())
+                    self.assertFalse(widget.price_chart_view.pixmap().isNull())
+                    self.assertEqual(widget._last_price_chart_sig, (widget._data_revision, widget._theme))
+
+                # 같은 데이터로 다시 열면 캐시된 결과만 반영하고 워커를 띄우지 않는다.
+                calls = count_mock.call_count
+                widget.refresh()
+                self.assertIsNone(widget._dashboard_worker)
+                self.assertEqual(count_mock.call_count, calls)
+            finally:
+                db.close()
+                widget.deleteLater()
+                self._qt_app.processEvents()
+
+    def test_dashboard_histogram_bins_match_with_and_without_numpy(self):
+        from src.ui.widgets.dashboard_parts import dashboard_worker
+
+        values = [0.5, 1.0, 1.2, 2.5, 3.0, 3.0, 7.5]
+        counts, edges = dashboard_worker.histogram_bins(values, bins=4)
+        with patch.object(dashboard_worker, "np", None):
+            py_counts, py_edges = dashboard_worker.histogram_bins(values, bins=4)
+            single = dashboard_worker.histogram_bins([2.0], bins=2)
+
+        self.assertEqual(counts, py_counts)
+        self.assertEqual([round(edge, 6) for edge in edges], [round(edge, 6) for edge in py_edges])
+        self.assertEqual(sum(counts), len(values))
+        self.assertEqual(single, ([0, 1], [1.5, 2.0, 2.5]))
+
+    def test_card_view_recycles_fixed_card_pool_while_scrolling(self):
+        from src.ui.widgets.cards import CardViewWidget
+
+        view = CardViewWidget(is_dark=True)
+        try:
+            view.resize(920, 700)
+            view.show()
+            self._qt_app.processEvents()
+            articles = [
+                {"단지명": f"단지{i}", "매물ID": f"C{i}", "거래유형": ("매매", "전세", "월세")[i % 3], "매매가": "1억"}
+                for i in range(20000)
+            ]
+            view.set_data(articles)
+            self._qt_app.processEvents()
+            viewport = view.viewport()
+            scroll_bar = view.verticalScrollBar()
+            assert viewport is not None and scroll_bar is not None
+
+            cols = view._calc_columns()
+            rows_on_screen = viewport.height() // view._row_height() + 2 + 2 * view._OVERSCAN_ROWS
+            total_height = view._card_spacing + (20000 + cols - 1) // cols * view._row_height()
+            self.assertEqual(scroll_bar.maximum(), total_height - viewport.height())
+            self.assertTrue(all(card.parentWidget() is viewport for card in view._cards))
+
+            scroll_bar.setValue(scroll_bar.maximum() // 2)
+            self._qt_app.processEvents()
+            pool = list(view._cards)
+            self.assertLessEqual(len(pool), rows_on_screen * cols)
+            for step in range(1, 40):
+                scroll_bar.setValue(scroll_bar.maximum() // 2 + step * 97)
+            self._qt_app.processEvents()
+            self.assertEqual(view._cards, pool)
+            start, end = view._visible_range
+            self.assertGreater(start, 1000)
+            bound = {card._bound_index: card for card in view._cards if card._bound_index is not None}
+            self.assertEqual(sorted(bound), list(range(start, end)))
+            for index, card in bound.items():
+                self.assertIs(card.data, articles[index])
+                self.assertEqual(card.name_label.text(), f"단지{index}")
+
+            clicked = []
+            view.article_clicked.connect(clicked.append)
+            bound[start].clicked.emit(bound[start].data)
+            self.assertEqual(clicked[0]["매물ID"], f"C{start}")
+            top = scroll_bar.value()
+            self.assertEqual(bound[start].y(), view._card_position(start)[1] - top)
+            self.assertLess(bound[start].y(), view._row_height())
+
+            view.filter_cards("단지1999")
+            self._qt_app.processEvents()
+            self.assertEqual(len(view._filtered_data), 11)
+            self.assertEqual(view._visible_range, (0, 11))
+            self.assertEqual(len(view._cards), len(pool))
+
+            view.filter_cards("")
+            view.set_data([])
+            self._qt_app.processEvents()
+            self.assertFalse(view.empty_label.isHidden())
+            self.assertTrue(view.empty_label.isVisible())
+            self.assertGreaterEqual(view.empty_label.height(), view.empty_label.sizeHint().height())
+            self.assertTrue(viewport.rect().contains(view.empty_label.geometry()))
+            self.assertEqual(scroll_bar.maximum(), 0)
+            self.assertTrue(all(card.isHidden() for card in view._cards))
+        finally:
+            view.deleteLater()
+            self._qt_app.processEvents()
+
+    def test_card_view_scrolls_past_widget_height_limit(self):
+        from src.ui.widgets.cards import CardViewWidget
+
+        view = CardViewWidget(is_dark=True)
+        try:
+            view.resize(320, 700)
+            view.show()
+            self._qt_app.processEvents()
+            # 한 열에 225px 카드 10만 개는 QWIDGETSIZE_MAX(16,777,215px)를 넘는다.
+            articles = [{"단지명": f"단지{i}", "매물ID": f"L{i}", "거래유형": "매매"} for i in range(100000)]
+            view.set_data(articles)
+            self._qt_app.processEvents()
+
+            self.assertEqual(view._calc_columns(), 1)
+            viewport = view.viewport()
+            scroll_bar = view.verticalScrollBar()
+            assert viewport is not None and scroll_bar is not None
+            self.assertGreater(scroll_bar.maximum(), 16777215)
+            scroll_bar.setValue(scroll_bar.maximum())
+            self._qt_app.processEvents()
+            start, end = view._visible_range
+            self.assertEqual(end, len(articles))
+            last = next(card for card in view._cards if card._bound_index == len(articles) - 1)
+            self.assertEqual(last.name_label.text(), f"단지{len(articles) - 1}")
+            self.assertLessEqual(last.geometry().bottom(), viewport.height())
+        finally:
+            view.deleteLater()
+            self._qt_app.processEvents()
+
+    def test_dashboard_exports_the_card_view_article_card(self):
+        from src.ui.widgets import cards, dashboard
+
+        self.assertIs(dashboard.ArticleCard, cards.ArticleCard)
+
     def test_dialogs_instantiation(self):
         from src.ui.dialogs import URLBatchDialog, AdvancedFilterDialog
 
@@ -551,7 +755,7 @@ class TestUIRuntimeSmoke(unittest.TestCase):
             ]
 
             tab._on_items_batch(sample)
-            self.assertEqual(tab.result_table.rowCount(), 2)
+            self.assertEqual(tab.result_model.rowCount(), 2)
             self.assertEqual(len(tab.collected_data), 2)
 
             tab._update_stats_ui({
@@ -12,9 +12,9 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
 def _table_text(table, row: int, column: int) -> str:
-    item = table.item(row, column)
-    assert item is not None
-    return item.text()
+    index = table.model().index(row, column)
+    assert index.isValid()
+    return str(index.data())
 
 
 def _force_complex_schedule_mode(app) -> None:
@@ -30,6 +30,25 @@ class TestUIWiring(unittest.TestCase):
 
         cls._qt_app = QApplication.instance() or QApplication([])
 
+    def setUp(self):
+        from src.core.database import ComplexDatabase
+
+        # 테스트가 띄운 DB의 스키마 보정 스레드를 모아 두었다가 tearDown 에서 멈춘다.
+        self._schema_backfill_dbs = []
+        start_backfills = ComplexDatabase.start_schema_backfills
+
+        def _tracking_start(db, *args, **kwargs):
+            self._schema_backfill_dbs.append(db)
+            return start_backfills(db, *args, **kwargs)
+
+        patcher = patch.object(ComplexDatabase, "start_schema_backfills", _tracking_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for db in self._schema_backfill_dbs:
+            self.assertTrue(db._stop_schema_backfills())
+
     def test_crawler_tab_saves_search_history_and_complex_finished_slot_is_ui_only(self):
         from src.core.crawler import CrawlerThread
         from src.core.database import ComplexDatabase
@@ -112,6 +131,7 @@ class TestUIWiring(unittest.TestCase):
             item_v2["매매가"] = "9,000만"
             out2 = thread._enrich_item_with_history_and_alerts(item_v2)
             self.assertLess(out2["price_change"], 0)
+            thread._flush_history_updates(force=True)
             self.assertGreaterEqual(len(alerts), 1)
 
             db.close()
@@ -204,13 +224,61 @@ class TestUIWiring(unittest.TestCase):
             ]
             tab._on_items_batch(batch)
             self.assertEqual(len(tab.collected_data), 2)
-            self.assertEqual(tab.result_table.rowCount(), 1)
+            self.assertEqual(tab.result_model.rowCount(), 1)
             self.assertEqual(_table_text(tab.result_table, 0, 7), "2건")
 
             db.close()
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_crawler_tab_compact_live_batches_insert_in_sorted_order(self):
+        from src.core.database import ComplexDatabase
+        from src.ui.widgets.crawler_tab import CrawlerTab
+
+        def _item(i):
+            return {
+                "단지명": f"정렬단지{i % 4}",
+                "단지ID": str(20000 + i % 4),
+                "거래유형": "매매",
+                "매매가": str(10000 + (i * 37) % 11 * 500),
+                "면적(평)": 20.0 + (i * 13) % 5,
+                "층/방향": f"{i}층",
+                "매물ID": f"S{i}",
+                "수집시각": "2026-02-20 10:00:00",
+            }
+
+        def _order(tab):
+            return [payload.get("매물ID") for payload in tab.result_model.payloads()]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "ui_compact_sorted.db"))
+            tab = CrawlerTab(db)
+            try:
+                tab._compact_duplicates = True
+                for criterion in ("가격 ↓", "면적 ↑"):
+                    tab.combo_sort.setCurrentText(criterion)
+                    tab._reset_result_state()
+                    tab.collected_data = []
+                    for batch_start in range(0, 60, 7):
+                        tab._on_items_batch([_item(i) for i in range(batch_start, min(60, batch_start + 7))])
+                    live_order = _order(tab)
+                    self.assertEqual(live_order, [d.get("매물ID") for d in tab._compact_rows_data])
+
+                    # 같은 묶음이 다시 들어오면 자기 행만 갱신된다.
+                    tab._on_items_batch([dict(_item(5), 매물ID="S5b")])
+                    tab._flush_compact_updates()
+                    row = tab._compact_row_for_key(tab._get_compact_key(_item(5)))
+                    self.assertIsNotNone(row)
+                    assert row is not None
+                    self.assertEqual(tab.result_model.payload(row).get("duplicate_count"), 2)
+
+                    tab._render_compact_rows()
+                    self.assertEqual(_order(tab), live_order, criterion)
+            finally:
+                db.close()
+                tab.deleteLater()
+                self._qt_app.processEvents()
+
     def test_crawler_tab_chunk_append_and_filter_cache(self):
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab
@@ -243,24 +311,65 @@ class TestUIWiring(unittest.TestCase):
 
             tab._pending_search_text = "alpha"
             tab._append_rows_batch(items)
-            self.assertEqual(tab.result_table.rowCount(), 450)
-            self.assertEqual(len(tab._row_search_cache), 450)
+            self.assertEqual(tab.result_model.rowCount(), 450)
+            self.assertIn("beta", tab.result_model.searchable(449))
 
-            hidden_alpha = sum(1 for r in range(450) if tab.result_table.isRowHidden(r))
-            self.assertEqual(hidden_alpha, 150)
+            self.assertEqual(tab.result_proxy.rowCount(), 300)
 
             tab._filter_results("beta")
-            hidden_beta = sum(1 for r in range(450) if tab.result_table.isRowHidden(r))
-            self.assertEqual(hidden_beta, 300)
+            self.assertEqual(tab.result_proxy.rowCount(), 150)
             # 반복 필터링에도 상태 일관성 유지
             tab._filter_results("beta")
-            hidden_beta_again = sum(1 for r in range(450) if tab.result_table.isRowHidden(r))
-            self.assertEqual(hidden_beta_again, 300)
+            self.assertEqual(tab.result_proxy.rowCount(), 150)
 
             db.close()
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_result_search_index_matches_linear_substring_scan(self):
+        from PyQt6.QtCore import Qt
+
+        from src.ui.widgets.result_table import ResultRecord, ResultTableModel
+
+        def _record(texts):
+            return ResultRecord(
+                texts=texts,
+                payload={},
+                searchable=" ".join(texts).lower(),
+                sort_values={},
+            )
+
+        model = ResultTableModel(["단지명", "거래", "층/방향", "특징"])
+        model.append_records(
+            [
+                _record([f"래미안단지{i}", "매매" if i % 2 else "전세", f"{i % 20}층 남향", "올수리 역세권" if i % 3 else "Park View"])
+                for i in range(60)
+            ]
+        )
+
+        def _linear(query):
+            return [row for row in range(model.rowCount()) if query in model.searchable(row)]
+
+        def _indexed(query):
+            return [row for row in range(model.rowCount()) if model.row_matches(row, query)]
+
+        queries = ["단지1", "미안", "매매", "층 남", "남향 올수", "park view", "k v", " 역세권", "수리", "없는검색어", "1층", "1", "층", "a 1"]
+        for query in queries:
+            self.assertEqual(_indexed(query), _linear(query), query)
+
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+        model.set_record(0, _record(["새단지", "월세", "3층 동향", "신축"]))
+        model.append_records([_record(["추가단지", "월세", "5층 동향", "신축 테라스"])])
+        for query in queries + ["월세", "동향", "신축", "단지"]:
+            self.assertEqual(_indexed(query), _linear(query), query)
+
+        self.assertEqual(len(model._search_index.term_rows("래미", prefix=True)), 59)
+        self.assertEqual(model._search_index.term_rows("미안", prefix=True), set())
+
+        model.clear()
+        self.assertFalse(model.row_matches(0, "단지"))
+        self.assertEqual(model.search_matches("단지"), set())
+
     def test_crawler_tab_rejects_start_when_thread_running(self):
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab
@@ -421,14 +530,11 @@ class TestUIWiring(unittest.TestCase):
             tab._advanced_filters = {"only_price_down": True}
             tab._filter_results("")
 
-            hidden = sum(1 for r in range(tab.result_table.rowCount()) if tab.result_table.isRowHidden(r))
-            self.assertEqual(hidden, 2)
+            self.assertEqual(tab.result_model.rowCount(), 3)
+            self.assertEqual(tab.result_proxy.rowCount(), 1)
 
             tab.clear_advanced_filters()
-            hidden_after_clear = sum(
-                1 for r in range(tab.result_table.rowCount()) if tab.result_table.isRowHidden(r)
-            )
-            self.assertEqual(hidden_after_clear, 0)
+            self.assertEqual(tab.result_proxy.rowCount(), tab.result_model.rowCount())
 
             db.close()
             tab.deleteLater()
@@ -1760,6 +1866,25 @@ class TestUIWiring(unittest.TestCase):
         app.deleteLater()
         self._qt_app.processEvents()
 
+    def test_app_shutdown_stops_pending_db_background_timer(self):
+        from src.ui.app import RealEstateApp
+
+        with patch("src.ui.app.QSystemTrayIcon.isSystemTrayAvailable", return_value=False):
+            app = RealEstateApp()
+        self.assertTrue(app._db_background_timer.isActive())
+
+        with (
+            patch.object(app.crawler_tab, "shutdown_crawl", return_value=True),
+            patch.object(app.geo_tab, "shutdown_crawl", return_value=True),
+        ):
+            self.assertTrue(app._shutdown())
+
+        self.assertFalse(app._db_background_timer.isActive())
+        self.assertFalse(app.db.start_schema_backfills(prune_caches=True))
+
+        app.deleteLater()
+        self._qt_app.processEvents()
+
     def test_app_shutdown_blocks_db_close_on_crawler_timeout(self):
         from src.ui.app import RealEstateApp
 
@@ -2080,7 +2205,7 @@ class TestUIWiring(unittest.TestCase):
                 },
             ]
             tab._on_items_batch(sample)
-            self.assertEqual(tab.result_table.rowCount(), 2)
+            self.assertEqual(tab.result_model.rowCount(), 2)
 
             filters = {
                 "price_min": 0,
@@ -2097,14 +2222,14 @@ class TestUIWiring(unittest.TestCase):
                 "exclude_keywords": [],
             }
             tab.set_advanced_filters(filters)
-            self.assertEqual(tab.result_table.rowCount(), 1)
+            self.assertEqual(tab.result_model.rowCount(), 1)
 
             tab.btn_view_mode.setChecked(True)
             tab._toggle_view_mode()
             self.assertEqual(len(tab.card_view._all_data), 1)
 
             tab.set_advanced_filters(None)
-            self.assertEqual(tab.result_table.rowCount(), 2)
+            self.assertEqual(tab.result_model.rowCount(), 2)
             self.assertEqual(len(tab.card_view._all_data), 2)
 
             db.close()
@@ -2176,7 +2301,7 @@ class TestUIWiring(unittest.TestCase):
                     "exclude_keywords": [],
                 }
                 tab.set_advanced_filters(filters)
-                self.assertEqual(tab.result_table.rowCount(), 1)
+                self.assertEqual(tab.result_model.rowCount(), 1)
                 self.assertEqual(_table_text(tab.result_table, 0, tab.COL_COMPLEX), "월세높은단지")
 
                 tab.btn_view_mode.setChecked(True)
@@ -2231,7 +2356,7 @@ class TestUIWiring(unittest.TestCase):
             ]
 
             tab._on_items_batch(items)
-            tab.result_table.sortItems(tab.COL_PRICE_SORT, Qt.SortOrder.DescendingOrder)
+            tab.result_table.sortByColumn(tab.COL_PRICE_SORT, Qt.SortOrder.DescendingOrder)
 
             visible = tab._export_items_for_scope("visible")
             raw = tab._export_items_for_scope("raw")
@@ -2300,6 +2425,39 @@ class TestUIWiring(unittest.TestCase):
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_crawler_tab_large_export_runs_in_background_worker(self):
+        from src.core.database import ComplexDatabase
+        from src.ui.widgets.crawler_tab import CrawlerTab
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "ui_export_worker.db"))
+            tab = CrawlerTab(db)
+            tab.collected_data = [{"단지명": f"단지{i}", "매물ID": f"A{i}"} for i in range(5)]
+            path = os.path.join(tmp, "export.jsonl")
+
+            with (
+                patch("src.ui.widgets.crawler_tab.EXPORT_BACKGROUND_MIN_ROWS", 3),
+                patch(
+                    "src.ui.widgets.crawler_tab.QFileDialog.getSaveFileName",
+                    return_value=(path, "JSON Lines (*.jsonl)"),
+                ),
+                patch("src.ui.widgets.crawler_tab.QMessageBox.critical") as mock_critical,
+                patch("src.ui.widgets.crawler_tab.QMessageBox.information") as mock_information,
+            ):
+                tab.save_jsonl("raw")
+                worker = tab._export_worker
+                self.assertIsNotNone(worker)
+                self.assertTrue(worker.wait(10000))
+                self._qt_app.processEvents()
+
+            mock_critical.assert_not_called()
+            self.assertTrue(mock_information.called)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 5)
+            db.close()
+            tab.deleteLater()
+            self._qt_app.processEvents()
+
     def test_crawler_tab_save_reports_legacy_none_export_failure(self):
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab
@@ -2335,6 +2493,51 @@ class TestUIWiring(unittest.TestCase):
             tab.deleteLater()
             self._qt_app.processEvents()
 
+    def test_crawler_tab_result_model_sorts_store_and_keeps_payloads_aligned(self):
+        from src.core.database import ComplexDatabase
+        from src.ui.widgets.crawler_tab import CrawlerTab
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ComplexDatabase(os.path.join(tmp, "ui_result_model.db"))
+            tab = CrawlerTab(db)
+            try:
+                tab.check_compact_duplicates.setChecked(False)
+                items = [
+                    {
+                        "단지명": f"모델단지{idx}",
+                        "단지ID": "72001",
+                        "거래유형": "매매",
+                        "매매가": price,
+                        "면적(평)": 30.0,
+                        "층/방향": "10층",
+                        "타입/특징": "model",
+                        "매물ID": f"M{idx}",
+                        "수집시각": "2026-03-15 10:00:00",
+                        "자산유형": "APT",
+                        "is_new": idx == 1,
+                    }
+                    for idx, price in enumerate(["20000", "10000", "30000"])
+                ]
+                tab._on_items_batch(items)
+                tab._sort_results("가격 ↓")
+
+                self.assertEqual(
+                    [tab.result_model.payload(row)["매물ID"] for row in range(3)],
+                    ["M2", "M0", "M1"],
+                )
+                self.assertEqual(_table_text(tab.result_table, 2, tab.COL_NEW), "N")
+
+                tab._update_favorite_state_for_key(("APT", "M0", "72001"), True)
+                self.assertTrue(tab.result_model.payload(1)["is_favorite"])
+
+                tab._filter_results("모델단지1")
+                self.assertEqual(tab.result_proxy.rowCount(), 1)
+                self.assertEqual(tab.result_proxy.source_rows(), [2])
+            finally:
+                db.close()
+                tab.deleteLater()
+                self._qt_app.processEvents()
+
     def test_crawler_tab_renders_favorites_with_asset_scoped_keys(self):
         from src.core.database import ComplexDatabase
         from src.ui.widgets.crawler_tab import CrawlerTab